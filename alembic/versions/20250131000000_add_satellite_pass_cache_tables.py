@@ -0,0 +1,82 @@
+"""add_satellite_pass_cache_tables
+
+Revision ID: 20250131000000
+Revises: 20250130000000
+Create Date: 2025-01-31 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250131000000"
+down_revision: str | Sequence[str] | None = "20250130000000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create satellite_pass_windows and satellite_passes tables for the pass cache."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    if "satellite_pass_windows" not in existing_tables:
+        op.create_table(
+            "satellite_pass_windows",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("norad_id", sa.Integer(), nullable=False),
+            sa.Column("tle_epoch", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("geohash", sa.String(length=12), nullable=False),
+            sa.Column("window_start", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("window_end", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("computed_at", sa.DateTime(timezone=True), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_satellite_pass_windows_norad_id", "satellite_pass_windows", ["norad_id"], unique=False)
+        op.create_index(
+            "idx_pass_window_key", "satellite_pass_windows", ["norad_id", "geohash", "tle_epoch"], unique=True
+        )
+
+    if "satellite_passes" not in existing_tables:
+        op.create_table(
+            "satellite_passes",
+            sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+            sa.Column("norad_id", sa.Integer(), nullable=False),
+            sa.Column("tle_epoch", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("geohash", sa.String(length=12), nullable=False),
+            sa.Column("satellite_name", sa.String(length=255), nullable=False),
+            sa.Column("rise_time", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("max_time", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("set_time", sa.DateTime(timezone=True), nullable=False),
+            sa.Column("max_altitude_deg", sa.Float(), nullable=False),
+            sa.Column("rise_azimuth_deg", sa.Float(), nullable=False),
+            sa.Column("max_azimuth_deg", sa.Float(), nullable=False),
+            sa.Column("set_azimuth_deg", sa.Float(), nullable=False),
+            sa.Column("range_km", sa.Float(), nullable=False),
+            sa.Column("is_sunlit", sa.Boolean(), nullable=False),
+            sa.Column("sun_altitude_deg", sa.Float(), nullable=False),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_satellite_passes_norad_id", "satellite_passes", ["norad_id"], unique=False)
+        op.create_index(
+            "idx_satellite_pass_key",
+            "satellite_passes",
+            ["norad_id", "geohash", "tle_epoch", "rise_time"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Drop the satellite pass cache tables."""
+    op.drop_index("idx_satellite_pass_key", table_name="satellite_passes")
+    op.drop_index("ix_satellite_passes_norad_id", table_name="satellite_passes")
+    op.drop_table("satellite_passes")
+    op.drop_index("idx_pass_window_key", table_name="satellite_pass_windows")
+    op.drop_index("ix_satellite_pass_windows_norad_id", table_name="satellite_pass_windows")
+    op.drop_table("satellite_pass_windows")
@@ -0,0 +1,92 @@
+"""add_integer_geohash_columns
+
+Revision ID: 20250201000000
+Revises: 20250131000000
+Create Date: 2025-02-01 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy import text
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250201000000"
+down_revision: str | Sequence[str] | None = "20250131000000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, index) pairs that get a geohash_int column
+_TABLES = (
+    ("light_pollution_grid", "idx_lp_geohash_int"),
+    ("dark_sky_sites", "idx_dark_sky_geohash_int"),
+)
+
+# Rows encoded and updated at a time
+_BATCH_SIZE = 100_000
+
+
+def upgrade() -> None:
+    """Add integer geohash columns to the spatial tables and populate them from lat/lon."""
+    from celestron_nexstar.api.location.geohash_utils import encode_int_array
+
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    for table, index in _TABLES:
+        if table not in existing_tables:
+            continue
+
+        existing_columns = [col["name"] for col in inspector.get_columns(table)]
+        if "geohash_int" not in existing_columns:
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.add_column(sa.Column("geohash_int", sa.BigInteger(), nullable=True))
+
+        existing_indexes = [idx["name"] for idx in inspector.get_indexes(table)]
+        if index not in existing_indexes:
+            op.create_index(index, table, ["geohash_int"], unique=False)
+
+        # Populate in batches, vectorised
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                text(
+                    f"SELECT id, latitude, longitude FROM {table} "
+                    "WHERE geohash_int IS NULL AND id > :last_id ORDER BY id LIMIT :limit"
+                ),
+                {"last_id": last_id, "limit": _BATCH_SIZE},
+            ).fetchall()
+            if not rows:
+                break
+            ids, lats, lons = zip(*rows, strict=True)
+            codes = encode_int_array(lats, lons).tolist()
+            conn.execute(
+                text(f"UPDATE {table} SET geohash_int = :geohash_int WHERE id = :id"),
+                [{"geohash_int": code, "id": row_id} for row_id, code in zip(ids, codes, strict=True)],
+            )
+            last_id = ids[-1]
+
+
+def downgrade() -> None:
+    """Remove integer geohash columns from the spatial tables."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    existing_tables = inspector.get_table_names()
+
+    for table, index in _TABLES:
+        if table not in existing_tables:
+            continue
+
+        existing_indexes = [idx["name"] for idx in inspector.get_indexes(table)]
+        if index in existing_indexes:
+            op.drop_index(index, table_name=table)
+
+        existing_columns = [col["name"] for col in inspector.get_columns(table)]
+        if "geohash_int" in existing_columns:
+            with op.batch_alter_table(table, schema=None) as batch_op:
+                batch_op.drop_column("geohash_int")
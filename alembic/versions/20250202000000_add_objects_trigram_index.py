@@ -0,0 +1,78 @@
+"""add_objects_trigram_index
+
+Revision ID: 20250202000000
+Revises: 20250201000000
+Create Date: 2025-02-02 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import text
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "20250202000000"
+down_revision: str | Sequence[str] | None = "20250201000000"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# The trigram tokenizer arrived in SQLite 3.34
+_MIN_SQLITE_VERSION = (3, 34, 0)
+
+
+def upgrade() -> None:
+    """Create the trigram FTS5 index over object names used by fuzzy search."""
+    conn = op.get_bind()
+    version = conn.execute(text("SELECT sqlite_version()")).scalar_one()
+    if tuple(int(part) for part in version.split(".")) < _MIN_SQLITE_VERSION:
+        # Fuzzy search reports itself unavailable without the index
+        return
+
+    # IF NOT EXISTS: older releases created the index on first fuzzy search
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS objects_trigram USING fts5(
+            name,
+            common_name,
+            content=objects,
+            content_rowid=id,
+            tokenize='trigram'
+        )
+    """)
+
+    # Create triggers to keep the index in sync with objects table
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS objects_trigram_ai AFTER INSERT ON objects BEGIN
+            INSERT INTO objects_trigram(rowid, name, common_name)
+            VALUES (new.id, new.name, new.common_name);
+        END
+    """)
+
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS objects_trigram_ad AFTER DELETE ON objects BEGIN
+            INSERT INTO objects_trigram(objects_trigram, rowid, name, common_name)
+            VALUES ('delete', old.id, old.name, old.common_name);
+        END
+    """)
+
+    op.execute("""
+        CREATE TRIGGER IF NOT EXISTS objects_trigram_au AFTER UPDATE ON objects BEGIN
+            INSERT INTO objects_trigram(objects_trigram, rowid, name, common_name)
+            VALUES ('delete', old.id, old.name, old.common_name);
+            INSERT INTO objects_trigram(rowid, name, common_name)
+            VALUES (new.id, new.name, new.common_name);
+        END
+    """)
+
+    # Index the objects already in the table
+    op.execute("INSERT INTO objects_trigram(objects_trigram) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Drop the trigram index and its triggers."""
+    op.execute("DROP TRIGGER IF EXISTS objects_trigram_au")
+    op.execute("DROP TRIGGER IF EXISTS objects_trigram_ad")
+    op.execute("DROP TRIGGER IF EXISTS objects_trigram_ai")
+    op.execute("DROP TABLE IF EXISTS objects_trigram")
@@ -44,6 +44,7 @@ from celestron_nexstar.api.core.types import (
     HorizontalCoordinates,
     TelescopeConfig,
     TelescopeInfo,
+    TelescopeState,
     TelescopeTime,
     TrackingMode,
 )
@@ -63,6 +64,7 @@ from celestron_nexstar.api.core.utils import (
     ra_dec_to_alt_az,
     ra_to_hours,
 )
+from celestron_nexstar.api.telescope.async_telescope import AsyncNexStarTelescope
 from celestron_nexstar.api.telescope.telescope import NexStarTelescope
 
 
@@ -72,6 +74,8 @@ __email__ = "your.email@example.com"
 
 __all__ = [
     "AlignmentMode",
+    # Asyncio telescope class
+    "AsyncNexStarTelescope",
     "CommandError",
     # Coordinate converter class
     "CoordinateConverter",
@@ -87,6 +91,7 @@ __all__ = [
     "TelescopeConfig",
     "TelescopeConnectionError",
     "TelescopeInfo",
+    "TelescopeState",
     "TelescopeTime",
     "TelescopeTimeoutError",
     # Type definitions
@@ -65,22 +65,21 @@ def _get_skyfield_objects() -> tuple[Any, Any, Any, Any | None, Any] | tuple[Non
     """Get Skyfield objects for calculations."""
 
     try:
-        from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+        from celestron_nexstar.api.ephemeris.registry import get_ephemeris_registry
 
-        loader = get_skyfield_loader()
-        ts = loader.timescale()
+        registry = get_ephemeris_registry()
+        ts = registry.timescale()
 
         # Load ephemeris - de421 includes Moon
         try:
-            eph = loader("de421.bsp")
+            eph = registry.kernel("de421.bsp")
         except FileNotFoundError:
             logger.warning("de421.bsp not found, eclipse calculations may fail")
             return None, None, None, None, None
 
-        earth = eph["earth"]
-        sun = eph["sun"]
+        earth, sun = registry.bodies("de421.bsp", "earth", "sun")
         try:
-            moon = eph["moon"]
+            moon = registry.body("de421.bsp", "moon")
         except KeyError:
             moon = None
 
@@ -0,0 +1,285 @@
+"""
+Sun and Moon Event Tables
+
+This module provides precomputed rise/set and twilight events for the Sun
+and Moon, shared by everything that asks "when does the Sun set" or "when
+does the Moon rise" for nearby times. Features include:
+- Every altitude crossing over a three-day span found in one Skyfield
+  find_discrete search per body (instead of hourly scans per call)
+- Sunrise/sunset plus the golden hour, blue hour and civil, nautical and
+  astronomical twilight boundaries from the same search
+- An LRU/TTL cache keyed on rounded location and UTC day, so all callers
+  for the same place and night share one table
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from threading import Lock
+from typing import Any
+
+import numpy as np
+from cachetools import TTLCache
+
+
+__all__ = [
+    "MOON_THRESHOLDS",
+    "SUN_THRESHOLDS",
+    "AltitudeCrossings",
+    "EphemerisEvents",
+    "clear_ephemeris_event_cache",
+    "find_altitude_crossings",
+    "get_ephemeris_events",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Altitudes (degrees) whose crossings are recorded: astronomical, nautical
+# and civil twilight, the blue hour, the horizon and the top of golden hour
+SUN_THRESHOLDS: tuple[float, ...] = (-18.0, -12.0, -6.0, -4.0, 0.0, 6.0)
+MOON_THRESHOLDS: tuple[float, ...] = (0.0,)
+
+# Days covered by a table, starting at 00:00 UTC of the requested day, so
+# any time in that day can look 48 hours ahead
+_SPAN_DAYS = 3
+
+# Sampling step for find_discrete: short enough that the Sun (at most 15°
+# an hour) cannot cross two thresholds 2° apart between samples
+_STEP_DAYS = 5.0 / 1440.0
+
+# Locations are rounded to about 1 km; event times move by a few seconds
+_LOCATION_DECIMALS = 2
+
+_cache: TTLCache[tuple[float, float, str], EphemerisEvents] = TTLCache(maxsize=64, ttl=6 * 3600)
+_cache_lock = Lock()
+
+
+@dataclass(frozen=True)
+class AltitudeCrossings:
+    """
+    Times a body crosses a set of altitudes, in order.
+
+    Attributes:
+        rising: For each threshold, times the body climbs through it
+        setting: For each threshold, times the body sinks through it
+    """
+
+    rising: dict[float, tuple[datetime, ...]]
+    setting: dict[float, tuple[datetime, ...]]
+
+    def next(self, threshold: float, after: datetime, rising: bool) -> datetime | None:
+        """
+        Get the first crossing of a threshold after a time.
+
+        Args:
+            threshold: Altitude in degrees (one of the recorded thresholds)
+            after: Time to search from (exclusive)
+            rising: Upward rather than downward crossing
+
+        Returns:
+            Crossing time, or None if there is none in the table
+        """
+        times = (self.rising if rising else self.setting)[threshold]
+        index = bisect_right(times, after)
+        return times[index] if index < len(times) else None
+
+    def previous(self, threshold: float, before: datetime, rising: bool) -> datetime | None:
+        """
+        Get the last crossing of a threshold before a time.
+
+        Args:
+            threshold: Altitude in degrees (one of the recorded thresholds)
+            before: Time to search back from (exclusive)
+            rising: Upward rather than downward crossing
+
+        Returns:
+            Crossing time, or None if there is none in the table
+        """
+        times = (self.rising if rising else self.setting)[threshold]
+        index = bisect_left(times, before)
+        return times[index - 1] if index > 0 else None
+
+
+@dataclass(frozen=True)
+class EphemerisEvents:
+    """
+    Sun and Moon altitude crossings for one location over a few days.
+
+    Attributes:
+        latitude: Observer latitude in degrees (rounded)
+        longitude: Observer longitude in degrees (rounded)
+        start: Start of the table (UTC)
+        end: End of the table (UTC)
+        sun: Sun crossings of SUN_THRESHOLDS
+        moon: Moon crossings of MOON_THRESHOLDS, None without lunar ephemeris
+    """
+
+    latitude: float
+    longitude: float
+    start: datetime
+    end: datetime
+    sun: AltitudeCrossings
+    moon: AltitudeCrossings | None
+
+    def sun_band(
+        self, lower: float, upper: float, after: datetime
+    ) -> tuple[datetime | None, datetime | None, datetime | None, datetime | None]:
+        """
+        Get the next evening and morning passages of the Sun through an altitude band.
+
+        The evening passage ends at the next downward crossing of ``lower``
+        and starts at the downward crossing of ``upper`` before it; the
+        morning passage ends at the next upward crossing of ``upper`` and
+        starts at the upward crossing of ``lower`` before it. A start that
+        falls before ``after`` (the Sun is already in the band) is None.
+
+        Args:
+            lower: Lower band altitude in degrees (one of SUN_THRESHOLDS)
+            upper: Upper band altitude in degrees (one of SUN_THRESHOLDS)
+            after: Time to search from
+
+        Returns:
+            Tuple of (evening_start, evening_end, morning_start, morning_end)
+        """
+
+        def starting(end: datetime | None, threshold: float, rising: bool) -> datetime | None:
+            if end is None:
+                return None
+            start = self.sun.previous(threshold, end, rising)
+            return start if start is not None and start >= after else None
+
+        evening_end = self.sun.next(lower, after, rising=False)
+        morning_end = self.sun.next(upper, after, rising=True)
+        return (
+            starting(evening_end, upper, rising=False),
+            evening_end,
+            starting(morning_end, lower, rising=True),
+            morning_end,
+        )
+
+
+def find_altitude_crossings(
+    ts: Any,
+    altitude_of: Callable[[Any], Any],
+    start: datetime,
+    end: datetime,
+    thresholds: tuple[float, ...],
+) -> AltitudeCrossings:
+    """
+    Find every crossing of a set of altitudes with Skyfield's find_discrete.
+
+    The body's altitude is reduced to a level (how many thresholds lie
+    below it); find_discrete locates each level change to about a second.
+
+    Args:
+        ts: Skyfield timescale
+        altitude_of: Altitude in degrees for a (vector) Skyfield Time
+        start: Start of the search (UTC)
+        end: End of the search (UTC)
+        thresholds: Ascending altitudes in degrees
+
+    Returns:
+        AltitudeCrossings for the span
+    """
+    from skyfield.searchlib import find_discrete
+
+    edges = np.asarray(thresholds, dtype=np.float64)
+
+    def level(t: Any) -> Any:
+        return np.searchsorted(edges, altitude_of(t))
+
+    level.step_days = _STEP_DAYS  # type: ignore[attr-defined]
+
+    t0, t1 = ts.from_datetime(start), ts.from_datetime(end)
+    times, levels = find_discrete(t0, t1, level, epsilon=1.0 / 86400.0)
+    previous = int(np.atleast_1d(level(t0))[0])
+    rising: dict[float, list[datetime]] = {threshold: [] for threshold in thresholds}
+    setting: dict[float, list[datetime]] = {threshold: [] for threshold in thresholds}
+    for when, current in zip(times.utc_datetime(), levels, strict=True):
+        current = int(current)
+        # A jump of several levels crosses every threshold in between
+        for index in range(min(previous, current), max(previous, current)):
+            (rising if current > previous else setting)[thresholds[index]].append(when.astimezone(UTC))
+        previous = current
+    return AltitudeCrossings(
+        rising={threshold: tuple(values) for threshold, values in rising.items()},
+        setting={threshold: tuple(values) for threshold, values in setting.items()},
+    )
+
+
+def _compute_events(
+    latitude: float, longitude: float, start: datetime, bodies: tuple[Any, Any, Any, Any]
+) -> EphemerisEvents:
+    """Search Sun and Moon crossings for a table starting at ``start``."""
+    from skyfield.api import Topos
+
+    ts, earth, sun, moon = bodies
+    observer = earth + Topos(latitude_degrees=latitude, longitude_degrees=longitude)
+    end = start + timedelta(days=_SPAN_DAYS)
+
+    def altitude_of(body: Any) -> Callable[[Any], Any]:
+        def altitude(t: Any) -> Any:
+            alt, _az, _distance = observer.at(t).observe(body).apparent().altaz()
+            return alt.degrees
+
+        return altitude
+
+    sun_crossings = find_altitude_crossings(ts, altitude_of(sun), start, end, SUN_THRESHOLDS)
+    moon_crossings = None
+    if moon is not None:
+        moon_crossings = find_altitude_crossings(ts, altitude_of(moon), start, end, MOON_THRESHOLDS)
+    return EphemerisEvents(
+        latitude=latitude, longitude=longitude, start=start, end=end, sun=sun_crossings, moon=moon_crossings
+    )
+
+
+def get_ephemeris_events(
+    latitude: float,
+    longitude: float,
+    dt: datetime,
+    bodies: tuple[Any, Any, Any, Any],
+) -> EphemerisEvents:
+    """
+    Get the Sun and Moon event table for a location, covering ``dt`` to ``dt`` + 48 hours.
+
+    Tables start at 00:00 UTC and are cached per rounded location and day,
+    so repeated calls for nearby times and places reuse one search.
+
+    Args:
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        dt: Time of interest (naive means UTC)
+        bodies: Skyfield (timescale, earth, sun, moon); moon may be None
+
+    Returns:
+        EphemerisEvents covering the next 48 hours
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    dt = dt.astimezone(UTC)
+    latitude = round(latitude, _LOCATION_DECIMALS)
+    longitude = round(longitude, _LOCATION_DECIMALS)
+    day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    key = (latitude, longitude, day.date().isoformat())
+
+    with _cache_lock:
+        events = _cache.get(key)
+    if events is not None:
+        return events
+
+    events = _compute_events(latitude, longitude, day, bodies)
+    logger.debug(f"Computed sun/moon events for ({latitude}, {longitude}) from {day.date()}")
+    with _cache_lock:
+        _cache[key] = events
+    return events
+
+
+def clear_ephemeris_event_cache() -> None:
+    """Drop all cached event tables."""
+    with _cache_lock:
+        _cache.clear()
@@ -16,7 +16,8 @@ from typing import TYPE_CHECKING, Any
 from skyfield.api import Topos
 from skyfield.searchlib import find_minima
 
-from celestron_nexstar.api.ephemeris.ephemeris import PLANET_NAMES, _get_ephemeris
+from celestron_nexstar.api.ephemeris.ephemeris import PLANET_NAMES
+from celestron_nexstar.api.ephemeris.registry import get_body, get_kernel, get_timescale
 
 
 if TYPE_CHECKING:
@@ -57,26 +58,34 @@ class EventType:
     RETROGRADE_END = "retrograde_end"
 
 
+# Ephemeris used for event searches (planets only, no moons)
+_EPHEMERIS_FILE = "de440s.bsp"
+
 # Major planets for event calculations (excluding moons)
 MAJOR_PLANETS = ["mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune"]
 
 
-def _get_planet_position(planet_name: str, t: Any, eph: Any) -> tuple[float, float] | None:
+def _get_body(name: str) -> Any:
+    """Get a body handle from the event ephemeris, trying the upper-case name too."""
+    try:
+        return get_body(_EPHEMERIS_FILE, name)
+    except KeyError:
+        return get_body(_EPHEMERIS_FILE, name.upper())
+
+
+def _get_planet_position(planet_name: str, t: Any) -> tuple[float, float] | None:
     """Get planet RA/Dec position at time t."""
     planet_key = planet_name.lower()
     if planet_key not in PLANET_NAMES:
         return None
 
     ephemeris_name, _bsp_file = PLANET_NAMES[planet_key]
-    earth = eph["earth"]
+    earth = _get_body("earth")
 
     try:
-        target = eph[ephemeris_name]
+        target = _get_body(ephemeris_name)
     except KeyError:
-        try:
-            target = eph[ephemeris_name.upper()]
-        except KeyError:
-            return None
+        return None
 
     astrometric = earth.at(t).observe(target)
     ra, dec, _distance = astrometric.radec()
@@ -100,23 +109,19 @@ def _angular_separation(ra1: float, dec1: float, ra2: float, dec2: float) -> flo
     return math.degrees(separation_rad)
 
 
-def _get_altitude(planet_name: str, observer_lat: float, observer_lon: float, t: Any, eph: Any) -> float:
+def _get_altitude(planet_name: str, observer_lat: float, observer_lon: float, t: Any) -> float:
     """Get planet altitude above horizon."""
     planet_key = planet_name.lower()
     if planet_key not in PLANET_NAMES:
         return -90.0
 
     ephemeris_name, _bsp_file = PLANET_NAMES[planet_key]
-    earth = eph["earth"]
-    observer = earth + Topos(latitude_degrees=observer_lat, longitude_degrees=observer_lon)
+    observer = _get_body("earth") + Topos(latitude_degrees=observer_lat, longitude_degrees=observer_lon)
 
     try:
-        target = eph[ephemeris_name]
+        target = _get_body(ephemeris_name)
     except KeyError:
-        try:
-            target = eph[ephemeris_name.upper()]
-        except KeyError:
-            return -90.0
+        return -90.0
 
     astrometric = observer.at(t).observe(target)
     alt, _az, _ = astrometric.apparent().altaz()
@@ -141,14 +146,11 @@ def get_planetary_conjunctions(
     """
 
     try:
-        from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
-
-        loader = get_skyfield_loader()
-        ts = loader.timescale()
-        eph = _get_ephemeris("de440s.bsp")
+        ts = get_timescale()
+        get_kernel(_EPHEMERIS_FILE)
     except (ImportError, AttributeError, ValueError, TypeError, KeyError, FileNotFoundError) as e:
         # ImportError: missing Skyfield modules
-        # AttributeError: missing methods/attributes on loader
+        # AttributeError: missing methods/attributes on ephemeris
         # ValueError: invalid ephemeris data
         # TypeError: wrong argument types
         # KeyError: missing ephemeris objects
@@ -167,8 +169,8 @@ def get_planetary_conjunctions(
                 # Find times when separation is minimized
                 # Capture loop variables as default parameters to avoid closure issues
                 def separation_at_time(t: Any, p1: str = planet1, p2: str = planet2) -> float:
-                    pos1 = _get_planet_position(p1, t, eph)
-                    pos2 = _get_planet_position(p2, t, eph)
+                    pos1 = _get_planet_position(p1, t)
+                    pos2 = _get_planet_position(p2, t)
                     if pos1 is None or pos2 is None:
                         return 180.0  # Maximum separation
                     ra1, dec1 = pos1
@@ -189,8 +191,8 @@ def get_planetary_conjunctions(
                             event_time = event_time.replace(tzinfo=UTC)
 
                         # Get altitude for both planets
-                        alt1 = _get_altitude(planet1, location.latitude, location.longitude, min_time, eph)
-                        alt2 = _get_altitude(planet2, location.latitude, location.longitude, min_time, eph)
+                        alt1 = _get_altitude(planet1, location.latitude, location.longitude, min_time)
+                        alt2 = _get_altitude(planet2, location.latitude, location.longitude, min_time)
                         is_visible = alt1 > 0 or alt2 > 0
                         avg_altitude = (alt1 + alt2) / 2.0
 
@@ -238,16 +240,12 @@ def get_planetary_oppositions(
     """
 
     try:
-        from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
-
-        loader = get_skyfield_loader()
-        ts = loader.timescale()
-        eph = _get_ephemeris("de440s.bsp")
-        sun = eph["sun"]
-        earth = eph["earth"]
+        ts = get_timescale()
+        get_kernel(_EPHEMERIS_FILE)
+        sun, earth = _get_body("sun"), _get_body("earth")
     except (ImportError, AttributeError, ValueError, TypeError, KeyError, FileNotFoundError) as e:
         # ImportError: missing Skyfield modules
-        # AttributeError: missing methods/attributes on loader
+        # AttributeError: missing methods/attributes on ephemeris
         # ValueError: invalid ephemeris data
         # TypeError: wrong argument types
         # KeyError: missing ephemeris objects (sun, earth)
@@ -267,7 +265,7 @@ def get_planetary_oppositions(
             # Find times when planet is opposite sun (elongation = 180°)
             # Capture loop variable as default parameter to avoid closure issues
             def elongation_at_time(t: Any, pname: str = planet_name) -> float:
-                pos = _get_planet_position(pname, t, eph)
+                pos = _get_planet_position(pname, t)
                 if pos is None:
                     return 0.0
                 ra_planet, dec_planet = pos
@@ -295,7 +293,7 @@ def get_planetary_oppositions(
                         event_time = event_time.replace(tzinfo=UTC)
 
                     # Get actual elongation
-                    pos = _get_planet_position(planet_name, min_time, eph)
+                    pos = _get_planet_position(planet_name, min_time)
                     if pos is None:
                         continue
                     ra_planet, dec_planet = pos
@@ -305,7 +303,7 @@ def get_planetary_oppositions(
                     dec_sun = dec_sun_obj.degrees
                     elongation = _angular_separation(ra_planet, dec_planet, ra_sun, dec_sun)
 
-                    altitude = _get_altitude(planet_name, location.latitude, location.longitude, min_time, eph)
+                    altitude = _get_altitude(planet_name, location.latitude, location.longitude, min_time)
                     is_visible = altitude > 0
 
                     notes = f"{planet_name.capitalize()} at opposition - best viewing time"
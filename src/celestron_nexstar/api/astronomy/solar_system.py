@@ -2,16 +2,24 @@
 Solar System Calculations
 
 Calculations for Sun and Moon positions, phases, and events.
+
+Rise/set and twilight times come from the shared event tables in
+ephemeris_events, and get_moon_info/get_sun_info results are memoized per
+rounded location and minute, since planners and event finders ask for the
+same night many times over.
 """
 
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from threading import Lock
 from typing import Any, NamedTuple
 
+from cachetools import TTLCache
 from skyfield.api import Topos
 
+from celestron_nexstar.api.astronomy.ephemeris_events import get_ephemeris_events
 from celestron_nexstar.api.core.enums import MoonPhase
 
 
@@ -24,11 +32,20 @@ __all__ = [
     "calculate_blue_hour",
     "calculate_golden_hour",
     "calculate_moon_phase",
+    "clear_solar_system_cache",
     "get_moon_info",
     "get_sun_info",
 ]
 
 
+# get_moon_info/get_sun_info results are shared by calls in the same minute
+# at the same (rounded) location
+_INFO_BUCKET_SECONDS = 60
+_INFO_LOCATION_DECIMALS = 4
+_info_cache: TTLCache[tuple[Any, ...], Any] = TTLCache(maxsize=256, ttl=900)
+_info_cache_lock = Lock()
+
+
 class MoonInfo(NamedTuple):
     """Moon information."""
 
@@ -57,23 +74,23 @@ class SunInfo(NamedTuple):
 def _get_skyfield_objects() -> tuple[Any, Any, Any, Any | None]:
     """Get Skyfield Earth, Sun, and Moon objects."""
     try:
-        from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+        from celestron_nexstar.api.ephemeris.registry import get_ephemeris_registry
 
-        loader = get_skyfield_loader()
-        ts = loader.timescale()
+        registry = get_ephemeris_registry()
+        ts = registry.timescale()
 
         # Load ephemeris - de421 includes Moon
         try:
-            eph = loader("de421.bsp")
+            bsp_file = "de421.bsp"
+            registry.kernel(bsp_file)
         except FileNotFoundError:
             logger.warning("de421.bsp not found, moon calculations may fail")
             # Fallback to de440s (no moon) for sun only
-            eph = loader("de440s.bsp")
+            bsp_file = "de440s.bsp"
 
-        earth = eph["earth"]
-        sun = eph["sun"]
+        earth, sun = registry.bodies(bsp_file, "earth", "sun")
         try:
-            moon = eph["moon"]
+            moon = registry.body(bsp_file, "moon")
         except KeyError:
             moon = None
 
@@ -141,6 +158,35 @@ def calculate_moon_phase(illumination: float, moon_ra: float, sun_ra: float) ->
         return MoonPhase.WANING_CRESCENT if not is_waxing else MoonPhase.WAXING_CRESCENT
 
 
+def _memoized(kind: str, observer_lat: float, observer_lon: float, dt: datetime, compute: Any) -> Any:
+    """Return a cached result for the same kind, rounded location and minute, or compute and cache it."""
+    key = (
+        kind,
+        round(observer_lat, _INFO_LOCATION_DECIMALS),
+        round(observer_lon, _INFO_LOCATION_DECIMALS),
+        int(dt.timestamp() // _INFO_BUCKET_SECONDS),
+    )
+    with _info_cache_lock:
+        if key in _info_cache:
+            return _info_cache[key]
+    result = compute(observer_lat, observer_lon, dt)
+    # Failures are not cached so a later call can succeed (e.g. once
+    # ephemeris files have been downloaded)
+    if result is not None:
+        with _info_cache_lock:
+            _info_cache[key] = result
+    return result
+
+
+def clear_solar_system_cache() -> None:
+    """Drop memoized moon/sun information and the cached event tables."""
+    from celestron_nexstar.api.astronomy.ephemeris_events import clear_ephemeris_event_cache
+
+    with _info_cache_lock:
+        _info_cache.clear()
+    clear_ephemeris_event_cache()
+
+
 def get_moon_info(
     observer_lat: float,
     observer_lon: float,
@@ -149,6 +195,8 @@ def get_moon_info(
     """
     Get current moon information including phase and position.
 
+    Results are memoized per minute and rounded location.
+
     Args:
         observer_lat: Observer latitude in degrees
         observer_lon: Observer longitude in degrees
@@ -162,6 +210,12 @@ def get_moon_info(
     elif dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
 
+    result: MoonInfo | None = _memoized("moon", observer_lat, observer_lon, dt, _compute_moon_info)
+    return result
+
+
+def _compute_moon_info(observer_lat: float, observer_lon: float, dt: datetime) -> MoonInfo | None:
+    """Calculate moon information (uncached)."""
     try:
         ts, earth, sun, moon = _get_skyfield_objects()
         if ts is None or earth is None or sun is None or moon is None:
@@ -214,89 +268,19 @@ def get_moon_info(
 
         phase_name = calculate_moon_phase(illumination, moon_ra, sun_ra)
 
-        # Calculate moonrise/moonset
-        moonrise_time = None
-        moonset_time = None
-
-        def _refine_horizon_crossing(start_dt: datetime, end_dt: datetime, rising: bool) -> datetime:
-            """Refine horizon crossing time using binary search between two datetimes."""
-            # Use 10-minute intervals for better precision
-            best_time = start_dt + timedelta(minutes=30)  # Default midpoint
-            min_diff = float("inf")
-
-            for minutes_offset in range(0, 61, 5):  # Check every 5 minutes
-                test_dt = start_dt + timedelta(minutes=minutes_offset)
-                if test_dt > end_dt:
-                    break
-                t_test = ts.from_datetime(test_dt)
-                astrometric_test = observer.at(t_test).observe(moon)
-                alt_test, _az_test, _ = astrometric_test.apparent().altaz()
-                moon_alt_test = alt_test.degrees
-
-                # Find the time closest to horizon (altitude = 0)
-                diff = abs(moon_alt_test)
-                if diff < min_diff:
-                    min_diff = diff
-                    best_time = test_dt
-
-                # If we're very close to horizon, we're done
-                if diff < 0.1:
-                    break
-
-            return best_time
-
+        # Next moonrise/moonset from the shared event table
+        moonrise_time, moonset_time = None, None
         try:
-            # Always look forward to find NEXT moonrise and NEXT moonset
-            # Sample next 48 hours at 1-hour intervals to find moonset and next moonrise
-            for hours_ahead in range(1, 49):
-                check_dt = dt + timedelta(hours=hours_ahead)
-                t_check = ts.from_datetime(check_dt)
-                astrometric_check = observer.at(t_check).observe(moon)
-                alt_check, _az_check, _ = astrometric_check.apparent().altaz()
-                moon_alt_check = alt_check.degrees
-
-                # Check previous hour for comparison
-                prev_dt = check_dt - timedelta(hours=1)
-                t_prev = ts.from_datetime(prev_dt)
-                astrometric_prev = observer.at(t_prev).observe(moon)
-                alt_prev, _az_prev, _ = astrometric_prev.apparent().altaz()
-                moon_alt_prev = alt_prev.degrees
-
-                # Moonset: was above, now below (find next moonset)
-                if moon_alt_prev > 0 and moon_alt_check <= 0 and moonset_time is None:
-                    # Refine the crossing time for better accuracy
-                    moonset_time = _refine_horizon_crossing(prev_dt, check_dt, rising=False)
-                    # Ensure UTC timezone
-                    if moonset_time.tzinfo is None:
-                        moonset_time = moonset_time.replace(tzinfo=UTC)
-                    # Only accept if it's in the future
-                    if moonset_time <= dt:
-                        moonset_time = None
-                        continue
-                    if moonrise_time is not None:
-                        break
-
-                # Moonrise: was below, now above (find next moonrise)
-                if moon_alt_prev <= 0 and moon_alt_check > 0 and moonrise_time is None:
-                    # Refine the crossing time for better accuracy
-                    moonrise_time = _refine_horizon_crossing(prev_dt, check_dt, rising=True)
-                    # Ensure UTC timezone
-                    if moonrise_time.tzinfo is None:
-                        moonrise_time = moonrise_time.replace(tzinfo=UTC)
-                    # Only accept if it's in the future
-                    if moonrise_time <= dt:
-                        moonrise_time = None
-                        continue
-                    if moonset_time is not None:
-                        break
+            events = get_ephemeris_events(observer_lat, observer_lon, dt, (ts, earth, sun, moon))
+            if events.moon is not None:
+                moonrise_time = events.moon.next(0.0, dt, rising=True)
+                moonset_time = events.moon.next(0.0, dt, rising=False)
         except (ValueError, TypeError, AttributeError, ZeroDivisionError) as e:
             # ValueError: invalid datetime or coordinates
             # TypeError: wrong argument types
             # AttributeError: missing attributes on Skyfield objects
             # ZeroDivisionError: division by zero in calculations
             logger.debug(f"Error calculating moonrise/moonset: {e}")
-            # If calculation fails, leave as None
-            pass
 
         return MoonInfo(
             phase_name=phase_name,
@@ -326,6 +310,8 @@ def get_sun_info(
     """
     Get current sun information including position and sunset/sunrise.
 
+    Results are memoized per minute and rounded location.
+
     Args:
         observer_lat: Observer latitude in degrees
         observer_lon: Observer longitude in degrees
@@ -339,6 +325,12 @@ def get_sun_info(
     elif dt.tzinfo is None:
         dt = dt.replace(tzinfo=UTC)
 
+    result: SunInfo | None = _memoized("sun", observer_lat, observer_lon, dt, _compute_sun_info)
+    return result
+
+
+def _compute_sun_info(observer_lat: float, observer_lon: float, dt: datetime) -> SunInfo | None:
+    """Calculate sun information (uncached)."""
     try:
         ts, earth, sun, _moon = _get_skyfield_objects()
         if ts is None or earth is None or sun is None:
@@ -360,54 +352,18 @@ def get_sun_info(
 
         is_daytime = sun_alt > 0
 
-        # Calculate sunset/sunrise
-        # Simple approach: sample at hourly intervals to find horizon crossing
-        sunset_time = None
-        sunrise_time = None
-
+        # Next sunset/sunrise from the shared event table
+        sunset_time, sunrise_time = None, None
         try:
-            # Sample next 48 hours at 1-hour intervals
-            for hours_ahead in range(1, 49):
-                check_dt = dt + timedelta(hours=hours_ahead)
-                t_check = ts.from_datetime(check_dt)
-                astrometric_check = observer.at(t_check).observe(sun)
-                alt_check, _az_check, _ = astrometric_check.apparent().altaz()
-                sun_alt_check = alt_check.degrees
-
-                # Check previous hour for comparison
-                prev_dt = check_dt - timedelta(hours=1)
-                t_prev = ts.from_datetime(prev_dt)
-                astrometric_prev = observer.at(t_prev).observe(sun)
-                alt_prev, _az_prev, _ = astrometric_prev.apparent().altaz()
-                sun_alt_prev = alt_prev.degrees
-
-                # Sunset: was above, now below (don't require is_daytime - find next sunset regardless)
-                if sun_alt_prev > 0 and sun_alt_check <= 0 and sunset_time is None:
-                    # Approximate sunset as midpoint between samples
-                    sunset_time = prev_dt + timedelta(minutes=30)
-                    # Ensure UTC timezone
-                    if sunset_time.tzinfo is None:
-                        sunset_time = sunset_time.replace(tzinfo=UTC)
-                    if sunrise_time is not None:
-                        break
-
-                # Sunrise: was below, now above (don't require not is_daytime - find next sunrise regardless)
-                if sun_alt_prev <= 0 and sun_alt_check > 0 and sunrise_time is None:
-                    # Approximate sunrise as midpoint between samples
-                    sunrise_time = prev_dt + timedelta(minutes=30)
-                    # Ensure UTC timezone
-                    if sunrise_time.tzinfo is None:
-                        sunrise_time = sunrise_time.replace(tzinfo=UTC)
-                    if sunset_time is not None:
-                        break
+            events = get_ephemeris_events(observer_lat, observer_lon, dt, (ts, earth, sun, _moon))
+            sunset_time = events.sun.next(0.0, dt, rising=False)
+            sunrise_time = events.sun.next(0.0, dt, rising=True)
         except (ValueError, TypeError, AttributeError, ZeroDivisionError) as e:
             # ValueError: invalid datetime or coordinates
             # TypeError: wrong argument types
             # AttributeError: missing attributes on Skyfield objects
             # ZeroDivisionError: division by zero in calculations
             logger.debug(f"Error calculating sunrise/sunset: {e}")
-            # If calculation fails, leave as None
-            pass
 
         return SunInfo(
             altitude_deg=sun_alt,
@@ -454,73 +410,11 @@ def calculate_golden_hour(
         dt = dt.replace(tzinfo=UTC)
 
     try:
-        ts, earth, sun, _moon = _get_skyfield_objects()
-        if ts is None or earth is None or sun is None:
+        bodies = _get_skyfield_objects()
+        if bodies[0] is None or bodies[1] is None or bodies[2] is None:
             return (None, None, None, None)
 
-        observer = earth + Topos(latitude_degrees=observer_lat, longitude_degrees=observer_lon)
-
-        evening_start = None
-        evening_end = None
-        morning_start = None
-        morning_end = None
-
-        # Get current sun altitude to determine if we're looking for evening or morning
-        t = ts.from_datetime(dt)
-        astrometric = observer.at(t).observe(sun)
-        alt, _az, _ = astrometric.apparent().altaz()
-        current_alt = alt.degrees
-
-        # Sample next 48 hours at 10-minute intervals for better precision
-        prev_alt = current_alt
-        in_evening_gh = False
-        in_morning_gh = False
-
-        for minutes_ahead in range(0, 48 * 60, 10):
-            check_dt = dt + timedelta(minutes=minutes_ahead)
-            # Ensure UTC timezone
-            if check_dt.tzinfo is None:
-                check_dt = check_dt.replace(tzinfo=UTC)
-            t_check = ts.from_datetime(check_dt)
-            astrometric_check = observer.at(t_check).observe(sun)
-            alt_check, _az_check, _ = astrometric_check.apparent().altaz()
-            sun_alt_check = alt_check.degrees
-
-            # Evening golden hour: sun descending from 6° to 0°
-            if sun_alt_check <= 6 and sun_alt_check >= 0:
-                if not in_evening_gh:
-                    # Entering evening golden hour
-                    if prev_alt > 6:
-                        evening_start = check_dt
-                        if evening_start.tzinfo is None:
-                            evening_start = evening_start.replace(tzinfo=UTC)
-                    in_evening_gh = True
-                evening_end = check_dt
-                if evening_end.tzinfo is None:
-                    evening_end = evening_end.replace(tzinfo=UTC)
-            elif in_evening_gh and sun_alt_check < 0:
-                # Exited evening golden hour
-                break
-
-            # Morning golden hour: sun ascending from 0° to 6°
-            if sun_alt_check >= 0 and sun_alt_check <= 6:
-                if not in_morning_gh:
-                    # Entering morning golden hour
-                    if prev_alt < 0:
-                        morning_start = check_dt
-                        if morning_start.tzinfo is None:
-                            morning_start = morning_start.replace(tzinfo=UTC)
-                    in_morning_gh = True
-                morning_end = check_dt
-                if morning_end.tzinfo is None:
-                    morning_end = morning_end.replace(tzinfo=UTC)
-            elif in_morning_gh and sun_alt_check > 6:
-                # Exited morning golden hour
-                break
-
-            prev_alt = sun_alt_check
-
-        return (evening_start, evening_end, morning_start, morning_end)
+        return get_ephemeris_events(observer_lat, observer_lon, dt, bodies).sun_band(0.0, 6.0, dt)
     except (ValueError, TypeError, AttributeError, ZeroDivisionError) as e:
         # ValueError: invalid datetime or coordinates
         # TypeError: wrong argument types
@@ -556,73 +450,11 @@ def calculate_blue_hour(
         dt = dt.replace(tzinfo=UTC)
 
     try:
-        ts, earth, sun, _moon = _get_skyfield_objects()
-        if ts is None or earth is None or sun is None:
+        bodies = _get_skyfield_objects()
+        if bodies[0] is None or bodies[1] is None or bodies[2] is None:
             return (None, None, None, None)
 
-        observer = earth + Topos(latitude_degrees=observer_lat, longitude_degrees=observer_lon)
-
-        evening_start = None
-        evening_end = None
-        morning_start = None
-        morning_end = None
-
-        # Get current sun altitude to determine if we're looking for evening or morning
-        t = ts.from_datetime(dt)
-        astrometric = observer.at(t).observe(sun)
-        alt, _az, _ = astrometric.apparent().altaz()
-        current_alt = alt.degrees
-
-        # Sample next 48 hours at 10-minute intervals for better precision
-        prev_alt = current_alt
-        in_evening_bh = False
-        in_morning_bh = False
-
-        for minutes_ahead in range(0, 48 * 60, 10):
-            check_dt = dt + timedelta(minutes=minutes_ahead)
-            # Ensure UTC timezone
-            if check_dt.tzinfo is None:
-                check_dt = check_dt.replace(tzinfo=UTC)
-            t_check = ts.from_datetime(check_dt)
-            astrometric_check = observer.at(t_check).observe(sun)
-            alt_check, _az_check, _ = astrometric_check.apparent().altaz()
-            sun_alt_check = alt_check.degrees
-
-            # Evening blue hour: sun descending from -4° to -6°
-            if sun_alt_check <= -4 and sun_alt_check >= -6:
-                if not in_evening_bh:
-                    # Entering evening blue hour
-                    if prev_alt > -4:
-                        evening_start = check_dt
-                        if evening_start.tzinfo is None:
-                            evening_start = evening_start.replace(tzinfo=UTC)
-                    in_evening_bh = True
-                evening_end = check_dt
-                if evening_end.tzinfo is None:
-                    evening_end = evening_end.replace(tzinfo=UTC)
-            elif in_evening_bh and sun_alt_check < -6:
-                # Exited evening blue hour
-                break
-
-            # Morning blue hour: sun ascending from -6° to -4°
-            if sun_alt_check >= -6 and sun_alt_check <= -4:
-                if not in_morning_bh:
-                    # Entering morning blue hour
-                    if prev_alt < -6:
-                        morning_start = check_dt
-                        if morning_start.tzinfo is None:
-                            morning_start = morning_start.replace(tzinfo=UTC)
-                    in_morning_bh = True
-                morning_end = check_dt
-                if morning_end.tzinfo is None:
-                    morning_end = morning_end.replace(tzinfo=UTC)
-            elif in_morning_bh and sun_alt_check > -4:
-                # Exited morning blue hour
-                break
-
-            prev_alt = sun_alt_check
-
-        return (evening_start, evening_end, morning_start, morning_end)
+        return get_ephemeris_events(observer_lat, observer_lon, dt, bodies).sun_band(-6.0, -4.0, dt)
     except (ValueError, TypeError, AttributeError, ZeroDivisionError) as e:
         # ValueError: invalid datetime or coordinates
         # TypeError: wrong argument types
@@ -660,73 +492,11 @@ def calculate_astronomical_twilight(
         dt = dt.replace(tzinfo=UTC)
 
     try:
-        ts, earth, sun, _moon = _get_skyfield_objects()
-        if ts is None or earth is None or sun is None:
+        bodies = _get_skyfield_objects()
+        if bodies[0] is None or bodies[1] is None or bodies[2] is None:
             return (None, None, None, None)
 
-        observer = earth + Topos(latitude_degrees=observer_lat, longitude_degrees=observer_lon)
-
-        evening_start = None
-        evening_end = None
-        morning_start = None
-        morning_end = None
-
-        # Get current sun altitude to determine if we're looking for evening or morning
-        t = ts.from_datetime(dt)
-        astrometric = observer.at(t).observe(sun)
-        alt, _az, _ = astrometric.apparent().altaz()
-        current_alt = alt.degrees
-
-        # Sample next 48 hours at 10-minute intervals for better precision
-        prev_alt = current_alt
-        in_evening_at = False
-        in_morning_at = False
-
-        for minutes_ahead in range(0, 48 * 60, 10):
-            check_dt = dt + timedelta(minutes=minutes_ahead)
-            # Ensure UTC timezone
-            if check_dt.tzinfo is None:
-                check_dt = check_dt.replace(tzinfo=UTC)
-            t_check = ts.from_datetime(check_dt)
-            astrometric_check = observer.at(t_check).observe(sun)
-            alt_check, _az_check, _ = astrometric_check.apparent().altaz()
-            sun_alt_check = alt_check.degrees
-
-            # Evening astronomical twilight: sun descending from -12° to -18°
-            if sun_alt_check <= -12 and sun_alt_check >= -18:
-                if not in_evening_at:
-                    # Entering evening astronomical twilight
-                    if prev_alt > -12:
-                        evening_start = check_dt
-                        if evening_start.tzinfo is None:
-                            evening_start = evening_start.replace(tzinfo=UTC)
-                    in_evening_at = True
-                evening_end = check_dt
-                if evening_end.tzinfo is None:
-                    evening_end = evening_end.replace(tzinfo=UTC)
-            elif in_evening_at and sun_alt_check < -18:
-                # Exited evening astronomical twilight (entered true night)
-                break
-
-            # Morning astronomical twilight: sun ascending from -18° to -12°
-            if sun_alt_check >= -18 and sun_alt_check <= -12:
-                if not in_morning_at:
-                    # Entering morning astronomical twilight
-                    if prev_alt < -18:
-                        morning_start = check_dt
-                        if morning_start.tzinfo is None:
-                            morning_start = morning_start.replace(tzinfo=UTC)
-                    in_morning_at = True
-                morning_end = check_dt
-                if morning_end.tzinfo is None:
-                    morning_end = morning_end.replace(tzinfo=UTC)
-            elif in_morning_at and sun_alt_check > -12:
-                # Exited morning astronomical twilight
-                break
-
-            prev_alt = sun_alt_check
-
-        return (evening_start, evening_end, morning_start, morning_end)
+        return get_ephemeris_events(observer_lat, observer_lon, dt, bodies).sun_band(-18.0, -12.0, dt)
     except (ValueError, TypeError, AttributeError, ZeroDivisionError) as e:
         # ValueError: invalid datetime or coordinates
         # TypeError: wrong argument types
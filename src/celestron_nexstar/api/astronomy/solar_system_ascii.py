@@ -12,7 +12,7 @@ from datetime import UTC, datetime
 from typing import NamedTuple
 
 from celestron_nexstar.api.ephemeris.ephemeris import PLANET_NAMES
-from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+from celestron_nexstar.api.ephemeris.registry import get_ephemeris_registry
 
 
 class PlanetPosition(NamedTuple):
@@ -68,13 +68,12 @@ def get_heliocentric_positions(dt: datetime | None = None) -> list[PlanetPositio
         dt = dt.replace(tzinfo=UTC)
 
     try:
-        loader = get_skyfield_loader()
-        ts = loader.timescale()
-        eph = loader("de440s.bsp")
+        registry = get_ephemeris_registry()
+        ts = registry.timescale()
+        eph = registry.kernel("de440s.bsp")
         t = ts.from_datetime(dt)
 
-        sun = eph["sun"]
-        earth = eph["earth"]
+        sun, earth = registry.bodies("de440s.bsp", "sun", "earth")
         positions: list[PlanetPosition] = []
 
         # Get all planets
@@ -19,6 +19,7 @@ __all__ = [
     "HorizontalCoordinates",
     "TelescopeConfig",
     "TelescopeInfo",
+    "TelescopeState",
     "TelescopeTime",
     "TrackingMode",
 ]
@@ -165,6 +166,28 @@ class TelescopeTime:
         return f"{self.year}-{self.month:02d}-{self.day:02d} {self.hour:02d}:{self.minute:02d}:{self.second:02d}"
 
 
+@dataclass
+class TelescopeState:
+    """
+    Snapshot of the telescope's pointing and motion state.
+
+    Attributes:
+        equatorial: Current RA/Dec position
+        horizontal: Current Alt/Az position
+        is_slewing: True if a goto is in progress
+        tracking_mode: Current tracking mode
+    """
+
+    equatorial: EquatorialCoordinates
+    horizontal: HorizontalCoordinates
+    is_slewing: bool
+    tracking_mode: TrackingMode
+
+    def __str__(self) -> str:
+        status = "slewing" if self.is_slewing else "stationary"
+        return f"{self.equatorial}; {self.horizontal}; {status}, tracking {self.tracking_mode.name}"
+
+
 @dataclass
 class TelescopeConfig:
     """
@@ -2,8 +2,10 @@
 Utility functions for Celestron NexStar telescope coordinate conversions
 and astronomical calculations.
 
-This module uses Astropy extensively for all astronomical calculations,
-providing a clean interface while leveraging a well-tested astronomy library.
+Angle parsing and formatting use Astropy. The coordinate transforms, sidereal
+time, Julian date and separation functions are thin scalar wrappers around the
+vectorized kernel in api.core.transforms; use that module directly to convert
+many objects or times in one call.
 """
 
 from __future__ import annotations
@@ -11,8 +13,15 @@ from __future__ import annotations
 from datetime import datetime
 
 from astropy import units as u
-from astropy.coordinates import ICRS, AltAz, Angle, EarthLocation, SkyCoord
-from astropy.time import Time
+from astropy.coordinates import Angle
+
+from celestron_nexstar.api.core.transforms import (
+    alt_az_to_ra_dec_array,
+    angular_separation_array,
+    julian_date_array,
+    local_sidereal_time_array,
+    ra_dec_to_alt_az_array,
+)
 
 
 __all__ = [
@@ -134,20 +143,8 @@ def alt_az_to_ra_dec(
     Returns:
         Tuple of (RA in hours, Dec in degrees)
     """
-    # Create observer location
-    location = EarthLocation(lat=latitude * u.deg, lon=longitude * u.deg)
-
-    # Create time object
-    time = Time(utc_time, scale="utc")
-
-    # Create AltAz coordinate
-    altaz = AltAz(az=azimuth * u.deg, alt=altitude * u.deg, location=location, obstime=time)
-
-    # Convert to ICRS (RA/Dec)
-    icrs = altaz.transform_to(ICRS())
-
-    # Return RA in hours and Dec in degrees
-    return icrs.ra.hour, icrs.dec.degree
+    ra, dec = alt_az_to_ra_dec_array(azimuth, altitude, latitude, longitude, utc_time)
+    return float(ra), float(dec)
 
 
 def ra_dec_to_alt_az(
@@ -166,20 +163,8 @@ def ra_dec_to_alt_az(
     Returns:
         Tuple of (Azimuth in degrees, Altitude in degrees)
     """
-    # Create observer location
-    location = EarthLocation(lat=latitude * u.deg, lon=longitude * u.deg)
-
-    # Create time object
-    time = Time(utc_time, scale="utc")
-
-    # Create ICRS coordinate (RA/Dec)
-    icrs = SkyCoord(ra=ra_hours * u.hourangle, dec=dec_degrees * u.deg, frame="icrs")
-
-    # Convert to AltAz
-    altaz = icrs.transform_to(AltAz(location=location, obstime=time))
-
-    # Return azimuth and altitude in degrees
-    return altaz.az.degree, altaz.alt.degree
+    azimuth, altitude = ra_dec_to_alt_az_array(ra_hours, dec_degrees, latitude, longitude, utc_time)
+    return float(azimuth), float(altitude)
 
 
 def calculate_lst(longitude: float, utc_time: datetime) -> float:
@@ -193,14 +178,7 @@ def calculate_lst(longitude: float, utc_time: datetime) -> float:
     Returns:
         LST in hours (0-24)
     """
-    # Create time object
-    time = Time(utc_time, scale="utc")
-
-    # Calculate LST using Astropy's sidereal time
-    # longitude parameter expects Angle, so convert degrees to Angle
-    lst = time.sidereal_time("mean", longitude=longitude * u.deg)
-
-    return float(lst.hour)
+    return float(local_sidereal_time_array(longitude, utc_time))
 
 
 def calculate_julian_date(dt: datetime) -> float:
@@ -213,8 +191,7 @@ def calculate_julian_date(dt: datetime) -> float:
     Returns:
         Julian Date
     """
-    time = Time(dt, scale="utc")
-    return float(time.jd)
+    return float(julian_date_array(dt))
 
 
 def angular_separation(ra1: float, dec1: float, ra2: float, dec2: float) -> float:
@@ -230,14 +207,7 @@ def angular_separation(ra1: float, dec1: float, ra2: float, dec2: float) -> floa
     Returns:
         Angular separation in degrees
     """
-    # Create SkyCoord objects for both positions
-    coord1 = SkyCoord(ra=ra1 * u.hourangle, dec=dec1 * u.deg, frame="icrs")
-    coord2 = SkyCoord(ra=ra2 * u.hourangle, dec=dec2 * u.deg, frame="icrs")
-
-    # Calculate separation using Astropy's built-in method
-    separation = coord1.separation(coord2)
-
-    return float(separation.degree)
+    return float(angular_separation_array(ra1, dec1, ra2, dec2))
 
 
 def format_ra(hours: float, precision: int = 2) -> str:
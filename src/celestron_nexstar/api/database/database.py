@@ -10,19 +10,19 @@ Uses SQLAlchemy ORM for type-safe database operations.
 from __future__ import annotations
 
 import logging
+import re
 import shutil
 import time
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import deal
 from rich.console import Console
 from sqlalchemy import text
-from sqlalchemy.engine import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session
@@ -36,6 +36,7 @@ from celestron_nexstar.api.core.exceptions import (
     DatabaseRestoreError,
 )
 from celestron_nexstar.api.database.models import CelestialObjectModel, EphemerisFileModel, MetadataModel
+from celestron_nexstar.api.database.name_index import NameIndex
 from celestron_nexstar.api.ephemeris.ephemeris import get_planetary_position, is_dynamic_object
 
 
@@ -45,6 +46,7 @@ console = Console()
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "SEARCH_MODES",
     "CatalogDatabase",
     "DatabaseStats",
     "backup_database",
@@ -135,6 +137,50 @@ CREATE TABLE IF NOT EXISTS metadata (
 );
 """
 
+# Search modes accepted by CatalogDatabase.search
+SEARCH_MODES = ("ranked", "prefix", "fuzzy")
+
+# bm25 column weights: a hit in the name outranks one in the common name,
+# which outranks one in the description
+_FTS_RANK = "bm25(objects_fts, 10.0, 5.0, 1.0)"
+_TRIGRAM_RANK = "bm25(objects_trigram, 2.0, 1.0)"
+
+# Rank the hits inside the FTS index, then hydrate only the requested page
+# with one join instead of one lookup per hit
+_SEARCH_SQL = """
+    SELECT objects.* FROM (
+        SELECT rowid AS hit_id, {rank} AS score
+        FROM {table}
+        WHERE {table} MATCH :query
+        ORDER BY score, rowid
+        LIMIT :limit OFFSET :offset
+    ) AS hits
+    JOIN objects ON objects.id = hits.hit_id
+    ORDER BY hits.score, objects.id
+"""
+
+
+def _search_terms(query: str) -> list[str]:
+    """Split a query into words, dropping FTS5 operators and punctuation."""
+    return re.findall(r"\w+", query)
+
+
+def _fts_match_expression(query: str, mode: str) -> str:
+    """
+    Build an FTS5 MATCH expression for a search mode.
+
+    Words are quoted so user input can never be parsed as FTS5 syntax.
+    Ranked mode requires every word, prefix mode treats every word as a
+    prefix ("andro gal" finds "Andromeda Galaxy"), and fuzzy mode matches
+    any trigram of any word so that misspellings still score well.
+    """
+    terms = _search_terms(query)
+    if mode == "fuzzy":
+        trigrams = dict.fromkeys(term[i : i + 3] for term in (t.lower() for t in terms) for i in range(len(term) - 2))
+        return " OR ".join(f'"{trigram}"' for trigram in trigrams)
+    suffix = "*" if mode == "prefix" else ""
+    return " ".join(f'"{term}"{suffix}' for term in terms)
+
 
 @dataclass(frozen=True)
 class DatabaseStats:
@@ -185,6 +231,12 @@ class CatalogDatabase:
             class_=AsyncSession,
             expire_on_commit=False,
         )
+        # Search index tables known to exist (True) or to be unavailable
+        # (False) in this engine's database, so the sqlite_master checks run
+        # once rather than on every search or insert
+        self._fts_state: dict[str, bool] = {}
+        # Autocompletion index, built on first use (see get_name_index)
+        self._name_index: NameIndex | None = None
         self._configure_optimizations()
 
     def _get_default_db_path(self) -> Path:
@@ -250,6 +302,8 @@ class CatalogDatabase:
     @deal.post(lambda result: result is None, message="Close must complete")
     async def close(self) -> None:
         """Close database connection."""
+        self._fts_state.clear()
+        self._name_index = None
         await self._engine.dispose()
 
     def __enter__(self) -> CatalogDatabase:
@@ -336,8 +390,12 @@ class CatalogDatabase:
         Ensure the FTS5 table exists. Creates it if missing.
 
         This is useful when the database was created without migrations
-        or if the FTS table was accidentally dropped.
+        or if the FTS table was accidentally dropped. The check is memoised,
+        so only the first call per engine touches the database.
         """
+        if self._fts_state.get("objects_fts"):
+            return
+
         async with self._AsyncSession() as session:
             # Check if FTS table exists
             result = await session.execute(
@@ -404,6 +462,36 @@ class CatalogDatabase:
                 await session.commit()
                 logger.info("FTS table created and populated")
 
+        self._fts_state["objects_fts"] = True
+
+    @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
+    async def has_trigram_table(self) -> bool:
+        """
+        Check whether the trigram FTS5 index used by fuzzy search exists.
+
+        The index covers name and common_name and is kept in sync by
+        triggers. It is created by the Alembic migrations, which skip it on
+        SQLite older than 3.34 (no trigram tokenizer). Only a positive
+        answer is memoised per engine, so the index is picked up as soon as
+        migrations have run.
+
+        Returns:
+            True if the index is available
+        """
+        if self._fts_state.get("objects_trigram"):
+            return True
+
+        async with self._AsyncSession() as session:
+            result = await session.execute(
+                text("SELECT name FROM sqlite_master WHERE type='table' AND name='objects_trigram'")
+            )
+            if result.fetchone() is None:
+                logger.debug("objects_trigram table missing (migrations not run), fuzzy search unavailable")
+                return False
+
+        self._fts_state["objects_trigram"] = True
+        return True
+
     @deal.post(lambda result: result is None, message="FTS repopulation must complete")
     async def repopulate_fts_table(self) -> None:
         """
@@ -459,6 +547,9 @@ class CatalogDatabase:
             if fts_count != objects_count:
                 logger.warning(f"FTS table count mismatch: {fts_count} vs {objects_count} objects")
 
+        # Repopulation follows bulk imports, which may have bypassed insert_object
+        self.invalidate_name_index()
+
     @deal.pre(
         lambda self, name, *args, **kwargs: name and len(name.strip()) > 0,
         message="Name must be non-empty",
@@ -543,6 +634,7 @@ class CatalogDatabase:
             session.add(model)
             await session.commit()
             await session.refresh(model)
+            self.invalidate_name_index()
             return model.id
 
     async def insert_objects_batch(
@@ -592,6 +684,7 @@ class CatalogDatabase:
 
             session.add_all(models)
             await session.commit()
+            self.invalidate_name_index()
             return len(models)
 
     async def get_existing_objects_set(
@@ -713,16 +806,41 @@ class CatalogDatabase:
                 return mapping.common_name.strip()
             return None
 
-    @deal.pre(lambda self, query, limit: query and len(query.strip()) > 0, message="Query must be non-empty")  # type: ignore[misc,arg-type]
-    @deal.pre(lambda self, query, limit: limit > 0, message="Limit must be positive")  # type: ignore[misc,arg-type]
+    @deal.pre(
+        lambda self, query, limit=100, offset=0, mode="ranked": query and len(query.strip()) > 0,
+        message="Query must be non-empty",
+    )  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, query, limit=100, offset=0, mode="ranked": limit > 0, message="Limit must be positive")  # type: ignore[misc,arg-type]
+    @deal.pre(
+        lambda self, query, limit=100, offset=0, mode="ranked": offset >= 0, message="Offset must be non-negative"
+    )  # type: ignore[misc,arg-type]
+    @deal.pre(
+        lambda self, query, limit=100, offset=0, mode="ranked": mode in SEARCH_MODES,
+        message=f"Mode must be one of {', '.join(SEARCH_MODES)}",
+    )  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, list), message="Must return list of objects")
-    async def search(self, query: str, limit: int = 100) -> list[CelestialObject]:
+    async def search(
+        self, query: str, limit: int = 100, offset: int = 0, mode: str = "ranked"
+    ) -> list[CelestialObject]:
         """
-        Fuzzy search using FTS5.
+        Full-text search using FTS5, best matches first.
+
+        Hits are ranked by bm25 (name matches above common name matches above
+        description matches) and the requested page is hydrated with a single
+        joined query.
+
+        Modes:
+            ranked: Every word must match a whole word
+            prefix: Every word may be the start of a word (for search-as-you-type)
+            fuzzy: Names sharing trigrams with the query, tolerating typos
+                   such as "andromda" (falls back to prefix mode for words
+                   shorter than three letters or a database without the trigram index)
 
         Args:
-            query: Search query
-            limit: Maximum results
+            query: Search query (FTS5 operators are treated as plain text)
+            limit: Maximum results (page size)
+            offset: Number of results to skip (page * limit for paging)
+            mode: One of "ranked", "prefix" or "fuzzy"
 
         Returns:
             List of matching objects
@@ -732,41 +850,26 @@ class CatalogDatabase:
         if not query:
             return []
 
-        # Ensure FTS table exists
-        await self.ensure_fts_table()
+        table, rank = "objects_fts", _FTS_RANK
+        if mode == "fuzzy":
+            if _fts_match_expression(query, mode) and await self.has_trigram_table():
+                table, rank = "objects_trigram", _TRIGRAM_RANK
+            else:
+                mode = "prefix"
+        if table == "objects_fts":
+            await self.ensure_fts_table()
 
-        async with self._AsyncSession() as session:
-            # FTS5 search requires raw SQL
-            # FTS5 query syntax: simple word queries work directly
-            # For multi-word queries, FTS5 uses AND by default
-            # Escape special characters that FTS5 treats as operators
-            fts_query = query.strip()
-
-            # FTS5 special characters: " AND OR NOT ( ) [ ] { } * : ^
-            # If query contains these, we need to escape or quote them
-            # For simple word searches, just use the word directly
-            try:
-                result = await session.execute(
-                    text("""
-                        SELECT objects.id FROM objects
-                        JOIN objects_fts ON objects.id = objects_fts.rowid
-                        WHERE objects_fts MATCH :query
-                        ORDER BY rank
-                        LIMIT :limit
-                    """),
-                    {"query": fts_query, "limit": limit},
-                )
+        fts_query = _fts_match_expression(query, mode)
+        if not fts_query:
+            return []
 
-                # Get IDs and fetch models
-                rows = result.fetchall()
-                object_ids = [row[0] for row in rows]
-                objects = []
-                for obj_id in object_ids:
-                    model = await session.get(CelestialObjectModel, obj_id)
-                    if model:
-                        objects.append(self._model_to_object(model))
+        async with self._AsyncSession() as session:
+            from sqlalchemy import select
 
-                return objects
+            try:
+                stmt = select(CelestialObjectModel).from_statement(text(_SEARCH_SQL.format(table=table, rank=rank)))
+                result = await session.execute(stmt, {"query": fts_query, "limit": limit, "offset": offset})
+                return [self._model_to_object(model) for model in result.scalars().all()]
             except (SQLAlchemyError, RuntimeError, AttributeError, ValueError, TypeError, KeyError, IndexError) as e:
                 # SQLAlchemyError: database errors, FTS table issues
                 # RuntimeError: async/await errors
@@ -928,14 +1031,95 @@ class CatalogDatabase:
             catalogs = result.scalars().all()
             return list(catalogs)
 
-    @deal.pre(lambda self, prefix, limit: limit > 0, message="Limit must be positive")  # type: ignore[misc,arg-type]
+    @property
+    def name_index_path(self) -> Path:
+        """Path of the autocompletion index cache file (next to the database)."""
+        return self.db_path.with_suffix(".names.json")
+
+    async def _name_index_fingerprint(self, session: AsyncSession) -> list[Any]:
+        """
+        Describe the names in the database cheaply enough to check at startup.
+
+        Any import, deletion or rename changes at least one of the object
+        count, the highest object ID, the latest update time or the number of
+        star name mappings.
+        """
+        result = await session.execute(text("SELECT COUNT(*), MAX(id), MAX(updated_at) FROM objects"))
+        fingerprint: list[Any] = [str(value) if value is not None else None for value in result.one()]
+        try:
+            mappings = await session.scalar(text("SELECT COUNT(*) FROM star_name_mappings"))
+        except SQLAlchemyError:
+            # Databases created before star name mappings existed
+            mappings = None
+        fingerprint.append(mappings)
+        return fingerprint
+
+    @deal.post(lambda result: isinstance(result, NameIndex), message="Must return NameIndex")
+    async def get_name_index(self) -> NameIndex:
+        """
+        Get the autocompletion index, loading or building it on first use.
+
+        The index holds every object name and common name plus the star name
+        mappings. It is loaded from the cache file when that was built from
+        the same data, otherwise rebuilt from the database and saved.
+
+        Returns:
+            NameIndex for this database
+        """
+        if self._name_index is not None:
+            return self._name_index
+
+        async with self._AsyncSession() as session:
+            fingerprint = await self._name_index_fingerprint(session)
+            index = NameIndex.load(self.name_index_path, fingerprint)
+            if index is None:
+                from sqlalchemy import select
+
+                names: list[str | None] = []
+                result = await session.execute(select(CelestialObjectModel.name, CelestialObjectModel.common_name))
+                for name, common_name in result:
+                    names.append(name)
+                    names.append(common_name)
+                if fingerprint[-1] is not None:
+                    from celestron_nexstar.api.database.models import StarNameMappingModel
+
+                    result = await session.execute(select(StarNameMappingModel.common_name))
+                    names.extend(result.scalars())
+
+                index = NameIndex(names, fingerprint)
+                try:
+                    index.save(self.name_index_path)
+                except OSError as e:
+                    # Read-only location: keep the in-memory index only
+                    logger.debug(f"Could not write name index cache {self.name_index_path}: {e}")
+                logger.debug(f"Built name index with {len(index)} names")
+
+        self._name_index = index
+        return index
+
+    @deal.post(lambda result: result is None, message="Invalidation must complete")
+    def invalidate_name_index(self) -> None:
+        """
+        Drop the autocompletion index and its cache file.
+
+        Called automatically after inserts through this class; call it after
+        changing object names by other means in this process.
+        """
+        self._name_index = None
+        try:
+            self.name_index_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not remove name index cache {self.name_index_path}: {e}")
+
+    @deal.pre(lambda self, prefix="", limit=50: limit > 0, message="Limit must be positive")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, list), message="Must return list of strings")
     async def get_names_for_completion(self, prefix: str = "", limit: int = 50) -> list[str]:
         """
         Get object names for command-line autocompletion.
 
         Filters names that start with the given prefix (case-insensitive).
-        Searches both the `name` and `common_name` fields.
+        Searches the `name` and `common_name` fields and the star name
+        mappings through the in-memory name index (see get_name_index).
 
         Args:
             prefix: Prefix to match (empty string returns all)
@@ -944,50 +1128,8 @@ class CatalogDatabase:
         Returns:
             List of unique names matching the prefix (case-insensitive)
         """
-        from sqlalchemy import func, select
-
-        async with self._AsyncSession() as session:
-            # Build case-insensitive filter using LIKE for better compatibility
-            prefix_lower = str(prefix).lower()
-
-            # Query both name and common_name fields, returning the actual values
-            # Use a UNION-like approach with separate queries, then combine
-            names_set = set()
-
-            # Query name field
-            name_query = (
-                select(CelestialObjectModel.name)
-                .distinct()
-                .filter(func.lower(CelestialObjectModel.name).like(f"{prefix_lower}%"))
-                .order_by(func.lower(CelestialObjectModel.name))
-                .limit(limit)
-            )
-            name_result = await session.execute(name_query)
-            name_results = name_result.fetchall()
-            for row in name_results:
-                if row[0]:
-                    names_set.add(row[0])
-
-            # Query common_name field
-            common_name_query = (
-                select(CelestialObjectModel.common_name)
-                .distinct()
-                .filter(
-                    CelestialObjectModel.common_name.isnot(None),
-                    func.lower(CelestialObjectModel.common_name).like(f"{prefix_lower}%"),
-                )
-                .order_by(func.lower(CelestialObjectModel.common_name))
-                .limit(limit)
-            )
-            # Fix type incompatibility: Row[tuple[str | None]], be explicit with Optional[str]
-            common_name_result = await session.execute(common_name_query)
-            common_name_results: Sequence[Row[tuple[str | None]]] = common_name_result.fetchall()
-            for common_name_row in common_name_results:
-                # Use cast to help mypy understand the type (common_name can be None)
-                val = cast(str | None, common_name_row[0])
-                if val is not None:
-                    names_set.add(val)
-            return sorted(names_set, key=str.lower)[:limit]
+        index = await self.get_name_index()
+        return index.complete(prefix, limit)
 
     @deal.pre(lambda self, limit: limit > 0, message="Limit must be positive")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, list), message="Must return list of strings")
@@ -1289,7 +1431,7 @@ def restore_database(backup_path: Path, db: CatalogDatabase | None = None) -> No
     import asyncio
 
     async def _dispose_engine() -> None:
-        await db._engine.dispose()
+        await db.close()
 
     asyncio.run(_dispose_engine())
 
@@ -1364,8 +1506,8 @@ async def rebuild_database(
 
         # Step 2: Drop existing database
         if db.db_path.exists():
-            # Close all connections
-            await db._engine.dispose()
+            # Close all connections (and forget which search indexes exist)
+            await db.close()
             # Remove database file
             db.db_path.unlink()
             logger.info("Database dropped")
@@ -342,10 +342,16 @@ async def seed_dark_sky_sites(db_session: AsyncSession, force: bool = False) ->
     data = [item for item in data if not (isinstance(item, dict) and any(key.startswith("_") for key in item))]
 
     # Import geohash utilities
-    from celestron_nexstar.api.location.geohash_utils import encode
+    from celestron_nexstar.api.location.geohash_utils import encode_array, encode_int_array
+
+    # Geohashes for all sites at once (precision 9 for ~5m accuracy)
+    lats = [item["latitude"] for item in data]
+    lons = [item["longitude"] for item in data]
+    geohashes = encode_array(lats, lons, precision=9).astype(str).tolist() if data else []
+    geohash_ints = encode_int_array(lats, lons).tolist() if data else []
 
     added = 0
-    for item in data:
+    for item, geohash, geohash_int in zip(data, geohashes, geohash_ints, strict=True):
         name = item["name"]
 
         # Check if already exists (idempotent)
@@ -353,9 +359,10 @@ async def seed_dark_sky_sites(db_session: AsyncSession, force: bool = False) ->
         if existing:
             continue
 
-        # Calculate geohash if missing (precision 9 for ~5m accuracy)
+        # Calculate geohash if missing
         if not item.get("geohash"):
-            item["geohash"] = encode(item["latitude"], item["longitude"], precision=9)
+            item["geohash"] = geohash
+        item["geohash_int"] = geohash_int
 
         # Create new dark sky site
         site = DarkSkySiteModel(**item)
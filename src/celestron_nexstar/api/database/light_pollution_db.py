@@ -11,25 +11,26 @@ without requiring external spatial database extensions.
 
 from __future__ import annotations
 
+import io
 import logging
+import struct
+import sys
+import time
+import zlib
+from collections.abc import Iterator
+from itertools import repeat
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from threading import Lock
+from typing import TYPE_CHECKING, Any, BinaryIO
 from urllib import request
 
-
-try:
-    import geopandas as gpd
-    from shapely.geometry import Point, box
-except ImportError:
-    # GeoPandas is in dependencies but handle gracefully if missing
-    gpd = None  # type: ignore[assignment, misc]
-    Point = None  # type: ignore[assignment, misc]
-    box = None  # type: ignore[assignment, misc]
-
+import numpy as np
+import numpy.typing as npt
 from rich.console import Console
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeRemainingColumn
 
-from celestron_nexstar.api.location.geohash_utils import encode, get_neighbors_for_search
+from celestron_nexstar.api.database.sqm_index import DEFAULT_SEARCH_RADIUS_KM, SQMIndex
+from celestron_nexstar.api.location.geohash_utils import encode_array, encode_int_array
 
 
 console = Console()
@@ -39,6 +40,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Loaded SQM indexes by database path, with the time their fingerprint was last checked
+_sqm_indexes: dict[Path, tuple[SQMIndex, float]] = {}
+_sqm_indexes_lock = Lock()
+
+# A loaded index is checked against the table at most this often, since the
+# fingerprint query reads every row
+_SQM_INDEX_RECHECK_SECONDS = 5.0
+
+# Row count, highest ID and sums of the SQM values; the weighted sum changes
+# when values are rewritten in place or moved between rows
+_SQM_FINGERPRINT_SQL = "SELECT COUNT(*), MAX(id), TOTAL(sqm_value), TOTAL(id * sqm_value) FROM light_pollution_grid"
+
 # World Atlas 2024 data URLs (from djlorenz.github.io)
 WORLD_ATLAS_URLS = {
     "world": "https://djlorenz.github.io/astronomy/lp2024/world2024.png",
@@ -152,6 +165,7 @@ def clear_light_pollution_data(db: CatalogDatabase) -> int:
         # Delete all rows using SQLAlchemy ORM
         session.query(LightPollutionGridModel).delete()
         session.commit()
+        invalidate_sqm_index(db)
 
         logger.info(f"Cleared {row_count} rows from light_pollution_grid table")
         return row_count
@@ -300,29 +314,6 @@ def _get_state_bounding_boxes() -> dict[str, tuple[float, float, float, float]]:
     return all_boundaries
 
 
-def _point_in_boundaries(lat: float, lon: float, boundaries: list[dict[str, Any]]) -> bool:
-    """
-    Check if a point is within any of the given boundaries.
-
-    Uses bounding box check for simplicity. For more accurate results,
-    would need full polygon geometry and point-in-polygon algorithm.
-
-    Args:
-        lat: Latitude
-        lon: Longitude
-        boundaries: List of boundary dictionaries with bbox
-
-    Returns:
-        True if point is within any boundary
-    """
-    for boundary in boundaries:
-        if boundary.get("type") == "bbox":
-            min_lat, max_lat, min_lon, max_lon = boundary["bbox"]
-            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
-                return True
-    return False
-
-
 async def _download_png(
     url: str, output_path: Path, progress: Progress | None = None, task_id: int | None = None
 ) -> bool:
@@ -394,6 +385,264 @@ async def _download_png(
         return False
 
 
+# PNG colour type -> samples per pixel
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Image rows decoded, converted and written per transaction
+STRIP_ROWS = 256
+
+# Largest piece of a PNG chunk read from the file at once
+_PNG_READ_SIZE = 1024 * 1024
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Serialise one PNG chunk (length, type, data, CRC)."""
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def _read_png_chunks(f: BinaryIO, max_size: int = _PNG_READ_SIZE) -> Iterator[tuple[bytes, bytes]]:
+    """Read (type, data) PNG chunks up to IEND, skipping CRCs; IDAT data longer than max_size comes in pieces."""
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        length, chunk_type = struct.unpack(">I4s", header)
+        if length == 0:
+            yield chunk_type, b""
+        while length > 0:
+            data = f.read(min(length, max_size) if chunk_type == b"IDAT" else length)
+            if not data:
+                return
+            length -= len(data)
+            yield chunk_type, data
+        f.read(4)
+        if chunk_type == b"IEND":
+            return
+
+
+def _decode_png_strip(
+    ihdr: bytes, extra_chunks: list[bytes], filtered: bytes, rows: int, previous_row: bytes | None
+) -> tuple[npt.NDArray[np.uint8], bytes]:
+    """
+    Decode a strip of filtered PNG scanlines to RGB.
+
+    The scanlines are wrapped in a small stored (uncompressed) PNG so that
+    Pillow's C decoder undoes the row filters. Filters can refer to the row
+    above, so the strip is preceded by the last row of the previous strip,
+    stored unfiltered.
+
+    Returns:
+        RGB array of the strip and the raw bytes of its last row
+    """
+    from PIL import Image
+
+    if previous_row is not None:
+        filtered = b"\x00" + previous_row + filtered
+        rows += 1
+    strip_png = b"".join(
+        [
+            _PNG_SIGNATURE,
+            _png_chunk(b"IHDR", ihdr[:4] + struct.pack(">I", rows) + ihdr[8:]),
+            *extra_chunks,
+            _png_chunk(b"IDAT", zlib.compress(filtered, 0)),
+            _png_chunk(b"IEND", b""),
+        ]
+    )
+    with Image.open(io.BytesIO(strip_png)) as img:
+        img.load()
+        last_row = np.asarray(img)[-1].tobytes()
+        rgb = np.asarray(img.convert("RGB"))
+    return (rgb[1:] if previous_row is not None else rgb), last_row
+
+
+def _iter_png_strips(png_path: Path, strip_rows: int = STRIP_ROWS) -> Iterator[tuple[int, npt.NDArray[np.uint8]]]:
+    """
+    Decode a PNG image in strips of rows with bounded memory.
+
+    IDAT data is read in pieces and inflated at most one strip at a time,
+    and each strip is decoded on its own, so only about one strip of pixels
+    is in memory at a time. Interlaced and non-8-bit images are decoded
+    whole and then split.
+
+    Args:
+        png_path: Path to PNG image
+        strip_rows: Rows per strip
+
+    Yields:
+        First row index and (rows, width, 3) RGB array of each strip
+    """
+    with open(png_path, "rb") as f:
+        if f.read(8) != _PNG_SIGNATURE:
+            raise ValueError(f"Not a PNG file: {png_path}")
+        chunks = _read_png_chunks(f)
+        _, ihdr = next(chunks)
+        width, height, bit_depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", ihdr)
+
+        if bit_depth != 8 or interlace or color_type not in _PNG_CHANNELS:
+            yield from _iter_image_strips(png_path, strip_rows)
+            return
+
+        stride = 1 + width * _PNG_CHANNELS[color_type]
+        strip_bytes = strip_rows * stride
+        extra_chunks: list[bytes] = []
+        inflater = zlib.decompressobj()
+        pending = bytearray()
+        previous_row: bytes | None = None
+        first_row = 0
+
+        def take_strips(final: bool) -> Iterator[tuple[int, npt.NDArray[np.uint8]]]:
+            nonlocal previous_row, first_row
+            while first_row < height:
+                rows = min(strip_rows, height - first_row)
+                if len(pending) < rows * stride:
+                    if final:
+                        raise ValueError(f"Truncated PNG data in {png_path}")
+                    return
+                rgb, previous_row = _decode_png_strip(
+                    ihdr, extra_chunks, bytes(pending[: rows * stride]), rows, previous_row
+                )
+                del pending[: rows * stride]
+                yield first_row, rgb
+                first_row += rows
+
+        for chunk_type, data in chunks:
+            if chunk_type == b"IDAT":
+                # Inflate no more than a strip per call so a highly compressed
+                # image cannot expand in one go
+                while data:
+                    pending += inflater.decompress(data, strip_bytes)
+                    data = inflater.unconsumed_tail
+                    yield from take_strips(final=False)
+            elif chunk_type in (b"PLTE", b"tRNS") and first_row == 0 and not pending:
+                extra_chunks.append(_png_chunk(chunk_type, data))
+        pending += inflater.flush()
+        yield from take_strips(final=True)
+
+
+def _iter_image_strips(png_path: Path, strip_rows: int) -> Iterator[tuple[int, npt.NDArray[np.uint8]]]:
+    """Decode a whole image with Pillow and split it into strips of rows."""
+    import warnings
+
+    from PIL import Image
+
+    # Increase PIL image size limit to handle large World Atlas images
+    # These are trusted source images, not security risks
+    Image.MAX_IMAGE_PIXELS = None
+    logger.debug(f"{png_path} is interlaced or not 8-bit, decoding it whole")
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
+        with Image.open(png_path) as img:
+            rgb = np.asarray(img.convert("RGB"))
+    for first_row in range(0, rgb.shape[0], strip_rows):
+        yield first_row, rgb[first_row : first_row + strip_rows]
+
+
+def _png_size(png_path: Path) -> tuple[int, int]:
+    """Read (width, height) from the PNG header."""
+    with open(png_path, "rb") as f:
+        header = f.read(24)
+    if header[:8] != _PNG_SIGNATURE:
+        raise ValueError(f"Not a PNG file: {png_path}")
+    width, height = struct.unpack(">II", header[16:24])
+    return int(width), int(height)
+
+
+def _rgb_to_sqm_array(rgb: npt.NDArray[np.uint8]) -> npt.NDArray[np.float64]:
+    """Convert an (..., 3) RGB array to SQM with the same scale as _rgb_to_sqm()."""
+    # Weighted brightness (luminance): 0.299*R + 0.587*G + 0.114*B
+    brightness = (rgb[..., 0] * 0.299 + rgb[..., 1] * 0.587 + rgb[..., 2] * 0.114) / 255.0
+    sqm = np.select(
+        [brightness < 0.01, brightness < 0.1, brightness < 0.3, brightness < 0.6, brightness < 0.9],
+        [
+            np.full_like(brightness, 22.0),  # Very dark (black)
+            21.5 + (brightness / 0.1) * 0.5,  # Dark blue
+            20.5 + ((brightness - 0.1) / 0.2) * 1.0,  # Blue to green
+            19.0 + ((brightness - 0.3) / 0.3) * 1.5,  # Green to yellow
+            18.0 + ((brightness - 0.6) / 0.3) * 1.0,  # Yellow to red
+        ],
+        17.0 + ((brightness - 0.9) / 0.1) * 0.5,  # Red to white
+    )
+    # Clamp to reasonable range
+    return np.clip(sqm, 17.0, 22.0)
+
+
+def _in_boundaries(
+    lats: npt.NDArray[np.float64], lons: npt.NDArray[np.float64], boundaries: list[dict[str, Any]]
+) -> npt.NDArray[np.bool_]:
+    """
+    Check which points are within any of the given boundaries.
+
+    Uses bounding box check for simplicity. For more accurate results,
+    would need full polygon geometry and point-in-polygon algorithm.
+
+    Args:
+        lats: Latitudes
+        lons: Longitudes
+        boundaries: List of boundary dictionaries with bbox
+
+    Returns:
+        True for each point within any boundary
+    """
+    inside = np.zeros(lats.shape, dtype=bool)
+    for boundary in boundaries:
+        if boundary.get("type") == "bbox":
+            min_lat, max_lat, min_lon, max_lon = boundary["bbox"]
+            inside |= (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
+    return inside
+
+
+def _peak_rss_mb() -> float | None:
+    """Get the peak resident set size of this process in MB (None where unsupported)."""
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+_UPSERT_SQL = (
+    "INSERT INTO light_pollution_grid (latitude, longitude, geohash, geohash_int, sqm_value, region) "
+    "VALUES (?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (latitude, longitude) DO UPDATE SET "
+    "geohash = excluded.geohash, geohash_int = excluded.geohash_int, "
+    "sqm_value = excluded.sqm_value, region = excluded.region"
+)
+
+
+async def _upsert_points(
+    db: CatalogDatabase,
+    lats: npt.NDArray[np.float64],
+    lons: npt.NDArray[np.float64],
+    sqm: npt.NDArray[np.float64],
+    region: str,
+) -> None:
+    """Insert or update grid points, with geohash indexing, in one transaction."""
+    if not len(lats):
+        return
+    # Geohash precision 9 for ~5m accuracy
+    geohashes = encode_array(lats, lons, precision=9).astype(str)
+    geohash_ints = encode_int_array(lats, lons)
+    rows = list(
+        zip(
+            lats.tolist(),
+            lons.tolist(),
+            geohashes.tolist(),
+            geohash_ints.tolist(),
+            sqm.tolist(),
+            repeat(region),
+            strict=False,
+        )
+    )
+    async with db._engine.begin() as conn:
+        await conn.exec_driver_sql(_UPSERT_SQL, rows)
+    with _sqm_indexes_lock:
+        _sqm_indexes.pop(db.db_path, None)
+
+
 async def _process_png_to_database(
     png_path: Path,
     region: str,
@@ -402,10 +651,15 @@ async def _process_png_to_database(
     state_filter: list[str] | None = None,
     progress: Progress | None = None,
     task_id: int | None = None,
+    strip_rows: int = STRIP_ROWS,
 ) -> int:
     """
     Process PNG image and store SQM values in database.
 
+    The image is decoded in strips of rows; each strip's grid points are
+    converted to SQM and geohashes with NumPy and upserted in one transaction,
+    so memory stays bounded by the strip size however large the image is.
+
     Args:
         png_path: Path to PNG image
         region: Region name
@@ -414,16 +668,13 @@ async def _process_png_to_database(
         state_filter: Optional list of state/province names to filter by
         progress: Optional progress bar for tracking processing
         task_id: Optional task ID for progress bar
+        strip_rows: Image rows decoded and written per transaction
 
     Returns:
         Number of grid points inserted
     """
     try:
-        from PIL import Image
-
-        # Increase PIL image size limit to handle large World Atlas images
-        # These are trusted source images, not security risks
-        Image.MAX_IMAGE_PIXELS = None  # Disable limit (or set to a very large number)
+        import PIL  # noqa: F401
     except ImportError:
         logger.error("PIL/Pillow not installed. Install with: pip install Pillow")
         return 0
@@ -434,18 +685,7 @@ async def _process_png_to_database(
 
     # Get region bounds
     lat_min, lat_max, lon_min, lon_max = REGION_BOUNDS.get(region, (-90, 90, -180, 180))
-
-    # Open image (suppress decompression bomb warning for trusted source)
-    import warnings
-
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
-        img: Any = Image.open(png_path)
-    width, height = img.size
-
-    # Convert to RGB if needed
-    if img.mode != "RGB":
-        img = cast(Any, img.convert("RGB"))
+    width, height = _png_size(png_path)
 
     # Calculate lat/lon step per pixel
     lat_step = (lat_max - lat_min) / height
@@ -463,510 +703,186 @@ async def _process_png_to_database(
         else:
             logger.warning(f"Could not load boundaries for {state_filter}, processing all data")
 
-    # Try to use numpy for faster processing if available
-    try:
-        import numpy as np
-
-        numpy_available = True
-    except ImportError:
-        numpy_available = False
-        np = cast(Any, None)
-
     # Calculate sampling step
     y_step = max(1, int(grid_resolution / lat_step))
     x_step = max(1, int(grid_resolution / lon_step))
-
-    # Process pixels and insert into database
-    inserted = 0
-    batch_size = 1000
-    batch_data = []
+    x_indices = np.arange(0, width, x_step)
+    lons = np.round((lon_min + x_indices * lon_step) / grid_resolution) * grid_resolution
 
     # Calculate total pixels to process for progress tracking
-    total_pixels = len(range(0, height, y_step)) * len(range(0, width, x_step))
-
+    total_pixels = len(range(0, height, y_step)) * len(x_indices)
     if progress and task_id is not None:
         progress.update(task_id, total=total_pixels, description=f"Processing {region}")
 
     logger.info(f"Processing {region} image ({width}x{height} pixels, {total_pixels:,} grid points)...")
     console.print(f"[dim]Processing {region} image ({width}x{height} pixels, {total_pixels:,} grid points)...[/dim]")
 
-    # Use numpy for vectorized processing if available
-    if numpy_available and np is not None:
-        # Convert PIL image to numpy array
-        # Note: For very large images (>10,000x10,000 pixels), this may use significant memory.
-        # The vectorized numpy approach is already quite efficient, but for extremely large images,
-        # consider processing in chunks to reduce peak memory usage.
-        img_array = np.array(img)
-        if len(img_array.shape) == 2:
-            # Grayscale - convert to RGB
-            img_array = np.stack([img_array, img_array, img_array], axis=2)
-        elif len(img_array.shape) == 4:
-            # RGBA - take only RGB
-            img_array = img_array[:, :, :3]
-
-        # Create coordinate grids (vectorized)
-        y_indices = np.arange(0, height, y_step)
-        x_indices = np.arange(0, width, x_step)
-        y_grid, x_grid = np.meshgrid(y_indices, x_indices, indexing="ij")
-
-        # Update total_pixels for numpy path (more accurate)
-        total_pixels = len(y_indices) * len(x_indices)
-        if progress and task_id is not None:
-            progress.update(task_id, total=total_pixels)
-
-        # Calculate lat/lon for all pixels at once (vectorized)
-        lats = lat_max - (y_grid * lat_step)
-        lons = lon_min + (x_grid * lon_step)
-
-        # Extract RGB values (vectorized)
-        r_values = img_array[y_grid, x_grid, 0]
-        g_values = img_array[y_grid, x_grid, 1]
-        b_values = img_array[y_grid, x_grid, 2]
-
-        # Convert RGB to SQM (vectorized)
-        # Use the same weighted brightness calculation as _rgb_to_sqm()
-        r_norm = r_values / 255.0
-        g_norm = g_values / 255.0
-        b_norm = b_values / 255.0
-        # Weighted brightness (luminance): 0.299*R + 0.587*G + 0.114*B
-        brightness = 0.299 * r_norm + 0.587 * g_norm + 0.114 * b_norm
-
-        # Apply the same piecewise conversion as _rgb_to_sqm()
-        # This matches the more accurate conversion function
-        sqm_values = np.where(
-            brightness < 0.01,  # Very dark (black)
-            22.0,
-            np.where(
-                brightness < 0.1,  # Dark blue
-                21.5 + (brightness / 0.1) * 0.5,
-                np.where(
-                    brightness < 0.3,  # Blue to green
-                    20.5 + ((brightness - 0.1) / 0.2) * 1.0,
-                    np.where(
-                        brightness < 0.6,  # Green to yellow
-                        19.0 + ((brightness - 0.3) / 0.3) * 1.5,
-                        np.where(
-                            brightness < 0.9,  # Yellow to red
-                            18.0 + ((brightness - 0.6) / 0.3) * 1.0,
-                            # Red to white
-                            17.0 + ((brightness - 0.9) / 0.1) * 0.5,
-                        ),
-                    ),
-                ),
-            ),
-        )
-        # Clamp to reasonable range
-        sqm_values = np.clip(sqm_values, 17.0, 22.0)
+    started = time.perf_counter()
+    inserted = 0
+    for first_row, rgb in _iter_png_strips(png_path, strip_rows):
+        # Sampled rows of this strip
+        local_rows = np.arange((-first_row) % y_step, rgb.shape[0], y_step)
+        if not len(local_rows):
+            continue
+        sqm = _rgb_to_sqm_array(rgb[local_rows][:, x_indices]).ravel()
 
         # Round to grid resolution (vectorized)
-        lat_rounded = np.round(lats / grid_resolution) * grid_resolution
-        lon_rounded = np.round(lons / grid_resolution) * grid_resolution
-
-        # Use GeoPandas for efficient spatial filtering if boundaries are specified
-        if boundary_filter and gpd is not None and box is not None:
-            # Create GeoDataFrame from all points (vectorized)
-            # Flatten arrays for GeoDataFrame creation
-            lats_flat = lat_rounded.flatten()
-            lons_flat = lon_rounded.flatten()
-            sqm_flat = sqm_values.flatten()
-
-            # Create point geometries
-            points_gdf = gpd.GeoDataFrame(  # type: ignore[arg-type]
-                {
-                    "latitude": lats_flat,
-                    "longitude": lons_flat,
-                    "sqm_value": sqm_flat,
-                },
-                geometry=gpd.points_from_xy(lons_flat, lats_flat),  # type: ignore[arg-type]
-                crs="EPSG:4326",
-            )
+        row_lats = np.round((lat_max - (first_row + local_rows) * lat_step) / grid_resolution) * grid_resolution
+        lat_grid = np.repeat(row_lats, len(lons))
+        lon_grid = np.tile(lons, len(row_lats))
 
-            # Convert bounding boxes to Shapely polygons for spatial join
-            boundary_polygons = []
-            for boundary in boundary_filter:
-                if boundary.get("type") == "bbox" and "bbox" in boundary:
-                    min_lat, max_lat, min_lon, max_lon = boundary["bbox"]
-                    # Create rectangular polygon from bounding box
-                    # box(minx, miny, maxx, maxy) - note: lon, lat order
-                    bbox_polygon = box(min_lon, min_lat, max_lon, max_lat)  # type: ignore[arg-type]
-                    boundary_polygons.append(bbox_polygon)
-
-            if boundary_polygons:
-                # Create GeoDataFrame from boundary polygons
-                boundaries_gdf = gpd.GeoDataFrame(  # type: ignore[arg-type]
-                    [1] * len(boundary_polygons), geometry=boundary_polygons, crs="EPSG:4326"
-                )
-                # Spatial join to find points within boundaries (much faster than loop)
-                points_within = gpd.sjoin(points_gdf, boundaries_gdf, how="inner", predicate="within")  # type: ignore[arg-type]
-
-                # Process filtered points using itertuples (much faster than iterrows)
-                for row in points_within.itertuples():
-                    lat = float(row.latitude)
-                    lon = float(row.longitude)
-                    sqm = float(row.sqm_value)
-
-                    batch_data.append((lat, lon, sqm, region))
-
-                    # Insert in batches
-                    if len(batch_data) >= batch_size:
-                        await _insert_batch(db, batch_data)
-                        inserted += len(batch_data)
-                        batch_data = []
-                        if progress and task_id is not None:
-                            progress.update(task_id, advance=batch_size)
-            else:
-                # No valid boundaries, process all points using vectorized operations
-                # Flatten arrays for vectorized processing
-                lats_flat = lat_rounded.flatten()
-                lons_flat = lon_rounded.flatten()
-                sqm_flat = sqm_values.flatten()
-
-                # Create batch_data using numpy (much faster than nested loops)
-                # All arrays have the same length (flattened from same shape), so strict=True is safe
-                all_data = list(
-                    zip(
-                        lats_flat.astype(float),
-                        lons_flat.astype(float),
-                        sqm_flat.astype(float),
-                        [region] * len(lats_flat),
-                        strict=True,
-                    )
-                )
-
-                # Process in batches for database insertion
-                for batch_start in range(0, len(all_data), batch_size):
-                    batch_end = min(batch_start + batch_size, len(all_data))
-                    batch_chunk = all_data[batch_start:batch_end]
-                    await _insert_batch(db, batch_chunk)
-                    inserted += len(batch_chunk)
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=len(batch_chunk))
-        else:
-            # No boundary filter - process all points using vectorized operations
-            # Flatten arrays for vectorized processing
-            lats_flat = lat_rounded.flatten()
-            lons_flat = lon_rounded.flatten()
-            sqm_flat = sqm_values.flatten()
-
-            # Create batch_data using numpy (much faster than nested loops)
-            # All arrays have the same length (flattened from same shape), so strict=True is safe
-            all_data = list(
-                zip(
-                    lats_flat.astype(float),
-                    lons_flat.astype(float),
-                    sqm_flat.astype(float),
-                    [region] * len(lats_flat),
-                    strict=True,
-                )
-            )
-
-            # Process in batches for database insertion
-            for batch_start in range(0, len(all_data), batch_size):
-                batch_end = min(batch_start + batch_size, len(all_data))
-                batch_chunk = all_data[batch_start:batch_end]
-                await _insert_batch(db, batch_chunk)
-                inserted += len(batch_chunk)
-                if progress and task_id is not None:
-                    progress.update(task_id, advance=len(batch_chunk))
-    else:
-        # Fallback to original pixel-by-pixel method
-        for y in range(0, height, y_step):
-            for x in range(0, width, x_step):
-                # Get pixel RGB
-                pixel = img.getpixel((x, y))
-                if isinstance(pixel, (int, float)):
-                    # Grayscale image
-                    r = g = b = int(pixel)
-                elif isinstance(pixel, tuple) and len(pixel) >= 3:
-                    # RGB/RGBA tuple
-                    r, g, b = pixel[0], pixel[1], pixel[2]
-                else:
-                    # Fallback (shouldn't happen with RGB mode)
-                    r = g = b = 0
-
-                # Convert to lat/lon
-                lat = lat_max - (y * lat_step)
-                lon = lon_min + (x * lon_step)
-
-                # Apply state/province filter if specified
-                if boundary_filter and not _point_in_boundaries(lat, lon, boundary_filter):
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=1)
-                    continue
-
-                # Convert RGB to SQM
-                sqm = _rgb_to_sqm(r, g, b)
-
-                # Round to grid resolution
-                lat_rounded = round(lat / grid_resolution) * grid_resolution
-                lon_rounded = round(lon / grid_resolution) * grid_resolution
-
-                batch_data.append((lat_rounded, lon_rounded, sqm, region))
-
-                # Insert in batches
-                if len(batch_data) >= batch_size:
-                    await _insert_batch(db, batch_data)
-                    inserted += len(batch_data)
-                    batch_data = []
-                    if progress and task_id is not None:
-                        progress.update(task_id, advance=batch_size)
+        if boundary_filter:
+            keep = _in_boundaries(lat_grid, lon_grid, boundary_filter)
+            lat_grid, lon_grid, sqm = lat_grid[keep], lon_grid[keep], sqm[keep]
 
-    # Insert remaining
-    if batch_data:
-        await _insert_batch(db, batch_data)
-        inserted += len(batch_data)
+        await _upsert_points(db, lat_grid, lon_grid, sqm, region)
+        inserted += len(sqm)
         if progress and task_id is not None:
-            progress.update(task_id, advance=len(batch_data))
+            progress.update(task_id, advance=len(local_rows) * len(lons))
 
     if progress and task_id is not None:
         progress.update(task_id, completed=total_pixels)
 
-    logger.info(f"Inserted {inserted:,} grid points for {region}")
+    elapsed = time.perf_counter() - started
+    rate = inserted / elapsed if elapsed > 0 else 0.0
+    peak_rss = _peak_rss_mb()
+    rss_text = f", peak RSS {peak_rss:,.0f} MB" if peak_rss is not None else ""
+    logger.info(f"Inserted {inserted:,} grid points for {region} in {elapsed:.1f}s ({rate:,.0f} rows/s{rss_text})")
+    console.print(f"[dim]Imported {region} at {rate:,.0f} rows/s{rss_text}[/dim]")
     return inserted
 
 
-async def _insert_batch(db: CatalogDatabase, batch_data: list[tuple[float, float, float, str]]) -> None:
-    """Insert batch of light pollution data with geohash indexing."""
-    from sqlalchemy import select
-
-    from celestron_nexstar.api.database.models import LightPollutionGridModel
+def _sqm_index_path(db: CatalogDatabase) -> Path:
+    """Path of the SQM index cache file (next to the database)."""
+    return db.db_path.with_suffix(".sqm.npy")
 
-    if not batch_data:
-        return
 
-    try:
-        async with db._AsyncSession() as session:
-            # Pre-calculate geohashes for all records
-            records_to_insert = []
-            for lat, lon, sqm, region in batch_data:
-                # Calculate geohash for indexing (use precision 9 for ~5m accuracy)
-                geohash_str = encode(lat, lon, precision=9)
-                records_to_insert.append(
-                    LightPollutionGridModel(
-                        latitude=lat,
-                        longitude=lon,
-                        geohash=geohash_str,
-                        sqm_value=sqm,
-                        region=region,
-                    )
-                )
+def invalidate_sqm_index(db: CatalogDatabase) -> None:
+    """
+    Drop the SQM index of a database so the next lookup rebuilds it.
 
-            # Use bulk_save_objects for better performance
-            # SQLite doesn't support ON CONFLICT in bulk operations, so we need to handle duplicates
-            # Use merge() approach: try to insert, if duplicate key error, update instead
-            try:
-                session.add_all(records_to_insert)
-                await session.commit()
-            except Exception as e:
-                # If bulk insert fails (e.g., due to unique constraint), fall back to individual inserts
-                await session.rollback()
-                logger.debug(f"Bulk insert failed, falling back to individual inserts: {e}")
-                for record in records_to_insert:
-                    # Check if record exists
-                    result = await session.execute(
-                        select(LightPollutionGridModel).where(
-                            LightPollutionGridModel.latitude == record.latitude,
-                            LightPollutionGridModel.longitude == record.longitude,
-                        )
-                    )
-                    existing = result.scalar_one_or_none()
-                    if existing:
-                        # Update existing record
-                        existing.geohash = record.geohash
-                        existing.sqm_value = record.sqm_value
-                        existing.region = record.region
-                    else:
-                        # Insert new record
-                        session.add(record)
-                await session.commit()
-    except Exception as e:
-        logger.error(f"Error inserting light pollution batch: {e}", exc_info=True)
-        raise
+    Args:
+        db: Database instance
+    """
+    with _sqm_indexes_lock:
+        _sqm_indexes.pop(db.db_path, None)
+    path = _sqm_index_path(db)
+    for stale in (path, path.with_suffix(".json")):
+        stale.unlink(missing_ok=True)
 
 
-def get_sqm_from_database(lat: float, lon: float, db: CatalogDatabase) -> float | None:
+def get_sqm_index(db: CatalogDatabase) -> SQMIndex | None:
     """
-    Get SQM value from database using geohash-based proximity search.
+    Get the spatial index of the light pollution grid, loading or building it on first use.
 
-    Uses geohash for fast nearest neighbor queries with hierarchical spatial indexing.
+    The index is memory-mapped from the cache file when that was built from
+    the same rows, otherwise rebuilt from the light_pollution_grid table and
+    saved. A loaded index is kept in memory and re-checked against the table
+    every few seconds, so changes made by other processes are picked up.
 
     Args:
-        lat: Latitude in degrees
-        lon: Longitude in degrees
         db: Database instance
 
     Returns:
-        SQM value or None if not found
+        SQMIndex for this database, or None if the table is missing or empty
     """
+    from sqlalchemy import inspect, text
+    from sqlalchemy.exc import SQLAlchemyError
 
-    # Check if table exists first
-    try:
-        from sqlalchemy import inspect
-
-        from celestron_nexstar.api.database.models import LightPollutionGridModel
+    with _sqm_indexes_lock:
+        cached = _sqm_indexes.get(db.db_path)
+    if cached is not None and time.monotonic() - cached[1] < _SQM_INDEX_RECHECK_SECONDS:
+        return cached[0]
 
+    try:
         with db._get_session_sync() as session:
             inspector = inspect(session.bind)
             if inspector is not None and "light_pollution_grid" not in inspector.get_table_names():
                 logger.debug("light_pollution_grid table does not exist")
+                invalidate_sqm_index(db)
                 return None
-    except Exception as e:
-        logger.debug(f"Error checking for table: {e}")
-        return None
-
-    search_radius_km = 22.0  # ~22km search radius
-
-    # Generate geohash for the search point
-    center_geohash = encode(lat, lon, precision=12)
 
-    # Get geohash prefixes to search (includes neighbors)
-    search_geohashes = get_neighbors_for_search(center_geohash, search_radius_km)
-
-    # Build query using geohash prefix matching
-    # Use LIKE to match geohash prefixes
-    geohash_patterns = [f"{gh}%" for gh in search_geohashes]
-
-    from sqlalchemy import func, or_, select
-
-    from celestron_nexstar.api.database.models import LightPollutionGridModel
-
-    result: list[Any]
-    with db._get_session_sync() as session:
-        # Query using geohash prefix matching with SQLAlchemy ORM
-        # This is much faster than bounding box queries for large datasets
-        # Build OR conditions for geohash LIKE patterns
-        geohash_conditions = or_(*[LightPollutionGridModel.geohash.like(pattern) for pattern in geohash_patterns])
-
-        # Build query - get more candidates than needed, we'll filter by accurate distance
-        # Using approximate distance for initial filtering, then GeoPandas for accurate calculation
-        distance_expr = func.abs(LightPollutionGridModel.latitude - lat) + func.abs(
-            LightPollutionGridModel.longitude - lon
-        )
-
-        # Build query - get more candidates (up to 10) for better interpolation
-        query = (
-            select(
-                LightPollutionGridModel.latitude,
-                LightPollutionGridModel.longitude,
-                LightPollutionGridModel.sqm_value,
-            )
-            .where(geohash_conditions)
-            .order_by(distance_expr)
-            .limit(10)  # Get more candidates for better selection
-        )
+            # Any download, clear or in-place update changes the fingerprint
+            checked_at = time.monotonic()
+            fingerprint = list(session.execute(text(_SQM_FINGERPRINT_SQL)).one())
+            if not fingerprint[0]:
+                logger.debug("light_pollution_grid table is empty")
+                invalidate_sqm_index(db)
+                return None
 
-        query_results = session.execute(query).fetchall()
-        result = list(query_results)
-
-        if not result:
-            logger.debug(f"No grid points found within {search_radius_km}km of {lat},{lon}")
-            return None
-
-        # Use GeoPandas for accurate distance calculation and point selection
-        if gpd is None or Point is None:
-            logger.error("GeoPandas not available for accurate distance calculation")
-            return None
-
-        # Create search point (Point and gpd are guaranteed to be not None here)
-        search_point = Point(lon, lat)  # type: ignore[arg-type]
-        search_gdf = gpd.GeoDataFrame([1], geometry=[search_point], crs="EPSG:4326")  # type: ignore[arg-type]
-
-        # Create GeoDataFrame from query results
-        grid_data = {
-            "latitude": [float(r[0]) for r in result],
-            "longitude": [float(r[1]) for r in result],
-            "sqm_value": [float(r[2]) for r in result],
-        }
-        grid_gdf = gpd.GeoDataFrame(  # type: ignore[arg-type]
-            grid_data,
-            geometry=gpd.points_from_xy([float(r[1]) for r in result], [float(r[0]) for r in result]),  # type: ignore[arg-type]
-            crs="EPSG:4326",
-        )
+            if cached is not None and cached[0].fingerprint == fingerprint:
+                with _sqm_indexes_lock:
+                    _sqm_indexes[db.db_path] = (cached[0], checked_at)
+                return cached[0]
+
+            path = _sqm_index_path(db)
+            index = SQMIndex.load(path, fingerprint)
+            if index is None:
+                points = session.execute(
+                    text("SELECT latitude, longitude, sqm_value FROM light_pollution_grid")
+                ).fetchall()
+                columns = np.array(points, dtype=np.float64).T
+                index = SQMIndex.from_points(columns[0], columns[1], columns[2], fingerprint=fingerprint)
+                logger.info(
+                    f"Built SQM index of {len(index):,} grid points ({index.sqm.shape[0]}x{index.sqm.shape[1]})"
+                )
+                try:
+                    index.save(path)
+                except OSError as e:
+                    logger.warning(f"Could not save SQM index cache {path}: {e}")
+    except SQLAlchemyError as e:
+        # SQLAlchemyError: database errors (locked, missing or corrupt tables)
+        logger.debug(f"Error loading light pollution grid: {e}")
+        return None
 
-        # Project to metric CRS for accurate distance calculation
-        search_projected = search_gdf.to_crs("EPSG:3857")
-        grid_projected = grid_gdf.to_crs("EPSG:3857")
+    with _sqm_indexes_lock:
+        _sqm_indexes[db.db_path] = (index, checked_at)
+    return index
 
-        # Calculate accurate distances in meters, convert to km
-        distances_m = grid_projected.geometry.distance(search_projected.geometry.iloc[0])
-        distances_km = distances_m / 1000.0
 
-        # Add distance column and filter by search radius
-        grid_gdf["distance_km"] = distances_km
-        grid_gdf = grid_gdf[grid_gdf["distance_km"] <= search_radius_km]
+def get_sqm_values(
+    latitudes: npt.ArrayLike,
+    longitudes: npt.ArrayLike,
+    db: CatalogDatabase,
+    max_distance_km: float = DEFAULT_SEARCH_RADIUS_KM,
+) -> npt.NDArray[np.float64]:
+    """
+    Get SQM values for many sites from the light pollution grid at once.
 
-        if grid_gdf.empty:
-            logger.debug(f"No grid points found within {search_radius_km}km of {lat},{lon}")
-            return None
+    Args:
+        latitudes: Site latitudes in degrees
+        longitudes: Site longitudes in degrees
+        db: Database instance
+        max_distance_km: Sites with no grid point this close get NaN
 
-        # Sort by distance and take closest points
-        grid_gdf = grid_gdf.sort_values("distance_km").head(4)
+    Returns:
+        Bilinearly interpolated SQM values (mag/arcsec²), NaN where unknown
+    """
+    index = get_sqm_index(db)
+    if index is None:
+        return np.full(np.broadcast(np.asarray(latitudes), np.asarray(longitudes)).shape, np.nan)
+    return index.lookup(latitudes, longitudes, max_distance_km)
 
-        if len(grid_gdf) == 1:
-            sqm = float(grid_gdf.iloc[0]["sqm_value"])
-            logger.debug(f"Found single grid point: SQM={sqm:.2f}")
-            return sqm
 
-        # Bilinear interpolation using the closest points
-        points = [
-            (float(row["latitude"]), float(row["longitude"]), float(row["sqm_value"])) for _, row in grid_gdf.iterrows()
-        ]
+def get_sqm_from_database(lat: float, lon: float, db: CatalogDatabase) -> float | None:
+    """
+    Get SQM value from database using the light pollution spatial index.
 
-        # Find the 4 closest points forming a rectangle
-        lats = sorted({p[0] for p in points})
-        lons = sorted({p[1] for p in points})
-
-        if len(lats) < 2 or len(lons) < 2:
-            # Not enough points for interpolation, use nearest
-            return points[0][2]
-
-        # Find bounding rectangle
-        lat1, lat2 = lats[0], lats[-1]
-        lon1, lon2 = lons[0], lons[-1]
-
-        # Get values at corners
-        values = {}
-        for p in points:
-            values[(p[0], p[1])] = p[2]
-
-        # Bilinear interpolation
-        def get_value(la: float, lo: float) -> float:
-            # Find nearest point using accurate distance
-            min_dist = float("inf")
-            nearest_val = points[0][2]
-            for p in points:
-                # Use GeoPandas for accurate distance calculation
-                p_point = Point(p[1], p[0])  # lon, lat
-                p_gdf = gpd.GeoDataFrame([1], geometry=[p_point], crs="EPSG:4326")
-                p_projected = p_gdf.to_crs("EPSG:3857")
-                search_proj = search_gdf.to_crs("EPSG:3857")
-                dist = float(p_projected.geometry.distance(search_proj.geometry.iloc[0]) / 1000.0)  # km
-                if dist < min_dist:
-                    min_dist = dist
-                    nearest_val = p[2]
-            return nearest_val
-
-        # Interpolate
-        v11 = get_value(lat1, lon1)
-        v12 = get_value(lat1, lon2)
-        v21 = get_value(lat2, lon1)
-        v22 = get_value(lat2, lon2)
-
-        # Bilinear interpolation formula
-        if lat2 != lat1 and lon2 != lon1:
-            t_lat = (lat - lat1) / (lat2 - lat1)
-            t_lon = (lon - lon1) / (lon2 - lon1)
-            sqm = (
-                v11 * (1 - t_lat) * (1 - t_lon)
-                + v21 * t_lat * (1 - t_lon)
-                + v12 * (1 - t_lat) * t_lon
-                + v22 * t_lat * t_lon
-            )
-        else:
-            # Fallback to nearest neighbor
-            sqm = get_value(lat, lon)
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        db: Database instance
 
-        return sqm
+    Returns:
+        SQM value or None if not found
+    """
+    index = get_sqm_index(db)
+    if index is None:
+        return None
+    sqm = index.sqm_at(lat, lon)
+    if sqm is None:
+        logger.debug(f"No grid points found within {DEFAULT_SEARCH_RADIUS_KM}km of {lat},{lon}")
+    return sqm
 
 
 async def download_world_atlas_data(
@@ -1060,4 +976,6 @@ async def download_world_atlas_data(
                     progress.remove_task(process_task)
                 results[region] = 0
 
+    # New grid points make the spatial index stale; it is rebuilt on next lookup
+    invalidate_sqm_index(db)
     return results
@@ -229,6 +229,8 @@ class LightPollutionGridModel(Base):
     latitude: Mapped[float] = mapped_column(Float, nullable=False)
     longitude: Mapped[float] = mapped_column(Float, nullable=False)
     geohash: Mapped[str] = mapped_column(String(12), nullable=False, index=True)
+    # 12-character geohash as an integer, for BETWEEN range searches
+    geohash_int: Mapped[int | None] = mapped_column(sa.BigInteger, nullable=True)
 
     # Light pollution data
     sqm_value: Mapped[float] = mapped_column(Float, nullable=False)
@@ -242,6 +244,7 @@ class LightPollutionGridModel(Base):
     # Composite indexes and constraints
     __table_args__ = (
         Index("idx_lp_geohash", "geohash"),
+        Index("idx_lp_geohash_int", "geohash_int"),
         Index("idx_lp_lat_lon", "latitude", "longitude"),
         Index("idx_lp_region", "region"),
         sa.UniqueConstraint("latitude", "longitude", name="uq_lp_lat_lon"),
@@ -654,6 +657,8 @@ class DarkSkySiteModel(Base):
     latitude: Mapped[float] = mapped_column(Float, nullable=False, index=True)
     longitude: Mapped[float] = mapped_column(Float, nullable=False, index=True)
     geohash: Mapped[str | None] = mapped_column(String(12), nullable=True, index=True)
+    # 12-character geohash as an integer, for BETWEEN range searches
+    geohash_int: Mapped[int | None] = mapped_column(sa.BigInteger, nullable=True)
 
     # Sky quality
     bortle_class: Mapped[int] = mapped_column(Integer, nullable=False, index=True)  # 1-9
@@ -675,6 +680,7 @@ class DarkSkySiteModel(Base):
     __table_args__ = (
         Index("idx_location", "latitude", "longitude"),
         Index("idx_dark_sky_geohash", "geohash"),  # For efficient spatial proximity searches
+        Index("idx_dark_sky_geohash_int", "geohash_int"),  # For integer geohash range searches
     )
 
     def __repr__(self) -> str:
@@ -862,6 +868,84 @@ class TLEModel(Base):
         return f"<TLE(norad_id={self.norad_id}, name='{self.satellite_name}', group='{self.satellite_group}')>"
 
 
+class SatellitePassWindowModel(Base):
+    """
+    SQLAlchemy model for satellite pass-search windows already computed.
+
+    One row per satellite, TLE epoch and observer geohash, recording the time
+    window whose passes are stored in satellite_passes. Extending the window
+    only needs the new tail to be computed; a newer TLE epoch invalidates it.
+    """
+
+    __tablename__ = "satellite_pass_windows"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Cache key
+    norad_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    tle_epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    geohash: Mapped[str] = mapped_column(String(12), nullable=False)
+
+    # Searched window
+    window_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    window_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Cache metadata
+    computed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC)
+    )
+
+    __table_args__ = (Index("idx_pass_window_key", "norad_id", "geohash", "tle_epoch", unique=True),)
+
+    def __repr__(self) -> str:
+        """String representation of a pass window."""
+        return f"<SatellitePassWindow(norad_id={self.norad_id}, geohash='{self.geohash}', end='{self.window_end}')>"
+
+
+class SatellitePassModel(Base):
+    """
+    SQLAlchemy model for cached satellite pass predictions.
+
+    Stores passes computed by the pass engine for a satellite, TLE epoch and
+    observer geohash. Passes are stored down to the horizon and filtered by
+    minimum altitude when read.
+    """
+
+    __tablename__ = "satellite_passes"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Cache key
+    norad_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+    tle_epoch: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    geohash: Mapped[str] = mapped_column(String(12), nullable=False)
+
+    # Pass timing
+    satellite_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    rise_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    max_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    set_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    # Pass characteristics
+    max_altitude_deg: Mapped[float] = mapped_column(Float, nullable=False)
+    rise_azimuth_deg: Mapped[float] = mapped_column(Float, nullable=False)
+    max_azimuth_deg: Mapped[float] = mapped_column(Float, nullable=False)
+    set_azimuth_deg: Mapped[float] = mapped_column(Float, nullable=False)
+    range_km: Mapped[float] = mapped_column(Float, nullable=False)  # Distance at culmination
+
+    # Visibility
+    is_sunlit: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    sun_altitude_deg: Mapped[float] = mapped_column(Float, nullable=False)  # Observer's sun altitude at culmination
+
+    __table_args__ = (Index("idx_satellite_pass_key", "norad_id", "geohash", "tle_epoch", "rise_time"),)
+
+    def __repr__(self) -> str:
+        """String representation of a satellite pass."""
+        return f"<SatellitePass(norad_id={self.norad_id}, rise='{self.rise_time}', max_alt={self.max_altitude_deg}°)>"
+
+
 class VariableStarModel(Base):
     """
     SQLAlchemy model for variable stars.
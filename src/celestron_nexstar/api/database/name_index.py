@@ -0,0 +1,135 @@
+"""
+Name Autocompletion Index
+
+This module provides the in-memory index behind CatalogDatabase's name
+autocompletion. Features include:
+- A sorted, case-folded array of every object name, common name and star
+  name mapping, searched with binary search (sub-millisecond over 100k+ names)
+- A JSON cache file next to the database for fast startup, tagged with a
+  fingerprint of the source tables so a stale cache is never used
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import deal
+
+
+__all__ = ["NAME_INDEX_VERSION", "NameIndex"]
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache file layout changes
+NAME_INDEX_VERSION = 1
+
+
+class NameIndex:
+    """
+    Immutable sorted index of names for prefix completion.
+
+    Names are kept once each (exact duplicates removed, case variants kept)
+    and ordered case-insensitively, so the matches for a prefix are one
+    contiguous slice found with a binary search.
+
+    Example:
+        >>> index = NameIndex(["M31", "Mizar", "Andromeda Galaxy"])
+        >>> index.complete("m", limit=10)
+        ['M31', 'Mizar']
+    """
+
+    def __init__(self, names: Iterable[str | None], fingerprint: Sequence[Any] = ()) -> None:
+        """
+        Build the index.
+
+        Args:
+            names: Names to index (None and blank entries are ignored)
+            fingerprint: Opaque description of the source data, stored with
+                the cache file to detect staleness
+        """
+        unique = {str(name) for name in names if name is not None and str(name).strip()}
+        pairs = sorted((name.casefold(), name) for name in unique)
+        self._keys = [key for key, _ in pairs]
+        self._names = [name for _, name in pairs]
+        self.fingerprint = list(fingerprint)
+
+    def __len__(self) -> int:
+        """Get the number of indexed names."""
+        return len(self._names)
+
+    @deal.pre(lambda self, prefix="", limit=50: limit > 0, message="Limit must be positive")  # type: ignore[misc,arg-type]
+    def complete(self, prefix: str = "", limit: int = 50) -> list[str]:
+        """
+        Get names starting with a prefix (case-insensitive), alphabetically.
+
+        Args:
+            prefix: Prefix to match (empty string matches everything)
+            limit: Maximum number of names to return
+
+        Returns:
+            Up to ``limit`` matching names
+        """
+        key = str(prefix).casefold()
+        start = bisect_left(self._keys, key)
+        stop = min(start + limit, len(self._keys))
+        end = start
+        while end < stop and self._keys[end].startswith(key):
+            end += 1
+        return self._names[start:end]
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the index to a cache file atomically.
+
+        Args:
+            path: Cache file path
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        payload = {"version": NAME_INDEX_VERSION, "fingerprint": self.fingerprint, "names": self._names}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, fingerprint: Sequence[Any]) -> NameIndex | None:
+        """
+        Read an index from a cache file if it matches the source data.
+
+        Args:
+            path: Cache file path
+            fingerprint: Current fingerprint of the source data
+
+        Returns:
+            The cached index, or None if the file is missing, unreadable,
+            from another version or built from different data
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable name index cache {path}: {e}")
+            return None
+
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != NAME_INDEX_VERSION
+            or payload.get("fingerprint") != list(fingerprint)
+        ):
+            return None
+
+        # The cache is written already sorted, so skip the rebuild
+        index = cls.__new__(cls)
+        index._names = [str(name) for name in payload.get("names", [])]
+        index._keys = [name.casefold() for name in index._names]
+        index.fingerprint = list(fingerprint)
+        return index
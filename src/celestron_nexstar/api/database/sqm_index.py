@@ -0,0 +1,310 @@
+"""
+Light Pollution Spatial Index
+
+This module provides the in-memory index behind light pollution SQM lookups.
+Features include:
+- The light_pollution_grid points rasterised into one regular float32 grid
+  (NaN where there is no data), so a lookup is an array index, not a query
+- Vectorised bilinear interpolation for arrays of sites, ignoring missing
+  corners, with a nearest-point fallback within a search radius
+- A memory-mapped .npy cache file next to the database with a JSON sidecar
+  holding a fingerprint of the source table, so a stale cache is never used
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import deal
+import numpy as np
+import numpy.typing as npt
+
+
+__all__ = ["DEFAULT_SEARCH_RADIUS_KM", "SQM_INDEX_VERSION", "SQMIndex"]
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache file layout changes
+SQM_INDEX_VERSION = 1
+
+# Sites with no grid point within this distance have no SQM value
+DEFAULT_SEARCH_RADIUS_KM = 22.0
+
+# Grid step used when the points do not reveal one (a single row or column)
+_DEFAULT_STEP_DEG = 0.1
+
+_KM_PER_DEGREE = 111.195
+
+
+def _infer_step(values: npt.NDArray[np.float64]) -> float | None:
+    """Get the typical spacing of gridded coordinate values."""
+    unique = np.unique(np.round(values, 6))
+    if len(unique) < 2:
+        return None
+    return float(np.median(np.diff(unique)))
+
+
+class SQMIndex:
+    """
+    Regular latitude/longitude raster of SQM values.
+
+    Row 0 is the southernmost latitude and column 0 the westernmost
+    longitude; cell (i, j) is centred on (lat_start + i * step,
+    lon_start + j * step).
+
+    Example:
+        >>> index = SQMIndex.from_points([40.0, 40.0, 40.1, 40.1], [-74.0, -73.9, -74.0, -73.9], [20, 21, 20, 21])
+        >>> round(index.sqm_at(40.05, -73.95), 2)
+        20.5
+    """
+
+    def __init__(
+        self,
+        sqm: npt.NDArray[np.float32],
+        lat_start: float,
+        lon_start: float,
+        step: float,
+        fingerprint: Sequence[Any] = (),
+    ) -> None:
+        """
+        Wrap a raster.
+
+        Args:
+            sqm: SQM values, shape (latitudes, longitudes), NaN where unknown
+            lat_start: Latitude of row 0 in degrees
+            lon_start: Longitude of column 0 in degrees
+            step: Grid spacing in degrees
+            fingerprint: Opaque description of the source data, stored with
+                the cache file to detect staleness
+        """
+        self.sqm = sqm
+        self.lat_start = lat_start
+        self.lon_start = lon_start
+        self.step = step
+        self.fingerprint = list(fingerprint)
+
+    @classmethod
+    def from_points(
+        cls,
+        latitudes: npt.ArrayLike,
+        longitudes: npt.ArrayLike,
+        sqm_values: npt.ArrayLike,
+        step: float | None = None,
+        fingerprint: Sequence[Any] = (),
+    ) -> SQMIndex:
+        """
+        Rasterise gridded points.
+
+        Args:
+            latitudes: Point latitudes in degrees
+            longitudes: Point longitudes in degrees
+            sqm_values: SQM value of each point
+            step: Grid spacing in degrees (inferred from the points if None)
+            fingerprint: Opaque description of the source data
+
+        Returns:
+            Index covering the bounding box of the points
+        """
+        lats = np.asarray(latitudes, dtype=np.float64)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        values = np.asarray(sqm_values, dtype=np.float32)
+        if lats.size == 0:
+            return cls(np.full((0, 0), np.nan, dtype=np.float32), 0.0, 0.0, step or _DEFAULT_STEP_DEG, fingerprint)
+
+        if step is None:
+            steps = [s for s in (_infer_step(lats), _infer_step(lons)) if s is not None]
+            step = min(steps) if steps else _DEFAULT_STEP_DEG
+
+        lat_start, lon_start = float(lats.min()), float(lons.min())
+        rows = np.rint((lats - lat_start) / step).astype(np.intp)
+        cols = np.rint((lons - lon_start) / step).astype(np.intp)
+        sqm = np.full((int(rows.max()) + 1, int(cols.max()) + 1), np.nan, dtype=np.float32)
+        sqm[rows, cols] = values
+        return cls(sqm, lat_start, lon_start, step, fingerprint)
+
+    def __len__(self) -> int:
+        """Get the number of grid cells with an SQM value."""
+        return int(np.count_nonzero(~np.isnan(self.sqm)))
+
+    @deal.pre(
+        lambda self, latitudes, longitudes, max_distance_km=DEFAULT_SEARCH_RADIUS_KM: max_distance_km >= 0,
+        message="Search radius must be non-negative",
+    )  # type: ignore[misc,arg-type]
+    def lookup(
+        self,
+        latitudes: npt.ArrayLike,
+        longitudes: npt.ArrayLike,
+        max_distance_km: float = DEFAULT_SEARCH_RADIUS_KM,
+    ) -> npt.NDArray[np.float64]:
+        """
+        Get SQM values for many sites at once.
+
+        Values are bilinearly interpolated from the surrounding cells that
+        have data. Sites with no such cell get the nearest value within
+        max_distance_km, or NaN.
+
+        Args:
+            latitudes: Site latitudes in degrees
+            longitudes: Site longitudes in degrees
+            max_distance_km: Search radius for the nearest-point fallback
+
+        Returns:
+            SQM values (mag/arcsec²), NaN where unknown
+        """
+        lats, lons = np.broadcast_arrays(
+            np.asarray(latitudes, dtype=np.float64), np.asarray(longitudes, dtype=np.float64)
+        )
+        shape = lats.shape
+        lats, lons = lats.ravel(), (lons.ravel() + 180.0) % 360.0 - 180.0
+        result = np.full(lats.shape, np.nan)
+        if self.sqm.size == 0 or lats.size == 0:
+            return result.reshape(shape)
+
+        rows_f = (lats - self.lat_start) / self.step
+        cols_f = (lons - self.lon_start) / self.step
+        row0, col0 = np.floor(rows_f).astype(np.intp), np.floor(cols_f).astype(np.intp)
+        t_row, t_col = rows_f - row0, cols_f - col0
+
+        total = np.zeros(lats.shape)
+        weight_sum = np.zeros(lats.shape)
+        for d_row, d_col in ((0, 0), (0, 1), (1, 0), (1, 1)):
+            values = self._cells(row0 + d_row, col0 + d_col)
+            weight = (t_row if d_row else 1.0 - t_row) * (t_col if d_col else 1.0 - t_col)
+            known = ~np.isnan(values)
+            total += np.where(known, values * weight, 0.0)
+            weight_sum += np.where(known, weight, 0.0)
+        interpolated = weight_sum > 1e-9
+        result[interpolated] = total[interpolated] / weight_sum[interpolated]
+
+        missing = np.flatnonzero(~interpolated)
+        if missing.size and max_distance_km > 0:
+            result[missing] = self._nearest(rows_f[missing], cols_f[missing], lats[missing], max_distance_km)
+        return result.reshape(shape)
+
+    def sqm_at(
+        self, latitude: float, longitude: float, max_distance_km: float = DEFAULT_SEARCH_RADIUS_KM
+    ) -> float | None:
+        """
+        Get the SQM value for one site.
+
+        Args:
+            latitude: Latitude in degrees
+            longitude: Longitude in degrees
+            max_distance_km: Search radius for the nearest-point fallback
+
+        Returns:
+            SQM value (mag/arcsec²), or None if there is no data nearby
+        """
+        value = float(self.lookup([latitude], [longitude], max_distance_km)[0])
+        return None if math.isnan(value) else value
+
+    def _cells(self, rows: npt.NDArray[np.intp], cols: npt.NDArray[np.intp]) -> npt.NDArray[np.float64]:
+        """Gather cell values, NaN outside the raster."""
+        n_rows, n_cols = self.sqm.shape
+        inside = (rows >= 0) & (rows < n_rows) & (cols >= 0) & (cols < n_cols)
+        values = self.sqm[np.clip(rows, 0, n_rows - 1), np.clip(cols, 0, n_cols - 1)].astype(np.float64)
+        values[~inside] = np.nan
+        return values
+
+    def _nearest(
+        self,
+        rows_f: npt.NDArray[np.float64],
+        cols_f: npt.NDArray[np.float64],
+        lats: npt.NDArray[np.float64],
+        max_distance_km: float,
+    ) -> npt.NDArray[np.float64]:
+        """Get the nearest cell value within the search radius for each site."""
+        reach = math.ceil(max_distance_km / (_KM_PER_DEGREE * self.step))
+        offsets = np.arange(-reach, reach + 1)
+        rows = np.rint(rows_f).astype(np.intp)[:, None, None] + offsets[None, :, None]
+        cols = np.rint(cols_f).astype(np.intp)[:, None, None] + offsets[None, None, :]
+        rows, cols = np.broadcast_arrays(rows, cols)
+        values = self._cells(rows, cols)
+
+        # Equirectangular distance is accurate to well under a cell at this range
+        north_km = (rows - rows_f[:, None, None]) * self.step * _KM_PER_DEGREE
+        east_km = (cols - cols_f[:, None, None]) * self.step * _KM_PER_DEGREE * np.cos(np.radians(lats))[:, None, None]
+        distance = np.hypot(north_km, east_km)
+        distance[np.isnan(values) | (distance > max_distance_km)] = np.inf
+
+        flat_distance = distance.reshape(len(lats), -1)
+        best = np.argmin(flat_distance, axis=1)
+        nearest = values.reshape(len(lats), -1)[np.arange(len(lats)), best]
+        return np.where(np.isfinite(flat_distance[np.arange(len(lats)), best]), nearest, np.nan)
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write the index to a cache file atomically.
+
+        The raster goes to ``path`` (.npy, memory-mappable) and the grid
+        geometry and fingerprint to a .json file beside it.
+
+        Args:
+            path: Cache file path (.npy)
+        """
+        path = Path(path)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, self.sqm)
+        os.replace(tmp_path, path)
+
+        meta_path = path.with_suffix(".json")
+        tmp_meta = meta_path.with_name(f"{meta_path.name}.{os.getpid()}.tmp")
+        meta = {
+            "version": SQM_INDEX_VERSION,
+            "fingerprint": self.fingerprint,
+            "lat_start": self.lat_start,
+            "lon_start": self.lon_start,
+            "step": self.step,
+        }
+        with open(tmp_meta, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_meta, meta_path)
+
+    @classmethod
+    def load(cls, path: str | Path, fingerprint: Sequence[Any]) -> SQMIndex | None:
+        """
+        Memory-map an index from a cache file if it matches the source data.
+
+        Args:
+            path: Cache file path (.npy)
+            fingerprint: Current fingerprint of the source data
+
+        Returns:
+            The cached index, or None if the file is missing, unreadable,
+            from another version or built from different data
+        """
+        path = Path(path)
+        try:
+            with open(path.with_suffix(".json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable SQM index cache {path}: {e}")
+            return None
+
+        if (
+            not isinstance(meta, dict)
+            or meta.get("version") != SQM_INDEX_VERSION
+            or meta.get("fingerprint") != list(fingerprint)
+        ):
+            return None
+
+        try:
+            sqm = np.load(path, mmap_mode="r")
+            return cls(sqm, float(meta["lat_start"]), float(meta["lon_start"]), float(meta["step"]), fingerprint)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # OSError: raster file missing or unreadable
+            # ValueError: not a valid .npy file
+            # KeyError: missing grid geometry in the sidecar
+            # TypeError: malformed grid geometry
+            logger.debug(f"Ignoring unreadable SQM index cache {path}: {e}")
+            return None
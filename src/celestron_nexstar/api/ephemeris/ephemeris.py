@@ -7,14 +7,19 @@ Uses Skyfield library to calculate real-time positions of planets and moons.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from functools import lru_cache
+from threading import Lock
+from typing import Any
 
 import deal
-from skyfield.jpllib import SpiceKernel
+import numpy as np
+import numpy.typing as npt
+from cachetools import LRUCache
 
 from celestron_nexstar.api.core.exceptions import EphemerisFileNotFoundError, UnknownEphemerisObjectError
-from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+from celestron_nexstar.api.ephemeris.registry import get_ephemeris_registry, get_kernel, get_timescale
 
 
 logger = logging.getLogger(__name__)
@@ -22,8 +27,11 @@ logger = logging.getLogger(__name__)
 
 __all__ = [
     "PLANET_NAMES",
+    "PlanetaryPositions",
+    "clear_planetary_position_cache",
     "get_planet_magnitude",
     "get_planetary_position",
+    "get_planetary_positions",
     "is_dynamic_object",
 ]
 
@@ -68,38 +76,62 @@ PLANET_NAMES = {
 }
 
 
-# Cache for loaded ephemeris files
-_ephemeris_cache: dict[str, SpiceKernel] = {}
-
-
-@lru_cache(maxsize=10)
-def _get_ephemeris(bsp_file: str) -> SpiceKernel:
+def _resolve_body(planet_key: str) -> tuple[Any, Any]:
     """
-    Load ephemeris data from a specific BSP file.
-
-    Cached to avoid reloading files on every call.
-    Will attempt to load from ~/.skyfield/ directory (or SKYFIELD_DIR env var).
-
-    Args:
-        bsp_file: Name of the BSP file to load
-
-    Returns:
-        Loaded ephemeris data
+    Get the Earth and target handles for a PLANET_NAMES key.
 
     Raises:
-        FileNotFoundError: If BSP file is not found
+        EphemerisFileNotFoundError: If the body's BSP file is not available
+        UnknownEphemerisObjectError: If the file does not contain the body
     """
-    if bsp_file in _ephemeris_cache:
-        return _ephemeris_cache[bsp_file]
+    # Get ephemeris name and required BSP file
+    # ephemeris_name is the SPICE target name (e.g., "299 VENUS")
+    # We need to use just the name part for Skyfield (e.g., "VENUS")
+    ephemeris_name, bsp_file = PLANET_NAMES[planet_key]
 
-    # Use centralized Skyfield loader
-    loader = get_skyfield_loader()
+    # Extract just the name part if it's a numeric ID format (e.g., "299 VENUS" -> "VENUS")
+    # Skyfield can handle both formats, but numeric IDs sometimes fail
+    if " " in ephemeris_name and ephemeris_name[0].isdigit():
+        # Format is like "299 VENUS" - extract the name part
+        spice_target = ephemeris_name.split(" ", 1)[1]
+    else:
+        spice_target = ephemeris_name
 
-    # Load file - will download to configured directory if not present
-    eph = loader(bsp_file)
+    # Load the appropriate ephemeris file
+    try:
+        eph = get_kernel(bsp_file)
+    except FileNotFoundError:
+        raise EphemerisFileNotFoundError(
+            f"Ephemeris file {bsp_file} not found. "
+            f"Download it with: nexstar ephemeris download {bsp_file.replace('.bsp', '')}"
+        ) from None
 
-    _ephemeris_cache[bsp_file] = eph
-    return eph
+    # Get Earth and target body (handles are resolved once per file)
+    registry = get_ephemeris_registry()
+    earth = registry.body(bsp_file, "earth")
+
+    try:
+        target = registry.body(bsp_file, spice_target)
+    except KeyError:
+        # Try uppercase version (JPL ephemeris files often use uppercase)
+        try:
+            target = registry.body(bsp_file, ephemeris_name.upper())
+        except KeyError:
+            # List available objects for better error message
+            available_objects = sorted(eph.names())
+            # Filter to strings only and convert to lowercase for comparison
+            mars_objects = [
+                str(obj) for obj in available_objects if isinstance(obj, str) and "mars" in str(obj).lower()
+            ]
+            error_msg = (
+                f"Object '{ephemeris_name}' not found in {bsp_file}.\n"
+                f"Available objects containing 'mars': {', '.join(mars_objects) if mars_objects else 'none'}\n"
+                f"Available objects: {', '.join(str(obj) for obj in available_objects[:20])}...\n"
+                f"The ephemeris file may be missing or corrupted, or the object name may be incorrect."
+            )
+            raise UnknownEphemerisObjectError(error_msg) from None
+
+    return earth, target
 
 
 @deal.pre(
@@ -146,31 +178,10 @@ def get_planetary_position(
             f"Unknown planet/moon: {planet_name}. Valid names: {', '.join(sorted(PLANET_NAMES.keys()))}"
         )
 
-    # Get ephemeris name and required BSP file
-    # ephemeris_name is the SPICE target name (e.g., "299 VENUS")
-    # We need to use just the name part for Skyfield (e.g., "VENUS")
-    ephemeris_name, bsp_file = PLANET_NAMES[planet_key]
-
-    # Extract just the name part if it's a numeric ID format (e.g., "299 VENUS" -> "VENUS")
-    # Skyfield can handle both formats, but numeric IDs sometimes fail
-    if " " in ephemeris_name and ephemeris_name[0].isdigit():
-        # Format is like "299 VENUS" - extract the name part
-        spice_target = ephemeris_name.split(" ", 1)[1]
-    else:
-        spice_target = ephemeris_name
-
-    # Load the appropriate ephemeris file
-    try:
-        eph = _get_ephemeris(bsp_file)
-    except FileNotFoundError:
-        raise EphemerisFileNotFoundError(
-            f"Ephemeris file {bsp_file} not found. "
-            f"Download it with: nexstar ephemeris download {bsp_file.replace('.bsp', '')}"
-        ) from None
+    earth, target = _resolve_body(planet_key)
 
     # Get timescale and current time
-    loader = get_skyfield_loader()
-    ts = loader.timescale()
+    ts = get_timescale()
     if dt is None:
         dt = datetime.now(UTC)
     elif dt.tzinfo is None:
@@ -179,30 +190,6 @@ def get_planetary_position(
 
     t = ts.from_datetime(dt)
 
-    # Get Earth and target body
-    earth = eph["earth"]
-
-    try:
-        target = eph[spice_target]
-    except KeyError:
-        # Try uppercase version (JPL ephemeris files often use uppercase)
-        try:
-            target = eph[ephemeris_name.upper()]
-        except KeyError:
-            # List available objects for better error message
-            available_objects = sorted(eph.names())
-            # Filter to strings only and convert to lowercase for comparison
-            mars_objects = [
-                str(obj) for obj in available_objects if isinstance(obj, str) and "mars" in str(obj).lower()
-            ]
-            error_msg = (
-                f"Object '{ephemeris_name}' not found in {bsp_file}.\n"
-                f"Available objects containing 'mars': {', '.join(mars_objects) if mars_objects else 'none'}\n"
-                f"Available objects: {', '.join(str(obj) for obj in available_objects[:20])}...\n"
-                f"The ephemeris file may be missing or corrupted, or the object name may be incorrect."
-            )
-            raise UnknownEphemerisObjectError(error_msg) from None
-
     # Calculate apparent position from Earth
     astrometric = earth.at(t).observe(target)
     ra, dec, _distance = astrometric.radec()
@@ -214,6 +201,158 @@ def get_planetary_position(
     return (ra_hours, dec_degrees)
 
 
+# Batched positions are cached per body, rounded location and whole minute
+# as rows of (ra_hours, dec_degrees, altitude, azimuth, distance_au, magnitude)
+_POSITION_CACHE_SIZE = 4096
+_LOCATION_DECIMALS = 4
+_position_cache: LRUCache[tuple[str, float, float, int], tuple[float, ...]] = LRUCache(maxsize=_POSITION_CACHE_SIZE)
+_position_cache_lock = Lock()
+
+
+@dataclass(frozen=True)
+class PlanetaryPositions:
+    """
+    Positions of one solar system body over a series of times.
+
+    Attributes:
+        name: Body name (key of PLANET_NAMES)
+        times: Unix times in seconds, rounded to the minute
+        ra_hours: Geocentric astrometric RA (as get_planetary_position)
+        dec_degrees: Geocentric astrometric Dec (as get_planetary_position)
+        altitude_degrees: Topocentric apparent altitude, without refraction
+        azimuth_degrees: Topocentric apparent azimuth
+        distance_au: Distance from the observer in AU
+        magnitude: Visual magnitude; phase-dependent for the major planets,
+                   the typical value otherwise (NaN when unknown)
+    """
+
+    name: str
+    times: npt.NDArray[np.float64]
+    ra_hours: npt.NDArray[np.float64]
+    dec_degrees: npt.NDArray[np.float64]
+    altitude_degrees: npt.NDArray[np.float64]
+    azimuth_degrees: npt.NDArray[np.float64]
+    distance_au: npt.NDArray[np.float64]
+    magnitude: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        """Get the number of times."""
+        return len(self.times)
+
+
+def _compute_positions(
+    planet_key: str, minutes: npt.NDArray[np.int64], observer_lat: float, observer_lon: float
+) -> npt.NDArray[np.float64]:
+    """Compute position rows for one body at whole Unix minutes in one Skyfield call, shape (6, M)."""
+    from skyfield.api import wgs84
+    from skyfield.magnitudelib import planetary_magnitude
+
+    earth, target = _resolve_body(planet_key)
+    # Unix time has no leap seconds, so split it into calendar days (which
+    # ts.utc normalizes) and minutes within the day
+    days, minute_of_day = np.divmod(minutes, 1440)
+    t = get_timescale().utc(1970, 1, 1 + days, 0, minute_of_day)
+
+    geocentric = earth.at(t).observe(target)
+    ra, dec, _distance = geocentric.radec()
+    observer = earth + wgs84.latlon(observer_lat, observer_lon)
+    alt, az, distance = observer.at(t).observe(target).apparent().altaz()
+
+    typical = get_planet_magnitude(planet_key)
+    typical_magnitude = float("nan") if typical is None else typical
+    try:
+        magnitude = np.asarray(planetary_magnitude(geocentric), dtype=np.float64)
+        magnitude = np.where(np.isnan(magnitude), typical_magnitude, magnitude)
+    except ValueError:
+        # No phase-dependent formula for moons, Pluto or the Moon
+        magnitude = np.full(len(minutes), typical_magnitude)
+
+    return np.vstack([ra.hours, dec.degrees, alt.degrees, az.degrees, distance.au, magnitude])
+
+
+@deal.pre(
+    lambda bodies, times, observer_lat=None, observer_lon=None: all(name.lower() in PLANET_NAMES for name in bodies),
+    message="Planet names must be valid",
+)  # type: ignore[misc,arg-type]
+@deal.raises(ValueError, FileNotFoundError)
+def get_planetary_positions(
+    bodies: Sequence[str],
+    times: Sequence[datetime] | datetime,
+    observer_lat: float | None = None,
+    observer_lon: float | None = None,
+) -> dict[str, PlanetaryPositions]:
+    """
+    Calculate positions of several solar system objects over a series of times.
+
+    Each body is evaluated at all times in one array-valued Skyfield call.
+    Times are rounded to the minute and results are cached per body,
+    location and minute, so overlapping requests (a night's timeline, then
+    a visibility check within it) only compute the minutes not seen before.
+
+    Args:
+        bodies: Planet or moon names (case-insensitive)
+        times: Datetimes to calculate for (naive means UTC)
+        observer_lat: Observer's latitude in degrees (default: uses saved location)
+        observer_lon: Observer's longitude in degrees (default: uses saved location)
+
+    Returns:
+        PlanetaryPositions keyed by lowercase body name
+
+    Raises:
+        EphemerisFileNotFoundError: If a body's BSP file is not available
+        UnknownEphemerisObjectError: If a body is not in its ephemeris file
+    """
+    if observer_lat is None or observer_lon is None:
+        from celestron_nexstar.api.location.observer import get_observer_location
+
+        location = get_observer_location()
+        observer_lat = location.latitude
+        observer_lon = location.longitude
+    lat = round(observer_lat, _LOCATION_DECIMALS)
+    lon = round(observer_lon, _LOCATION_DECIMALS)
+
+    if isinstance(times, datetime):
+        times = [times]
+    unix = np.array([(dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)).timestamp() for dt in times])
+    minutes = np.round(unix / 60.0).astype(np.int64)
+
+    results: dict[str, PlanetaryPositions] = {}
+    for name in bodies:
+        planet_key = name.lower()
+        if planet_key in results:
+            continue
+
+        with _position_cache_lock:
+            rows = {int(m): _position_cache.get((planet_key, lat, lon, int(m))) for m in np.unique(minutes)}
+        missing = np.array([m for m, row in rows.items() if row is None], dtype=np.int64)
+        if missing.size:
+            computed = _compute_positions(planet_key, missing, lat, lon)
+            with _position_cache_lock:
+                for m, row in zip(missing, computed.T, strict=True):
+                    values = tuple(float(value) for value in row)
+                    rows[int(m)] = values
+                    _position_cache[(planet_key, lat, lon, int(m))] = values
+
+        columns = np.array([rows[int(m)] for m in minutes], dtype=np.float64).reshape(len(minutes), 6).T
+        results[planet_key] = PlanetaryPositions(
+            name=planet_key,
+            times=minutes * 60.0,
+            ra_hours=columns[0],
+            dec_degrees=columns[1],
+            altitude_degrees=columns[2],
+            azimuth_degrees=columns[3],
+            distance_au=columns[4],
+            magnitude=columns[5],
+        )
+    return results
+
+
+def clear_planetary_position_cache() -> None:
+    """Drop all cached batched positions."""
+    with _position_cache_lock:
+        _position_cache.clear()
+
+
 @deal.pre(lambda object_name: object_name is not None, message="Object name required")  # type: ignore[misc,arg-type]
 @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
 def is_dynamic_object(object_name: str) -> bool:
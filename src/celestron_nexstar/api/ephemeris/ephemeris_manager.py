@@ -730,6 +730,11 @@ def download_file(file_key: str, force: bool = False) -> Path:
     # This ensures we use the correct NAIF URLs instead of Skyfield's defaults
     loader.download(info.url, filename=info.filename)
 
+    # Drop any kernel opened from the old file so the new one is used
+    from celestron_nexstar.api.ephemeris.registry import get_ephemeris_registry
+
+    get_ephemeris_registry().discard(info.filename)
+
     return file_path
 
 
@@ -864,6 +869,10 @@ def delete_file(file_key: str) -> bool:
     info = EPHEMERIS_FILES[file_key]
     file_path = get_ephemeris_directory() / info.filename
 
+    from celestron_nexstar.api.ephemeris.registry import get_ephemeris_registry
+
+    get_ephemeris_registry().discard(info.filename)
+
     try:
         file_path.unlink()
         return True
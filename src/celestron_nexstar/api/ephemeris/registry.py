@@ -0,0 +1,207 @@
+"""
+Ephemeris Handle Registry
+
+This module provides one process-wide owner for Skyfield resources, so
+every calculation shares the same timescale, ephemeris kernels and body
+handles instead of reloading them per call. Features include:
+- One Timescale (with its bundled leap second and Delta T tables)
+- Each BSP kernel opened once; jplephem memory-maps the file, so its pages
+  are shared by every caller and only touched segments are read
+- Body handles (earth, sun, moon, planets) resolved once per kernel
+- Load timings for startup profiling, and a warm-up helper
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Iterable
+from threading import RLock
+from typing import TYPE_CHECKING, Any
+
+from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+
+
+if TYPE_CHECKING:
+    from skyfield.jpllib import SpiceKernel
+    from skyfield.timelib import Timescale
+
+
+__all__ = [
+    "DEFAULT_WARM_UP_FILES",
+    "EphemerisRegistry",
+    "get_body",
+    "get_ephemeris_registry",
+    "get_kernel",
+    "get_timescale",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Kernels most commands need (Sun, Moon and planets)
+DEFAULT_WARM_UP_FILES = ("de421.bsp",)
+
+
+class EphemerisRegistry:
+    """
+    Thread-safe cache of Skyfield timescale, kernels and body handles.
+
+    Failed loads are not cached, so a kernel downloaded later (for example
+    with ``nexstar ephemeris download``) is picked up on the next request.
+
+    Example:
+        >>> registry = get_ephemeris_registry()
+        >>> ts = registry.timescale()
+        >>> earth, moon = registry.bodies("de421.bsp", "earth", "moon")
+    """
+
+    def __init__(self) -> None:
+        """Create an empty registry (resources load on first use)."""
+        self._lock = RLock()
+        self._timescale: Timescale | None = None
+        self._kernels: dict[str, SpiceKernel] = {}
+        self._bodies: dict[tuple[str, str], Any] = {}
+        self._timings: dict[str, float] = {}
+
+    def _timed(self, label: str, load: Any) -> Any:
+        started = time.perf_counter()
+        result = load()
+        elapsed = time.perf_counter() - started
+        self._timings[label] = elapsed
+        logger.debug(f"Loaded {label} in {elapsed * 1000:.1f} ms")
+        return result
+
+    def timescale(self) -> Timescale:
+        """Get the shared Skyfield Timescale."""
+        with self._lock:
+            if self._timescale is None:
+                self._timescale = self._timed("timescale", get_skyfield_loader().timescale)
+            return self._timescale
+
+    def kernel(self, bsp_file: str) -> SpiceKernel:
+        """
+        Get an ephemeris kernel, opening it on first use.
+
+        Args:
+            bsp_file: BSP file name (e.g. "de421.bsp")
+
+        Returns:
+            Loaded kernel
+
+        Raises:
+            FileNotFoundError: If the file is missing and cannot be downloaded
+        """
+        with self._lock:
+            kernel = self._kernels.get(bsp_file)
+            if kernel is None:
+                loader = get_skyfield_loader()
+                kernel = self._timed(bsp_file, lambda: loader(bsp_file))
+                self._kernels[bsp_file] = kernel
+            return kernel
+
+    def body(self, bsp_file: str, name: str) -> Any:
+        """
+        Get a body handle from a kernel.
+
+        Args:
+            bsp_file: BSP file name
+            name: Body name as Skyfield accepts it (e.g. "earth", "MARS BARYCENTER")
+
+        Returns:
+            Skyfield vector function for the body
+
+        Raises:
+            FileNotFoundError: If the kernel is not available
+            KeyError: If the kernel has no such body
+        """
+        key = (bsp_file, name)
+        with self._lock:
+            handle = self._bodies.get(key)
+            if handle is None:
+                handle = self.kernel(bsp_file)[name]
+                self._bodies[key] = handle
+            return handle
+
+    def bodies(self, bsp_file: str, *names: str) -> tuple[Any, ...]:
+        """Get several body handles from one kernel (see body)."""
+        return tuple(self.body(bsp_file, name) for name in names)
+
+    def warm_up(self, bsp_files: Iterable[str] = DEFAULT_WARM_UP_FILES) -> dict[str, float]:
+        """
+        Load the timescale and kernels ahead of first use.
+
+        Missing kernels are skipped (and logged) rather than raised, so
+        warm-up never blocks startup.
+
+        Args:
+            bsp_files: Kernels to open
+
+        Returns:
+            Load time in seconds for everything loaded so far (see timings)
+        """
+        self.timescale()
+        for bsp_file in bsp_files:
+            try:
+                self.kernel(bsp_file)
+            except (FileNotFoundError, OSError, ValueError) as e:
+                # FileNotFoundError/OSError: not downloaded, or offline
+                # ValueError: corrupt file
+                logger.warning(f"Could not warm up {bsp_file}: {e}")
+        return self.timings
+
+    @property
+    def timings(self) -> dict[str, float]:
+        """Get the load time in seconds of each resource loaded so far."""
+        with self._lock:
+            return dict(self._timings)
+
+    def discard(self, bsp_file: str) -> None:
+        """Forget one kernel and its body handles (e.g. after it is re-downloaded or deleted)."""
+        with self._lock:
+            self._kernels.pop(bsp_file, None)
+            self._timings.pop(bsp_file, None)
+            for key in [key for key in self._bodies if key[0] == bsp_file]:
+                del self._bodies[key]
+
+    def clear(self) -> None:
+        """Forget all loaded resources (e.g. after replacing ephemeris files)."""
+        with self._lock:
+            self._timescale = None
+            self._kernels.clear()
+            self._bodies.clear()
+            self._timings.clear()
+
+
+_registry = EphemerisRegistry()
+
+
+def get_ephemeris_registry() -> EphemerisRegistry:
+    """Get the process-wide ephemeris registry."""
+    return _registry
+
+
+def get_timescale() -> Timescale:
+    """Get the shared Skyfield Timescale."""
+    return _registry.timescale()
+
+
+def get_kernel(bsp_file: str) -> SpiceKernel:
+    """
+    Get a shared ephemeris kernel.
+
+    Raises:
+        FileNotFoundError: If the file is missing and cannot be downloaded
+    """
+    return _registry.kernel(bsp_file)
+
+
+def get_body(bsp_file: str, name: str) -> Any:
+    """
+    Get a shared body handle.
+
+    Raises:
+        FileNotFoundError: If the kernel is not available
+        KeyError: If the kernel has no such body
+    """
+    return _registry.body(bsp_file, name)
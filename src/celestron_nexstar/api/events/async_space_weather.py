@@ -0,0 +1,325 @@
+"""
+Concurrent Space Weather Aggregator
+
+This module provides an asyncio counterpart to get_space_weather_conditions
+that fetches every NOAA SWPC feed concurrently over one pooled aiohttp
+session, so latency is set by the slowest feed instead of the sum of them.
+Features include:
+- One aiohttp session and connection pool shared by all feeds
+- Per-feed time-to-live matching how often SWPC updates each product
+- Stale-while-revalidate: expired payloads are returned at once while a
+  background refresh fetches the new one
+- A payload cache shared by every client in the process
+- Configurable base URL, so a local HTTP server can stand in for SWPC
+
+Parsing and NOAA scale logic are shared with the synchronous functions in
+space_weather, so both paths produce identical conditions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from threading import Lock
+from types import TracebackType
+from typing import Any
+
+import aiohttp
+
+from celestron_nexstar.api.events.space_weather import (
+    GOES_XRS_URL,
+    KP_FORECAST_URL,
+    PROTON_FLUX_FALLBACK_URL,
+    PROTON_FLUX_URL,
+    RADIO_FLUX_URL,
+    SOLAR_WIND_MAG_URL,
+    SOLAR_WIND_PLASMA_URL,
+    SWPC_BASE_URL,
+    SpaceWeatherConditions,
+    _build_conditions,
+    _parse_daily_radio_flux,
+    _parse_goes_xray,
+    _parse_kp,
+    _parse_proton_flux,
+    _parse_solar_wind,
+    _parse_xrs_radio_flux,
+)
+
+
+__all__ = [
+    "MAX_STALE_SECONDS",
+    "SWPC_FEEDS",
+    "AsyncSpaceWeatherClient",
+    "SWPCFeed",
+    "fetch_space_weather_conditions",
+]
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SWPCFeed:
+    """
+    A NOAA SWPC JSON product.
+
+    Attributes:
+        name: Feed name, used as the cache key
+        path: URL path below the SWPC base URL
+        ttl_seconds: Seconds a fetched payload is considered fresh
+        fallback_path: Path tried when the primary path fails (optional)
+    """
+
+    name: str
+    path: str
+    ttl_seconds: float
+    fallback_path: str | None = None
+
+
+def _path(url: str) -> str:
+    """Strip the SWPC base URL from a feed URL."""
+    return url.removeprefix(SWPC_BASE_URL)
+
+
+# Time-to-live follows each product's update cadence: solar wind and X-rays
+# every minute, protons every five minutes, Kp every three hours (the
+# forecast a little more often) and the 10.7cm flux once a day
+SWPC_FEEDS: tuple[SWPCFeed, ...] = (
+    SWPCFeed("plasma", _path(SOLAR_WIND_PLASMA_URL), ttl_seconds=60.0),
+    SWPCFeed("mag", _path(SOLAR_WIND_MAG_URL), ttl_seconds=60.0),
+    SWPCFeed("xrays", _path(GOES_XRS_URL), ttl_seconds=60.0),
+    SWPCFeed("protons", _path(PROTON_FLUX_URL), ttl_seconds=300.0, fallback_path=_path(PROTON_FLUX_FALLBACK_URL)),
+    SWPCFeed("kp", _path(KP_FORECAST_URL), ttl_seconds=900.0),
+    SWPCFeed("radio_flux", _path(RADIO_FLUX_URL), ttl_seconds=3600.0),
+)
+
+# Expired payloads older than this are not served while revalidating; the
+# caller waits for the new payload instead (and gets the old one only if
+# the fetch fails)
+MAX_STALE_SECONDS = 6 * 3600.0
+
+
+@dataclass(frozen=True)
+class _FeedEntry:
+    """A fetched feed payload and when it was fetched (clock seconds)."""
+
+    payload: Any
+    fetched_at: float
+
+
+# Payloads shared by every client, so clients created per request (one
+# asyncio.run per CLI or TUI refresh) still reuse each other's fetches
+_shared_cache: dict[str, _FeedEntry] = {}
+_shared_cache_lock = Lock()
+
+
+class AsyncSpaceWeatherClient:
+    """
+    Asyncio client fetching NOAA SWPC feeds concurrently.
+
+    Fresh payloads are served from the cache. Expired payloads (up to
+    max_stale_seconds old) are served immediately while a background task
+    refreshes them; closing the client waits for those refreshes so the
+    cache is current for the next client. Concurrent requests for the same
+    feed share one fetch.
+
+    Example:
+        >>> import asyncio
+        >>> async def main():
+        ...     async with AsyncSpaceWeatherClient() as client:
+        ...         conditions = await client.get_conditions()
+        ...         print(conditions.kp_index)
+        >>> asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        base_url: str = SWPC_BASE_URL,
+        feeds: Iterable[SWPCFeed] = SWPC_FEEDS,
+        timeout: float = 10.0,
+        max_stale_seconds: float = MAX_STALE_SECONDS,
+        shared_cache: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            base_url: SWPC base URL (point at a local server for tests)
+            feeds: Feeds this client can fetch
+            timeout: Total timeout per request in seconds
+            max_stale_seconds: Oldest expired payload served while revalidating
+            shared_cache: Use the process-wide payload cache (False for a private one)
+            clock: Monotonic time source in seconds
+        """
+        self.base_url = base_url.rstrip("/")
+        self.feeds = {feed.name: feed for feed in feeds}
+        self.timeout = timeout
+        self.max_stale_seconds = max_stale_seconds
+        self._clock = clock
+        self._cache = _shared_cache if shared_cache else {}
+        self._cache_lock = _shared_cache_lock if shared_cache else Lock()
+        self._session: aiohttp.ClientSession | None = None
+        self._fetches: dict[str, asyncio.Task[Any]] = {}
+
+    async def __aenter__(self) -> AsyncSpaceWeatherClient:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Wait for background refreshes, then close the HTTP session."""
+        if self._fetches:
+            await asyncio.gather(*self._fetches.values(), return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=len(self.feeds)),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _download(self, feed: SWPCFeed) -> Any:
+        """Download a feed's JSON, trying its fallback path if the primary fails."""
+        session = self._get_session()
+        paths = [feed.path] if feed.fallback_path is None else [feed.path, feed.fallback_path]
+        for i, path in enumerate(paths):
+            async with session.get(f"{self.base_url}{path}") as response:
+                if response.status == 200 or i == len(paths) - 1:
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+        return None
+
+    async def _fetch(self, feed: SWPCFeed) -> Any:
+        """Fetch a feed and store it in the cache, returning None on failure."""
+        try:
+            payload = await self._download(feed)
+        except (aiohttp.ClientError, TimeoutError, ValueError) as e:
+            # aiohttp.ClientError: HTTP/network errors
+            # TimeoutError: request timeout
+            # ValueError: invalid JSON
+            logger.debug(f"Error fetching SWPC feed {feed.name}: {e}")
+            return None
+        finally:
+            self._fetches.pop(feed.name, None)
+
+        with self._cache_lock:
+            self._cache[feed.name] = _FeedEntry(payload=payload, fetched_at=self._clock())
+        return payload
+
+    def _start_fetch(self, feed: SWPCFeed) -> asyncio.Task[Any]:
+        """Start fetching a feed, or join the fetch already in flight."""
+        task = self._fetches.get(feed.name)
+        if task is None:
+            task = asyncio.create_task(self._fetch(feed))
+            self._fetches[feed.name] = task
+        return task
+
+    async def get_feed(self, name: str) -> Any:
+        """
+        Get a feed's JSON payload.
+
+        Args:
+            name: Feed name (see SWPC_FEEDS)
+
+        Returns:
+            Parsed JSON payload, or None if it has never been fetched successfully
+
+        Raises:
+            KeyError: If the feed name is unknown
+        """
+        feed = self.feeds[name]
+        with self._cache_lock:
+            entry = self._cache.get(name)
+        age = self._clock() - entry.fetched_at if entry is not None else None
+
+        if entry is not None and age is not None and age < feed.ttl_seconds:
+            return entry.payload
+
+        task = self._start_fetch(feed)
+        if entry is not None and age is not None and age < self.max_stale_seconds:
+            # Stale-while-revalidate: the refresh completes in the background
+            return entry.payload
+
+        payload = await asyncio.shield(task)
+        if payload is None and entry is not None:
+            return entry.payload
+        return payload
+
+    async def fetch_all(self) -> dict[str, Any]:
+        """
+        Get every feed's payload concurrently.
+
+        Returns:
+            Dictionary mapping feed name to payload (None where unavailable)
+        """
+        names = list(self.feeds)
+        payloads = await asyncio.gather(*(self.get_feed(name) for name in names))
+        return dict(zip(names, payloads, strict=True))
+
+    async def get_conditions(self) -> SpaceWeatherConditions:
+        """
+        Get current space weather conditions from all SWPC feeds at once.
+
+        Returns:
+            SpaceWeatherConditions object with current data
+        """
+        payloads = await self.fetch_all()
+
+        radio_flux_107 = _parse_or(None, _parse_xrs_radio_flux, payloads.get("xrays"))
+        if radio_flux_107 is None:
+            radio_flux_107 = _parse_or(None, _parse_daily_radio_flux, payloads.get("radio_flux"))
+
+        return _build_conditions(
+            solar_wind=_parse_or({}, _parse_solar_wind, payloads.get("plasma"), payloads.get("mag")),
+            xray_data=_parse_or({}, _parse_goes_xray, payloads.get("xrays")),
+            kp_data=_parse_or({}, _parse_kp, payloads.get("kp")),
+            radio_flux_107=radio_flux_107,
+            proton_data=_parse_or({}, _parse_proton_flux, payloads.get("protons")),
+        )
+
+
+def _parse_or(default: Any, parse: Callable[..., Any], *payloads: Any) -> Any:
+    """Parse feed payloads, returning the default if they are malformed."""
+    try:
+        return parse(*payloads)
+    except (ValueError, TypeError, KeyError, IndexError, AttributeError) as e:
+        # ValueError: invalid data format
+        # TypeError: wrong data types
+        # KeyError: missing keys in payload
+        # IndexError: missing array indices
+        # AttributeError: unexpected payload structure
+        logger.debug(f"Error parsing SWPC payload with {parse.__name__}: {e}")
+        return default
+
+
+async def fetch_space_weather_conditions(client: AsyncSpaceWeatherClient | None = None) -> SpaceWeatherConditions:
+    """
+    Fetch current space weather conditions with all SWPC feeds in parallel.
+
+    Args:
+        client: Client to use (optional; a temporary one is created and closed)
+
+    Returns:
+        SpaceWeatherConditions object with current data
+    """
+    if client is not None:
+        return await client.get_conditions()
+    async with AsyncSpaceWeatherClient() as new_client:
+        return await new_client.get_conditions()
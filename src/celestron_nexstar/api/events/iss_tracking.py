@@ -14,11 +14,11 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from skyfield.api import wgs84
 from skyfield.sgp4lib import EarthSatellite
 
 from celestron_nexstar.api.core.exceptions import TLEFetchError
-from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+from celestron_nexstar.api.ephemeris.registry import get_timescale
+from celestron_nexstar.api.events.pass_engine import PredictedPass, predict_passes, tle_from_satellite
 from celestron_nexstar.api.telescope.compass import azimuth_to_compass_8point
 
 
@@ -41,7 +41,6 @@ CELESTRAK_ISS_URL = "https://celestrak.org/NORAD/elements/gp.php?CATNR=25544&FOR
 TLE_CACHE_DIR = Path.home() / ".celestron_nexstar" / "cache"
 TLE_CACHE_FILE = TLE_CACHE_DIR / "iss_tle.txt"
 TLE_MAX_AGE_HOURS = 24  # Refresh TLE every 24 hours
-PASS_CACHE_MAX_AGE_HOURS = 24  # Pass predictions valid for 24 hours
 
 
 @dataclass(frozen=True)
@@ -216,13 +215,54 @@ async def _get_iss_satellite() -> EarthSatellite:
         line1, line2, _fetch_time = await _fetch_tle_from_celestrak()
 
     # Create satellite object
-    loader = get_skyfield_loader()
-    ts = loader.timescale()
+    ts = get_timescale()
     satellite = EarthSatellite(line1, line2, "ISS (ZARYA)", ts)
 
     return satellite
 
 
+def _to_iss_pass(prediction: PredictedPass) -> ISSPass:
+    """Convert a pass engine prediction to an ISSPass."""
+    # Calculate magnitude at maximum altitude
+    # ISS magnitude depends on distance: magnitude = -1.3 - 2.5 * log10(distance_km / 400)
+    # ISS is typically 400-450 km altitude, so we normalize to 400 km
+    # Typical range: -3.5 (very bright) to +2.0 (dimmer)
+    if not prediction.is_sunlit:
+        # Not visible if in Earth's shadow
+        magnitude = 10.0
+    elif prediction.range_km > 0:
+        magnitude = max(-4.0, min(3.0, -1.3 - 2.5 * math.log10(prediction.range_km / 400.0)))
+    else:
+        # Fallback to altitude-based approximation if distance unavailable
+        magnitude = max(-4.0, min(3.0, -1.3 + (90.0 - prediction.max_altitude_deg) / 20.0))
+
+    return ISSPass(
+        rise_time=prediction.rise_time,
+        max_time=prediction.culmination_time,
+        set_time=prediction.set_time,
+        duration_seconds=int((prediction.set_time - prediction.rise_time).total_seconds()),
+        max_altitude_deg=prediction.max_altitude_deg,
+        rise_azimuth_deg=prediction.rise_azimuth_deg,
+        max_azimuth_deg=prediction.culmination_azimuth_deg,
+        set_azimuth_deg=prediction.set_azimuth_deg,
+        magnitude=magnitude,
+        is_visible=prediction.is_sunlit,
+    )
+
+
+def _search_window(start_time: datetime | None, days: int) -> tuple[datetime, datetime]:
+    """Normalize the start of a search (default: now) to UTC and add the window length."""
+    match start_time:
+        case None:
+            start_time = datetime.now(UTC)
+        case dt if dt.tzinfo is None:
+            start_time = dt.replace(tzinfo=UTC)
+        case _:
+            start_time = start_time.astimezone(UTC)
+
+    return start_time, start_time + timedelta(days=days)
+
+
 async def get_iss_passes(
     latitude: float,
     longitude: float,
@@ -233,8 +273,8 @@ async def get_iss_passes(
     """
     Calculate ISS passes for a location.
 
-    Uses Skyfield to compute accurate satellite passes with detailed
-    azimuth and altitude information.
+    Uses the vectorized pass engine (SGP4) to compute satellite passes with
+    rise, peak and set azimuths.
 
     Args:
         latitude: Observer latitude in degrees
@@ -248,125 +288,18 @@ async def get_iss_passes(
 
     Raises:
         TLEFetchError: If satellite data cannot be obtained
-        ISSCalculationError: If pass calculations fail
     """
-    match start_time:
-        case None:
-            start_time = datetime.now(UTC)
-        case dt if dt.tzinfo is None:
-            start_time = dt.replace(tzinfo=UTC)
-        case _:
-            start_time = start_time.astimezone(UTC)
-
-    end_time = start_time + timedelta(days=days)
+    start_time, end_time = _search_window(start_time, days)
 
     logger.info(f"Calculating ISS passes for lat={latitude}, lon={longitude}, {days} days")
 
     # Get ISS satellite
     satellite = await _get_iss_satellite()
 
-    # Create observer location
-    observer = wgs84.latlon(latitude, longitude)
-
-    # Load timescale
-    loader = get_skyfield_loader()
-    ts = loader.timescale()
-    t0 = ts.from_datetime(start_time)
-    t1 = ts.from_datetime(end_time)
-
-    # Find events: 0=rise, 1=culminate (max alt), 2=set
-    t, events = satellite.find_events(observer, t0, t1, altitude_degrees=0.0)
-
-    # Group events into passes (rise -> culminate -> set)
-    passes: list[ISSPass] = []
-    i = 0
-    while i < len(events):
-        match events[i]:
-            case 0:  # Rise event
-                rise_t = t[i]
-                rise_time = rise_t.utc_datetime()
-
-                # Look for culmination
-                if i + 1 < len(events) and events[i + 1] == 1:
-                    max_t = t[i + 1]
-                    max_time = max_t.utc_datetime()
-
-                    # Look for set
-                    if i + 2 < len(events) and events[i + 2] == 2:
-                        set_t = t[i + 2]
-                        set_time = set_t.utc_datetime()
-
-                        # Calculate positions
-                        difference_rise = satellite - observer
-                        topocentric_rise = difference_rise.at(rise_t)
-                        _alt_rise, az_rise, _distance_rise = topocentric_rise.altaz()
-
-                        difference_max = satellite - observer
-                        topocentric_max = difference_max.at(max_t)
-                        alt_max, az_max, distance_max = topocentric_max.altaz()
-
-                        difference_set = satellite - observer
-                        topocentric_set = difference_set.at(set_t)
-                        _alt_set, az_set, _distance_set = topocentric_set.altaz()
-
-                        max_altitude = alt_max.degrees
-
-                        # Filter by minimum altitude
-                        if max_altitude >= min_altitude_deg:
-                            # Check if sunlit (visible)
-                            # ISS is visible when it's in sunlight and observer is in darkness
-                            loader = get_skyfield_loader()
-                            eph = loader("de421.bsp")
-                            is_sunlit = satellite.at(max_t).is_sunlit(eph)
-
-                            # Calculate magnitude at maximum altitude
-                            # ISS magnitude depends on altitude and distance
-                            # Formula: magnitude ≈ -1.3 - 2.5 * log10(altitude_km / 400)
-                            # Simplified: magnitude = -1.3 + (90 - altitude) / 20.0
-                            # At zenith (90°): ~-3.5, at horizon (0°): ~+2.0
-                            if is_sunlit:
-                                # Distance in km (Skyfield returns distance in AU, convert to km)
-                                distance_km = distance_max.km
-
-                                # ISS magnitude formula based on distance
-                                # Typical range: -3.5 (very bright) to +2.0 (dimmer)
-                                if distance_km > 0:
-                                    # More accurate: magnitude = -1.3 - 2.5 * log10(distance_km / 400)
-                                    # ISS is typically 400-450 km altitude, so we normalize to 400 km
-                                    magnitude = -1.3 - 2.5 * math.log10(distance_km / 400.0)
-                                    # Clamp to realistic range for ISS
-                                    magnitude = max(-4.0, min(3.0, magnitude))
-                                else:
-                                    # Fallback to altitude-based approximation if distance unavailable
-                                    magnitude = -1.3 + (90.0 - max_altitude) / 20.0
-                                    magnitude = max(-4.0, min(3.0, magnitude))
-                            else:
-                                # Not visible if in Earth's shadow
-                                magnitude = 10.0
-
-                            duration = int((set_time - rise_time).total_seconds())
-
-                            iss_pass = ISSPass(
-                                rise_time=rise_time,
-                                max_time=max_time,
-                                set_time=set_time,
-                                duration_seconds=duration,
-                                max_altitude_deg=max_altitude,
-                                rise_azimuth_deg=az_rise.degrees,
-                                max_azimuth_deg=az_max.degrees,
-                                set_azimuth_deg=az_set.degrees,
-                                magnitude=magnitude,
-                                is_visible=is_sunlit,
-                            )
-
-                            passes.append(iss_pass)
-
-                        i += 3  # Move past rise-culminate-set
-                        continue
-            case _:
-                pass  # Not a rise event, continue
-
-        i += 1
+    result = predict_passes(
+        [tle_from_satellite(satellite)], latitude, longitude, start_time, end_time, min_altitude_deg, workers=1
+    )
+    passes = [_to_iss_pass(prediction) for prediction in result.passes]
 
     logger.info(f"Found {len(passes)} ISS passes")
     return passes
@@ -383,8 +316,9 @@ async def get_iss_passes_cached(
     """
     Get ISS passes with database caching.
 
-    Checks database cache first. If cache is fresh (< 24 hours), returns cached data.
-    Otherwise calculates new passes and updates cache.
+    Passes are cached by TLE epoch and observer geohash, so repeated calls
+    reuse them and a longer window only computes the new tail. A new TLE
+    invalidates the cached passes.
 
     Args:
         latitude: Observer latitude in degrees
@@ -397,89 +331,18 @@ async def get_iss_passes_cached(
     Returns:
         List of ISS passes sorted by rise time
     """
-    if start_time is None:
-        start_time = datetime.now(UTC)
-
-    # Round location to ~1km precision for cache key
-    lat_rounded = round(latitude, 2)
-    lon_rounded = round(longitude, 2)
-
-    # Try to get from cache
-    if db_session is not None:
-        from celestron_nexstar.api.database.models import ISSPassModel
-
-        # Check for fresh cached passes
-        cache_cutoff = datetime.now(UTC) - timedelta(hours=PASS_CACHE_MAX_AGE_HOURS)
-
-        cached_passes = (
-            db_session.query(ISSPassModel)
-            .filter(
-                ISSPassModel.latitude == lat_rounded,
-                ISSPassModel.longitude == lon_rounded,
-                ISSPassModel.rise_time >= start_time,
-                ISSPassModel.fetched_at >= cache_cutoff,
-            )
-            .order_by(ISSPassModel.rise_time)
-            .all()
-        )
-
-        if cached_passes:
-            logger.info(f"Using {len(cached_passes)} cached ISS passes")
-            return [
-                ISSPass(
-                    rise_time=p.rise_time,
-                    max_time=p.max_time,
-                    set_time=p.set_time,
-                    duration_seconds=p.duration_seconds,
-                    max_altitude_deg=p.max_altitude_deg,
-                    rise_azimuth_deg=p.rise_azimuth_deg,
-                    max_azimuth_deg=p.max_azimuth_deg,
-                    set_azimuth_deg=p.set_azimuth_deg,
-                    magnitude=p.magnitude,
-                    is_visible=p.is_visible,
-                )
-                for p in cached_passes
-            ]
-
-    # Calculate fresh passes
-    passes = await get_iss_passes(latitude, longitude, start_time, days, min_altitude_deg)
-
-    # Cache in database
-    if db_session is not None and passes:
-        from celestron_nexstar.api.database.models import ISSPassModel
-        from celestron_nexstar.api.location.geohash_utils import encode
-
-        # Calculate geohash for this location (precision 9 for ~5m accuracy)
-        location_geohash = encode(lat_rounded, lon_rounded, precision=9)
-
-        # Delete old cached passes for this location
-        db_session.query(ISSPassModel).filter(
-            ISSPassModel.latitude == lat_rounded,
-            ISSPassModel.longitude == lon_rounded,
-        ).delete()
-
-        # Insert new passes
-        fetch_time = datetime.now(UTC)
-        for iss_pass in passes:
-            pass_model = ISSPassModel(
-                latitude=lat_rounded,
-                longitude=lon_rounded,
-                geohash=location_geohash,
-                rise_time=iss_pass.rise_time,
-                max_time=iss_pass.max_time,
-                set_time=iss_pass.set_time,
-                duration_seconds=iss_pass.duration_seconds,
-                max_altitude_deg=iss_pass.max_altitude_deg,
-                rise_azimuth_deg=iss_pass.rise_azimuth_deg,
-                max_azimuth_deg=iss_pass.max_azimuth_deg,
-                set_azimuth_deg=iss_pass.set_azimuth_deg,
-                magnitude=iss_pass.magnitude,
-                is_visible=iss_pass.is_visible,
-                fetched_at=fetch_time,
-            )
-            db_session.add(pass_model)
-
-        db_session.commit()
-        logger.info(f"Cached {len(passes)} ISS passes in database")
+    from celestron_nexstar.api.events.pass_cache import get_cached_passes
 
-    return passes
+    start_time, end_time = _search_window(start_time, days)
+    satellite = await _get_iss_satellite()
+
+    predictions = get_cached_passes(
+        [tle_from_satellite(satellite)],
+        latitude,
+        longitude,
+        start_time,
+        end_time,
+        min_altitude_deg=min_altitude_deg,
+        db_session=db_session,
+    )
+    return [_to_iss_pass(prediction) for prediction in predictions]
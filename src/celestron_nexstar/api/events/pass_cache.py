@@ -0,0 +1,329 @@
+"""
+Persistent Satellite Pass Cache
+
+This module provides database caching of satellite pass predictions, so
+repeated CLI invocations reuse passes instead of recomputing them.
+Features include:
+- Passes keyed by NORAD id, TLE epoch, observer geohash and search window
+- Incremental extension: a later window end computes only the new tail
+- Invalidation of passes from older TLE epochs when a newer TLE is stored
+- All missing windows computed together with the pass engine
+
+Passes are stored down to the horizon and filtered by minimum altitude when
+read, so one cached search serves every altitude threshold.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import SQLAlchemyError
+
+from celestron_nexstar.api.events.pass_engine import TLE, PredictedPass, predict_passes
+
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+
+__all__ = [
+    "PASS_CACHE_GEOHASH_PRECISION",
+    "get_cached_passes",
+    "invalidate_stale_passes",
+    "tle_cache_key",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Geohash precision of the observer key (7 characters is about 150 m, which
+# moves pass times by well under a second)
+PASS_CACHE_GEOHASH_PRECISION = 7
+
+# Passes are cached down to this peak altitude and filtered when read
+PASS_CACHE_MIN_ALTITUDE_DEG = 0.0
+
+# Tail searches restart this far before the covered end, so a pass that rose
+# before it but set after it is found (longer than any low-orbit pass)
+_TAIL_OVERLAP = timedelta(minutes=30)
+
+# Satellites per OR-ed invalidation clause (SQLite expression depth limit)
+_INVALIDATE_BATCH = 200
+
+_UNIX_EPOCH_JD = 2440587.5
+
+
+def _utc(value: datetime) -> datetime:
+    """Make a datetime timezone-aware UTC (SQLite returns naive datetimes)."""
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def tle_cache_key(line1: str, line2: str) -> tuple[int, datetime]:
+    """
+    Get the (NORAD id, epoch) cache key of a TLE.
+
+    Args:
+        line1: First line of TLE
+        line2: Second line of TLE
+
+    Returns:
+        NORAD catalog number and TLE epoch (UTC)
+    """
+    from sgp4.api import Satrec
+
+    satrec = Satrec.twoline2rv(line1, line2)
+    days = (satrec.jdsatepoch - _UNIX_EPOCH_JD) + satrec.jdsatepochF
+    return int(satrec.satnum), datetime(1970, 1, 1, tzinfo=UTC) + timedelta(days=days)
+
+
+def invalidate_stale_passes(db_session: Session, epochs: Mapping[int, datetime]) -> int:
+    """
+    Delete cached passes computed from TLEs older than the given epochs.
+
+    Does not commit; call from the transaction that stores the new TLEs.
+
+    Args:
+        db_session: Database session
+        epochs: Newest TLE epoch for each NORAD id
+
+    Returns:
+        Number of cached passes deleted
+    """
+    from celestron_nexstar.api.database.models import SatellitePassModel, SatellitePassWindowModel
+
+    deleted = 0
+    items = list(epochs.items())
+    for i in range(0, len(items), _INVALIDATE_BATCH):
+        batch = items[i : i + _INVALIDATE_BATCH]
+        for model in (SatellitePassWindowModel, SatellitePassModel):
+            stale = or_(*(and_(model.norad_id == norad_id, model.tle_epoch < epoch) for norad_id, epoch in batch))
+            count = db_session.query(model).filter(stale).delete(synchronize_session=False)
+            if model is SatellitePassModel:
+                deleted += count
+    if deleted:
+        logger.info(f"Invalidated {deleted} cached satellite passes from older TLEs")
+    return deleted
+
+
+def _update_cache(
+    db_session: Session,
+    keyed: dict[tuple[int, datetime], TLE],
+    geohash: str,
+    latitude: float,
+    longitude: float,
+    elevation_m: float,
+    start: datetime,
+    end: datetime,
+) -> None:
+    """Compute and store whatever part of [start, end] the cache is missing."""
+    from celestron_nexstar.api.database.models import SatellitePassModel, SatellitePassWindowModel
+
+    invalidate_stale_passes(db_session, dict(keyed.keys()))
+
+    windows = {
+        (row.norad_id, _utc(row.tle_epoch)): row
+        for row in db_session.query(SatellitePassWindowModel)
+        .filter(
+            SatellitePassWindowModel.geohash == geohash,
+            SatellitePassWindowModel.norad_id.in_({norad_id for norad_id, _ in keyed}),
+        )
+        .all()
+    }
+
+    # Group satellites by the search they need: the whole window (covered_end
+    # None) or only the tail after the end already covered
+    searches: dict[datetime | None, list[tuple[int, datetime]]] = defaultdict(list)
+    for key in keyed:
+        window = windows.get(key)
+        if window is not None and _utc(window.window_start) <= start < _utc(window.window_end):
+            if _utc(window.window_end) < end:
+                searches[_utc(window.window_end)].append(key)
+        else:
+            searches[None].append(key)
+
+    computed_at = datetime.now(UTC)
+    for covered_end, keys in searches.items():
+        if covered_end is None:
+            # Nothing reusable: replace whatever was cached for these satellites here
+            for norad_id, epoch in keys:
+                db_session.query(SatellitePassModel).filter(
+                    SatellitePassModel.norad_id == norad_id,
+                    SatellitePassModel.geohash == geohash,
+                    SatellitePassModel.tle_epoch == epoch,
+                ).delete(synchronize_session=False)
+        search_start = start if covered_end is None else covered_end - _TAIL_OVERLAP
+
+        # Satellites are named by position so passes map back to their key
+        indexed = [(str(i), keyed[key][1], keyed[key][2]) for i, key in enumerate(keys)]
+        result = predict_passes(
+            indexed,
+            latitude,
+            longitude,
+            search_start,
+            end,
+            min_altitude_deg=PASS_CACHE_MIN_ALTITUDE_DEG,
+            elevation_m=elevation_m,
+        )
+        for prediction in result.passes:
+            if covered_end is not None and prediction.set_time <= covered_end:
+                continue  # Already cached
+            norad_id, epoch = keys[int(prediction.name)]
+            db_session.add(
+                SatellitePassModel(
+                    norad_id=norad_id,
+                    tle_epoch=epoch,
+                    geohash=geohash,
+                    satellite_name=keyed[norad_id, epoch][0],
+                    rise_time=prediction.rise_time,
+                    max_time=prediction.culmination_time,
+                    set_time=prediction.set_time,
+                    max_altitude_deg=prediction.max_altitude_deg,
+                    rise_azimuth_deg=prediction.rise_azimuth_deg,
+                    max_azimuth_deg=prediction.culmination_azimuth_deg,
+                    set_azimuth_deg=prediction.set_azimuth_deg,
+                    range_km=prediction.range_km,
+                    is_sunlit=prediction.is_sunlit,
+                    sun_altitude_deg=prediction.sun_altitude_deg,
+                )
+            )
+
+        for key in keys:
+            window = windows.get(key)
+            if window is None:
+                window = SatellitePassWindowModel(norad_id=key[0], tle_epoch=key[1], geohash=geohash)
+                db_session.add(window)
+            if covered_end is None:
+                window.window_start = start
+            window.window_end = end
+            window.computed_at = computed_at
+
+        logger.info(
+            f"Computed {'tail of ' if covered_end else ''}pass window for {len(keys)} satellites "
+            f"({result.satellites_per_second:.0f} satellites/s)"
+        )
+
+    db_session.commit()
+
+
+def _read_cache(
+    db_session: Session,
+    keyed: dict[tuple[int, datetime], TLE],
+    geohash: str,
+    start: datetime,
+    end: datetime,
+    min_altitude_deg: float,
+) -> list[PredictedPass]:
+    """Load the cached passes of these TLEs inside [start, end]."""
+    from celestron_nexstar.api.database.models import SatellitePassModel
+
+    rows = (
+        db_session.query(SatellitePassModel)
+        .filter(
+            SatellitePassModel.geohash == geohash,
+            SatellitePassModel.norad_id.in_({norad_id for norad_id, _ in keyed}),
+            SatellitePassModel.rise_time >= start,
+            SatellitePassModel.set_time <= end,
+            SatellitePassModel.max_altitude_deg >= min_altitude_deg,
+        )
+        .order_by(SatellitePassModel.rise_time)
+        .all()
+    )
+    return [
+        PredictedPass(
+            name=row.satellite_name,
+            rise_time=_utc(row.rise_time),
+            culmination_time=_utc(row.max_time),
+            set_time=_utc(row.set_time),
+            max_altitude_deg=row.max_altitude_deg,
+            is_sunlit=row.is_sunlit,
+            sun_altitude_deg=row.sun_altitude_deg,
+            rise_azimuth_deg=row.rise_azimuth_deg,
+            culmination_azimuth_deg=row.max_azimuth_deg,
+            set_azimuth_deg=row.set_azimuth_deg,
+            range_km=row.range_km,
+        )
+        for row in rows
+        if (row.norad_id, _utc(row.tle_epoch)) in keyed
+    ]
+
+
+def _cached_passes(
+    db_session: Session,
+    tles: Sequence[TLE],
+    latitude: float,
+    longitude: float,
+    start: datetime,
+    end: datetime,
+    min_altitude_deg: float,
+    elevation_m: float,
+) -> list[PredictedPass]:
+    """Bring the cache up to date for these TLEs and read their passes."""
+    from celestron_nexstar.api.location.geohash_utils import encode
+
+    keyed = {tle_cache_key(line1, line2): (name, line1, line2) for name, line1, line2 in tles}
+    geohash = encode(latitude, longitude, precision=PASS_CACHE_GEOHASH_PRECISION)
+    _update_cache(db_session, keyed, geohash, latitude, longitude, elevation_m, start, end)
+    return _read_cache(db_session, keyed, geohash, start, end, min_altitude_deg)
+
+
+def get_cached_passes(
+    tles: Sequence[TLE],
+    latitude: float,
+    longitude: float,
+    start: datetime,
+    end: datetime,
+    min_altitude_deg: float = 10.0,
+    elevation_m: float = 0.0,
+    db_session: Session | None = None,
+) -> list[PredictedPass]:
+    """
+    Get satellite passes, computing only what the database cache lacks.
+
+    Without a session, a session on the catalog database is opened (and the
+    cache tables created if migrations have not run). If the database cannot
+    be used the passes are computed directly.
+
+    Args:
+        tles: (name, line1, line2) for each satellite
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        start: Start of the search window (naive means UTC)
+        end: End of the search window (naive means UTC)
+        min_altitude_deg: Minimum peak altitude for a pass
+        elevation_m: Observer elevation in meters
+        db_session: Database session (optional)
+
+    Returns:
+        Passes sorted by rise time
+    """
+    if not tles:
+        return []
+    start, end = _utc(start), _utc(end)
+    try:
+        if db_session is not None:
+            return _cached_passes(db_session, tles, latitude, longitude, start, end, min_altitude_deg, elevation_m)
+
+        from celestron_nexstar.api.database.database import get_database
+        from celestron_nexstar.api.database.models import Base, SatellitePassModel, SatellitePassWindowModel
+
+        with get_database()._get_session_sync() as session:
+            Base.metadata.create_all(
+                session.get_bind(),
+                tables=[SatellitePassWindowModel.__table__, SatellitePassModel.__table__],  # type: ignore[list-item]
+                checkfirst=True,
+            )
+            return _cached_passes(session, tles, latitude, longitude, start, end, min_altitude_deg, elevation_m)
+    except (SQLAlchemyError, OSError) as e:
+        # SQLAlchemyError: database errors (locked, missing or corrupt tables)
+        # OSError: database file cannot be opened
+        logger.warning(f"Satellite pass cache unavailable, computing passes directly: {e}")
+        if db_session is not None:
+            db_session.rollback()
+
+    result = predict_passes(tles, latitude, longitude, start, end, min_altitude_deg, elevation_m)
+    return list(result.passes)
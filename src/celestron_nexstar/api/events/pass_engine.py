@@ -0,0 +1,448 @@
+"""
+Satellite Pass Prediction Engine
+
+This module provides pass prediction for whole satellite constellations
+(thousands of TLEs) without calling Skyfield's find_events per satellite.
+Features include:
+- Coarse pre-screening: every satellite in a chunk is propagated over a
+  one-minute grid with a single vectorized SGP4 call (sgp4's SatrecArray)
+- Refinement of candidate passes only: rise and set by bisection and
+  culmination by golden-section search, to about half a second
+- Sunlit and dark-sky flags for all passes at once, from an analytic Sun
+  position and a cylindrical Earth shadow (no ephemeris file needed)
+- Chunks fanned out across a process pool, with satellites/sec reporting
+
+Altitudes are geometric (no refraction) for an observer on the WGS84
+ellipsoid, as with Skyfield's find_events. Passes must start and end inside
+the search window; passes peaking below about 2° can fall between samples.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import deal
+import numpy as np
+import numpy.typing as npt
+
+from celestron_nexstar.api.core.transforms import local_sidereal_time_array
+
+
+if TYPE_CHECKING:
+    from skyfield.sgp4lib import EarthSatellite
+
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "DEFAULT_STEP_SECONDS",
+    "PassSearchResult",
+    "PredictedPass",
+    "predict_passes",
+    "tle_from_satellite",
+]
+
+
+logger = logging.getLogger(__name__)
+
+FloatArray = npt.NDArray[np.float64]
+TLE = tuple[str, str, str]
+
+# Coarse grid step. A pass reaching 2° stays above the horizon for several
+# minutes, so it cannot fall between samples.
+DEFAULT_STEP_SECONDS = 60.0
+
+# Satellites per worker task; bounds the (satellites, times, 3) position
+# arrays to a few tens of MB for a week-long search
+DEFAULT_CHUNK_SIZE = 128
+
+# Fewest satellites a worker process is given by default. Each takes a few
+# ms to search, so below this a process costs more to start than it saves
+_MIN_SATELLITES_PER_WORKER = 64
+
+# Candidates are passes whose coarse peak is within this of the minimum
+# altitude (the true peak lies between samples, so it can be higher)
+_SCREEN_MARGIN_DEG = 5.0
+
+# Refinement iterations: each halves a crossing bracket (60 s -> 0.2 s) and
+# shrinks a peak bracket by the golden ratio (120 s -> 0.4 s)
+_REFINE_ITERATIONS = 12
+_GOLDEN = (np.sqrt(5.0) - 1.0) / 2.0
+
+# Sun altitude below which the sky is dark enough to see satellites
+DARK_SKY_SUN_ALTITUDE_DEG = -6.0
+
+# WGS84 ellipsoid (km)
+_EARTH_RADIUS_KM = 6378.137
+_EARTH_FLATTENING = 1.0 / 298.257223563
+_ECCENTRICITY_SQUARED = _EARTH_FLATTENING * (2.0 - _EARTH_FLATTENING)
+
+_JD_UNIX_EPOCH = 2440587.5
+
+
+@dataclass(frozen=True)
+class PredictedPass:
+    """
+    One satellite pass.
+
+    Attributes:
+        name: Satellite name
+        rise_time: When the satellite rises above the horizon (UTC)
+        culmination_time: Time of maximum altitude (UTC)
+        set_time: When the satellite sets below the horizon (UTC)
+        max_altitude_deg: Peak altitude in degrees
+        is_sunlit: Satellite is in sunlight at culmination
+        sun_altitude_deg: Sun's altitude for the observer at culmination
+        rise_azimuth_deg: Azimuth where the satellite rises (degrees east of north)
+        culmination_azimuth_deg: Azimuth at maximum altitude
+        set_azimuth_deg: Azimuth where the satellite sets
+        range_km: Distance from the observer at culmination
+    """
+
+    name: str
+    rise_time: datetime
+    culmination_time: datetime
+    set_time: datetime
+    max_altitude_deg: float
+    is_sunlit: bool
+    sun_altitude_deg: float
+    rise_azimuth_deg: float = 0.0
+    culmination_azimuth_deg: float = 0.0
+    set_azimuth_deg: float = 0.0
+    range_km: float = 0.0
+
+    @property
+    def is_visible(self) -> bool:
+        """Check if the pass can be seen: a sunlit satellite in a dark sky."""
+        return self.is_sunlit and self.sun_altitude_deg <= DARK_SKY_SUN_ALTITUDE_DEG
+
+
+@dataclass(frozen=True)
+class PassSearchResult:
+    """
+    Passes found by predict_passes, with search statistics.
+
+    Attributes:
+        passes: Passes sorted by rise time
+        satellites: Number of satellites searched
+        candidates: Coarse passes that were refined
+        elapsed_seconds: Wall-clock search time
+    """
+
+    passes: tuple[PredictedPass, ...]
+    satellites: int
+    candidates: int
+    elapsed_seconds: float
+
+    @property
+    def satellites_per_second(self) -> float:
+        """Get the search throughput."""
+        return self.satellites / self.elapsed_seconds if self.elapsed_seconds > 0 else float("inf")
+
+
+def tle_from_satellite(satellite: EarthSatellite) -> TLE:
+    """
+    Get (name, line1, line2) for a Skyfield satellite.
+
+    Worker processes rebuild satellites from TLE text, since sgp4's
+    Satrec objects cannot be pickled.
+    """
+    from sgp4.exporter import export_tle
+
+    line1, line2 = export_tle(satellite.model)
+    return str(satellite.name), line1, line2
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (fewer than os.cpu_count() under affinity limits)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _split_julian(unix: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """Split Unix times into whole and fractional Julian dates (as SGP4 expects)."""
+    days = unix / 86400.0
+    whole = np.floor(days)
+    return whole + _JD_UNIX_EPOCH, days - whole
+
+
+def _observer_vectors(
+    latitude: float, longitude: float, elevation_m: float, unix: FloatArray
+) -> tuple[FloatArray, FloatArray]:
+    """Observer position (km) and local vertical in the TEME frame, shape (T, 3) each."""
+    lat = np.radians(latitude)
+    normal = _EARTH_RADIUS_KM / np.sqrt(1.0 - _ECCENTRICITY_SQUARED * np.sin(lat) ** 2)
+    height = elevation_m / 1000.0
+    # TEME is rotated from the Earth-fixed frame by Greenwich mean sidereal time
+    theta = np.radians(local_sidereal_time_array(longitude, unix) * 15.0)
+    cos_theta, sin_theta = np.cos(theta), np.sin(theta)
+    rho = (normal + height) * np.cos(lat)
+    z = (normal * (1.0 - _ECCENTRICITY_SQUARED) + height) * np.sin(lat)
+    position = np.stack([rho * cos_theta, rho * sin_theta, np.full_like(theta, z)], axis=-1)
+    up = np.stack([np.cos(lat) * cos_theta, np.cos(lat) * sin_theta, np.full_like(theta, np.sin(lat))], axis=-1)
+    return position, up
+
+
+def _altitude(satellite: FloatArray, observer: FloatArray, up: FloatArray) -> FloatArray:
+    """Geometric altitude in degrees of satellite positions (..., 3) from an observer."""
+    offset = satellite - observer
+    sine = np.sum(offset * up, axis=-1) / np.linalg.norm(offset, axis=-1)
+    return np.asarray(np.degrees(np.arcsin(np.clip(sine, -1.0, 1.0))), dtype=np.float64)
+
+
+def _azimuth_and_range(
+    satellite: FloatArray, latitude: float, longitude: float, elevation_m: float, unix: FloatArray
+) -> tuple[FloatArray, FloatArray]:
+    """Azimuth (degrees east of north) and range (km) of satellite positions from an observer."""
+    observer, _up = _observer_vectors(latitude, longitude, elevation_m, unix)
+    offset = satellite - observer
+    lat = np.radians(latitude)
+    theta = np.radians(local_sidereal_time_array(longitude, unix) * 15.0)
+    east = offset[..., 1] * np.cos(theta) - offset[..., 0] * np.sin(theta)
+    north = (
+        np.cos(lat) * offset[..., 2]
+        - np.sin(lat) * np.cos(theta) * offset[..., 0]
+        - np.sin(lat) * np.sin(theta) * offset[..., 1]
+    )
+    return np.degrees(np.arctan2(east, north)) % 360.0, np.linalg.norm(offset, axis=-1)
+
+
+def _sun_direction(unix: FloatArray) -> FloatArray:
+    """Unit vector to the Sun (equator and equinox of date, about 0.01°), shape (T, 3)."""
+    n = unix / 86400.0 + _JD_UNIX_EPOCH - 2451545.0
+    mean_longitude = np.radians(280.460 + 0.9856474 * n)
+    anomaly = np.radians(357.528 + 0.9856003 * n)
+    longitude = mean_longitude + np.radians(1.915 * np.sin(anomaly) + 0.020 * np.sin(2.0 * anomaly))
+    obliquity = np.radians(23.439 - 0.0000004 * n)
+    return np.stack(
+        [np.cos(longitude), np.cos(obliquity) * np.sin(longitude), np.sin(obliquity) * np.sin(longitude)], axis=-1
+    )
+
+
+def _is_sunlit(position: FloatArray, sun: FloatArray) -> npt.NDArray[np.bool_]:
+    """Check positions (km) against a cylindrical Earth shadow."""
+    along = np.sum(position * sun, axis=-1)
+    across = np.linalg.norm(position - along[..., None] * sun, axis=-1)
+    return np.asarray((along > 0.0) | (across > _EARTH_RADIUS_KM), dtype=np.bool_)
+
+
+def _group_by_satellite(owner: npt.NDArray[np.intp]) -> list[tuple[int, npt.NDArray[np.intp]]]:
+    """Split element indices by the satellite that owns them."""
+    order = np.argsort(owner, kind="stable")
+    satellites, starts = np.unique(owner[order], return_index=True)
+    return list(zip(satellites.tolist(), np.split(order, starts[1:]), strict=True))
+
+
+def _track(
+    satrecs: Sequence[Any],
+    groups: list[tuple[int, npt.NDArray[np.intp]]],
+    latitude: float,
+    longitude: float,
+    elevation_m: float,
+    unix: FloatArray,
+) -> tuple[FloatArray, FloatArray]:
+    """Altitudes (degrees) and TEME positions (km) of many satellites, each at its own times."""
+    positions = np.empty((len(unix), 3))
+    failed = np.empty(len(unix), dtype=bool)
+    for index, probes in groups:
+        errors, positions[probes], _velocities = satrecs[index].sgp4_array(*_split_julian(unix[probes]))
+        failed[probes] = errors != 0
+    observer, up = _observer_vectors(latitude, longitude, elevation_m, unix)
+    return np.where(failed, -90.0, _altitude(positions, observer, up)), positions
+
+
+def _predict_chunk(
+    tles: Sequence[TLE],
+    latitude: float,
+    longitude: float,
+    elevation_m: float,
+    start: float,
+    end: float,
+    min_altitude_deg: float,
+    step_seconds: float,
+) -> tuple[list[PredictedPass], int]:
+    """Find the passes of one chunk of satellites (runs in a worker process)."""
+    from sgp4.api import Satrec, SatrecArray
+
+    satrecs = [Satrec.twoline2rv(line1, line2) for _, line1, line2 in tles]
+    count = max(2, int(np.ceil((end - start) / step_seconds)) + 1)
+    times = np.linspace(start, end, count)
+
+    # Coarse screen: all satellites at all grid times in one call
+    errors, positions, _velocities = SatrecArray(satrecs).sgp4(*_split_julian(times))
+    observer, up = _observer_vectors(latitude, longitude, elevation_m, times)
+    altitudes = _altitude(positions, observer, up)
+    altitudes[errors != 0] = -90.0
+    above = altitudes > 0.0
+
+    # Pair each rise with the next set; keep runs that peak near the minimum
+    owners, rises, sets, peaks = [], [], [], []
+    for index in range(len(satrecs)):
+        rise = np.flatnonzero(~above[index, :-1] & above[index, 1:])
+        set_ = np.flatnonzero(above[index, :-1] & ~above[index, 1:])
+        following = np.searchsorted(set_, rise)
+        rise, set_ = rise[following < len(set_)], set_[following[following < len(set_)]]
+        peak = np.array(
+            [r + 1 + np.argmax(altitudes[index, r + 1 : s + 1]) for r, s in zip(rise, set_, strict=True)],
+            dtype=np.intp,
+        )
+        keep = altitudes[index, peak] >= min_altitude_deg - _SCREEN_MARGIN_DEG
+        owners.append(np.full(np.count_nonzero(keep), index, dtype=np.intp))
+        rises.append(rise[keep])
+        sets.append(set_[keep])
+        peaks.append(peak[keep])
+    owner = np.concatenate(owners)
+    candidates = len(owner)
+    if not candidates:
+        return [], 0
+    rise, set_, peak = np.concatenate(rises), np.concatenate(sets), np.concatenate(peaks)
+
+    # Refine all candidates together: bisect rise and set crossings and
+    # golden-section search the peak, one propagation per satellite per step
+    low = np.concatenate([times[rise], times[set_]])
+    high = low + (times[1] - times[0])
+    low_above = np.repeat([False, True], candidates)
+    a, b = times[np.maximum(peak - 1, 0)], times[np.minimum(peak + 1, count - 1)]
+    probe_groups = _group_by_satellite(np.tile(owner, 4))
+    for _ in range(_REFINE_ITERATIONS):
+        middle = 0.5 * (low + high)
+        c, d = b - _GOLDEN * (b - a), a + _GOLDEN * (b - a)
+        values, _ = _track(satrecs, probe_groups, latitude, longitude, elevation_m, np.concatenate([middle, c, d]))
+        same = (values[: 2 * candidates] > 0.0) == low_above
+        low, high = np.where(same, middle, low), np.where(same, high, middle)
+        left_higher = values[2 * candidates : 3 * candidates] > values[3 * candidates :]
+        a, b = np.where(left_higher, a, c), np.where(left_higher, d, b)
+
+    # Rise, culmination and set of every candidate in one propagation
+    crossings = 0.5 * (low + high)
+    events = np.concatenate([crossings[:candidates], 0.5 * (a + b), crossings[candidates:]])
+    event_altitudes, event_positions = _track(
+        satrecs, _group_by_satellite(np.tile(owner, 3)), latitude, longitude, elevation_m, events
+    )
+    azimuths, ranges = _azimuth_and_range(event_positions, latitude, longitude, elevation_m, events)
+    rise_at, peak_at, set_at = (
+        np.arange(candidates),
+        np.arange(candidates, 2 * candidates),
+        np.arange(2 * candidates, 3 * candidates),
+    )
+    passed = np.flatnonzero(event_altitudes[peak_at] >= min_altitude_deg)
+    peak_at = peak_at[passed]
+
+    # Sunlight and sky darkness for every pass at once
+    sun = _sun_direction(events[peak_at])
+    sunlit = _is_sunlit(event_positions[peak_at], sun)
+    _site, vertical = _observer_vectors(latitude, longitude, elevation_m, events[peak_at])
+    sun_altitudes = np.degrees(np.arcsin(np.clip(np.sum(sun * vertical, axis=-1), -1.0, 1.0)))
+
+    passes = [
+        PredictedPass(
+            name=tles[owner[j]][0],
+            rise_time=datetime.fromtimestamp(events[rise_at[j]], UTC),
+            culmination_time=datetime.fromtimestamp(events[peak], UTC),
+            set_time=datetime.fromtimestamp(events[set_at[j]], UTC),
+            max_altitude_deg=float(event_altitudes[peak]),
+            is_sunlit=bool(sunlit[k]),
+            sun_altitude_deg=float(sun_altitudes[k]),
+            rise_azimuth_deg=float(azimuths[rise_at[j]]),
+            culmination_azimuth_deg=float(azimuths[peak]),
+            set_azimuth_deg=float(azimuths[set_at[j]]),
+            range_km=float(ranges[peak]),
+        )
+        for k, (j, peak) in enumerate(zip(passed, peak_at, strict=True))
+    ]
+    return passes, candidates
+
+
+@deal.pre(lambda tles, latitude, *args, **kwargs: -90 <= latitude <= 90, message="Latitude must be -90 to +90 degrees")
+@deal.pre(lambda _: _.step_seconds > 0 and _.chunk_size > 0, message="Step and chunk size must be positive")
+def predict_passes(
+    tles: Sequence[TLE],
+    latitude: float,
+    longitude: float,
+    start: datetime,
+    end: datetime,
+    min_altitude_deg: float = 10.0,
+    elevation_m: float = 0.0,
+    step_seconds: float = DEFAULT_STEP_SECONDS,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> PassSearchResult:
+    """
+    Predict passes of many satellites over an observer.
+
+    Satellites are split into chunks; each chunk is screened on a coarse
+    grid and its candidate passes refined, in a process pool when there is
+    more than one worker. By default there is one worker per available CPU,
+    as long as each gets enough satellites to repay starting its process;
+    small searches and single-CPU hosts stay in this process. If the pool
+    cannot be started the chunks run in this process instead.
+
+    Args:
+        tles: (name, line1, line2) for each satellite (see tle_from_satellite)
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        start: Start of the search window (naive means UTC)
+        end: End of the search window (naive means UTC)
+        min_altitude_deg: Minimum peak altitude for a pass
+        elevation_m: Observer elevation in meters
+        step_seconds: Coarse grid step
+        workers: Worker processes (default: one per CPU when worth it, 1 to stay in process)
+        chunk_size: Satellites per worker task
+
+    Returns:
+        PassSearchResult with passes sorted by rise time
+    """
+    started = time.perf_counter()
+    start_unix = (start if start.tzinfo is not None else start.replace(tzinfo=UTC)).timestamp()
+    end_unix = (end if end.tzinfo is not None else end.replace(tzinfo=UTC)).timestamp()
+    if workers is None:
+        workers = min(_available_cpus(), len(tles) // _MIN_SATELLITES_PER_WORKER)
+    if workers > 1:
+        # At least one chunk per worker, so none of them sits idle
+        chunk_size = min(chunk_size, -(-len(tles) // workers))
+    chunks = [tles[i : i + chunk_size] for i in range(0, len(tles), chunk_size)]
+    task = partial(
+        _predict_chunk,
+        latitude=latitude,
+        longitude=longitude,
+        elevation_m=elevation_m,
+        start=start_unix,
+        end=end_unix,
+        min_altitude_deg=min_altitude_deg,
+        step_seconds=step_seconds,
+    )
+
+    workers = min(workers, len(chunks))
+    results: list[tuple[list[PredictedPass], int]] | None = None
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(task, chunks))
+        except (OSError, BrokenProcessPool) as e:
+            # OSError: processes cannot be created here (sandbox, limits)
+            # BrokenProcessPool: a worker died (e.g. killed for memory)
+            logger.warning(f"Pass prediction pool failed, continuing in process: {e}")
+    if results is None:
+        results = [task(chunk) for chunk in chunks]
+
+    passes = sorted((p for chunk_passes, _ in results for p in chunk_passes), key=lambda p: p.rise_time)
+    result = PassSearchResult(
+        passes=tuple(passes),
+        satellites=len(tles),
+        candidates=sum(candidates for _, candidates in results),
+        elapsed_seconds=time.perf_counter() - started,
+    )
+    logger.debug(
+        f"Predicted {len(passes)} passes of {result.satellites} satellites "
+        f"({result.candidates} candidates) at {result.satellites_per_second:.0f} satellites/s"
+    )
+    return result
@@ -127,10 +127,9 @@ def get_bright_satellite_passes(
 
     # Create observer and load timescale once (reused for all satellites)
     observer = wgs84.latlon(location.latitude, location.longitude)
-    from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+    from celestron_nexstar.api.ephemeris.registry import get_timescale
 
-    loader = get_skyfield_loader()
-    ts = loader.timescale()
+    ts = get_timescale()
     t0 = ts.from_datetime(start_time)
     t1 = ts.from_datetime(end_time)
 
@@ -451,6 +450,11 @@ async def _store_group_tle(
             )
             db_session.add(tle_model)
 
+        # Passes predicted from older TLEs of these satellites are now stale
+        from celestron_nexstar.api.events.pass_cache import invalidate_stale_passes, tle_cache_key
+
+        invalidate_stale_passes(db_session, dict(tle_cache_key(line1, line2) for _, _, line1, line2 in tle_list))
+
         db_session.commit()
         logger.info(f"Stored {len(tle_list)} {group_name} TLE records in database")
 
@@ -512,10 +516,9 @@ async def _get_group_satellites(
         await _store_group_tle(tle_list, group_name, db_session)
 
     # Create satellite objects
-    from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
+    from celestron_nexstar.api.ephemeris.registry import get_timescale
 
-    loader = get_skyfield_loader()
-    ts = loader.timescale()
+    ts = get_timescale()
     satellites = []
 
     for norad_id, name, line1, line2 in tle_list:
@@ -584,7 +587,7 @@ def get_starlink_passes(
     end_time = start_time + timedelta(days=days)
 
     return _calculate_passes_for_satellites(
-        satellites, location, start_time, end_time, min_altitude_deg, max_passes, "Starlink"
+        satellites, location, start_time, end_time, min_altitude_deg, max_passes, "Starlink", db_session
     )
 
 
@@ -610,10 +613,14 @@ def _calculate_passes_for_satellites(
     min_altitude_deg: float,
     max_passes: int,
     group_name: str = "satellite",
+    db_session: Session | None = None,
 ) -> list[SatellitePass]:
     """
     Calculate passes for a list of satellites.
 
+    Passes are cached in the database by TLE epoch and observer geohash, so
+    only windows not computed before are searched.
+
     Args:
         satellites: List of EarthSatellite objects
         location: Observer location
@@ -622,6 +629,7 @@ def _calculate_passes_for_satellites(
         min_altitude_deg: Minimum peak altitude for pass
         max_passes: Maximum number of passes to return
         group_name: Name of satellite group (for notes)
+        db_session: Database session (optional, for caching)
 
     Returns:
         List of SatellitePass objects
@@ -630,95 +638,51 @@ def _calculate_passes_for_satellites(
         logger.warning(f"No {group_name} satellites available")
         return []
 
-    passes: list[SatellitePass] = []
-    observer = wgs84.latlon(location.latitude, location.longitude)
+    from celestron_nexstar.api.events.pass_cache import get_cached_passes
+    from celestron_nexstar.api.events.pass_engine import tle_from_satellite
 
-    # Load timescale and ephemeris
-    from celestron_nexstar.api.ephemeris.skyfield_utils import get_skyfield_loader
-
-    loader = get_skyfield_loader()
-    ts = loader.timescale()
-    t0 = ts.from_datetime(start_time)
-    t1 = ts.from_datetime(end_time)
-
-    # Load ephemeris for sun visibility check
-    eph = loader("de421.bsp")
-
-    # Calculate passes for each satellite
+    tles = []
     for satellite in satellites:
         try:
-            # Find events: 0=rise, 1=culminate (max alt), 2=set
-            t, events = satellite.find_events(observer, t0, t1, altitude_degrees=0.0)
-
-            # Group events into passes (rise -> culminate -> set)
-            i = 0
-            while i < len(events) and len(passes) < max_passes:
-                if events[i] == 0:  # Rise event
-                    rise_t = t[i]
-                    rise_time = rise_t.utc_datetime()
-
-                    # Look for culmination
-                    if i + 1 < len(events) and events[i + 1] == 1:
-                        max_t = t[i + 1]
-                        max_time = max_t.utc_datetime()
-
-                        # Look for set
-                        if i + 2 < len(events) and events[i + 2] == 2:
-                            set_t = t[i + 2]
-                            set_time = set_t.utc_datetime()
-
-                            # Calculate max altitude
-                            difference_max = satellite - observer
-                            topocentric_max = difference_max.at(max_t)
-                            alt_max, _az_max, _distance = topocentric_max.altaz()
-                            max_altitude = alt_max.degrees
-
-                            # Filter by minimum altitude
-                            if max_altitude >= min_altitude_deg:
-                                # Check if sunlit (visible)
-                                is_sunlit = satellite.at(max_t).is_sunlit(eph)
-
-                                # Estimate magnitude (rough estimate based on altitude)
-                                magnitude = 3.0 + (90 - max_altitude) / 30.0
-                                if not is_sunlit:
-                                    magnitude = 10.0  # Not visible if in shadow
-
-                                # Get satellite name from TLE
-                                satellite_name = str(satellite.name) if hasattr(satellite, "name") else group_name
-
-                                passes.append(
-                                    SatellitePass(
-                                        name=satellite_name,
-                                        rise_time=rise_time,
-                                        max_time=max_time,
-                                        set_time=set_time,
-                                        max_altitude_deg=max_altitude,
-                                        magnitude=magnitude,
-                                        is_visible=is_sunlit,
-                                        notes=f"{group_name.title()} satellite pass",
-                                    )
-                                )
-
-                            i += 3  # Move past rise-culminate-set
-                            continue
-
-                i += 1
-
-        except (ValueError, TypeError, AttributeError, ZeroDivisionError, KeyError, IndexError) as e:
-            # ValueError: invalid time/coordinate calculations
-            # TypeError: wrong data types
-            # AttributeError: missing satellite/position attributes
-            # ZeroDivisionError: division by zero in calculations
-            # KeyError: missing keys in data
-            # IndexError: missing array indices
-            logger.debug(f"Error calculating passes for satellite: {e}")
-            continue
+            tles.append(tle_from_satellite(satellite))
+        except (ValueError, AttributeError) as e:
+            # ValueError: orbital elements cannot be written as a TLE
+            # AttributeError: not a TLE-based satellite
+            logger.debug(f"Skipping satellite without usable TLE: {e}")
+
+    predictions = get_cached_passes(
+        tles,
+        location.latitude,
+        location.longitude,
+        start_time,
+        end_time,
+        min_altitude_deg=min_altitude_deg,
+        elevation_m=location.elevation,
+        db_session=db_session,
+    )
 
-    # Sort by rise time
-    passes.sort(key=lambda p: p.rise_time)
+    passes: list[SatellitePass] = []
+    for prediction in predictions[:max_passes]:
+        # Estimate magnitude (rough estimate based on altitude)
+        magnitude = 3.0 + (90 - prediction.max_altitude_deg) / 30.0
+        if not prediction.is_sunlit:
+            magnitude = 10.0  # Not visible if in shadow
+
+        passes.append(
+            SatellitePass(
+                name=prediction.name,
+                rise_time=prediction.rise_time,
+                max_time=prediction.culmination_time,
+                set_time=prediction.set_time,
+                max_altitude_deg=prediction.max_altitude_deg,
+                magnitude=magnitude,
+                is_visible=prediction.is_visible,
+                notes=f"{group_name.title()} satellite pass",
+            )
+        )
 
-    logger.info(f"Found {len(passes)} {group_name} passes")
-    return passes[:max_passes]
+    logger.info(f"Found {len(predictions)} {group_name} passes")
+    return passes
 
 
 def get_stations_passes(
@@ -764,7 +728,7 @@ def get_stations_passes(
     end_time = start_time + timedelta(days=days)
 
     return _calculate_passes_for_satellites(
-        satellites, location, start_time, end_time, min_altitude_deg, max_passes, "space station"
+        satellites, location, start_time, end_time, min_altitude_deg, max_passes, "space station", db_session
     )
 
 
@@ -811,5 +775,5 @@ def get_visual_passes(
     end_time = start_time + timedelta(days=days)
 
     return _calculate_passes_for_satellites(
-        satellites, location, start_time, end_time, min_altitude_deg, max_passes, "visual"
+        satellites, location, start_time, end_time, min_altitude_deg, max_passes, "visual", db_session
     )
@@ -9,12 +9,20 @@ from __future__ import annotations
 
 import contextlib
 import logging
+import math
+import struct
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from threading import Lock
+from typing import Any
 
+import numpy as np
+import numpy.typing as npt
 import requests
 import requests_cache
+from cachetools import TTLCache
 from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
 
 
@@ -30,15 +38,40 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "NOAAScale",
     "OvationAuroraForecast",
+    "OvationAuroraGrid",
     "SpaceWeatherConditions",
     "get_goes_xray_data",
     "get_ovation_aurora_forecast",
+    "get_ovation_aurora_grid",
     "get_radio_flux_107",
     "get_solar_wind_data",
     "get_space_weather_conditions",
+    "parse_ovation_grid",
 ]
 
 
+SWPC_BASE_URL = "https://services.swpc.noaa.gov"
+SOLAR_WIND_PLASMA_URL = f"{SWPC_BASE_URL}/products/solar-wind/plasma-7-day.json"
+SOLAR_WIND_MAG_URL = f"{SWPC_BASE_URL}/products/solar-wind/mag-7-day.json"
+GOES_XRS_URL = f"{SWPC_BASE_URL}/json/goes/goes-xrs-report.json"
+RADIO_FLUX_URL = f"{SWPC_BASE_URL}/json/radio_flux/daily_flux.json"
+PROTON_FLUX_URL = f"{SWPC_BASE_URL}/json/goes/goes-proton-flux.json"
+PROTON_FLUX_FALLBACK_URL = f"{SWPC_BASE_URL}/products/goes/goes-proton-flux.json"
+KP_FORECAST_URL = f"{SWPC_BASE_URL}/products/noaa-planetary-k-index-forecast.json"
+OVATION_URL = f"{SWPC_BASE_URL}/json/ovation_aurora_latest.json"
+
+# Ovation intensities are normalized by this to give probabilities
+OVATION_INTENSITY_SCALE = 15.0
+
+# Binary grid cache: magic, forecast and observation times (Unix seconds),
+# rows, columns, first latitude/longitude and their steps
+_OVATION_MAGIC = b"OVG1"
+_OVATION_HEADER = struct.Struct("<4sddiidddd")
+_OVATION_MAX_AGE_SECONDS = 1800
+_ovation_cache: TTLCache[Path, OvationAuroraGrid] = TTLCache(maxsize=4, ttl=_OVATION_MAX_AGE_SECONDS)
+_ovation_cache_lock = Lock()
+
+
 @dataclass
 class NOAAScale:
     """NOAA Space Weather Scale value."""
@@ -148,6 +181,164 @@ def _parse_noaa_scale(scale_str: str | None, scale_type: str) -> NOAAScale | Non
     return None
 
 
+def _entry_time(entry: dict[str, object], *keys: str) -> datetime | None:
+    """Extract the timestamp of a feed entry from the first key present, or None if invalid."""
+    time_str = next((entry.get(key) for key in keys if entry.get(key)), None)
+    if not time_str:
+        return None
+    with contextlib.suppress(ValueError, AttributeError):
+        if isinstance(time_str, str):
+            return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    return None
+
+
+def _latest_entry(data: list[Any], *time_keys: str) -> dict[str, Any] | None:
+    """Get the most recent entry of a list-of-objects feed."""
+    # Filter entries with valid timestamps and get the latest
+    entries_with_times = [
+        (entry, time)
+        for entry in data
+        if isinstance(entry, dict) and (time := _entry_time(entry, *time_keys)) is not None
+    ]
+    latest_pair = max(entries_with_times, key=lambda x: x[1], default=None)
+    return latest_pair[0] if latest_pair else None
+
+
+def _parse_solar_wind(plasma: Any, mag: Any) -> dict[str, float | None]:
+    """Parse the latest solar wind values from the plasma and magnetic field feeds."""
+    if not plasma or len(plasma) < 2:
+        return {}
+
+    # Format: First row is header, subsequent rows are data
+    # Header: ["time_tag", "density", "speed", "temperature"]
+    # Get the most recent entry (last row)
+    latest_row = plasma[-1]
+    try:
+        density = float(latest_row[1]) if latest_row[1] else None
+        speed = float(latest_row[2]) if latest_row[2] else None
+    except (IndexError, ValueError, TypeError):
+        density = None
+        speed = None
+
+    bt = None
+    bz = None
+    if mag and len(mag) >= 2:
+        # Header: ["time_tag", "bt", "bz", "phi", "theta"]
+        latest_mag = mag[-1]
+        try:
+            bt = float(latest_mag[1]) if latest_mag[1] else None
+            bz = float(latest_mag[2]) if latest_mag[2] else None
+        except (IndexError, ValueError, TypeError):
+            bt = None
+            bz = None
+
+    return {
+        "solar_wind_speed": speed,
+        "solar_wind_bt": bt,
+        "solar_wind_bz": bz,
+        "solar_wind_density": density,
+    }
+
+
+def _parse_goes_xray(data: Any) -> dict[str, float | str | None]:
+    """Parse the latest X-ray flux and class from the GOES XRS report."""
+    if not data:
+        return {}
+
+    latest = _latest_entry(data, "time_tag")
+    if not latest:
+        return {}
+
+    flux = latest.get("flux")
+    xray_class = latest.get("class")
+
+    # Convert flux to float if it's a string
+    xray_flux = None
+    if flux:
+        with contextlib.suppress(ValueError, TypeError):
+            xray_flux = float(flux)
+
+    return {
+        "xray_flux": xray_flux,
+        "xray_class": str(xray_class) if xray_class else None,
+    }
+
+
+def _parse_xrs_radio_flux(data: Any) -> float | None:
+    """Look for a 10.7cm radio flux value in the GOES XRS report."""
+    # The structure may vary, so we'll try multiple approaches
+    field_names = ("flux_107", "f107", "radio_flux")
+    for entry in data or []:
+        if isinstance(entry, dict):
+            # Try common field names
+            flux_107 = next((entry.get(field) for field in field_names if entry.get(field)), None)
+            if flux_107:
+                with contextlib.suppress(ValueError, TypeError):
+                    return float(flux_107)
+    return None
+
+
+def _parse_daily_radio_flux(data: Any) -> float | None:
+    """Parse the most recent 10.7cm radio flux from the daily solar flux feed."""
+    if not data or not isinstance(data, list):
+        return None
+    latest_entry = _latest_entry(data, "time_tag", "date", "time")
+    if latest_entry:
+        flux_value = latest_entry.get("flux") or latest_entry.get("f107") or latest_entry.get("flux_107")
+        if flux_value:
+            with contextlib.suppress(ValueError, TypeError):
+                return float(flux_value)
+    return None
+
+
+def _parse_proton_flux(data: Any) -> dict[str, float | None]:
+    """Parse the latest >10 MeV proton flux from the GOES proton flux feed."""
+    if data and isinstance(data, list):
+        latest = _latest_entry(data, "time_tag", "time")
+        if latest:
+            # Look for >10 MeV proton flux
+            flux_10mev = latest.get("flux_10mev") or latest.get("p10") or latest.get("proton_flux")
+            if flux_10mev:
+                with contextlib.suppress(ValueError, TypeError):
+                    return {"proton_flux_10mev": float(flux_10mev)}
+    return {}
+
+
+def _parse_kp(data: Any) -> dict[str, float | None]:
+    """Parse the most recent observed Kp index from the planetary K-index forecast."""
+    if not data or len(data) < 2:
+        return {}
+
+    # Find the most recent observed value
+    def get_kp_entry_time(row: list[object]) -> datetime | None:
+        """Extract datetime from Kp data row if it's observed."""
+        if len(row) < 3:
+            return None
+        try:
+            observed = str(row[2]).lower() if row[2] else ""
+            if observed == "observed":
+                time_str = str(row[0])
+                return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC)
+        except (ValueError, IndexError, TypeError, AttributeError):
+            pass
+        return None
+
+    # Filter rows with valid timestamps and get the latest
+    rows_with_times = [
+        (row, time) for row in data[1:] if len(row) >= 3 and (time := get_kp_entry_time(row)) is not None
+    ]
+    if rows_with_times:
+        latest_row_pair = max(rows_with_times, key=lambda x: x[1])
+        latest_row = latest_row_pair[0]
+        try:
+            latest_kp = float(latest_row[1])
+            return {"kp_index": latest_kp}
+        except (ValueError, IndexError, TypeError):
+            pass
+
+    return {"kp_index": None}
+
+
 def get_solar_wind_data() -> dict[str, float | None]:
     """
     Fetch current solar wind data from NOAA SWPC.
@@ -159,49 +350,18 @@ def get_solar_wind_data() -> dict[str, float | None]:
         session = _get_cached_session()
 
         # Try 7-day plasma data (most recent)
-        url = "https://services.swpc.noaa.gov/products/solar-wind/plasma-7-day.json"
-        response = session.get(url, timeout=10)
+        response = session.get(SOLAR_WIND_PLASMA_URL, timeout=10)
         response.raise_for_status()
         data = response.json()
 
         if not data or len(data) < 2:
             return {}
 
-        # Format: First row is header, subsequent rows are data
-        # Header: ["time_tag", "density", "speed", "temperature"]
-        # Get the most recent entry (last row)
-        latest_row = data[-1]
-        try:
-            density = float(latest_row[1]) if latest_row[1] else None
-            speed = float(latest_row[2]) if latest_row[2] else None
-        except (IndexError, ValueError, TypeError):
-            density = None
-            speed = None
-
         # Get magnetic field data
-        mag_url = "https://services.swpc.noaa.gov/products/solar-wind/mag-7-day.json"
-        mag_response = session.get(mag_url, timeout=10)
-        bt = None
-        bz = None
-
-        if mag_response.status_code == 200:
-            mag_data = mag_response.json()
-            if mag_data and len(mag_data) >= 2:
-                # Header: ["time_tag", "bt", "bz", "phi", "theta"]
-                latest_mag = mag_data[-1]
-                try:
-                    bt = float(latest_mag[1]) if latest_mag[1] else None
-                    bz = float(latest_mag[2]) if latest_mag[2] else None
-                except (IndexError, ValueError, TypeError):
-                    bt = None
-                    bz = None
-
-        return {
-            "solar_wind_speed": speed,
-            "solar_wind_bt": bt,
-            "solar_wind_bz": bz,
-            "solar_wind_density": density,
-        }
+        mag_response = session.get(SOLAR_WIND_MAG_URL, timeout=10)
+        mag_data = mag_response.json() if mag_response.status_code == 200 else None
+
+        return _parse_solar_wind(data, mag_data)
     except (requests.RequestException, ValueError, TypeError, KeyError, IndexError, TimeoutError) as e:
         # requests.RequestException: HTTP/network errors
         # ValueError: invalid JSON or data format
@@ -224,50 +384,9 @@ def get_goes_xray_data() -> dict[str, float | str | None]:
         session = _get_cached_session()
 
         # GOES XRS report
-        url = "https://services.swpc.noaa.gov/json/goes/goes-xrs-report.json"
-        response = session.get(url, timeout=10)
+        response = session.get(GOES_XRS_URL, timeout=10)
         response.raise_for_status()
-        data = response.json()
-
-        if not data:
-            return {}
-
-        # Find the most recent entry using max() with key function
-        def get_entry_time(entry: dict[str, object]) -> datetime | None:
-            """Extract datetime from entry, or return None if invalid."""
-            time_str = entry.get("time_tag")
-            if not time_str:
-                return None
-            with contextlib.suppress(ValueError, AttributeError):
-                if isinstance(time_str, str):
-                    return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-            return None
-
-        # Filter entries with valid timestamps and get the latest
-        entries_with_times = [
-            (entry, time) for entry in data if isinstance(entry, dict) and (time := get_entry_time(entry)) is not None
-        ]
-        latest_pair = max(entries_with_times, key=lambda x: x[1], default=None)
-        latest = latest_pair[0] if latest_pair else None
-
-        if latest:
-            flux = latest.get("flux")
-            xray_class = latest.get("class")
-
-            # Convert flux to float if it's a string
-            xray_flux = None
-            if flux:
-                with contextlib.suppress(ValueError, TypeError):
-                    xray_flux = float(flux)
-
-            xray_class_str = str(xray_class) if xray_class else None
-
-            return {
-                "xray_flux": xray_flux,
-                "xray_class": xray_class_str,
-            }
-
-        return {}
+        return _parse_goes_xray(response.json())
     except (requests.RequestException, ValueError, TypeError, KeyError, IndexError, TimeoutError) as e:
         # requests.RequestException: HTTP/network errors
         # ValueError: invalid JSON or data format
@@ -293,60 +412,22 @@ def get_radio_flux_107() -> float | None:
         session = _get_cached_session()
 
         # Try the GOES XRS report which sometimes includes radio flux
-        # Alternative: Use daily solar data endpoint if available
-        url = "https://services.swpc.noaa.gov/json/goes/goes-xrs-report.json"
-        response = session.get(url, timeout=10)
+        response = session.get(GOES_XRS_URL, timeout=10)
         response.raise_for_status()
         data = response.json()
 
         if not data:
             return None
 
-        # Look for radio flux in the data
-        # The structure may vary, so we'll try multiple approaches
-        field_names = ("flux_107", "f107", "radio_flux")
-        for entry in data:
-            if isinstance(entry, dict):
-                # Try common field names
-                flux_107 = next((entry.get(field) for field in field_names if entry.get(field)), None)
-                if flux_107:
-                    with contextlib.suppress(ValueError, TypeError):
-                        return float(flux_107)
+        flux_107 = _parse_xrs_radio_flux(data)
+        if flux_107 is not None:
+            return flux_107
 
         # Try alternative endpoint for daily solar flux
-        # NOAA provides daily solar flux data
         try:
-            flux_url = "https://services.swpc.noaa.gov/json/radio_flux/daily_flux.json"
-            flux_response = session.get(flux_url, timeout=10)
+            flux_response = session.get(RADIO_FLUX_URL, timeout=10)
             if flux_response.status_code == 200:
-                flux_data = flux_response.json()
-                if flux_data and isinstance(flux_data, list):
-                    # Get the most recent entry
-                    def get_flux_entry_time(entry: dict[str, object]) -> datetime | None:
-                        """Extract datetime from flux entry."""
-                        time_str = entry.get("time_tag") or entry.get("date") or entry.get("time")
-                        if not time_str:
-                            return None
-                        with contextlib.suppress(ValueError, AttributeError):
-                            if isinstance(time_str, str):
-                                return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                        return None
-
-                    # Filter entries with valid timestamps and get the latest
-                    entries_with_times = [
-                        (entry, time)
-                        for entry in flux_data
-                        if isinstance(entry, dict) and (time := get_flux_entry_time(entry)) is not None
-                    ]
-                    latest_entry_pair = max(entries_with_times, key=lambda x: x[1], default=None)
-                    latest_entry = latest_entry_pair[0] if latest_entry_pair else None
-                    if latest_entry:
-                        flux_value = (
-                            latest_entry.get("flux") or latest_entry.get("f107") or latest_entry.get("flux_107")
-                        )
-                        if flux_value:
-                            with contextlib.suppress(ValueError, TypeError):
-                                return float(flux_value)
+                return _parse_daily_radio_flux(flux_response.json())
         except (KeyError, IndexError, AttributeError):
             # KeyError: missing keys in response
             # IndexError: missing array indices
@@ -381,46 +462,13 @@ def get_proton_flux_data() -> dict[str, float | None]:
     try:
         session = _get_cached_session()
 
-        # Try GOES proton flux endpoint
-        # Common endpoint: goes-proton-flux or similar
-        # Note: Exact endpoint may need verification
-        url = "https://services.swpc.noaa.gov/json/goes/goes-proton-flux.json"
-        response = session.get(url, timeout=10)
-
+        # Try GOES proton flux endpoint, then the alternative endpoint format
+        response = session.get(PROTON_FLUX_URL, timeout=10)
         if response.status_code != 200:
-            # Try alternative endpoint format
-            url = "https://services.swpc.noaa.gov/products/goes/goes-proton-flux.json"
-            response = session.get(url, timeout=10)
+            response = session.get(PROTON_FLUX_FALLBACK_URL, timeout=10)
 
         if response.status_code == 200:
-            data = response.json()
-            if data and isinstance(data, list):
-                # Find the most recent entry
-                def get_proton_entry_time(entry: dict[str, object]) -> datetime | None:
-                    """Extract datetime from proton flux entry."""
-                    time_str = entry.get("time_tag") or entry.get("time")
-                    if not time_str:
-                        return None
-                    with contextlib.suppress(ValueError, AttributeError):
-                        if isinstance(time_str, str):
-                            return datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                    return None
-
-                # Filter entries with valid timestamps and get the latest
-                entries_with_times = [
-                    (entry, time)
-                    for entry in data
-                    if isinstance(entry, dict) and (time := get_proton_entry_time(entry)) is not None
-                ]
-                latest_pair = max(entries_with_times, key=lambda x: x[1], default=None)
-                latest = latest_pair[0] if latest_pair else None
-
-                if latest:
-                    # Look for >10 MeV proton flux
-                    flux_10mev = latest.get("flux_10mev") or latest.get("p10") or latest.get("proton_flux")
-                    if flux_10mev:
-                        with contextlib.suppress(ValueError, TypeError):
-                            return {"proton_flux_10mev": float(flux_10mev)}
+            return _parse_proton_flux(response.json())
 
         return {}
     except (requests.RequestException, ValueError, TypeError, KeyError, IndexError, TimeoutError) as e:
@@ -445,42 +493,9 @@ def get_kp_ap_data() -> dict[str, float | None]:
         session = _get_cached_session()
 
         # Kp forecast includes current observed values
-        url = "https://services.swpc.noaa.gov/products/noaa-planetary-k-index-forecast.json"
-        response = session.get(url, timeout=10)
+        response = session.get(KP_FORECAST_URL, timeout=10)
         response.raise_for_status()
-        data = response.json()
-
-        if not data or len(data) < 2:
-            return {}
-
-        # Find the most recent observed value
-        def get_kp_entry_time(row: list[object]) -> datetime | None:
-            """Extract datetime from Kp data row if it's observed."""
-            if len(row) < 3:
-                return None
-            try:
-                observed = str(row[2]).lower() if row[2] else ""
-                if observed == "observed":
-                    time_str = str(row[0])
-                    return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S").replace(tzinfo=UTC)
-            except (ValueError, IndexError, TypeError, AttributeError):
-                pass
-            return None
-
-        # Filter rows with valid timestamps and get the latest
-        rows_with_times = [
-            (row, time) for row in data[1:] if len(row) >= 3 and (time := get_kp_entry_time(row)) is not None
-        ]
-        if rows_with_times:
-            latest_row_pair = max(rows_with_times, key=lambda x: x[1])
-            latest_row = latest_row_pair[0]
-            try:
-                latest_kp = float(latest_row[1])
-                return {"kp_index": latest_kp}
-            except (ValueError, IndexError, TypeError):
-                pass
-
-        return {"kp_index": None}
+        return _parse_kp(response.json())
     except (requests.RequestException, KeyError, TimeoutError) as e:
         # requests.RequestException: HTTP/network errors
         # KeyError: missing keys in response
@@ -493,20 +508,37 @@ def get_space_weather_conditions() -> SpaceWeatherConditions:
     """
     Fetch current space weather conditions from NOAA SWPC.
 
+    Feeds are fetched one after another; use
+    ``async_space_weather.fetch_space_weather_conditions`` to fetch them
+    concurrently.
+
     Returns:
         SpaceWeatherConditions object with current data
     """
+    return _build_conditions(
+        solar_wind=get_solar_wind_data(),
+        xray_data=get_goes_xray_data(),
+        kp_data=get_kp_ap_data(),
+        radio_flux_107=get_radio_flux_107(),
+        proton_data=get_proton_flux_data(),
+    )
+
+
+def _build_conditions(
+    solar_wind: dict[str, float | None],
+    xray_data: dict[str, float | str | None],
+    kp_data: dict[str, float | None],
+    radio_flux_107: float | None,
+    proton_data: dict[str, float | None],
+) -> SpaceWeatherConditions:
+    """Combine parsed feed values into conditions with NOAA scales and alerts."""
     conditions = SpaceWeatherConditions(last_updated=datetime.now(UTC))
 
-    # Fetch solar wind data
-    solar_wind = get_solar_wind_data()
     conditions.solar_wind_speed = solar_wind.get("solar_wind_speed")
     conditions.solar_wind_bt = solar_wind.get("solar_wind_bt")
     conditions.solar_wind_bz = solar_wind.get("solar_wind_bz")
     conditions.solar_wind_density = solar_wind.get("solar_wind_density")
 
-    # Fetch X-ray data
-    xray_data = get_goes_xray_data()
     xray_flux_val = xray_data.get("xray_flux")
     xray_class_val = xray_data.get("xray_class")
     if isinstance(xray_flux_val, float):
@@ -514,15 +546,8 @@ def get_space_weather_conditions() -> SpaceWeatherConditions:
     if isinstance(xray_class_val, str):
         conditions.xray_class = xray_class_val
 
-    # Fetch Kp index
-    kp_data = get_kp_ap_data()
     conditions.kp_index = kp_data.get("kp_index")
-
-    # Fetch 10.7cm radio flux
-    conditions.radio_flux_107 = get_radio_flux_107()
-
-    # Fetch proton flux for S-scale calculation
-    proton_data = get_proton_flux_data()
+    conditions.radio_flux_107 = radio_flux_107
     proton_flux_10mev = proton_data.get("proton_flux_10mev")
 
     # Determine NOAA scales from Kp index, X-ray class, and proton flux
@@ -636,8 +661,7 @@ def get_ovation_aurora_forecast() -> list[OvationAuroraForecast] | None:
     try:
         session = _get_cached_session()
 
-        url = "https://services.swpc.noaa.gov/json/ovation_aurora_latest.json"
-        response = session.get(url, timeout=10)
+        response = session.get(OVATION_URL, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -713,7 +737,7 @@ def get_ovation_aurora_forecast() -> list[OvationAuroraForecast] | None:
                                             float(coord_seq[2]),
                                         )
                                         # Normalize to 0.0-1.0 for consistency (Ovation uses 0-15 scale)
-                                        prob = intensity / 15.0 if intensity > 0 else 0.0
+                                        prob = intensity / OVATION_INTENSITY_SCALE if intensity > 0 else 0.0
                                         forecasts.append(
                                             OvationAuroraForecast(
                                                 timestamp=timestamp,
@@ -743,3 +767,229 @@ def get_ovation_aurora_forecast() -> list[OvationAuroraForecast] | None:
         # TimeoutError: request timeout
         logger.debug(f"Error fetching Ovation aurora forecast: {e}")
         return None
+
+
+@dataclass(frozen=True)
+class OvationAuroraGrid:
+    """
+    Ovation aurora forecast as a dense latitude/longitude grid.
+
+    Lookups are O(1) bilinear interpolations, and many sites can be queried
+    in one vectorized call. Longitudes wrap around when the grid spans the
+    whole globe; latitudes outside the grid are clamped to its edge.
+
+    Attributes:
+        forecast_time: Time the forecast applies to (UTC)
+        observation_time: Time of the solar wind observation used (UTC)
+        intensity: Aurora intensity, float32 array of shape (latitudes, longitudes)
+        latitude_start: Latitude of the first row in degrees
+        longitude_start: Longitude of the first column in degrees
+        latitude_step: Row spacing in degrees
+        longitude_step: Column spacing in degrees
+    """
+
+    forecast_time: datetime
+    observation_time: datetime | None
+    intensity: npt.NDArray[np.float32]
+    latitude_start: float
+    longitude_start: float
+    latitude_step: float
+    longitude_step: float
+
+    @property
+    def wraps(self) -> bool:
+        """Check if the longitudes cover the whole globe."""
+        return bool(abs(self.intensity.shape[1] * self.longitude_step - 360.0) < 1e-6)
+
+    def probabilities(self, latitudes: npt.ArrayLike, longitudes: npt.ArrayLike) -> npt.NDArray[np.float64]:
+        """
+        Get aurora probabilities (same scale as OvationAuroraForecast) for many sites.
+
+        Args:
+            latitudes: Site latitudes in degrees
+            longitudes: Site longitudes in degrees (-180 to 360)
+
+        Returns:
+            Probabilities, broadcast over the inputs
+        """
+        n_lat, n_lon = self.intensity.shape
+        row = np.clip(
+            (np.asarray(latitudes, dtype=np.float64) - self.latitude_start) / self.latitude_step, 0, n_lat - 1
+        )
+        column = (np.asarray(longitudes, dtype=np.float64) - self.longitude_start) / self.longitude_step
+        row0 = np.minimum(np.floor(row).astype(np.intp), n_lat - 2)
+        if self.wraps:
+            column = np.mod(column, n_lon)
+            column0 = np.floor(column).astype(np.intp) % n_lon
+            column1 = (column0 + 1) % n_lon
+        else:
+            column = np.clip(column, 0, n_lon - 1)
+            column0 = np.minimum(np.floor(column).astype(np.intp), n_lon - 2)
+            column1 = column0 + 1
+        row_weight = row - row0
+        column_weight = column - np.floor(column)
+
+        grid = self.intensity
+        lower = grid[row0, column0] * (1.0 - column_weight) + grid[row0, column1] * column_weight
+        upper = grid[row0 + 1, column0] * (1.0 - column_weight) + grid[row0 + 1, column1] * column_weight
+        return np.asarray((lower * (1.0 - row_weight) + upper * row_weight) / OVATION_INTENSITY_SCALE, dtype=np.float64)
+
+    def probability_at(self, latitude: float, longitude: float) -> float:
+        """Get the aurora probability (same scale as OvationAuroraForecast) at one site."""
+        return float(self.probabilities(latitude, longitude))
+
+    def save(self, path: Path) -> None:
+        """
+        Write the grid to a compact binary file.
+
+        The file is a fixed header followed by the raw little-endian float32
+        intensities (about 260 KB for the NOAA 1° grid).
+        """
+        n_lat, n_lon = self.intensity.shape
+        header = _OVATION_HEADER.pack(
+            _OVATION_MAGIC,
+            self.forecast_time.timestamp(),
+            self.observation_time.timestamp() if self.observation_time else float("nan"),
+            n_lat,
+            n_lon,
+            self.latitude_start,
+            self.longitude_start,
+            self.latitude_step,
+            self.longitude_step,
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(path.suffix + ".tmp")
+        temporary.write_bytes(header + self.intensity.astype("<f4").tobytes())
+        temporary.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> OvationAuroraGrid:
+        """
+        Read a grid written by save().
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid grid file
+        """
+        data = path.read_bytes()
+        if len(data) < _OVATION_HEADER.size:
+            raise ValueError(f"Truncated Ovation grid file: {path}")
+        magic, forecast, observation, n_lat, n_lon, lat0, lon0, lat_step, lon_step = _OVATION_HEADER.unpack_from(data)
+        if magic != _OVATION_MAGIC or len(data) != _OVATION_HEADER.size + 4 * n_lat * n_lon:
+            raise ValueError(f"Not an Ovation grid file: {path}")
+        intensity = np.frombuffer(data, dtype="<f4", offset=_OVATION_HEADER.size).reshape(n_lat, n_lon)
+        return cls(
+            forecast_time=datetime.fromtimestamp(forecast, UTC),
+            observation_time=None if math.isnan(observation) else datetime.fromtimestamp(observation, UTC),
+            intensity=intensity.astype(np.float32),
+            latitude_start=lat0,
+            longitude_start=lon0,
+            latitude_step=lat_step,
+            longitude_step=lon_step,
+        )
+
+
+def _parse_ovation_time(payload: dict[str, Any], *keys: str) -> datetime | None:
+    """Parse the first ISO timestamp found under keys."""
+    for key in keys:
+        value = payload.get(key)
+        if isinstance(value, str):
+            with contextlib.suppress(ValueError):
+                parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+    return None
+
+
+def parse_ovation_grid(payload: dict[str, Any]) -> OvationAuroraGrid | None:
+    """
+    Parse an Ovation payload straight into a dense grid.
+
+    The NOAA payload is {"Forecast Time": ..., "coordinates": [[lon, lat, aurora], ...]}
+    on a regular grid; points missing from a regular grid are left at zero.
+
+    Args:
+        payload: Decoded JSON from ovation_aurora_latest.json
+
+    Returns:
+        OvationAuroraGrid, or None if the payload has no regular grid
+    """
+    try:
+        points = np.asarray(payload.get("coordinates") or payload.get("coords"), dtype=np.float64)
+    except (ValueError, TypeError):
+        # ValueError: ragged or non-numeric coordinates
+        # TypeError: coordinates missing
+        return None
+    if points.ndim != 2 or points.shape[1] < 3:
+        return None
+
+    longitudes, latitudes, intensity = points[:, 0], points[:, 1], points[:, 2]
+    unique_lats, unique_lons = np.unique(latitudes), np.unique(longitudes)
+    if len(unique_lats) < 2 or len(unique_lons) < 2:
+        return None
+    lat_step, lon_step = float(np.min(np.diff(unique_lats))), float(np.min(np.diff(unique_lons)))
+    rows = np.rint((latitudes - unique_lats[0]) / lat_step).astype(np.intp)
+    columns = np.rint((longitudes - unique_lons[0]) / lon_step).astype(np.intp)
+
+    grid = np.zeros((rows.max() + 1, columns.max() + 1), dtype=np.float32)
+    grid[rows, columns] = intensity
+    forecast_time = _parse_ovation_time(payload, "Forecast Time", "time_tag", "time", "timestamp")
+    return OvationAuroraGrid(
+        forecast_time=forecast_time or datetime.now(UTC),
+        observation_time=_parse_ovation_time(payload, "Observation Time"),
+        intensity=grid,
+        latitude_start=float(unique_lats[0]),
+        longitude_start=float(unique_lons[0]),
+        latitude_step=lat_step,
+        longitude_step=lon_step,
+    )
+
+
+def get_ovation_aurora_grid(cache_file: Path | None = None) -> OvationAuroraGrid | None:
+    """
+    Get the latest Ovation aurora forecast as a dense grid.
+
+    The grid is kept in memory and in a binary cache file for 30 minutes
+    (NOAA updates the forecast about every 5 minutes, for 30 minutes ahead),
+    so repeated lookups do not parse JSON again.
+
+    Args:
+        cache_file: Binary cache file (default: ~/.cache/celestron-nexstar/ovation_grid.bin)
+
+    Returns:
+        OvationAuroraGrid, or None if unavailable
+    """
+    path = cache_file or Path.home() / ".cache" / "celestron-nexstar" / "ovation_grid.bin"
+    with _ovation_cache_lock:
+        grid = _ovation_cache.get(path)
+    if grid is not None:
+        return grid
+
+    with contextlib.suppress(OSError, ValueError):
+        # OSError: cache file missing or unreadable
+        # ValueError: cache file corrupt
+        if time.time() - path.stat().st_mtime < _OVATION_MAX_AGE_SECONDS:
+            grid = OvationAuroraGrid.load(path)
+
+    if grid is None:
+        try:
+            response = _get_cached_session().get(OVATION_URL, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError, TimeoutError) as e:
+            # requests.RequestException: HTTP/network errors
+            # ValueError: invalid JSON
+            # TimeoutError: request timeout
+            logger.debug(f"Error fetching Ovation aurora grid: {e}")
+            return None
+        grid = parse_ovation_grid(data) if isinstance(data, dict) else None
+        if grid is None:
+            return None
+        try:
+            grid.save(path)
+        except OSError as e:
+            # OSError: cache directory not writable
+            logger.debug(f"Could not write Ovation grid cache: {e}")
+
+    with _ovation_cache_lock:
+        _ovation_cache[path] = grid
+    return grid
@@ -126,12 +126,16 @@ def find_dark_sites_near(
 
         async def _get_sites() -> list[DarkSkySiteModel]:
             async with get_db_session() as db:
-                from sqlalchemy import select
+                from sqlalchemy import or_, select
 
-                # Query all sites matching bortle class
+                from celestron_nexstar.api.location.geohash_utils import get_int_ranges_for_search
+
+                # Query sites matching bortle class within the integer geohash ranges around the location
+                ranges = get_int_ranges_for_search(location.latitude, location.longitude, max_distance_km)
                 result = await db.execute(
                     select(DarkSkySiteModel).filter(
                         DarkSkySiteModel.bortle_class <= min_bortle.value,
+                        or_(*(DarkSkySiteModel.geohash_int.between(low, high) for low, high in ranges)),
                     )
                 )
                 return list(result.scalars().all())
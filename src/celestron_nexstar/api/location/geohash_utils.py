@@ -5,15 +5,48 @@ Geohash encodes geographic coordinates into short strings that can be used for
 hierarchical spatial indexing and proximity searches. Points with similar geohashes
 are geographically close together.
 
+The array functions encode millions of points at once by quantising
+coordinates to integers and interleaving their bits with NumPy.
+
 Reference: https://en.wikipedia.org/wiki/Geohash
 """
 
 from __future__ import annotations
 
+import numpy as np
+import numpy.typing as npt
+
 
 # Geohash base32 alphabet (excludes a, i, l, o to avoid confusion)
 GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
 
+_ALPHABET_BYTES = np.frombuffer(GEOHASH_ALPHABET.encode("ascii"), dtype=np.uint8)
+
+# Masks spreading the low 32 bits of an integer to the even bit positions
+_SPREAD_STEPS = (
+    (16, 0x0000FFFF0000FFFF),
+    (8, 0x00FF00FF00FF00FF),
+    (4, 0x0F0F0F0F0F0F0F0F),
+    (2, 0x3333333333333333),
+    (1, 0x5555555555555555),
+)
+
+# Masks gathering the even bit positions of an integer into its low 32 bits
+_COMPACT_STEPS = (
+    (1, 0x3333333333333333),
+    (2, 0x0F0F0F0F0F0F0F0F),
+    (4, 0x00FF00FF00FF00FF),
+    (8, 0x0000FFFF0000FFFF),
+    (16, 0x00000000FFFFFFFF),
+)
+
+# Value of each ASCII byte as a geohash digit (-1 for bytes outside the alphabet)
+_DIGIT_VALUES = np.full(256, -1, dtype=np.int16)
+_DIGIT_VALUES[_ALPHABET_BYTES] = np.arange(32)
+
+# Integer geohash columns hold full-precision (12 character, 60 bit) geohashes
+INT_GEOHASH_PRECISION = 12
+
 
 def encode(latitude: float, longitude: float, precision: int = 12) -> str:
     """
@@ -77,6 +110,143 @@ def encode(latitude: float, longitude: float, precision: int = 12) -> str:
     return "".join(geohash)
 
 
+def _quantize(values: npt.NDArray[np.float64], low: float, span: float, bits: int) -> npt.NDArray[np.uint64]:
+    """Get the index of each value's cell when [low, low + span] is split into 2**bits cells."""
+    cells = np.floor((values - low) / span * float(1 << bits))
+    return np.clip(cells, 0, (1 << bits) - 1).astype(np.uint64)
+
+
+def _spread_bits(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    """Move bit i of each value to bit 2i."""
+    spread = values & np.uint64(0xFFFFFFFF)
+    for shift, mask in _SPREAD_STEPS:
+        spread = (spread | (spread << np.uint64(shift))) & np.uint64(mask)
+    return spread
+
+
+def _compact_bits(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    """Move bit 2i of each value to bit i (the inverse of _spread_bits)."""
+    compact = values & np.uint64(0x5555555555555555)
+    for shift, mask in _COMPACT_STEPS:
+        compact = (compact | (compact >> np.uint64(shift))) & np.uint64(mask)
+    return compact
+
+
+def _split_bits(precision: int) -> tuple[int, int]:
+    """Get the number of (longitude, latitude) bits in a geohash of the given precision."""
+    total_bits = 5 * precision
+    return (total_bits + 1) // 2, total_bits // 2
+
+
+def _combine(
+    lat_cells: npt.NDArray[np.uint64], lon_cells: npt.NDArray[np.uint64], precision: int
+) -> npt.NDArray[np.uint64]:
+    """Interleave latitude and longitude cell indices into geohash bits (longitude first)."""
+    # The last bit is a longitude bit when the total is odd, a latitude bit when even
+    if precision % 2:
+        return _spread_bits(lon_cells) | (_spread_bits(lat_cells) << np.uint64(1))
+    return (_spread_bits(lon_cells) << np.uint64(1)) | _spread_bits(lat_cells)
+
+
+def _separate(codes: npt.NDArray[np.uint64], precision: int) -> tuple[npt.NDArray[np.uint64], npt.NDArray[np.uint64]]:
+    """Split geohash bits into (latitude, longitude) cell indices (the inverse of _combine)."""
+    if precision % 2:
+        return _compact_bits(codes >> np.uint64(1)), _compact_bits(codes)
+    return _compact_bits(codes), _compact_bits(codes >> np.uint64(1))
+
+
+def _interleave(latitudes: npt.ArrayLike, longitudes: npt.ArrayLike, precision: int) -> npt.NDArray[np.uint64]:
+    """Get the geohash bits (5 per character, longitude first) of each point as an integer."""
+    lon_bits, lat_bits = _split_bits(precision)
+    lat_cells = _quantize(np.clip(np.asarray(latitudes, dtype=np.float64), -90.0, 90.0), -90.0, 180.0, lat_bits)
+    lon_cells = _quantize(np.clip(np.asarray(longitudes, dtype=np.float64), -180.0, 180.0), -180.0, 360.0, lon_bits)
+    return _combine(lat_cells, lon_cells, precision)
+
+
+def _to_chars(codes: npt.NDArray[np.uint64], precision: int) -> npt.NDArray[np.bytes_]:
+    """Map geohash bits to fixed-width base32 byte strings."""
+    # Split into 5-bit groups, most significant first, and map to the alphabet
+    shifts = np.arange(5 * (precision - 1), -1, -5, dtype=np.uint64)
+    digits = ((codes.ravel()[:, None] >> shifts[None, :]) & np.uint64(31)).astype(np.intp)
+    chars = np.ascontiguousarray(_ALPHABET_BYTES[digits])
+    return chars.view(f"S{precision}").reshape(codes.shape)
+
+
+def _from_chars(geohashes: npt.ArrayLike) -> tuple[npt.NDArray[np.uint64], int]:
+    """Get the geohash bits and common precision of an array of geohash strings."""
+    chars = np.asarray(geohashes)
+    if chars.dtype.kind == "U":
+        chars = np.char.encode(chars, "ascii")
+    elif chars.dtype.kind != "S":
+        chars = chars.astype(bytes)
+    precision = chars.dtype.itemsize
+    if not 1 <= precision <= 12:
+        raise ValueError(f"Geohash precision must be 1-12, got {precision}")
+
+    flat = np.ascontiguousarray(chars).reshape(-1)
+    digits = _DIGIT_VALUES[flat.view(np.uint8).reshape(-1, precision)]
+    if (digits < 0).any():
+        # Invalid characters, or NUL padding from geohashes shorter than the longest one
+        raise ValueError("Geohashes must all have the same length and use only base32 geohash characters")
+
+    codes = np.zeros(len(flat), dtype=np.uint64)
+    for i in range(precision):
+        codes = (codes << np.uint64(5)) | digits[:, i].astype(np.uint64)
+    return codes.reshape(chars.shape), precision
+
+
+def encode_array(latitudes: npt.ArrayLike, longitudes: npt.ArrayLike, precision: int = 12) -> npt.NDArray[np.bytes_]:
+    """
+    Encode arrays of latitudes and longitudes into geohashes.
+
+    Gives the same geohashes as encode() for each point.
+
+    Args:
+        latitudes: Latitudes in degrees (-90 to 90)
+        longitudes: Longitudes in degrees (-180 to 180)
+        precision: Number of characters in each geohash (1-12, default: 12)
+
+    Returns:
+        Fixed-width byte strings (dtype S<precision>), shaped like the inputs
+
+    Example:
+        >>> encode_array([48.8566, 40.7128], [2.3522, -74.0060], 7)
+        array([b'u09tvw0', b'dr5regw'], dtype='|S7')
+    """
+    if not 1 <= precision <= 12:
+        raise ValueError(f"Geohash precision must be 1-12, got {precision}")
+    lats, lons = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64), np.asarray(longitudes, dtype=np.float64))
+    return _to_chars(_interleave(lats, lons, precision), precision)
+
+
+def encode_int_array(
+    latitudes: npt.ArrayLike, longitudes: npt.ArrayLike, precision: int = INT_GEOHASH_PRECISION
+) -> npt.NDArray[np.int64]:
+    """
+    Encode arrays of latitudes and longitudes into integer geohashes.
+
+    An integer geohash holds the 5 bits of each character, so geohashes
+    sharing a prefix form one contiguous range of integers (see int_range()).
+
+    Args:
+        latitudes: Latitudes in degrees (-90 to 90)
+        longitudes: Longitudes in degrees (-180 to 180)
+        precision: Number of geohash characters encoded (1-12, default: 12)
+
+    Returns:
+        Integer geohashes, shaped like the inputs
+
+    Example:
+        >>> encode_int_array([48.8566], [2.3522], 2)
+        array([832])
+    """
+    if not 1 <= precision <= 12:
+        raise ValueError(f"Geohash precision must be 1-12, got {precision}")
+    lats, lons = np.broadcast_arrays(np.asarray(latitudes, dtype=np.float64), np.asarray(longitudes, dtype=np.float64))
+    # At most 60 bits, so the values fit SQLite's signed 64-bit INTEGER
+    return _interleave(lats, lons, precision).astype(np.int64)
+
+
 def decode(geohash: str) -> tuple[float, float, float, float]:
     """
     Decode a geohash string into latitude and longitude bounds.
@@ -128,6 +298,33 @@ def decode(geohash: str) -> tuple[float, float, float, float]:
     return lat, lon, lat_err, lon_err
 
 
+def decode_array(
+    geohashes: npt.ArrayLike,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """
+    Decode an array of geohashes into cell centres and errors.
+
+    Gives the same values as decode() for each geohash. All geohashes must
+    have the same length.
+
+    Args:
+        geohashes: Geohash strings (str or bytes)
+
+    Returns:
+        Tuple of (latitudes, longitudes, lat_errors, lon_errors) arrays,
+        shaped like the input
+    """
+    codes, precision = _from_chars(geohashes)
+    lon_bits, lat_bits = _split_bits(precision)
+    lat_cells, lon_cells = _separate(codes, precision)
+
+    lat_err = 90.0 / (1 << lat_bits)
+    lon_err = 180.0 / (1 << lon_bits)
+    lats = -90.0 + (2 * lat_cells.astype(np.float64) + 1) * lat_err
+    lons = -180.0 + (2 * lon_cells.astype(np.float64) + 1) * lon_err
+    return lats, lons, np.full(lats.shape, lat_err), np.full(lons.shape, lon_err)
+
+
 def neighbors(geohash: str) -> list[str]:
     """
     Get the 8 neighboring geohashes (north, south, east, west, and diagonals).
@@ -140,10 +337,10 @@ def neighbors(geohash: str) -> list[str]:
     """
     lat, lon, lat_err, lon_err = decode(geohash)
 
-    # Calculate offsets for neighbors
+    # Step one cell (twice the error) to reach the middle of each neighbor
     neighbors_list = []
-    for dlat in [-lat_err, 0, lat_err]:
-        for dlon in [-lon_err, 0, lon_err]:
+    for dlat in [-2 * lat_err, 0, 2 * lat_err]:
+        for dlon in [-2 * lon_err, 0, 2 * lon_err]:
             if dlat == 0 and dlon == 0:
                 continue  # Skip center point
             neighbor_lat = lat + dlat
@@ -165,6 +362,33 @@ def neighbors(geohash: str) -> list[str]:
     return unique_neighbors
 
 
+def neighbors_array(geohashes: npt.ArrayLike) -> npt.NDArray[np.bytes_]:
+    """
+    Get the 8 neighboring geohashes of each geohash in an array.
+
+    Neighbors are in the order south-west, south, south-east, west, east,
+    north-west, north, north-east. Like neighbors(), cells are clamped at the
+    poles and at +/-180° longitude, so edge cells repeat themselves or each
+    other instead of wrapping. All geohashes must have the same length.
+
+    Args:
+        geohashes: Geohash strings (str or bytes)
+
+    Returns:
+        Fixed-width byte strings shaped (*input shape, 8)
+    """
+    codes, precision = _from_chars(geohashes)
+    lon_bits, lat_bits = _split_bits(precision)
+    lat_cells, lon_cells = (cells.astype(np.int64)[..., None] for cells in _separate(codes, precision))
+
+    offsets = [(dlat, dlon) for dlat in (-1, 0, 1) for dlon in (-1, 0, 1) if dlat or dlon]
+    dlat = np.array([offset[0] for offset in offsets])
+    dlon = np.array([offset[1] for offset in offsets])
+    lat_cells = np.clip(lat_cells + dlat, 0, (1 << lat_bits) - 1).astype(np.uint64)
+    lon_cells = np.clip(lon_cells + dlon, 0, (1 << lon_bits) - 1).astype(np.uint64)
+    return _to_chars(_combine(lat_cells, lon_cells, precision), precision)
+
+
 def get_precision_for_radius(radius_km: float) -> int:
     """
     Get recommended geohash precision for a given search radius.
@@ -235,3 +459,104 @@ def get_neighbors_for_search(geohash: str, radius_km: float) -> list[str]:
 
     # Remove duplicates
     return list(dict.fromkeys(search_hashes))
+
+
+def geohash_to_int(geohash: str) -> int:
+    """
+    Get the integer geohash of a geohash string.
+
+    Args:
+        geohash: Geohash string (1-12 characters)
+
+    Returns:
+        Integer holding the 5 bits of each character
+
+    Example:
+        >>> geohash_to_int('u0')
+        832
+    """
+    return int(_from_chars(geohash)[0])
+
+
+def int_range(geohash: str, precision: int = INT_GEOHASH_PRECISION) -> tuple[int, int]:
+    """
+    Get the range of integer geohashes that start with a geohash prefix.
+
+    Columns holding encode_int_array() values at the given precision can be
+    searched with ``BETWEEN low AND high`` on an integer index instead of
+    ``LIKE 'prefix%'``.
+
+    Args:
+        geohash: Geohash prefix (no longer than precision)
+        precision: Precision of the integer geohashes searched (default: 12)
+
+    Returns:
+        Tuple of (low, high) inclusive bounds
+
+    Example:
+        >>> int_range('u0', precision=3)
+        (26624, 26655)
+    """
+    if len(geohash) > precision:
+        raise ValueError(f"Geohash prefix '{geohash}' is longer than precision {precision}")
+    shift = 5 * (precision - len(geohash))
+    low = geohash_to_int(geohash) << shift
+    return low, low + (1 << shift) - 1
+
+
+def get_int_ranges_for_search(
+    latitude: float, longitude: float, radius_km: float, precision: int = INT_GEOHASH_PRECISION
+) -> list[tuple[int, int]]:
+    """
+    Get integer geohash ranges covering every point within a radius.
+
+    The bounding box of the search circle is covered by geohash cells at the
+    finest precision that needs no more than 9 of them, and the cells'
+    integer ranges are merged. Matching rows still need an exact distance check.
+
+    Args:
+        latitude: Latitude of the search center in degrees
+        longitude: Longitude of the search center in degrees
+        radius_km: Search radius in kilometers
+        precision: Precision of the integer geohashes searched (default: 12)
+
+    Returns:
+        Sorted, non-overlapping (low, high) inclusive ranges
+    """
+    # ~111 km per degree of latitude, and per degree of longitude shrinking with cos(latitude)
+    lat_delta = radius_km / 111.0
+    cos_lat = float(np.cos(np.radians(latitude)))
+    if latitude + lat_delta >= 90.0 or latitude - lat_delta <= -90.0 or radius_km >= 111.0 * 180.0 * cos_lat:
+        # Circles over a pole or all longitudes span every geohash
+        return [(0, (1 << (5 * precision)) - 1)]
+    lon_delta = lat_delta / cos_lat
+
+    for cell_precision in range(precision, 0, -1):
+        lon_bits, lat_bits = _split_bits(cell_precision)
+        lat_low, lat_high = (
+            int((lat + 90.0) / 180.0 * (1 << lat_bits)) for lat in (latitude - lat_delta, latitude + lat_delta)
+        )
+        lon_low, lon_high = (
+            int(np.floor((lon + 180.0) / 360.0 * (1 << lon_bits)))
+            for lon in (longitude - lon_delta, longitude + lon_delta)
+        )
+        if (lat_high - lat_low + 1) * (lon_high - lon_low + 1) <= 9:
+            break
+
+    # Longitude cells wrap around the antimeridian
+    lat_cells, lon_cells = np.meshgrid(
+        np.arange(lat_low, lat_high + 1, dtype=np.uint64),
+        np.arange(lon_low, lon_high + 1) % (1 << lon_bits),
+        indexing="ij",
+    )
+    codes = np.unique(_combine(lat_cells.ravel(), lon_cells.ravel().astype(np.uint64), cell_precision))
+
+    shift = 5 * (precision - cell_precision)
+    ranges: list[tuple[int, int]] = []
+    for code in codes.tolist():
+        low, high = code << shift, ((code + 1) << shift) - 1
+        if ranges and ranges[-1][1] + 1 == low:
+            ranges[-1] = (ranges[-1][0], high)
+        else:
+            ranges.append((low, high))
+    return ranges
@@ -12,10 +12,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sqlite3
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from enum import IntEnum
 from pathlib import Path
+from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 
@@ -29,9 +33,9 @@ logger = logging.getLogger(__name__)
 
 # Cache configuration
 CACHE_DIR = Path.home() / ".celestron_nexstar" / "cache"
-CACHE_FILE = CACHE_DIR / "light_pollution.json"
+CACHE_FILE = CACHE_DIR / "light_pollution.db"
 CACHE_STALE_HOURS = 24  # Consider cache stale after 24 hours
-CACHE_MAX_AGE_DAYS = 7  # Maximum age before forcing refresh
+CACHE_MEMORY_SIZE = 4096  # Entries kept in memory in front of the cache file
 
 
 class BortleClass(IntEnum):
@@ -170,59 +174,125 @@ async def _create_light_pollution_data(
     )
 
 
-def _ensure_cache_dir() -> None:
-    """Ensure cache directory exists."""
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
-
-
-def _load_cache() -> dict[str, Any] | None:
-    """Load cached light pollution data."""
-    if not CACHE_FILE.exists():
-        return None
-
-    try:
-        with open(CACHE_FILE, encoding="utf-8") as f:
-            cache_data: dict[str, Any] = json.load(f)
-            return cache_data
-    except (json.JSONDecodeError, OSError) as e:
-        logger.warning(f"Failed to load cache: {e}")
-        return None
-
-
-def _save_cache(data: dict[str, Any]) -> None:
-    """Save light pollution data to cache."""
-    _ensure_cache_dir()
-    try:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-    except OSError as e:
-        logger.warning(f"Failed to save cache: {e}")
-
-
-def _is_cache_stale(cache_data: dict[str, Any]) -> bool:
-    """Check if cache is stale."""
-    if "timestamp" not in cache_data:
-        return True
-
-    try:
-        cache_time = datetime.fromisoformat(cache_data["timestamp"])
-        age = datetime.now(UTC) - cache_time.replace(tzinfo=UTC)
-        return age > timedelta(hours=CACHE_STALE_HOURS)
-    except (ValueError, KeyError):
-        return True
-
+class _LightPollutionCache:
+    """
+    Keyed on-disk cache of SQM values with an in-process LRU in front.
 
-def _is_cache_too_old(cache_data: dict[str, Any]) -> bool:
-    """Check if cache is too old and should be refreshed."""
-    if "timestamp" not in cache_data:
-        return True
+    Entries live in one SQLite table keyed by location, each with its own
+    expiry time, so a lookup or store touches only its own row. Every write
+    is a single-row transaction, so concurrent writers (tasks, threads or
+    processes) never leave the cache half-written.
+    """
 
-    try:
-        cache_time = datetime.fromisoformat(cache_data["timestamp"])
-        age = datetime.now(UTC) - cache_time.replace(tzinfo=UTC)
-        return age > timedelta(days=CACHE_MAX_AGE_DAYS)
-    except (ValueError, KeyError):
-        return True
+    def __init__(self, path: Path, memory_size: int = CACHE_MEMORY_SIZE) -> None:
+        self.path = path
+        self._memory: OrderedDict[str, tuple[float, str | None, float]] = OrderedDict()
+        self._memory_size = memory_size
+        self._lock = Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache file on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Entries used to live in one JSON file beside the store; they are
+            # cheap to refetch, so drop it rather than carry it forever
+            legacy = self.path.with_suffix(".json")
+            try:
+                legacy.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug(f"Could not remove legacy light pollution cache {legacy}: {e}")
+            conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            # WAL lets readers carry on while another process writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS light_pollution_cache ("
+                "key TEXT PRIMARY KEY, sqm REAL NOT NULL, source TEXT, "
+                "fetched_at TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, key: str, entry: tuple[float, str | None, float]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_size:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> tuple[float, str | None] | None:
+        """
+        Get the cached SQM value and source for a key.
+
+        Returns:
+            Tuple of (sqm, source), or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                try:
+                    row = (
+                        self._connect()
+                        .execute("SELECT sqm, source, expires_at FROM light_pollution_cache WHERE key = ?", (key,))
+                        .fetchone()
+                    )
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to read light pollution cache: {e}")
+                    return None
+                if row is None:
+                    return None
+                entry = (float(row[0]), row[1], float(row[2]))
+            if entry[2] <= now:
+                self._memory.pop(key, None)
+                return None
+            self._remember(key, entry)
+            return entry[0], entry[1]
+
+    def put(self, key: str, sqm: float, source: str | None, ttl: timedelta | None = None) -> None:
+        """Store an SQM value for a key, expiring after ttl (default: CACHE_STALE_HOURS)."""
+        fetched_at = datetime.now(UTC)
+        expires_at = (fetched_at + (ttl if ttl is not None else timedelta(hours=CACHE_STALE_HOURS))).timestamp()
+        with self._lock:
+            self._remember(key, (sqm, source, expires_at))
+            try:
+                self._connect().execute(
+                    "INSERT INTO light_pollution_cache (key, sqm, source, fetched_at, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET sqm = excluded.sqm, source = excluded.source, "
+                    "fetched_at = excluded.fetched_at, expires_at = excluded.expires_at",
+                    (key, sqm, source, fetched_at.isoformat(), expires_at),
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to save light pollution cache: {e}")
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._memory.clear()
+            try:
+                self._connect().execute("DELETE FROM light_pollution_cache")
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to clear light pollution cache: {e}")
+
+    def close(self) -> None:
+        """Close the cache file."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_caches: dict[Path, _LightPollutionCache] = {}
+_caches_lock = Lock()
+
+
+def _get_cache() -> _LightPollutionCache:
+    """Get the shared cache for CACHE_FILE."""
+    with _caches_lock:
+        cache = _caches.get(CACHE_FILE)
+        if cache is None:
+            cache = _caches[CACHE_FILE] = _LightPollutionCache(CACHE_FILE)
+        return cache
 
 
 def _get_cache_key(lat: float, lon: float) -> str:
@@ -336,23 +406,15 @@ async def get_light_pollution_data(
         RuntimeError: If no light pollution data found in database for this location
     """
     cache_key = _get_cache_key(lat, lon)
+    cache = _get_cache()
 
-    # Check cache first (unless forcing refresh)
+    # Check cache first (unless forcing refresh); the cache file can block
+    # on another process's write, so keep it off the event loop
     if not force_refresh:
-        cache_data = _load_cache()
-        if cache_data and "data" in cache_data:
-            location_data = cache_data["data"].get(cache_key)
-            if location_data and "timestamp" in location_data:
-                try:
-                    cache_time = datetime.fromisoformat(location_data["timestamp"])
-                    age = datetime.now(UTC) - cache_time.replace(tzinfo=UTC)
-                    if age < timedelta(hours=CACHE_STALE_HOURS):
-                        logger.debug(f"Using cached light pollution data for {lat},{lon}")
-                        return await _create_light_pollution_data(
-                            db_session, location_data["sqm"], location_data.get("source"), cached=True
-                        )
-                except (ValueError, KeyError):
-                    pass
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached light pollution data for {lat},{lon}")
+            return await _create_light_pollution_data(db_session, cached[0], cached[1], cached=True)
 
     # Need to fetch new data from database
     logger.info(f"Fetching light pollution data for {lat},{lon}")
@@ -374,17 +436,7 @@ async def get_light_pollution_data(
     source = "database"
 
     # Save to cache
-    cache_data = _load_cache() or {"data": {}, "timestamp": datetime.now(UTC).isoformat()}
-    if "data" not in cache_data:
-        cache_data["data"] = {}
-
-    cache_data["data"][cache_key] = {
-        "sqm": sqm,
-        "source": source,
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
-    cache_data["timestamp"] = datetime.now(UTC).isoformat()
-    _save_cache(cache_data)
+    await asyncio.to_thread(cache.put, cache_key, sqm, source)
 
     return await _create_light_pollution_data(db_session, sqm, source, cached=False)
 
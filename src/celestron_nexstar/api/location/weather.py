@@ -12,6 +12,7 @@ import logging
 import os
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
 import numpy as np
@@ -20,6 +21,10 @@ from celestron_nexstar.api.database.models import HistoricalWeatherModel, Weathe
 from celestron_nexstar.api.location.observer import ObserverLocation
 
 
+if TYPE_CHECKING:
+    from celestron_nexstar.api.database.database import CatalogDatabase
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -356,6 +361,213 @@ def _is_forecast_stale(forecast: WeatherForecastModel, now: datetime) -> bool:
         return fetch_age_hours > 12
 
 
+# Open-Meteo forecast endpoint (accepts comma-separated lists of coordinates)
+OPEN_METEO_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Locations per multi-location Open-Meteo request
+WEATHER_BATCH_SIZE = 50
+
+# Multi-location requests sent at once by fetch_weather_batch
+WEATHER_BATCH_CONCURRENCY = 4
+
+_CURRENT_WEATHER_VARIABLES = ["temperature_2m", "relative_humidity_2m", "cloud_cover", "wind_speed_10m", "weather_code"]
+_HOURLY_WEATHER_VARIABLES = ["temperature_2m", "dew_point_2m", "relative_humidity_2m", "cloud_cover", "wind_speed_10m"]
+
+
+async def _ensure_weather_forecast_table(db: CatalogDatabase) -> None:
+    """Create the weather_forecast table if it is missing."""
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from celestron_nexstar.api.database.models import Base
+
+    try:
+        async with db._engine.begin() as conn:
+            # Not memoised: the database may be rebuilt or deleted while the
+            # process runs, and with checkfirst an existing table costs only
+            # a catalog lookup
+            await conn.run_sync(
+                lambda sync_conn: Base.metadata.create_all(
+                    sync_conn,
+                    tables=[WeatherForecastModel.__table__],  # type: ignore[list-item]
+                    checkfirst=True,
+                )
+            )
+    except (SQLAlchemyError, AttributeError, RuntimeError, ValueError, TypeError, OSError) as e:
+        # SQLAlchemyError: database connection/creation errors
+        # AttributeError: missing database attributes
+        # RuntimeError: database connection/creation errors
+        # ValueError: invalid table schema
+        # TypeError: wrong argument types
+        # OSError: file I/O errors
+        logger.debug(f"Could not check/create weather_forecast table: {e}")
+
+
+def _safe_float(value: float | None) -> float | None:
+    """Convert value to float, returning None if NaN or None."""
+    if value is None:
+        return None
+    try:
+        result = float(value)
+    except (ValueError, TypeError):
+        return None
+    return None if np.isnan(result) else result
+
+
+def _weather_condition(weather_code: int | None) -> str | None:
+    """Map a WMO weather code to a condition string."""
+    if weather_code is None:
+        return None
+    match int(weather_code):
+        case 0:
+            return "Clear"
+        case 1 | 2 | 3:
+            return "Partly Cloudy"
+        case 45 | 48:
+            return "Foggy"
+        case 51 | 53 | 55 | 56 | 57:
+            return "Drizzle"
+        case 61 | 63 | 65 | 66 | 67:
+            return "Rain"
+        case 71 | 73 | 75 | 77:
+            return "Snow"
+        case 80 | 81 | 82:
+            return "Rain Showers"
+        case 85 | 86:
+            return "Snow Showers"
+        case 95 | 96 | 99:
+            return "Thunderstorm"
+        case _:
+            return "Cloudy"
+
+
+def _parse_current_weather(data: dict[str, Any]) -> WeatherData:
+    """Build WeatherData from one location's Open-Meteo forecast response."""
+    # Open-Meteo API returns data directly in current object, not nested under "variables"
+    current = data.get("current", {})
+    hourly = data.get("hourly", {})
+
+    temp_f = _safe_float(current.get("temperature_2m"))
+    humidity = _safe_float(current.get("relative_humidity_2m"))
+
+    # Get dew point from hourly data (first hour)
+    dew_point_values = hourly.get("dew_point_2m", [])
+    dew_point_f = _safe_float(dew_point_values[0]) if dew_point_values else None
+
+    # If dew point not available, calculate from temp/humidity
+    if dew_point_f is None and temp_f is not None and humidity is not None:
+        dew_point_f = calculate_dew_point_fahrenheit(temp_f, humidity)
+
+    return WeatherData(
+        temperature_c=temp_f,
+        dew_point_f=dew_point_f,
+        humidity_percent=humidity,
+        cloud_cover_percent=_safe_float(current.get("cloud_cover")),
+        wind_speed_ms=_safe_float(current.get("wind_speed_10m")),
+        visibility_km=None,
+        condition=_weather_condition(current.get("weather_code")),
+        last_updated="now",
+    )
+
+
+def _weather_from_forecast(forecast: WeatherForecastModel) -> WeatherData:
+    """Convert a cached forecast row to WeatherData."""
+    return WeatherData(
+        temperature_c=forecast.temperature_f,
+        dew_point_f=forecast.dew_point_f,
+        humidity_percent=forecast.humidity_percent,
+        cloud_cover_percent=forecast.cloud_cover_percent,
+        wind_speed_ms=forecast.wind_speed_mph,
+        visibility_km=None,
+        condition=None,
+        last_updated=forecast.fetched_at.isoformat() if forecast.fetched_at else None,
+    )
+
+
+async def _store_current_weather(weather_by_location: dict[ObserverLocation, WeatherData]) -> None:
+    """
+    Upsert current-hour weather for many locations in one transaction.
+
+    Existing rows for the current hour are read in one query and updated in
+    place; the rest are inserted.
+    """
+    from sqlalchemy import select
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from celestron_nexstar.api.database.database import get_database
+    from celestron_nexstar.api.location.geohash_utils import encode_array
+
+    to_store = {location: weather for location, weather in weather_by_location.items() if not weather.error}
+    if not to_store:
+        return
+
+    try:
+        db = get_database()
+        locations = list(to_store)
+        geohashes = encode_array(
+            [location.latitude for location in locations], [location.longitude for location in locations], precision=9
+        ).astype(str)
+        now_db = datetime.now(UTC)
+        current_hour_start_db = now_db.replace(minute=0, second=0, microsecond=0)
+        current_hour_end_db = current_hour_start_db + timedelta(hours=1)
+
+        async with db._AsyncSession() as session:
+            # Existing forecasts for this hour, for all locations at once
+            stmt = select(WeatherForecastModel).where(
+                WeatherForecastModel.latitude.in_({location.latitude for location in locations}),
+                WeatherForecastModel.longitude.in_({location.longitude for location in locations}),
+                WeatherForecastModel.forecast_timestamp >= current_hour_start_db,
+                WeatherForecastModel.forecast_timestamp < current_hour_end_db,
+            )
+            result = await session.execute(stmt)
+            existing_by_position: dict[tuple[float, float], WeatherForecastModel] = {}
+            for forecast in result.scalars().all():
+                existing_by_position.setdefault((forecast.latitude, forecast.longitude), forecast)
+
+            for location, location_geohash in zip(locations, geohashes.tolist(), strict=True):
+                weather = to_store[location]
+                seeing_score = calculate_seeing_conditions(weather)
+                existing = existing_by_position.get((location.latitude, location.longitude))
+
+                if existing:
+                    # Update existing forecast
+                    existing.geohash = location_geohash
+                    existing.temperature_f = weather.temperature_c
+                    existing.dew_point_f = weather.dew_point_f
+                    existing.humidity_percent = weather.humidity_percent
+                    existing.cloud_cover_percent = weather.cloud_cover_percent
+                    existing.wind_speed_mph = weather.wind_speed_ms
+                    existing.seeing_score = seeing_score
+                    existing.fetched_at = now_db
+                else:
+                    # Insert new forecast
+                    forecast = WeatherForecastModel(
+                        latitude=location.latitude,
+                        longitude=location.longitude,
+                        geohash=location_geohash,
+                        forecast_timestamp=current_hour_start_db,
+                        temperature_f=weather.temperature_c,
+                        dew_point_f=weather.dew_point_f,
+                        humidity_percent=weather.humidity_percent,
+                        cloud_cover_percent=weather.cloud_cover_percent,
+                        wind_speed_mph=weather.wind_speed_ms,
+                        seeing_score=seeing_score,
+                        fetched_at=now_db,
+                    )
+                    session.add(forecast)
+                    existing_by_position[(location.latitude, location.longitude)] = forecast
+
+            await session.commit()
+            logger.debug(f"Stored current weather for {len(locations)} location(s) in database")
+    except (SQLAlchemyError, AttributeError, RuntimeError, ValueError, TypeError, KeyError) as e:
+        # SQLAlchemyError: database errors (locked, missing or corrupt tables)
+        # AttributeError: missing database/model attributes
+        # RuntimeError: database connection/commit errors
+        # ValueError: invalid data format
+        # TypeError: wrong argument types
+        # KeyError: missing keys in data
+        logger.warning(f"Error storing current weather in database: {e}")
+
+
 async def fetch_hourly_weather_forecast(location: ObserverLocation, hours: int = 24) -> list[HourlySeeingForecast]:
     """
     Fetch hourly weather forecast and calculate seeing conditions for each hour.
@@ -377,44 +589,15 @@ async def fetch_hourly_weather_forecast(location: ObserverLocation, hours: int =
     # Helper function to check database
     async def _check_database_cache() -> tuple[list[WeatherForecastModel], datetime]:
         """Check database for cached forecasts. Returns (forecasts, now)."""
-        from sqlalchemy import and_, select, text
+        from sqlalchemy import and_, select
 
         from celestron_nexstar.api.database.database import get_database
-        from celestron_nexstar.api.database.models import Base, WeatherForecastModel
+        from celestron_nexstar.api.database.models import WeatherForecastModel
 
         db = get_database()
 
         # Ensure weather_forecast table exists (create if migration hasn't run yet)
-        try:
-
-            async def _check_and_create_table() -> None:
-                async with db._engine.begin() as conn:
-                    # Check if table exists by trying to query it
-                    # If it doesn't exist, create it
-                    try:
-                        await conn.execute(text("SELECT 1 FROM weather_forecast LIMIT 1"))
-                    except (AttributeError, RuntimeError, ValueError, TypeError) as e:
-                        # AttributeError: missing connection attributes
-                        # RuntimeError: database errors, table doesn't exist
-                        # ValueError: invalid SQL
-                        # TypeError: wrong argument types
-                        # Table doesn't exist, create it
-                        logger.debug(f"weather_forecast table not found, creating it... (error: {e})")
-                    await conn.run_sync(
-                        lambda sync_conn: Base.metadata.create_all(
-                            sync_conn,
-                            tables=[WeatherForecastModel.__table__],  # type: ignore[list-item]
-                        )
-                    )
-
-            await _check_and_create_table()
-        except (AttributeError, RuntimeError, ValueError, TypeError, OSError) as e:
-            # AttributeError: missing database attributes
-            # RuntimeError: database connection/creation errors
-            # ValueError: invalid table schema
-            # TypeError: wrong argument types
-            # OSError: file I/O errors
-            logger.debug(f"Could not check/create weather_forecast table: {e}")
+        await _ensure_weather_forecast_table(db)
 
         now = datetime.now(UTC)
         existing_forecasts = []
@@ -748,44 +931,15 @@ async def fetch_weather(location: ObserverLocation) -> WeatherData:
     # Helper function to check database
     async def _check_database_cache() -> WeatherForecastModel | None:
         """Check database for cached weather. Returns cached forecast or None."""
-        from sqlalchemy import and_, select, text
+        from sqlalchemy import and_, select
 
         from celestron_nexstar.api.database.database import get_database
-        from celestron_nexstar.api.database.models import Base, WeatherForecastModel
+        from celestron_nexstar.api.database.models import WeatherForecastModel
 
         db = get_database()
 
         # Ensure weather_forecast table exists
-        try:
-
-            async def _check_and_create_table() -> None:
-                async with db._engine.begin() as conn:
-                    # Check if table exists by trying to query it
-                    # If it doesn't exist, create it
-                    try:
-                        await conn.execute(text("SELECT 1 FROM weather_forecast LIMIT 1"))
-                    except (AttributeError, RuntimeError, ValueError, TypeError) as e:
-                        # AttributeError: missing connection attributes
-                        # RuntimeError: database errors, table doesn't exist
-                        # ValueError: invalid SQL
-                        # TypeError: wrong argument types
-                        # Table doesn't exist, create it
-                        logger.debug(f"weather_forecast table not found, creating it... (error: {e})")
-                    await conn.run_sync(
-                        lambda sync_conn: Base.metadata.create_all(
-                            sync_conn,
-                            tables=[WeatherForecastModel.__table__],  # type: ignore[list-item]
-                        )
-                    )
-
-            await _check_and_create_table()
-        except (AttributeError, RuntimeError, ValueError, TypeError, OSError) as e:
-            # AttributeError: missing database attributes
-            # RuntimeError: database connection/creation errors
-            # ValueError: invalid table schema
-            # TypeError: wrong argument types
-            # OSError: file I/O errors
-            logger.debug(f"Could not check/create weather_forecast table: {e}")
+        await _ensure_weather_forecast_table(db)
 
         try:
             async with db._AsyncSession() as session:
@@ -827,16 +981,7 @@ async def fetch_weather(location: ObserverLocation) -> WeatherData:
         if existing:
             # Convert database model to WeatherData
             logger.debug("Using cached weather data from database")
-            return WeatherData(
-                temperature_c=existing.temperature_f,
-                dew_point_f=existing.dew_point_f,
-                humidity_percent=existing.humidity_percent,
-                cloud_cover_percent=existing.cloud_cover_percent,
-                wind_speed_ms=existing.wind_speed_mph,
-                visibility_km=None,
-                condition=None,
-                last_updated=existing.fetched_at.isoformat() if existing.fetched_at else None,
-            )
+            return _weather_from_forecast(existing)
     except (AttributeError, RuntimeError, ValueError, TypeError, KeyError, IndexError) as e:
         # AttributeError: missing database/model attributes
         # RuntimeError: database connection errors
@@ -849,24 +994,11 @@ async def fetch_weather(location: ObserverLocation) -> WeatherData:
     # Not in cache or stale, fetch from API
     logger.debug("Fetching current weather from Open-Meteo API")
     try:
-        url = "https://api.open-meteo.com/v1/forecast"
         params: dict[str, str | int | float | list[str]] = {
             "latitude": location.latitude,
             "longitude": location.longitude,
-            "current": [
-                "temperature_2m",
-                "relative_humidity_2m",
-                "cloud_cover",
-                "wind_speed_10m",
-                "weather_code",
-            ],
-            "hourly": [
-                "temperature_2m",
-                "dew_point_2m",
-                "relative_humidity_2m",
-                "cloud_cover",
-                "wind_speed_10m",
-            ],
+            "current": _CURRENT_WEATHER_VARIABLES,
+            "hourly": _HOURLY_WEATHER_VARIABLES,
             "timezone": "auto",
             "wind_speed_unit": "mph",
             "temperature_unit": "fahrenheit",
@@ -875,157 +1007,17 @@ async def fetch_weather(location: ObserverLocation) -> WeatherData:
 
         async with (
             aiohttp.ClientSession() as session,
-            session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response,
+            session.get(OPEN_METEO_FORECAST_URL, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response,
         ):
             if response.status != 200:
                 return WeatherData(error=f"HTTP {response.status}")
 
             data = await response.json()
 
-        # Parse response
-        current = data.get("current", {})
-        hourly = data.get("hourly", {})
-
-        def safe_float(value: float | None) -> float | None:
-            """Convert value to float, returning None if NaN or None."""
-            if value is None:
-                return None
-            if np is not None and np.isnan(value):
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-
-        # Open-Meteo API returns data directly in current object, not nested under "variables"
-        temp_f = safe_float(current.get("temperature_2m"))
-        humidity = safe_float(current.get("relative_humidity_2m"))
-        cloud_cover = safe_float(current.get("cloud_cover"))
-        wind_speed_mph = safe_float(current.get("wind_speed_10m"))
-        weather_code = current.get("weather_code")
-
-        # Get dew point from hourly data (first hour)
-        # Open-Meteo API returns hourly data directly in hourly object
-        dew_point_values = hourly.get("dew_point_2m", [])
-        dew_point_f = safe_float(dew_point_values[0]) if dew_point_values else None
-
-        # If dew point not available, calculate from temp/humidity
-        if dew_point_f is None and temp_f is not None and humidity is not None:
-            dew_point_f = calculate_dew_point_fahrenheit(temp_f, humidity)
-
-        # Map weather code to condition string
-        condition = None
-        if weather_code is not None:
-            code = int(weather_code)
-            match code:
-                case 0:
-                    condition = "Clear"
-                case 1 | 2 | 3:
-                    condition = "Partly Cloudy"
-                case 45 | 48:
-                    condition = "Foggy"
-                case 51 | 53 | 55 | 56 | 57:
-                    condition = "Drizzle"
-                case 61 | 63 | 65 | 66 | 67:
-                    condition = "Rain"
-                case 71 | 73 | 75 | 77:
-                    condition = "Snow"
-                case 80 | 81 | 82:
-                    condition = "Rain Showers"
-                case 85 | 86:
-                    condition = "Snow Showers"
-                case 95 | 96 | 99:
-                    condition = "Thunderstorm"
-                case _:
-                    condition = "Cloudy"
-
-        weather_data = WeatherData(
-            temperature_c=temp_f,
-            dew_point_f=dew_point_f,
-            humidity_percent=humidity,
-            cloud_cover_percent=cloud_cover,
-            wind_speed_ms=wind_speed_mph,
-            visibility_km=None,
-            condition=condition,
-            last_updated="now",
-        )
+        weather_data = _parse_current_weather(data)
 
         # Store in database for future use
-        if not weather_data.error:
-
-            async def _store_weather_in_db(weather_to_store: WeatherData) -> None:
-                """Store weather in database."""
-                from sqlalchemy import and_, select
-
-                from celestron_nexstar.api.database.database import get_database
-                from celestron_nexstar.api.database.models import WeatherForecastModel
-                from celestron_nexstar.api.location.geohash_utils import encode
-
-                db = get_database()
-                try:
-                    location_geohash = encode(location.latitude, location.longitude, precision=9)
-                    now_db = datetime.now(UTC)
-                    current_hour_start_db = now_db.replace(minute=0, second=0, microsecond=0)
-                    current_hour_end_db = current_hour_start_db + timedelta(hours=1)
-
-                    async with db._AsyncSession() as session:
-                        # Check if forecast already exists for this hour
-                        stmt = (
-                            select(WeatherForecastModel)
-                            .where(
-                                and_(
-                                    WeatherForecastModel.latitude == location.latitude,
-                                    WeatherForecastModel.longitude == location.longitude,
-                                    WeatherForecastModel.forecast_timestamp >= current_hour_start_db,
-                                    WeatherForecastModel.forecast_timestamp < current_hour_end_db,
-                                )
-                            )
-                            .limit(1)
-                        )
-                        result = await session.execute(stmt)
-                        existing = result.scalar_one_or_none()
-
-                        # Calculate seeing score
-                        seeing_score = calculate_seeing_conditions(weather_to_store)
-
-                        if existing:
-                            # Update existing forecast
-                            existing.geohash = location_geohash
-                            existing.temperature_f = weather_to_store.temperature_c
-                            existing.dew_point_f = weather_to_store.dew_point_f
-                            existing.humidity_percent = weather_to_store.humidity_percent
-                            existing.cloud_cover_percent = weather_to_store.cloud_cover_percent
-                            existing.wind_speed_mph = weather_to_store.wind_speed_ms
-                            existing.seeing_score = seeing_score
-                            existing.fetched_at = now_db
-                        else:
-                            # Insert new forecast
-                            db_forecast = WeatherForecastModel(
-                                latitude=location.latitude,
-                                longitude=location.longitude,
-                                geohash=location_geohash,
-                                forecast_timestamp=current_hour_start_db,
-                                temperature_f=weather_to_store.temperature_c,
-                                dew_point_f=weather_to_store.dew_point_f,
-                                humidity_percent=weather_to_store.humidity_percent,
-                                cloud_cover_percent=weather_to_store.cloud_cover_percent,
-                                wind_speed_mph=weather_to_store.wind_speed_ms,
-                                seeing_score=seeing_score,
-                                fetched_at=now_db,
-                            )
-                            session.add(db_forecast)
-
-                        await session.commit()
-                        logger.debug("Stored current weather in database")
-                except (AttributeError, RuntimeError, ValueError, TypeError, KeyError) as e:
-                    # AttributeError: missing database/model attributes
-                    # RuntimeError: database connection/commit errors
-                    # ValueError: invalid data format
-                    # TypeError: wrong argument types
-                    # KeyError: missing keys in data
-                    logger.warning(f"Error storing current weather in database: {e}")
-
-            await _store_weather_in_db(weather_data)
+        await _store_current_weather({location: weather_data})
 
         return weather_data
 
@@ -1051,31 +1043,142 @@ async def fetch_weather(location: ObserverLocation) -> WeatherData:
         return WeatherData(error=f"Error fetching weather: {e}")
 
 
-async def fetch_weather_batch(locations: list[ObserverLocation]) -> dict[ObserverLocation, WeatherData]:
+async def _load_cached_current_weather(locations: list[ObserverLocation]) -> dict[ObserverLocation, WeatherData]:
+    """Get fresh current-hour weather from the database for many locations in one query."""
+    from sqlalchemy import select
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from celestron_nexstar.api.database.database import get_database
+
+    now = datetime.now(UTC)
+    current_hour_start = now.replace(minute=0, second=0, microsecond=0)
+    current_hour_end = current_hour_start + timedelta(hours=1)
+
+    try:
+        db = get_database()
+        await _ensure_weather_forecast_table(db)
+        async with db._AsyncSession() as session:
+            stmt = (
+                select(WeatherForecastModel)
+                .where(
+                    WeatherForecastModel.latitude.in_({location.latitude for location in locations}),
+                    WeatherForecastModel.longitude.in_({location.longitude for location in locations}),
+                    WeatherForecastModel.forecast_timestamp >= current_hour_start,
+                    WeatherForecastModel.forecast_timestamp < current_hour_end,
+                )
+                .order_by(WeatherForecastModel.forecast_timestamp.desc())
+            )
+            result = await session.execute(stmt)
+            fresh: dict[tuple[float, float], WeatherForecastModel] = {}
+            for forecast in result.scalars().all():
+                if not _is_forecast_stale(forecast, now):
+                    fresh.setdefault((forecast.latitude, forecast.longitude), forecast)
+    except (SQLAlchemyError, AttributeError, RuntimeError, ValueError, TypeError, KeyError, IndexError) as e:
+        # SQLAlchemyError: database errors (locked, missing or corrupt tables)
+        # AttributeError: missing database/model attributes
+        # RuntimeError: database connection errors
+        # ValueError: invalid data format
+        # TypeError: wrong argument types
+        # KeyError: missing keys in data
+        # IndexError: missing array indices
+        logger.debug(f"Error checking database for current weather: {e}")
+        return {}
+
+    cached: dict[ObserverLocation, WeatherData] = {}
+    for location in locations:
+        fresh_forecast = fresh.get((location.latitude, location.longitude))
+        if fresh_forecast is not None:
+            cached[location] = _weather_from_forecast(fresh_forecast)
+    return cached
+
+
+async def _fetch_current_weather_chunk(
+    session: aiohttp.ClientSession, locations: list[ObserverLocation]
+) -> dict[ObserverLocation, WeatherData]:
+    """Fetch current weather for several locations with one Open-Meteo request."""
+    params: dict[str, str | int | float] = {
+        "latitude": ",".join(str(location.latitude) for location in locations),
+        "longitude": ",".join(str(location.longitude) for location in locations),
+        "current": ",".join(_CURRENT_WEATHER_VARIABLES),
+        "hourly": ",".join(_HOURLY_WEATHER_VARIABLES),
+        "timezone": "auto",
+        "wind_speed_unit": "mph",
+        "temperature_unit": "fahrenheit",
+        "forecast_days": 1,
+    }
+    try:
+        async with session.get(OPEN_METEO_FORECAST_URL, params=params) as response:
+            if response.status != 200:
+                return dict.fromkeys(locations, WeatherData(error=f"HTTP {response.status}"))
+            data = await response.json()
+
+        # One object per location, in request order (a bare object for a single location)
+        results = data if isinstance(data, list) else [data]
+        if len(results) != len(locations):
+            raise ValueError(f"Expected {len(locations)} locations in response, got {len(results)}")
+        return {location: _parse_current_weather(result) for location, result in zip(locations, results, strict=True)}
+    except (aiohttp.ClientError, TimeoutError, ValueError, TypeError, KeyError, IndexError, AttributeError) as e:
+        # aiohttp.ClientError: HTTP/network errors
+        # TimeoutError: request timeout
+        # ValueError: invalid JSON or data format
+        # TypeError: wrong data types
+        # KeyError: missing keys in response
+        # IndexError: missing array indices
+        # AttributeError: missing attributes in response
+        logger.warning(f"Error fetching weather for {len(locations)} location(s) from Open-Meteo: {e}")
+        return dict.fromkeys(locations, WeatherData(error=f"Error fetching weather: {e}"))
+
+
+async def fetch_weather_batch(
+    locations: list[ObserverLocation],
+    session: aiohttp.ClientSession | None = None,
+    batch_size: int = WEATHER_BATCH_SIZE,
+) -> dict[ObserverLocation, WeatherData]:
     """
-    Fetch weather data for multiple locations concurrently.
+    Fetch weather data for multiple locations with a few multi-location requests.
+
+    Fresh current-hour weather is read from the database in one query. The
+    remaining locations are sent to Open-Meteo as comma-separated coordinate
+    lists, batch_size per request, over one pooled session, and all results
+    are stored with one bulk upsert.
 
     Args:
         locations: List of observer locations
+        session: HTTP session to use (optional; a pooled one is created and closed)
+        batch_size: Locations per Open-Meteo request
 
     Returns:
         Dictionary mapping locations to WeatherData
     """
-    tasks = [fetch_weather(loc) for loc in locations]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    data_map: dict[ObserverLocation, WeatherData] = {}
-    for location, result in zip(locations, results, strict=False):
-        if isinstance(result, Exception):
-            logger.error(f"Error fetching weather for {location}: {result}")
-            data_map[location] = WeatherData(error=f"Error: {result}")
-        elif isinstance(result, WeatherData):
-            data_map[location] = result
-        else:
-            logger.warning(f"Unexpected result type for {location}: {type(result)}")
-            data_map[location] = WeatherData(error="Unexpected error")
+    unique = list(dict.fromkeys(locations))
+    if not unique:
+        return {}
+
+    data_map = await _load_cached_current_weather(unique)
+    missing = [location for location in unique if location not in data_map]
+    if missing:
+        logger.debug(f"Fetching current weather for {len(missing)} location(s) from Open-Meteo API")
+        chunks = [missing[i : i + batch_size] for i in range(0, len(missing), batch_size)]
 
-    return data_map
+        async def _fetch_all(http_session: aiohttp.ClientSession) -> list[dict[ObserverLocation, WeatherData]]:
+            return await asyncio.gather(*(_fetch_current_weather_chunk(http_session, chunk) for chunk in chunks))
+
+        if session is not None:
+            chunk_results = await _fetch_all(session)
+        else:
+            async with aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=WEATHER_BATCH_CONCURRENCY),
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as new_session:
+                chunk_results = await _fetch_all(new_session)
+
+        fetched: dict[ObserverLocation, WeatherData] = {}
+        for chunk_result in chunk_results:
+            fetched.update(chunk_result)
+        await _store_current_weather(fetched)
+        data_map.update(fetched)
+
+    return {location: data_map[location] for location in unique}
 
 
 async def fetch_historical_weather_climatology(
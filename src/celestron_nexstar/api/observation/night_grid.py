@@ -0,0 +1,435 @@
+"""
+Night Sky Grid
+
+This module provides NightGrid, a precomputed time-step by object
+altitude/azimuth matrix for one location and time window. Everything a
+planner needs about when objects are up is derived from the matrix with
+array operations instead of per-object sampling loops. Features include:
+- One vectorized transform pass for a whole catalog (see api.core.transforms)
+- Rise, set and transit times, maximum altitude and hours above any altitude
+  for every object at once
+- Planets and moons follow their ephemeris positions across the window
+- ObjectVisibilityTimeline results compatible with planning_utils
+- A small cache so repeated planner calls for the same night share one grid
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any
+
+import deal
+import numpy as np
+import numpy.typing as npt
+
+from celestron_nexstar.api.catalogs.catalogs import CelestialObject
+from celestron_nexstar.api.core.transforms import ra_dec_to_alt_az_array
+from celestron_nexstar.api.ephemeris.ephemeris import is_dynamic_object
+from celestron_nexstar.api.observation.planning_utils import ObjectVisibilityTimeline
+from celestron_nexstar.api.observation.rise_set import PositionFunc, position_track
+
+
+__all__ = [
+    "DEFAULT_STEP_MINUTES",
+    "NightGrid",
+    "get_night_grid",
+]
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STEP_MINUTES = 10.0
+
+# Grids kept by get_night_grid
+_CACHE_SIZE = 4
+_cache: OrderedDict[tuple[Any, ...], NightGrid] = OrderedDict()
+_cache_lock = Lock()
+
+
+def _to_datetime(unix_seconds: float) -> datetime | None:
+    return None if np.isnan(unix_seconds) else datetime.fromtimestamp(float(unix_seconds), UTC)
+
+
+@dataclass(frozen=True)
+class NightGrid:
+    """
+    Altitude/azimuth of many objects sampled on a regular time grid.
+
+    Rows are time steps and columns are objects, so ``altitude[:, j]`` is the
+    altitude curve of ``names[j]`` across the window. Event times are
+    returned as Unix seconds, with NaN where the event does not happen in
+    the window.
+
+    Attributes:
+        names: Object names, one per column
+        times: Unix time of each row (float64 seconds)
+        altitude: Altitude in degrees, shape (len(times), len(names))
+        azimuth: Azimuth in degrees, same shape
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        dec_degrees: Declination of each object at the middle of the window
+    """
+
+    names: tuple[str, ...]
+    times: npt.NDArray[np.float64]
+    altitude: npt.NDArray[np.float32]
+    azimuth: npt.NDArray[np.float32]
+    latitude: float
+    longitude: float
+    dec_degrees: npt.NDArray[np.float64]
+
+    def __str__(self) -> str:
+        """Format as a one-line summary."""
+        start = _to_datetime(float(self.times[0]))
+        hours = (self.times[-1] - self.times[0]) / 3600.0
+        return (
+            f"{len(self.names)} objects by {len(self.times)} steps over {hours:.1f} h from "
+            f"{start.isoformat() if start else '?'} at ({self.latitude:.2f}°, {self.longitude:.2f}°)"
+        )
+
+    def __len__(self) -> int:
+        """Get the number of objects."""
+        return len(self.names)
+
+    @property
+    def step_seconds(self) -> float:
+        """Get the time step in seconds."""
+        return float(self.times[1] - self.times[0]) if len(self.times) > 1 else 0.0
+
+    @classmethod
+    @deal.pre(
+        lambda cls, names, ra_hours, dec_degrees, latitude, longitude, start, hours=24.0, step_minutes=10.0: (
+            hours > 0 and step_minutes > 0
+        ),
+        message="Window and step must be positive",
+    )  # type: ignore[misc,arg-type]
+    def from_coordinates(
+        cls,
+        names: Sequence[str],
+        ra_hours: npt.ArrayLike,
+        dec_degrees: npt.ArrayLike,
+        latitude: float,
+        longitude: float,
+        start: datetime,
+        hours: float = 24.0,
+        step_minutes: float = DEFAULT_STEP_MINUTES,
+    ) -> NightGrid:
+        """
+        Build a grid from coordinates.
+
+        Args:
+            names: Object names
+            ra_hours: RA in hours, shape (N,) or (T, N) for moving objects
+            dec_degrees: Dec in degrees, same shape as ``ra_hours``
+            latitude: Observer latitude in degrees
+            longitude: Observer longitude in degrees
+            start: Start of the window (naive means UTC)
+            hours: Window length in hours
+            step_minutes: Time step in minutes
+
+        Returns:
+            NightGrid covering [start, start + hours]
+        """
+        times = cls.grid_times(start, hours, step_minutes)
+        ra = np.asarray(ra_hours, dtype=np.float64)
+        dec = np.asarray(dec_degrees, dtype=np.float64)
+        azimuth, altitude = ra_dec_to_alt_az_array(ra, dec, latitude, longitude, times[:, None])
+        azimuth, altitude = (
+            np.broadcast_to(azimuth, (len(times), len(names))),
+            np.broadcast_to(altitude, (len(times), len(names))),
+        )
+        mid_dec = dec if dec.ndim < 2 else dec[len(times) // 2]
+        return cls(
+            names=tuple(str(name) for name in names),
+            times=times,
+            altitude=altitude.astype(np.float32),
+            azimuth=azimuth.astype(np.float32),
+            latitude=float(latitude),
+            longitude=float(longitude),
+            dec_degrees=np.broadcast_to(mid_dec, (len(names),)).astype(np.float64),
+        )
+
+    @classmethod
+    def for_objects(
+        cls,
+        objects: Sequence[CelestialObject],
+        latitude: float,
+        longitude: float,
+        start: datetime,
+        hours: float = 24.0,
+        step_minutes: float = DEFAULT_STEP_MINUTES,
+        position_func: PositionFunc | None = None,
+    ) -> NightGrid:
+        """
+        Build a grid for catalog objects.
+
+        Planets and moons are positioned every hour (with ``position_func``,
+        or batched ephemeris positions by default) across the window and interpolated onto the grid. Objects whose
+        position cannot be calculated are left out (and logged).
+
+        Args:
+            objects: Objects to include
+            latitude: Observer latitude in degrees
+            longitude: Observer longitude in degrees
+            start: Start of the window (naive means UTC)
+            hours: Window length in hours
+            step_minutes: Time step in minutes
+            position_func: RA/Dec lookup for solar system objects, called as
+                           ``position_func(name, latitude, longitude, dt)``
+
+        Returns:
+            NightGrid with one column per usable object
+        """
+        times = cls.grid_times(start, hours, step_minutes)
+        names: list[str] = []
+        ra_columns: list[npt.NDArray[np.float64] | float] = []
+        dec_columns: list[npt.NDArray[np.float64] | float] = []
+        ra: npt.NDArray[np.float64] | float
+        dec: npt.NDArray[np.float64] | float
+        for obj in objects:
+            if is_dynamic_object(obj.name):
+                try:
+                    ra, dec = position_track(obj.name, latitude, longitude, times[0], times[-1], position_func)(times)
+                except Exception as e:
+                    # Ephemeris lookups can fail for many reasons (missing
+                    # files, unknown bodies); one object must not sink the grid
+                    logger.debug(f"Skipping {obj.name} in night grid: {e}")
+                    continue
+            else:
+                ra, dec = obj.ra_hours, obj.dec_degrees
+            names.append(obj.name)
+            ra_columns.append(ra)
+            dec_columns.append(dec)
+
+        ra_grid = np.column_stack([np.broadcast_to(ra, times.shape) for ra in ra_columns]) if names else np.empty(0)
+        dec_grid = np.column_stack([np.broadcast_to(dec, times.shape) for dec in dec_columns]) if names else np.empty(0)
+        return cls.from_coordinates(names, ra_grid, dec_grid, latitude, longitude, start, hours, step_minutes)
+
+    @staticmethod
+    def grid_times(start: datetime, hours: float, step_minutes: float) -> npt.NDArray[np.float64]:
+        """Get the Unix times of a window's grid rows (both ends included)."""
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=UTC)
+        steps = max(1, round(hours * 60.0 / step_minutes))
+        return start.timestamp() + np.arange(steps + 1, dtype=np.float64) * (hours * 3600.0 / steps)
+
+    def index(self, name: str) -> int:
+        """
+        Get the column of an object.
+
+        Raises:
+            KeyError: If the object is not in the grid
+        """
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _crossings(self, min_altitude: float, rising: bool) -> npt.NDArray[np.float64]:
+        """Time of the first upward (or downward) crossing of an altitude per object."""
+        offset = self.altitude.astype(np.float64) - min_altitude
+        before, after = offset[:-1], offset[1:]
+        crossing = (before <= 0) & (after > 0) if rising else (before > 0) & (after <= 0)
+        found = crossing.any(axis=0)
+        row = crossing.argmax(axis=0)
+        columns = np.arange(len(self.names))
+        a, b = before[row, columns], after[row, columns]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fraction = np.clip(a / (a - b), 0.0, 1.0)
+        result = self.times[row] + fraction * self.step_seconds
+        return np.where(found, result, np.nan)
+
+    @deal.pre(lambda self, min_altitude=0.0: -90 <= min_altitude <= 90, message="Altitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    def rise_times(self, min_altitude: float = 0.0) -> npt.NDArray[np.float64]:
+        """
+        Get the first time each object rises above an altitude.
+
+        Args:
+            min_altitude: Altitude in degrees (0 for the horizon)
+
+        Returns:
+            Unix times, NaN where the object does not rise in the window
+        """
+        return self._crossings(min_altitude, rising=True)
+
+    @deal.pre(lambda self, min_altitude=0.0: -90 <= min_altitude <= 90, message="Altitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    def set_times(self, min_altitude: float = 0.0) -> npt.NDArray[np.float64]:
+        """
+        Get the first time each object sets below an altitude.
+
+        Args:
+            min_altitude: Altitude in degrees (0 for the horizon)
+
+        Returns:
+            Unix times, NaN where the object does not set in the window
+        """
+        return self._crossings(min_altitude, rising=False)
+
+    def _culmination(self) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Transit time and maximum altitude per object, refined with a parabola through the peak."""
+        altitude = self.altitude.astype(np.float64)
+        row = altitude.argmax(axis=0)
+        columns = np.arange(len(self.names))
+        peak = altitude[row, columns]
+        interior = (row > 0) & (row < len(self.times) - 1)
+        before = altitude[np.maximum(row - 1, 0), columns]
+        after = altitude[np.minimum(row + 1, len(self.times) - 1), columns]
+        curvature = before - 2.0 * peak + after
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shift = np.where(interior & (curvature < 0), 0.5 * (before - after) / curvature, 0.0)
+        shift = np.clip(shift, -0.5, 0.5)
+        transit = np.where(interior, self.times[row] + shift * self.step_seconds, np.nan)
+        return transit, peak - 0.25 * (before - after) * shift
+
+    def transit_times(self) -> npt.NDArray[np.float64]:
+        """
+        Get each object's highest point (upper culmination) in the window.
+
+        Returns:
+            Unix times, NaN where the highest point is at either end of the
+            window (the culmination falls outside it)
+        """
+        return self._culmination()[0]
+
+    def max_altitudes(self) -> npt.NDArray[np.float64]:
+        """Get each object's highest altitude in the window in degrees."""
+        return self._culmination()[1]
+
+    @deal.pre(lambda self, min_altitude=0.0: -90 <= min_altitude <= 90, message="Altitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    def hours_above(self, min_altitude: float = 0.0) -> npt.NDArray[np.float64]:
+        """
+        Get how long each object spends above an altitude in the window.
+
+        Steps that cross the altitude contribute the interpolated fraction.
+
+        Args:
+            min_altitude: Altitude in degrees
+
+        Returns:
+            Hours per object
+        """
+        offset = self.altitude.astype(np.float64) - min_altitude
+        before, after = offset[:-1], offset[1:]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            partial = np.clip(np.maximum(before, after) / np.abs(after - before), 0.0, 1.0)
+        fraction = np.where((before > 0) & (after > 0), 1.0, np.where((before <= 0) & (after <= 0), 0.0, partial))
+        return np.asarray(fraction.sum(axis=0) * self.step_seconds / 3600.0, dtype=np.float64)
+
+    def at(self, when: datetime) -> tuple[npt.NDArray[np.float32], npt.NDArray[np.float32]]:
+        """
+        Get every object's altitude and azimuth at the grid row nearest a time.
+
+        Args:
+            when: Time (naive means UTC)
+
+        Returns:
+            Tuple of (altitude, azimuth) arrays in degrees
+        """
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        row = int(np.abs(self.times - when.timestamp()).argmin())
+        return self.altitude[row], self.azimuth[row]
+
+    def timelines(self) -> list[ObjectVisibilityTimeline]:
+        """
+        Get rise/transit/set summaries for every object.
+
+        Returns:
+            One ObjectVisibilityTimeline per column, in grid order
+        """
+        rises = self.rise_times()
+        sets = self.set_times()
+        transits, peaks = self._culmination()
+        above = self.altitude > 0
+        always = np.asarray(above.all(axis=0))
+        never = ~np.asarray(above.any(axis=0))
+        # Circumpolar: the declination keeps the object above the horizon all day
+        hemisphere = 1.0 if self.latitude >= 0 else -1.0
+        circumpolar = hemisphere * self.dec_degrees > 90.0 - abs(self.latitude)
+        return [
+            ObjectVisibilityTimeline(
+                object_name=name,
+                rise_time=_to_datetime(rises[j]),
+                transit_time=_to_datetime(transits[j]) if peaks[j] > 0 else None,
+                set_time=_to_datetime(sets[j]),
+                max_altitude=float(peaks[j]),
+                is_circumpolar=bool(circumpolar[j]),
+                is_always_visible=bool(always[j]),
+                is_never_visible=bool(never[j]),
+            )
+            for j, name in enumerate(self.names)
+        ]
+
+    def timeline(self, name: str) -> ObjectVisibilityTimeline:
+        """
+        Get the rise/transit/set summary of one object.
+
+        Raises:
+            KeyError: If the object is not in the grid
+        """
+        single = NightGrid(
+            names=(name,),
+            times=self.times,
+            altitude=self.altitude[:, [self.index(name)]],
+            azimuth=self.azimuth[:, [self.index(name)]],
+            latitude=self.latitude,
+            longitude=self.longitude,
+            dec_degrees=self.dec_degrees[[self.index(name)]],
+        )
+        return single.timelines()[0]
+
+
+def get_night_grid(
+    objects: Sequence[CelestialObject],
+    latitude: float,
+    longitude: float,
+    start: datetime,
+    hours: float = 24.0,
+    step_minutes: float = DEFAULT_STEP_MINUTES,
+) -> NightGrid:
+    """
+    Get a NightGrid, reusing a recent one built for the same inputs.
+
+    The most recent grids are kept in memory, keyed by location, window and
+    the objects' names and coordinates, so repeated calls for the same night
+    (such as the observation planner's recommendations) share one computation.
+
+    Args:
+        objects: Objects to include
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        start: Start of the window (naive means UTC)
+        hours: Window length in hours
+        step_minutes: Time step in minutes
+
+    Returns:
+        NightGrid for the objects
+    """
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=UTC)
+    key = (
+        round(latitude, 6),
+        round(longitude, 6),
+        start.timestamp(),
+        hours,
+        step_minutes,
+        tuple((obj.name, obj.ra_hours, obj.dec_degrees) for obj in objects),
+    )
+    with _cache_lock:
+        grid = _cache.get(key)
+        if grid is not None:
+            _cache.move_to_end(key)
+            return grid
+
+    grid = NightGrid.for_objects(objects, latitude, longitude, start, hours, step_minutes)
+    with _cache_lock:
+        _cache[key] = grid
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    logger.debug(f"Computed night grid: {grid}")
+    return grid
@@ -34,6 +34,7 @@ from celestron_nexstar.api.location.weather import (
     calculate_seeing_conditions,
     fetch_weather,
 )
+from celestron_nexstar.api.observation.night_grid import get_night_grid
 from celestron_nexstar.api.observation.optics import calculate_limiting_magnitude, get_current_configuration
 from celestron_nexstar.api.observation.visibility import VisibilityInfo, filter_visible_objects
 
@@ -562,10 +563,22 @@ class ObservationPlanner:
                     filtered_pairs.append((obj, vis_info))
             visible_pairs = filtered_pairs
 
+        # How long each candidate stays above the cutoff, from one altitude grid for all of them
+        visible_hours = self._calculate_visible_hours(
+            [obj for obj, _ in visible_pairs], conditions, min_altitude_deg=20.0
+        )
+
         # Score and rank objects (with cached moon position)
         recommendations = []
         for obj, vis_info in visible_pairs:
-            rec = self._score_object(obj, conditions, vis_info, moon_ra=moon_ra, moon_dec=moon_dec)
+            rec = self._score_object(
+                obj,
+                conditions,
+                vis_info,
+                moon_ra=moon_ra,
+                moon_dec=moon_dec,
+                visible_hours=visible_hours.get(obj.name),
+            )
             if rec:
                 recommendations.append(rec)
 
@@ -867,6 +880,7 @@ class ObservationPlanner:
         vis_info: VisibilityInfo,
         moon_ra: float | None = None,
         moon_dec: float | None = None,
+        visible_hours: float | None = None,
     ) -> RecommendedObject | None:
         """Score an object for recommendation."""
         if not vis_info.is_visible:
@@ -899,7 +913,7 @@ class ObservationPlanner:
             altitude=vis_info.altitude_deg or 0.0,
             azimuth=vis_info.azimuth_deg or 0.0,
             best_viewing_time=best_time,
-            visible_duration_hours=8.0,  # Simplified
+            visible_duration_hours=visible_hours if visible_hours is not None else 8.0,
             apparent_magnitude=obj.magnitude or 0.0,
             observability_score=vis_info.observability_score,
             visibility_probability=visibility_prob,
@@ -1048,6 +1062,32 @@ class ObservationPlanner:
 
         return transit_time
 
+    def _calculate_visible_hours(
+        self,
+        objects: list[CelestialObject],
+        conditions: ObservingConditions,
+        min_altitude_deg: float,
+    ) -> dict[str, float]:
+        """Calculate how many hours each object spends above an altitude between now and sunrise."""
+        if not objects:
+            return {}
+        start = conditions.timestamp if conditions.timestamp.tzinfo else conditions.timestamp.replace(tzinfo=UTC)
+        hours = 12.0
+        if conditions.sunrise_time is not None:
+            sunrise = conditions.sunrise_time
+            if sunrise.tzinfo is None:
+                sunrise = sunrise.replace(tzinfo=UTC)
+            until_sunrise = (sunrise - start).total_seconds() / 3600.0
+            if 0 < until_sunrise <= 24:
+                hours = until_sunrise
+        try:
+            grid = get_night_grid(objects, conditions.latitude, conditions.longitude, start, hours)
+        except Exception as e:
+            # Durations are informational; fall back to the default rather than drop recommendations
+            logger.debug(f"Could not calculate visible hours: {e}")
+            return {}
+        return dict(zip(grid.names, grid.hours_above(min_altitude_deg).tolist(), strict=True))
+
     def _calculate_moon_separation(
         self,
         obj: CelestialObject,
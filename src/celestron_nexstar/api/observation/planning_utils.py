@@ -25,7 +25,6 @@ from celestron_nexstar.api.core.enums import CelestialObjectType, MoonPhase
 from celestron_nexstar.api.core.utils import calculate_lst, ra_dec_to_alt_az
 from celestron_nexstar.api.ephemeris.ephemeris import get_planetary_position, is_dynamic_object
 from celestron_nexstar.api.location.observer import get_observer_location
-from celestron_nexstar.api.observation.visibility import get_object_altitude_azimuth
 
 
 logger = logging.getLogger(__name__)
@@ -68,38 +67,6 @@ class ObjectVisibilityTimeline:
     is_never_visible: bool
 
 
-def _refine_horizon_crossing(
-    prev_dt: datetime,
-    check_dt: datetime,
-    obj: CelestialObject,
-    observer_lat: float,
-    observer_lon: float,
-    rising: bool,
-) -> datetime | None:
-    """Refine horizon crossing time using binary search."""
-    # Sample at 5-minute intervals
-    best_time = prev_dt + timedelta(minutes=30)
-    min_diff = float("inf")
-
-    for minutes_offset in range(0, 61, 5):
-        test_dt = prev_dt + timedelta(minutes=minutes_offset)
-        if test_dt > check_dt:
-            break
-
-        try:
-            alt, _az = get_object_altitude_azimuth(obj, observer_lat, observer_lon, test_dt)
-            diff = abs(alt)
-            if diff < min_diff:
-                min_diff = diff
-                best_time = test_dt
-            if diff < 0.1:
-                break
-        except Exception:
-            continue
-
-    return best_time if min_diff < 5.0 else None
-
-
 def get_object_visibility_timeline(
     obj: CelestialObject,
     observer_lat: float | None = None,
@@ -163,7 +130,7 @@ def get_object_visibility_timeline(
             transit_time += timedelta(hours=24)
 
     # Get altitude at transit
-    transit_alt, _ = ra_dec_to_alt_az(ra_hours, dec_degrees, observer_lat, observer_lon, transit_time)
+    _, transit_alt = ra_dec_to_alt_az(ra_hours, dec_degrees, observer_lat, observer_lon, transit_time)
     max_altitude = transit_alt
 
     # Check if always visible or never visible
@@ -175,27 +142,14 @@ def get_object_visibility_timeline(
     set_time: datetime | None = None
 
     if not is_circumpolar and not is_never_visible:
-        # Sample next 48 hours to find rise/set
-        for hours_ahead in range(1, 49):
-            check_dt = start_time + timedelta(hours=hours_ahead)
-            try:
-                alt_check, _ = get_object_altitude_azimuth(obj, observer_lat, observer_lon, check_dt)
-                prev_dt = check_dt - timedelta(hours=1)
-                alt_prev, _ = get_object_altitude_azimuth(obj, observer_lat, observer_lon, prev_dt)
-
-                # Rise: was below, now above
-                if alt_prev <= 0 and alt_check > 0 and rise_time is None:
-                    rise_time = _refine_horizon_crossing(prev_dt, check_dt, obj, observer_lat, observer_lon, True)
-                    if set_time is not None:
-                        break
-
-                # Set: was above, now below
-                if alt_prev > 0 and alt_check <= 0 and set_time is None:
-                    set_time = _refine_horizon_crossing(prev_dt, check_dt, obj, observer_lat, observer_lon, False)
-                    if rise_time is not None:
-                        break
-            except Exception:
-                continue
+        from celestron_nexstar.api.observation.rise_set import RiseSetTransit
+
+        solved = RiseSetTransit.for_objects(
+            [obj], observer_lat, observer_lon, start_time, search_hours=48.0, position_func=get_planetary_position
+        )
+        if len(solved):
+            solved_timeline = solved.timeline(obj.name)
+            rise_time, set_time = solved_timeline.rise_time, solved_timeline.set_time
 
     return ObjectVisibilityTimeline(
         object_name=obj.name,
@@ -570,14 +524,15 @@ def get_transit_times(
     elif date.tzinfo is None:
         date = date.replace(tzinfo=UTC)
 
-    transit_times: dict[str, datetime] = {}
+    from celestron_nexstar.api.observation.rise_set import RiseSetTransit
 
-    for obj in objects:
-        try:
-            timeline = get_object_visibility_timeline(obj, observer_lat, observer_lon, date)
-            if timeline.transit_time:
-                transit_times[obj.name] = timeline.transit_time
-        except Exception:
-            continue
-
-    return transit_times
+    # The next transit at or after the date, within a day
+    solved = RiseSetTransit.for_objects(
+        objects,
+        observer_lat,
+        observer_lon,
+        date,
+        search_hours=24.0,
+        position_func=get_planetary_position,
+    )
+    return {timeline.object_name: timeline.transit_time for timeline in solved.timelines() if timeline.transit_time}
@@ -0,0 +1,480 @@
+"""
+Rise, Set and Transit Solver
+
+This module provides batched rise/set/transit times for whole catalogs.
+Fixed objects (stars, deep-sky objects) are solved in closed form from the
+hour angle at which they reach a given altitude, then polished with one
+Newton step against the full transform, so thousands of objects take a
+single vectorized pass. Solar system objects move during the night and are
+solved numerically instead. Features include:
+- Next rise, transit and set after a start time, to about a second
+- Any threshold altitude, with optional atmospheric refraction
+- Circumpolar and never-rising detection
+- A bracketing root finder for any altitude-versus-time function
+- ObjectVisibilityTimeline results compatible with planning_utils
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import deal
+import numpy as np
+import numpy.typing as npt
+
+from celestron_nexstar.api.catalogs.catalogs import CelestialObject
+from celestron_nexstar.api.core.transforms import (
+    apparent_ra_dec_array,
+    local_sidereal_time_array,
+    ra_dec_to_alt_az_array,
+    refraction_degrees,
+)
+from celestron_nexstar.api.ephemeris.ephemeris import get_planetary_positions, is_dynamic_object
+from celestron_nexstar.api.observation.planning_utils import ObjectVisibilityTimeline
+
+
+__all__ = [
+    "SIDEREAL_DAY_SECONDS",
+    "RiseSetTransit",
+    "find_rise_set_transit",
+    "position_track",
+]
+
+
+logger = logging.getLogger(__name__)
+
+# Mean sidereal day and the rate of sidereal time against UTC
+SIDEREAL_RATE = 1.00273790935
+SIDEREAL_DAY_SECONDS = 86400.0 / SIDEREAL_RATE
+
+# Solar system positions are sampled this often and interpolated
+_TRACK_SAMPLE_HOURS = 1.0
+
+# Root finder: coarse scan step, bisection tolerance, and the half-width of
+# the central difference used for the rate of change of altitude
+_SCAN_STEP_SECONDS = 600.0
+_TOLERANCE_SECONDS = 1.0
+_DERIVATIVE_SECONDS = 30.0
+
+FloatArray = npt.NDArray[np.float64]
+AltitudeFunc = Callable[[FloatArray], FloatArray]
+PositionFunc = Callable[[str, float, float, datetime], tuple[float, float]]
+
+
+def _unix(when: datetime) -> float:
+    return (when if when.tzinfo is not None else when.replace(tzinfo=UTC)).timestamp()
+
+
+def _to_datetime(unix_seconds: float) -> datetime | None:
+    return None if np.isnan(unix_seconds) else datetime.fromtimestamp(float(unix_seconds), UTC)
+
+
+def _geometric_threshold(altitude: float, refraction: bool) -> float:
+    """Geometric altitude at which an object appears at ``altitude``."""
+    if not refraction:
+        return altitude
+    return altitude - float(refraction_degrees(altitude, apparent=True))
+
+
+def position_track(
+    name: str,
+    latitude: float,
+    longitude: float,
+    start: float,
+    end: float,
+    position_func: PositionFunc | None = None,
+) -> Callable[[FloatArray], tuple[FloatArray, FloatArray]]:
+    """
+    Sample a moving object's RA/Dec hourly and return an interpolator.
+
+    Without ``position_func`` all samples come from one batched
+    get_planetary_positions call. RA is unwrapped before interpolation so
+    it does not jump across 0h/24h.
+
+    Args:
+        name: Object name passed to ``position_func``
+        latitude: Observer latitude in degrees
+        longitude: Observer longitude in degrees
+        start: Start of the span (Unix seconds)
+        end: End of the span (Unix seconds)
+        position_func: RA/Dec lookup, called as
+                       ``position_func(name, latitude, longitude, dt)``
+                       (default: batched ephemeris positions)
+
+    Returns:
+        Function mapping Unix times to (RA in hours, Dec in degrees)
+    """
+    count = max(2, int(np.ceil((end - start) / (_TRACK_SAMPLE_HOURS * 3600.0))) + 1)
+    sample_times = np.linspace(start, end, count)
+    sample_datetimes = [datetime.fromtimestamp(t, UTC) for t in sample_times]
+    if position_func is None:
+        # Batched positions are snapped to the minute; interpolate between
+        # the times actually computed. Pad by a minute so the span is covered.
+        sample_datetimes[0] -= timedelta(minutes=1)
+        sample_datetimes[-1] += timedelta(minutes=1)
+        samples = get_planetary_positions([name], sample_datetimes, latitude, longitude)[name.lower()]
+        sample_times = samples.times
+        positions = np.column_stack([samples.ra_hours, samples.dec_degrees])
+    else:
+        positions = np.array([position_func(name, latitude, longitude, dt) for dt in sample_datetimes])
+    ra = np.degrees(np.unwrap(np.radians(positions[:, 0] * 15.0))) / 15.0
+    dec = positions[:, 1]
+
+    def track(times: FloatArray) -> tuple[FloatArray, FloatArray]:
+        return np.interp(times, sample_times, ra) % 24.0, np.interp(times, sample_times, dec)
+
+    return track
+
+
+def _bisect(func: AltitudeFunc, low: FloatArray, high: FloatArray) -> FloatArray:
+    """Refine sign changes of ``func`` in [low, high] brackets, all at once."""
+    f_low = func(low)
+    while low.size and np.max(high - low) > _TOLERANCE_SECONDS:
+        middle = 0.5 * (low + high)
+        f_middle = func(middle)
+        same = np.sign(f_middle) == np.sign(f_low)
+        low, f_low = np.where(same, middle, low), np.where(same, f_middle, f_low)
+        high = np.where(same, high, middle)
+    return 0.5 * (low + high)
+
+
+def find_rise_set_transit(
+    altitude_func: AltitudeFunc,
+    start: float,
+    end: float,
+    altitude: float = 0.0,
+) -> tuple[float, float, float, float]:
+    """
+    Find the first rise, transit and set of a body by root finding.
+
+    The altitude curve is scanned every 10 minutes; every sign change is
+    then bracketed and bisected to a second. Transit is where the rate of
+    change of altitude goes from positive to negative.
+
+    Args:
+        altitude_func: Altitude in degrees for an array of Unix times
+        start: Start of the search (Unix seconds)
+        end: End of the search (Unix seconds)
+        altitude: Threshold altitude in degrees
+
+    Returns:
+        Tuple of (rise, transit, set, altitude at transit); times are Unix
+        seconds and every value is NaN when it does not happen in the span
+    """
+    steps = max(1, int(np.ceil((end - start) / _SCAN_STEP_SECONDS)))
+    times = np.linspace(start, end, steps + 1)
+
+    def offset(t: FloatArray) -> FloatArray:
+        return altitude_func(t) - altitude
+
+    def rate(t: FloatArray) -> FloatArray:
+        return altitude_func(t + _DERIVATIVE_SECONDS) - altitude_func(t - _DERIVATIVE_SECONDS)
+
+    values, rates = offset(times), rate(times)
+    rising = np.flatnonzero((values[:-1] <= 0) & (values[1:] > 0))
+    setting = np.flatnonzero((values[:-1] > 0) & (values[1:] <= 0))
+    peaks = np.flatnonzero((rates[:-1] > 0) & (rates[1:] <= 0))
+
+    def first(indices: npt.NDArray[np.intp], func: AltitudeFunc) -> float:
+        if not indices.size:
+            return float("nan")
+        return float(_bisect(func, times[indices[:1]], times[indices[:1] + 1])[0])
+
+    transit = first(peaks, rate)
+    transit_altitude = float(altitude_func(np.array([transit]))[0]) if not np.isnan(transit) else float("nan")
+    return first(rising, offset), transit, first(setting, offset), transit_altitude
+
+
+@dataclass(frozen=True)
+class RiseSetTransit:
+    """
+    Next rise, transit and set of many objects after a start time.
+
+    Times are Unix seconds, NaN where the event does not happen (no rise or
+    set for circumpolar and never-rising objects; no transit in the search
+    span for a moving object).
+
+    Attributes:
+        names: Object names
+        start: Start of the search (Unix seconds)
+        latitude: Observer latitude in degrees
+        altitude: Threshold altitude in degrees
+        rise_times: Next time each object climbs through the threshold
+        transit_times: Next upper culmination
+        set_times: Next time each object sinks through the threshold
+        max_altitudes: Altitude at transit in degrees
+        is_circumpolar: Object stays above the threshold
+        is_never_visible: Object stays below the threshold
+    """
+
+    names: tuple[str, ...]
+    start: float
+    latitude: float
+    altitude: float
+    rise_times: FloatArray
+    transit_times: FloatArray
+    set_times: FloatArray
+    max_altitudes: FloatArray
+    is_circumpolar: npt.NDArray[np.bool_]
+    is_never_visible: npt.NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        """Get the number of objects."""
+        return len(self.names)
+
+    @classmethod
+    @deal.pre(
+        lambda cls, names, ra_hours, dec_degrees, latitude, longitude, start, altitude=0.0, refraction=False: (
+            -90 <= latitude <= 90
+        ),
+        message="Latitude must be -90 to +90 degrees",
+    )  # type: ignore[misc,arg-type]
+    def from_coordinates(
+        cls,
+        names: Sequence[str],
+        ra_hours: npt.ArrayLike,
+        dec_degrees: npt.ArrayLike,
+        latitude: float,
+        longitude: float,
+        start: datetime,
+        altitude: float = 0.0,
+        refraction: bool = False,
+    ) -> RiseSetTransit:
+        """
+        Solve fixed objects in closed form.
+
+        The object reaches geometric altitude h at hour angle H with
+        cos H = (sin h - sin(lat) sin(dec)) / (cos(lat) cos(dec)); rise and
+        set are the transit time minus and plus H in sidereal time. Each
+        rise and set is then corrected with one Newton step against
+        ra_dec_to_alt_az_array, which absorbs the small aberration and
+        precession changes over the day.
+
+        Args:
+            names: Object names
+            ra_hours: J2000 RA in hours, shape (N,)
+            dec_degrees: J2000 Dec in degrees, shape (N,)
+            latitude: Observer latitude in degrees
+            longitude: Observer longitude in degrees
+            start: Start of the search (naive means UTC)
+            altitude: Threshold altitude in degrees (0 for the horizon)
+            refraction: ``altitude`` is observed, so allow for refraction
+
+        Returns:
+            RiseSetTransit for the objects
+        """
+        start_unix = _unix(start)
+        ra_j2000 = np.atleast_1d(np.asarray(ra_hours, dtype=np.float64))
+        dec_j2000 = np.atleast_1d(np.asarray(dec_degrees, dtype=np.float64))
+        ra, dec = apparent_ra_dec_array(ra_j2000, dec_j2000, start_unix + 43200.0)
+        threshold = _geometric_threshold(altitude, refraction)
+
+        # Next transit: hour angle zero
+        hour_angle = float(local_sidereal_time_array(longitude, start_unix, apparent=True)) - ra
+        transit = start_unix + np.mod(-hour_angle, 24.0) * 3600.0 / SIDEREAL_RATE
+
+        lat, dec_rad = np.radians(latitude), np.radians(dec)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cos_h = (np.sin(np.radians(threshold)) - np.sin(lat) * np.sin(dec_rad)) / (np.cos(lat) * np.cos(dec_rad))
+        circumpolar = cos_h < -1.0
+        never = cos_h > 1.0
+        crosses = ~(circumpolar | never)
+        semi_arc = np.degrees(np.arccos(np.clip(cos_h, -1.0, 1.0))) / 15.0 * 3600.0 / SIDEREAL_RATE
+
+        # The next rise follows the next transit's rise; the next set may
+        # belong to the previous transit
+        rise = transit - semi_arc
+        rise = np.where(rise < start_unix, rise + SIDEREAL_DAY_SECONDS, rise)
+        set_ = transit - SIDEREAL_DAY_SECONDS + semi_arc
+        set_ = np.where(set_ < start_unix, set_ + SIDEREAL_DAY_SECONDS, set_)
+        rise = cls._polish(ra_j2000, dec_j2000, latitude, longitude, rise, threshold, np.where(crosses, 1.0, 0.0))
+        set_ = cls._polish(ra_j2000, dec_j2000, latitude, longitude, set_, threshold, np.where(crosses, -1.0, 0.0))
+
+        max_altitude = 90.0 - np.abs(latitude - dec)
+        if refraction:
+            max_altitude = max_altitude + refraction_degrees(max_altitude)
+        return cls(
+            names=tuple(str(name) for name in names),
+            start=start_unix,
+            latitude=float(latitude),
+            altitude=float(altitude),
+            rise_times=np.where(crosses, rise, np.nan),
+            transit_times=transit,
+            set_times=np.where(crosses, set_, np.nan),
+            max_altitudes=max_altitude,
+            is_circumpolar=circumpolar,
+            is_never_visible=never,
+        )
+
+    @staticmethod
+    def _polish(
+        ra: FloatArray,
+        dec: FloatArray,
+        latitude: float,
+        longitude: float,
+        times: FloatArray,
+        threshold: float,
+        direction: FloatArray,
+    ) -> FloatArray:
+        """One Newton step on altitude(t) = threshold, using the rate of change along the diurnal arc."""
+        _, altitude = ra_dec_to_alt_az_array(ra, dec, latitude, longitude, times)
+        _, ahead = ra_dec_to_alt_az_array(ra, dec, latitude, longitude, times + _DERIVATIVE_SECONDS)
+        rate = (ahead - altitude) / _DERIVATIVE_SECONDS
+        # Skip objects that barely graze the threshold, where the rate
+        # vanishes and the step would be meaningless
+        usable = (direction * rate) > 1e-6
+        with np.errstate(invalid="ignore", divide="ignore"):
+            step = np.where(usable, (threshold - altitude) / rate, 0.0)
+        return np.asarray(times + np.clip(step, -600.0, 600.0), dtype=np.float64)
+
+    @classmethod
+    def for_objects(
+        cls,
+        objects: Sequence[CelestialObject],
+        latitude: float,
+        longitude: float,
+        start: datetime,
+        altitude: float = 0.0,
+        refraction: bool = False,
+        search_hours: float = 26.0,
+        position_func: PositionFunc | None = None,
+    ) -> RiseSetTransit:
+        """
+        Solve a catalog, fixed objects in closed form and moving ones numerically.
+
+        Objects whose position cannot be calculated are left out (and logged).
+
+        Args:
+            objects: Objects to solve
+            latitude: Observer latitude in degrees
+            longitude: Observer longitude in degrees
+            start: Start of the search (naive means UTC)
+            altitude: Threshold altitude in degrees (0 for the horizon)
+            refraction: ``altitude`` is observed, so allow for refraction
+            search_hours: How far ahead to look for moving objects' events
+                          (the default covers the Moon's 24h50m day)
+            position_func: RA/Dec lookup for solar system objects, called as
+                           ``position_func(name, latitude, longitude, dt)``
+                           (default: batched ephemeris positions)
+
+        Returns:
+            RiseSetTransit with one entry per usable object, in input order
+        """
+        fixed = [obj for obj in objects if not is_dynamic_object(obj.name)]
+        solved = cls.from_coordinates(
+            [obj.name for obj in fixed],
+            [obj.ra_hours for obj in fixed],
+            [obj.dec_degrees for obj in fixed],
+            latitude,
+            longitude,
+            start,
+            altitude,
+            refraction,
+        )
+        rows = {
+            name: (rise, transit, set_, peak, circumpolar, never)
+            for name, rise, transit, set_, peak, circumpolar, never in zip(
+                solved.names,
+                solved.rise_times,
+                solved.transit_times,
+                solved.set_times,
+                solved.max_altitudes,
+                solved.is_circumpolar,
+                solved.is_never_visible,
+                strict=True,
+            )
+        }
+
+        start_unix = _unix(start)
+        end_unix = start_unix + search_hours * 3600.0
+        threshold = _geometric_threshold(altitude, refraction)
+        for obj in objects:
+            if obj.name in rows:
+                continue
+            try:
+                track = position_track(
+                    obj.name,
+                    latitude,
+                    longitude,
+                    start_unix - _DERIVATIVE_SECONDS,
+                    end_unix + _DERIVATIVE_SECONDS,
+                    position_func,
+                )
+            except Exception as e:
+                # Ephemeris lookups can fail for many reasons (missing files,
+                # unknown bodies); one object must not sink the whole batch
+                logger.debug(f"Skipping {obj.name} in rise/set solver: {e}")
+                continue
+
+            def altitude_func(
+                times: FloatArray, track: Callable[..., tuple[FloatArray, FloatArray]] = track
+            ) -> FloatArray:
+                ra, dec = track(times)
+                return ra_dec_to_alt_az_array(ra, dec, latitude, longitude, times)[1]
+
+            rise, transit, set_, peak = find_rise_set_transit(altitude_func, start_unix, end_unix, threshold)
+            if refraction and not np.isnan(peak):
+                peak += float(refraction_degrees(peak))
+            above = float(altitude_func(np.array([start_unix]))[0]) > threshold
+            no_crossing = np.isnan(rise) and np.isnan(set_)
+            rows[obj.name] = (rise, transit, set_, peak, no_crossing and above, no_crossing and not above)
+
+        names = [obj.name for obj in objects if obj.name in rows]
+        columns = list(zip(*(rows[name] for name in names), strict=True)) or [()] * 6
+        return cls(
+            names=tuple(names),
+            start=start_unix,
+            latitude=float(latitude),
+            altitude=float(altitude),
+            rise_times=np.array(columns[0], dtype=np.float64),
+            transit_times=np.array(columns[1], dtype=np.float64),
+            set_times=np.array(columns[2], dtype=np.float64),
+            max_altitudes=np.array(columns[3], dtype=np.float64),
+            is_circumpolar=np.array(columns[4], dtype=bool),
+            is_never_visible=np.array(columns[5], dtype=bool),
+        )
+
+    def index(self, name: str) -> int:
+        """
+        Get the position of an object.
+
+        Raises:
+            KeyError: If the object was not solved
+        """
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(name) from None
+
+    def _timeline(self, j: int) -> ObjectVisibilityTimeline:
+        return ObjectVisibilityTimeline(
+            object_name=self.names[j],
+            rise_time=_to_datetime(self.rise_times[j]),
+            transit_time=_to_datetime(self.transit_times[j]) if self.max_altitudes[j] > self.altitude else None,
+            set_time=_to_datetime(self.set_times[j]),
+            max_altitude=float(self.max_altitudes[j]),
+            is_circumpolar=bool(self.is_circumpolar[j]),
+            is_always_visible=bool(self.is_circumpolar[j]),
+            is_never_visible=bool(self.is_never_visible[j]),
+        )
+
+    def timeline(self, name: str) -> ObjectVisibilityTimeline:
+        """
+        Get the rise/transit/set summary of one object.
+
+        Raises:
+            KeyError: If the object was not solved
+        """
+        return self._timeline(self.index(name))
+
+    def timelines(self) -> list[ObjectVisibilityTimeline]:
+        """
+        Get rise/transit/set summaries for every object.
+
+        Returns:
+            One ObjectVisibilityTimeline per object, in order
+        """
+        return [self._timeline(j) for j in range(len(self.names))]
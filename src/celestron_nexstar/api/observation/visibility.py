@@ -17,7 +17,11 @@ import numpy as np
 from celestron_nexstar.api.catalogs.catalogs import CelestialObject
 from celestron_nexstar.api.core.enums import SkyBrightness
 from celestron_nexstar.api.core.utils import angular_separation, calculate_lst, ra_dec_to_alt_az
-from celestron_nexstar.api.ephemeris.ephemeris import get_planetary_position, is_dynamic_object
+from celestron_nexstar.api.ephemeris.ephemeris import (
+    get_planetary_position,
+    get_planetary_positions,
+    is_dynamic_object,
+)
 from celestron_nexstar.api.location.observer import get_observer_location
 from celestron_nexstar.api.observation.optics import (
     OpticalConfiguration,
@@ -39,6 +43,36 @@ __all__ = [
 ]
 
 
+# Moons mapped to their parent planets
+_MOON_PARENTS = {
+    # Jupiter moons
+    "io": "jupiter",
+    "europa": "jupiter",
+    "ganymede": "jupiter",
+    "callisto": "jupiter",
+    # Saturn moons
+    "titan": "saturn",
+    "rhea": "saturn",
+    "iapetus": "saturn",
+    "dione": "saturn",
+    "tethys": "saturn",
+    "enceladus": "saturn",
+    "mimas": "saturn",
+    "hyperion": "saturn",
+    # Uranus moons
+    "titania": "uranus",
+    "oberon": "uranus",
+    "ariel": "uranus",
+    "umbriel": "uranus",
+    "miranda": "uranus",
+    # Neptune moon
+    "triton": "neptune",
+    # Mars moons
+    "phobos": "mars",
+    "deimos": "mars",
+}
+
+
 @dataclass(frozen=True, slots=True)
 class VisibilityInfo:
     """Information about an object's visibility."""
@@ -126,8 +160,8 @@ def get_object_altitude_azimuth(
         ra_hours = obj.ra_hours
         dec_degrees = obj.dec_degrees
 
-    # Convert to altitude/azimuth
-    alt_deg, az_deg = ra_dec_to_alt_az(ra_hours, dec_degrees, observer_lat, observer_lon, dt)
+    # Convert to altitude/azimuth (ra_dec_to_alt_az returns azimuth first)
+    az_deg, alt_deg = ra_dec_to_alt_az(ra_hours, dec_degrees, observer_lat, observer_lon, dt)
 
     return alt_deg, az_deg
 
@@ -153,40 +187,11 @@ def calculate_parent_separation(
     Returns:
         Angular separation in arcminutes, or None if not a moon
     """
-    # Map moons to their parent planets
-    moon_parents = {
-        # Jupiter moons
-        "io": "jupiter",
-        "europa": "jupiter",
-        "ganymede": "jupiter",
-        "callisto": "jupiter",
-        # Saturn moons
-        "titan": "saturn",
-        "rhea": "saturn",
-        "iapetus": "saturn",
-        "dione": "saturn",
-        "tethys": "saturn",
-        "enceladus": "saturn",
-        "mimas": "saturn",
-        "hyperion": "saturn",
-        # Uranus moons
-        "titania": "uranus",
-        "oberon": "uranus",
-        "ariel": "uranus",
-        "umbriel": "uranus",
-        "miranda": "uranus",
-        # Neptune moon
-        "triton": "neptune",
-        # Mars moons
-        "phobos": "mars",
-        "deimos": "mars",
-    }
-
     moon_key = moon_name.lower()
-    if moon_key not in moon_parents:
+    if moon_key not in _MOON_PARENTS:
         return None
 
-    parent_name = moon_parents[moon_key]
+    parent_name = _MOON_PARENTS[moon_key]
 
     # Get positions of both objects
     try:
@@ -254,6 +259,22 @@ def assess_visibility(
             observability_score=0.0,
         )
 
+    separation_arcmin = None
+    if obj.object_type == "moon" and obj.name.lower() != "moon":  # Not Earth's Moon
+        separation_arcmin = calculate_parent_separation(obj.name, observer_lat, observer_lon, dt)
+
+    return _assess_at_position(obj, altitude_deg, azimuth_deg, limiting_mag, min_altitude_deg, separation_arcmin)
+
+
+def _assess_at_position(
+    obj: CelestialObject,
+    altitude_deg: float,
+    azimuth_deg: float,
+    limiting_mag: float,
+    min_altitude_deg: float,
+    separation_arcmin: float | None,
+) -> VisibilityInfo:
+    """Score an object whose position (and, for moons, parent separation) is already known."""
     reasons = []
     is_visible = True
     observability_score = 1.0  # Start at perfect
@@ -286,20 +307,17 @@ def assess_visibility(
                 reasons.append(f"Magnitude {apparent_mag:.2f} well within limit")
 
     # Check 3: For moons, check separation from parent planet
-    if obj.object_type == "moon" and obj.name.lower() != "moon":  # Not Earth's Moon
-        separation_arcmin = calculate_parent_separation(obj.name, observer_lat, observer_lon, dt)
-
-        if separation_arcmin is not None:
-            # Moons very close to parent are hard to see due to glare
-            if separation_arcmin < 1.0:
-                is_visible = False
-                reasons.append(f"Too close to parent planet ({separation_arcmin:.1f}' separation)")
-                observability_score = 0.0
-            elif separation_arcmin < 5.0:
-                observability_score *= separation_arcmin / 5.0
-                reasons.append(f"Close to parent planet ({separation_arcmin:.1f}' separation, glare may affect)")
-            else:
-                reasons.append(f"Good separation from parent ({separation_arcmin:.1f}')")
+    if separation_arcmin is not None:
+        # Moons very close to parent are hard to see due to glare
+        if separation_arcmin < 1.0:
+            is_visible = False
+            reasons.append(f"Too close to parent planet ({separation_arcmin:.1f}' separation)")
+            observability_score = 0.0
+        elif separation_arcmin < 5.0:
+            observability_score *= separation_arcmin / 5.0
+            reasons.append(f"Close to parent planet ({separation_arcmin:.1f}' separation, glare may affect)")
+        else:
+            reasons.append(f"Good separation from parent ({separation_arcmin:.1f}')")
 
     # Check 4: Atmospheric conditions at low altitude
     if altitude_deg < 30 and is_visible:
@@ -444,6 +462,8 @@ def _filter_visible_objects_vectorized(
         else:
             fixed_objects.append((i, obj))
 
+    visible: list[tuple[CelestialObject, VisibilityInfo]] = []
+
     # Process fixed objects in batch (vectorized)
     if fixed_objects:
         _, fixed_objs = zip(*fixed_objects, strict=False)
@@ -496,7 +516,6 @@ def _filter_visible_objects_vectorized(
         scores[~is_visible_mask] = 0.0
 
         # Process results
-        visible = []
         for idx, (_, obj) in enumerate(fixed_objects):
             if is_visible_mask[idx] and scores[idx] >= min_observability_score:
                 alt = float(altitudes[idx])
@@ -535,19 +554,51 @@ def _filter_visible_objects_vectorized(
                 )
                 visible.append((obj, visibility))
 
-    # Process dynamic objects individually (can't vectorize easily)
-    for obj in dynamic_objects:
-        visibility = assess_visibility(
-            obj,
-            config=config,
-            sky_brightness=sky_brightness,
-            min_altitude_deg=min_altitude_deg,
-            observer_lat=observer_lat,
-            observer_lon=observer_lon,
-            dt=dt,
-        )
-        if visibility.is_visible and visibility.observability_score >= min_observability_score:
-            visible.append((obj, visibility))
+    # Process dynamic objects from one batched ephemeris lookup per body
+    if dynamic_objects:
+        names = {obj.name.lower() for obj in dynamic_objects}
+        names |= {_MOON_PARENTS[name] for name in names if name in _MOON_PARENTS}
+        positions = {}
+        for name in sorted(names):
+            try:
+                positions.update(get_planetary_positions([name], dt, observer_lat, observer_lon))
+            except Exception as e:
+                # Missing ephemeris files or unknown bodies: those objects
+                # fall back to assess_visibility, which reports the reason
+                logger.debug(f"No batched position for {name}: {e}")
+
+        for obj in dynamic_objects:
+            key = obj.name.lower()
+            if key not in positions:
+                visibility = assess_visibility(
+                    obj,
+                    config=config,
+                    sky_brightness=sky_brightness,
+                    min_altitude_deg=min_altitude_deg,
+                    observer_lat=observer_lat,
+                    observer_lon=observer_lon,
+                    dt=dt,
+                )
+            else:
+                separation_arcmin = None
+                parent = _MOON_PARENTS.get(key)
+                if obj.object_type == "moon" and parent in positions:
+                    separation_arcmin = 60.0 * angular_separation(
+                        float(positions[key].ra_hours[0]),
+                        float(positions[key].dec_degrees[0]),
+                        float(positions[parent].ra_hours[0]),
+                        float(positions[parent].dec_degrees[0]),
+                    )
+                visibility = _assess_at_position(
+                    obj,
+                    float(positions[key].altitude_degrees[0]),
+                    float(positions[key].azimuth_degrees[0]),
+                    limiting_mag,
+                    min_altitude_deg,
+                    separation_arcmin,
+                )
+            if visibility.is_visible and visibility.observability_score >= min_observability_score:
+                visible.append((obj, visibility))
 
     # Sort by observability score (best first)
     visible.sort(key=lambda x: x[1].observability_score, reverse=True)
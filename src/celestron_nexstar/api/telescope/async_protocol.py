@@ -0,0 +1,495 @@
+"""
+Asyncio NexStar Communication Protocol Implementation
+
+This module implements the NexStar protocol on asyncio streams so that
+telescope I/O can share an event loop with the TUI and data layers, and a
+single process can drive several mounts concurrently without threads.
+
+Transports:
+- TCP/IP: asyncio streams (SkyPortal WiFi Adapter, default port 4030)
+- Serial: non-blocking pyserial port fed into an asyncio StreamReader
+  (event-loop reader callback where supported, worker thread otherwise)
+
+Command formats and coordinate encoding are identical to NexStarProtocol.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+
+import deal
+import serial
+from returns.result import Result
+
+from celestron_nexstar.api.core.exceptions import NotConnectedError, TelescopeConnectionError, TelescopeTimeoutError
+from celestron_nexstar.api.telescope.protocol import NexStarProtocol
+
+
+__all__ = ["AsyncNexStarProtocol"]
+
+
+logger = logging.getLogger(__name__)
+
+
+class _SerialStream:
+    """Non-blocking serial port exposed as an asyncio StreamReader."""
+
+    POLL_TIMEOUT = 0.1
+
+    def __init__(self, conn: serial.Serial, loop: asyncio.AbstractEventLoop) -> None:
+        self.conn = conn
+        self.loop = loop
+        self.reader = asyncio.StreamReader()
+        self._pump_task: asyncio.Task[None] | None = None
+        self._fd: int | None = None
+
+        try:
+            fd = conn.fileno()
+            loop.add_reader(fd, self._on_readable)
+            self._fd = fd
+        except (AttributeError, NotImplementedError, OSError, ValueError):
+            # No selectable file descriptor (e.g. Windows): read in a worker thread instead
+            conn.timeout = self.POLL_TIMEOUT
+            self._pump_task = loop.create_task(self._pump())
+
+    def _on_readable(self) -> None:
+        """Move everything waiting on the port into the stream reader."""
+        try:
+            data = self.conn.read(max(1, self.conn.in_waiting))
+        except serial.SerialException as e:
+            self.reader.set_exception(TelescopeConnectionError(f"Failed to receive response: {e}"))
+            self._remove_reader()
+            return
+        if data:
+            self.reader.feed_data(data)
+
+    async def _pump(self) -> None:
+        """Blocking reads in a worker thread, for platforms without a selectable port."""
+        while self.conn.is_open:
+            try:
+                data = await asyncio.to_thread(self.conn.read, max(1, self.conn.in_waiting))
+            except serial.SerialException as e:
+                self.reader.set_exception(TelescopeConnectionError(f"Failed to receive response: {e}"))
+                return
+            if data:
+                self.reader.feed_data(data)
+
+    def write(self, payload: bytes) -> None:
+        """Write a command payload to the port."""
+        try:
+            self.conn.write(payload)
+        except serial.SerialException as e:
+            raise TelescopeConnectionError(f"Failed to send command: {e}") from e
+
+    def _remove_reader(self) -> None:
+        if self._fd is not None:
+            with contextlib.suppress(Exception):
+                self.loop.remove_reader(self._fd)
+            self._fd = None
+
+    def close(self) -> None:
+        """Stop reading and close the port."""
+        self._remove_reader()
+        if self._pump_task is not None:
+            self._pump_task.cancel()
+            self._pump_task = None
+        if self.conn.is_open:
+            self.conn.close()
+
+
+class AsyncNexStarProtocol:
+    """
+    Asyncio implementation of the NexStar communication protocol.
+
+    Mirrors NexStarProtocol with coroutine methods. Exchanges on one
+    connection are serialised with an asyncio lock, so several tasks may
+    share a protocol instance safely.
+    """
+
+    TERMINATOR = NexStarProtocol.TERMINATOR
+    DEFAULT_BAUDRATE = NexStarProtocol.DEFAULT_BAUDRATE
+    DEFAULT_TIMEOUT = NexStarProtocol.DEFAULT_TIMEOUT
+    DEFAULT_TCP_PORT = NexStarProtocol.DEFAULT_TCP_PORT
+    DEFAULT_TCP_HOST = NexStarProtocol.DEFAULT_TCP_HOST
+    LATENCY_HISTORY = NexStarProtocol.LATENCY_HISTORY
+    # Delay after opening before the first command (seconds)
+    SERIAL_SETTLE_TIME = 0.5
+    TCP_SETTLE_TIME = 0.2
+
+    # Coordinate helpers are shared with the synchronous protocol
+    degrees_to_hex = staticmethod(NexStarProtocol.degrees_to_hex)
+    hex_to_degrees = staticmethod(NexStarProtocol.hex_to_degrees)
+    encode_coordinate_pair = staticmethod(NexStarProtocol.encode_coordinate_pair)
+    decode_coordinate_pair = staticmethod(NexStarProtocol.decode_coordinate_pair)
+    encode_variable_rate = staticmethod(NexStarProtocol.encode_variable_rate)
+
+    def __init__(
+        self,
+        port: str | None = None,
+        baudrate: int = DEFAULT_BAUDRATE,
+        timeout: float = DEFAULT_TIMEOUT,
+        connection_type: str = "serial",
+        host: str = DEFAULT_TCP_HOST,
+        tcp_port: int = DEFAULT_TCP_PORT,
+    ):
+        """
+        Initialize protocol handler.
+
+        Args:
+            port: Serial port path (required for serial connections)
+            baudrate: Communication speed (default 9600, only used for serial)
+            timeout: Connection timeout in seconds
+            connection_type: 'serial' or 'tcp' (default: 'serial')
+            host: TCP/IP host address (default: '192.168.4.1' for SkyPortal WiFi Adapter)
+            tcp_port: TCP/IP port number (default: 4030 for SkyPortal WiFi Adapter)
+        """
+        self.connection_type = connection_type
+        self.port = port or "/dev/ttyUSB0"
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.host = host
+        self.tcp_port = tcp_port
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._serial: _SerialStream | None = None
+        self._lock = asyncio.Lock()
+        # Round-trip latency of recent commands (seconds)
+        self.last_round_trip: float | None = None
+        self.round_trip_times: deque[float] = deque(maxlen=self.LATENCY_HISTORY)
+
+    async def open(self) -> bool:
+        """
+        Open connection to telescope (serial or TCP/IP).
+
+        Returns:
+            True if connection successful
+
+        Raises:
+            TelescopeConnectionError: If connection cannot be opened
+        """
+        if self.connection_type == "tcp":
+            return await self._open_tcp()
+        else:
+            return await self._open_serial()
+
+    async def _open_serial(self) -> bool:
+        """Open a non-blocking serial connection to telescope."""
+        try:
+            logger.debug(f"Opening serial connection to {self.port} at {self.baudrate} baud")
+            conn = await asyncio.to_thread(
+                serial.Serial,
+                port=self.port,
+                baudrate=self.baudrate,
+                timeout=0,
+                bytesize=serial.EIGHTBITS,
+                parity=serial.PARITY_NONE,
+                stopbits=serial.STOPBITS_ONE,
+            )
+        except serial.SerialException as e:
+            logger.error(f"Failed to open serial port {self.port}: {e}")
+            raise TelescopeConnectionError(f"Failed to open port {self.port}: {e}") from e
+
+        await asyncio.sleep(self.SERIAL_SETTLE_TIME)  # Allow connection to stabilize
+        conn.reset_input_buffer()
+        self._serial = _SerialStream(conn, asyncio.get_running_loop())
+        self._reader = self._serial.reader
+        logger.info(f"Serial connection opened successfully on {self.port}")
+        return True
+
+    async def _open_tcp(self) -> bool:
+        """Open TCP/IP connection to telescope (e.g., via SkyPortal WiFi Adapter)."""
+        try:
+            logger.debug(f"Opening TCP/IP connection to {self.host}:{self.tcp_port}")
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.tcp_port), self.timeout
+            )
+        except (OSError, TimeoutError) as e:
+            logger.error(f"Failed to open TCP/IP connection to {self.host}:{self.tcp_port}: {e}")
+            raise TelescopeConnectionError(f"Failed to connect to {self.host}:{self.tcp_port}: {e}") from e
+
+        await asyncio.sleep(self.TCP_SETTLE_TIME)  # Allow connection to stabilize
+        logger.info(f"TCP/IP connection opened successfully to {self.host}:{self.tcp_port}")
+        return True
+
+    async def close(self) -> None:
+        """Close connection (serial or TCP/IP)."""
+        if self._writer is not None:
+            try:
+                self._writer.close()
+                await self._writer.wait_closed()
+                logger.info(f"TCP/IP connection closed to {self.host}:{self.tcp_port}")
+            except Exception as e:
+                logger.warning(f"Error closing TCP/IP socket: {e}")
+            self._writer = None
+        if self._serial is not None:
+            self._serial.close()
+            self._serial = None
+            logger.info(f"Serial connection closed on {self.port}")
+        self._reader = None
+
+    def is_open(self) -> bool:
+        """Check if connection is open."""
+        if self.connection_type == "tcp":
+            return self._writer is not None and not self._writer.is_closing()
+        else:
+            return self._serial is not None and self._serial.conn.is_open
+
+    async def send_command(self, command: str) -> str:
+        """
+        Send a command and receive response.
+
+        Args:
+            command: Command string to send (without terminator)
+
+        Returns:
+            Response string (without terminator)
+
+        Raises:
+            NotConnectedError: If not connected and reconnection fails
+            TelescopeConnectionError: If the transport fails
+            TelescopeTimeoutError: If no response within timeout
+        """
+        return (await self.transaction([command]))[0]
+
+    async def transaction(self, commands: list[str]) -> list[str]:
+        """
+        Send several commands in one write and receive their responses in order.
+
+        Args:
+            commands: Command strings to send (without terminators)
+
+        Returns:
+            Response strings (without terminators), one per command
+
+        Raises:
+            NotConnectedError: If not connected and reconnection fails
+            TelescopeConnectionError: If the transport fails
+            TelescopeTimeoutError: If not all responses arrive within timeout
+        """
+        if not commands:
+            return []
+
+        async with self._lock:
+            await self._ensure_open()
+            assert self._reader is not None, "Connection should be open at this point"
+
+            # Binary arguments (rates, time fields) use the full byte range
+            payload = "".join(command + self.TERMINATOR for command in commands).encode("latin-1")
+            logger.debug(f"Sending command(s): {', '.join(repr(command) for command in commands)}")
+            started = time.perf_counter()
+            await self._write(payload)
+
+            responses: list[str] = []
+            try:
+                # One deadline for the whole transaction, however many commands it holds
+                async with asyncio.timeout(self.timeout):
+                    while len(responses) < len(commands):
+                        raw = await self._reader.readuntil(self.TERMINATOR.encode("ascii"))
+                        response_str = raw[:-1].decode("latin-1")
+                        logger.debug(f"Received response: {response_str!r}")
+                        responses.append(response_str)
+            except TimeoutError:
+                command = commands[len(responses)]
+                logger.error(f"Timeout waiting for response to command: {command!r}")
+                # A late reply would be read as the next command's response, so start over on a clean stream
+                await self.close()
+                raise TelescopeTimeoutError(f"Timeout waiting for response to: {command}") from None
+            except asyncio.IncompleteReadError:
+                await self.close()
+                raise TelescopeConnectionError("Connection closed by remote host") from None
+
+            self._record_round_trip(time.perf_counter() - started)
+            return responses
+
+    async def _ensure_open(self) -> None:
+        """Reopen the connection if it is not open."""
+        if not self.is_open():
+            logger.info("Connection not open, attempting to reconnect...")
+            try:
+                await self.open()
+            except TelescopeConnectionError as e:
+                logger.error(f"Reconnection failed: {e}")
+                raise NotConnectedError("Connection not open and reconnection failed") from e
+            logger.info("Reconnected successfully")
+
+    async def _write(self, payload: bytes) -> None:
+        """Write a payload to the open transport."""
+        if self._writer is not None:
+            try:
+                self._writer.write(payload)
+                await self._writer.drain()
+            except OSError as e:
+                logger.error(f"Error sending command over TCP/IP: {e}")
+                raise TelescopeConnectionError(f"Failed to send command: {e}") from e
+        else:
+            assert self._serial is not None, "Serial connection should be open at this point"
+            self._serial.write(payload)
+
+    def _record_round_trip(self, seconds: float) -> None:
+        """Record the round-trip latency of a completed command or transaction."""
+        self.last_round_trip = seconds
+        self.round_trip_times.append(seconds)
+
+    def get_latency_stats(self) -> dict[str, float]:
+        """
+        Get round-trip latency statistics for recent commands.
+
+        Returns:
+            Dictionary with count, last, mean, min and max (seconds);
+            empty if no command has completed yet
+        """
+        samples = list(self.round_trip_times)
+        if not samples:
+            return {}
+        return {
+            "count": float(len(samples)),
+            "last": samples[-1],
+            "mean": sum(samples) / len(samples),
+            "min": min(samples),
+            "max": max(samples),
+        }
+
+    # ========== Common Command Patterns ==========
+
+    async def get_single_byte(self, command: str) -> int | None:
+        """Send command and receive single-byte response."""
+        response = await self.send_command(command)
+        if len(response) == 1:
+            return ord(response[0])
+        return None
+
+    async def get_two_bytes(self, command: str) -> tuple[int, int] | None:
+        """Send command and receive two-byte response."""
+        response = await self.send_command(command)
+        if len(response) == 2:
+            return ord(response[0]), ord(response[1])
+        return None
+
+    async def send_empty_command(self, command: str) -> bool:
+        """Send command expecting empty response (success indicator)."""
+        response = await self.send_command(command)
+        return response == ""
+
+    # ========== Specific Protocol Commands ==========
+
+    @deal.pre(lambda self, char="x": len(char) == 1)  # type: ignore[misc,arg-type]
+    async def echo(self, char: str = "x") -> bool:
+        """Test connection with echo command (K<char>#)."""
+        try:
+            response = await self.send_command(f"K{char}")
+            return response == char
+        except (NotConnectedError, TelescopeTimeoutError, TelescopeConnectionError):
+            return False
+
+    async def get_version(self) -> tuple[int, int]:
+        """Get firmware version (V#)."""
+        result = await self.get_two_bytes("V")
+        return result if result else (0, 0)
+
+    async def get_model(self) -> int:
+        """Get telescope model number (m#)."""
+        result = await self.get_single_byte("m")
+        return result if result is not None else 0
+
+    async def get_ra_dec_precise(self) -> Result[tuple[float, float], str]:
+        """Get precise RA/Dec position in degrees (E#)."""
+        return self.decode_coordinate_pair(await self.send_command("E"))
+
+    async def get_alt_az_precise(self) -> Result[tuple[float, float], str]:
+        """Get precise Az/Alt position in degrees (Z#)."""
+        return self.decode_coordinate_pair(await self.send_command("Z"))
+
+    @deal.pre(lambda self, ra_degrees, dec_degrees: 0.0 <= ra_degrees <= 360.0 and 0.0 <= dec_degrees <= 360.0)  # type: ignore[misc,arg-type]
+    async def goto_ra_dec_precise(self, ra_degrees: float, dec_degrees: float) -> bool:
+        """Slew to RA/Dec coordinates in degrees (R<RA>,<DEC>#)."""
+        return await self.send_empty_command(f"R{self.encode_coordinate_pair(ra_degrees, dec_degrees)}")
+
+    @deal.pre(lambda self, az_degrees, alt_degrees: 0.0 <= az_degrees <= 360.0 and 0.0 <= alt_degrees <= 360.0)  # type: ignore[misc,arg-type]
+    async def goto_alt_az_precise(self, az_degrees: float, alt_degrees: float) -> bool:
+        """Slew to Alt/Az coordinates in degrees (B<AZ>,<ALT>#)."""
+        return await self.send_empty_command(f"B{self.encode_coordinate_pair(az_degrees, alt_degrees)}")
+
+    @deal.pre(lambda self, ra_degrees, dec_degrees: 0.0 <= ra_degrees <= 360.0 and 0.0 <= dec_degrees <= 360.0)  # type: ignore[misc,arg-type]
+    async def sync_ra_dec_precise(self, ra_degrees: float, dec_degrees: float) -> bool:
+        """Sync to RA/Dec coordinates in degrees (S<RA>,<DEC>#)."""
+        return await self.send_empty_command(f"S{self.encode_coordinate_pair(ra_degrees, dec_degrees)}")
+
+    async def is_goto_in_progress(self) -> bool:
+        """Check if goto is in progress (L#)."""
+        return await self.send_command("L") == "1"
+
+    async def cancel_goto(self) -> bool:
+        """Cancel current goto (M#)."""
+        return await self.send_empty_command("M")
+
+    @deal.pre(lambda self, axis, direction, rate: axis in [1, 2] and direction in [17, 18] and 0 <= rate <= 9)  # type: ignore[misc,arg-type]
+    async def variable_rate_motion(self, axis: int, direction: int, rate: int) -> bool:
+        """Initiate variable rate motion (P<axis><direction><rate><0><0><0>#)."""
+        command = f"P{chr(axis)}{chr(direction)}{chr(rate)}{chr(0)}{chr(0)}{chr(0)}"
+        return await self.send_empty_command(command)
+
+    @deal.pre(
+        lambda self, axis, arcsec_per_sec: axis in [1, 2] and abs(arcsec_per_sec) <= NexStarProtocol.MAX_VARIABLE_RATE
+    )  # type: ignore[misc,arg-type]
+    async def variable_rate_slew(self, axis: int, arcsec_per_sec: float) -> bool:
+        """Slew one axis at a precise signed rate in arcsec/sec (P<3><dest><dir><hi><lo><0><0>#)."""
+        return await self.send_empty_command(self.encode_variable_rate(axis, arcsec_per_sec))
+
+    async def get_tracking_mode(self) -> int:
+        """Get tracking mode (t#)."""
+        result = await self.get_single_byte("t")
+        return result if result is not None else 0
+
+    @deal.pre(lambda self, mode: 0 <= mode <= 3)  # type: ignore[misc,arg-type]
+    async def set_tracking_mode(self, mode: int) -> bool:
+        """Set tracking mode (T<mode>#)."""
+        return await self.send_empty_command(f"T{chr(mode)}")
+
+    async def get_location(self) -> tuple[float, float] | None:
+        """Get observer location in unsigned degrees (w#)."""
+        response = await self.send_command("w")
+        if len(response) == 16:
+            try:
+                return self.hex_to_degrees(response[:8]), self.hex_to_degrees(response[8:16])
+            except ValueError:
+                return None
+        return None
+
+    @deal.pre(
+        lambda self, latitude_degrees, longitude_degrees: (
+            0.0 <= latitude_degrees <= 360.0 and 0.0 <= longitude_degrees <= 360.0
+        )
+    )  # type: ignore[misc,arg-type]
+    async def set_location(self, latitude_degrees: float, longitude_degrees: float) -> bool:
+        """Set observer location in unsigned degrees (W<lat>,<lon>#)."""
+        return await self.send_empty_command(f"W{self.encode_coordinate_pair(latitude_degrees, longitude_degrees)}")
+
+    async def get_time(self) -> tuple[int, int, int, int, int, int, int, int] | None:
+        """Get date and time (h#)."""
+        response = await self.send_command("h")
+        if len(response) == 8:
+            values = tuple(ord(c) for c in response)
+            return (values[0], values[1], values[2], values[3], values[4], values[5], values[6], values[7])
+        return None
+
+    @deal.pre(
+        lambda self, hour, minute, second, month, day, year_offset, timezone, dst: (
+            0 <= hour <= 23
+            and 0 <= minute <= 59
+            and 0 <= second <= 59
+            and 1 <= month <= 12
+            and 1 <= day <= 31
+            and year_offset >= 0
+            and dst in [0, 1]
+        )
+    )  # type: ignore[misc,arg-type]
+    async def set_time(
+        self, hour: int, minute: int, second: int, month: int, day: int, year_offset: int, timezone: int, dst: int
+    ) -> bool:
+        """Set date and time (H<H><M><S><month><day><year><tz><dst>#)."""
+        command = f"H{chr(hour)}{chr(minute)}{chr(second)}{chr(month)}{chr(day)}{chr(year_offset)}{chr(timezone % 256)}{chr(dst)}"
+        return await self.send_empty_command(command)
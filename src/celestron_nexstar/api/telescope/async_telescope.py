@@ -0,0 +1,571 @@
+"""
+Asyncio Celestron NexStar Telescope API
+
+Provides an asyncio-native counterpart to NexStarTelescope for applications
+that run their telescope I/O on an event loop (TUI, web services, fleets of
+mounts driven from one process).
+
+This module provides the AsyncNexStarTelescope class, which wraps the
+AsyncNexStarProtocol with the same high-level methods as NexStarTelescope.
+Features include:
+- Coroutine versions of every NexStarTelescope method
+- TCP/IP via asyncio streams (SkyPortal WiFi Adapter, default port 4030)
+- Non-blocking serial I/O, no time.sleep in timed moves
+- Async context manager support
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Literal
+
+import deal
+
+from celestron_nexstar.api.catalogs.converters import CoordinateConverter
+from celestron_nexstar.api.core.enums import Direction
+from celestron_nexstar.api.core.exceptions import InvalidCoordinateError, NotConnectedError, TelescopeConnectionError
+from celestron_nexstar.api.core.types import (
+    EquatorialCoordinates,
+    GeographicLocation,
+    HorizontalCoordinates,
+    TelescopeConfig,
+    TelescopeInfo,
+    TelescopeState,
+    TelescopeTime,
+    TrackingMode,
+)
+from celestron_nexstar.api.telescope.async_protocol import AsyncNexStarProtocol
+
+
+__all__ = ["AsyncNexStarTelescope"]
+
+
+logger = logging.getLogger(__name__)
+
+# Single-axis directions mapped to (axis, direction code)
+_AXIS_MOTION = {
+    Direction.UP: (2, 17),  # Altitude axis, positive
+    Direction.DOWN: (2, 18),  # Altitude axis, negative
+    Direction.LEFT: (1, 17),  # Azimuth axis, positive
+    Direction.RIGHT: (1, 18),  # Azimuth axis, negative
+}
+
+# Diagonal directions mapped to their (altitude, azimuth) components
+_DIAGONALS = {
+    Direction.UP_LEFT: (Direction.UP, Direction.LEFT),
+    Direction.UP_RIGHT: (Direction.UP, Direction.RIGHT),
+    Direction.DOWN_LEFT: (Direction.DOWN, Direction.LEFT),
+    Direction.DOWN_RIGHT: (Direction.DOWN, Direction.RIGHT),
+}
+
+# Duration of a single hand-controller style step (seconds)
+STEP_DURATION = 0.2
+
+
+def _parse_direction(direction: Direction | str) -> Direction:
+    """Convert a direction string to the Direction enum."""
+    # Direction is a str enum, so members and plain strings convert alike
+    try:
+        return Direction(direction.lower())
+    except ValueError:
+        raise ValueError(f"Invalid direction: {direction}") from None
+
+
+def _equatorial(response: str) -> EquatorialCoordinates:
+    """Decode an E# response into signed equatorial coordinates."""
+    return (
+        AsyncNexStarProtocol.decode_coordinate_pair(response)
+        .map(
+            lambda coords: EquatorialCoordinates(
+                ra_hours=CoordinateConverter.ra_degrees_to_hours(coords[0]),
+                dec_degrees=CoordinateConverter.dec_to_signed(coords[1]),
+            )
+        )
+        .value_or(EquatorialCoordinates(ra_hours=0.0, dec_degrees=0.0))
+    )
+
+
+def _horizontal(response: str) -> HorizontalCoordinates:
+    """Decode a Z# response into signed horizontal coordinates."""
+    return (
+        AsyncNexStarProtocol.decode_coordinate_pair(response)
+        .map(
+            lambda coords: HorizontalCoordinates(
+                azimuth=coords[0], altitude=CoordinateConverter.altitude_to_signed(coords[1])
+            )
+        )
+        .value_or(HorizontalCoordinates(azimuth=0.0, altitude=0.0))
+    )
+
+
+class AsyncNexStarTelescope:
+    """
+    Asyncio interface for controlling Celestron NexStar 6SE/8SE telescope.
+
+    Mirrors NexStarTelescope method for method; every I/O method is a
+    coroutine. Commands issued concurrently on one instance are serialised
+    by the protocol, while separate instances run fully concurrently on the
+    same event loop.
+
+    Example:
+        >>> import asyncio
+        >>> from celestron_nexstar import AsyncNexStarTelescope, TelescopeConfig
+        >>> async def main():
+        ...     config = TelescopeConfig(connection_type='tcp', host='192.168.4.1')
+        ...     async with AsyncNexStarTelescope(config) as telescope:
+        ...         print(await telescope.get_position_ra_dec())
+        >>> asyncio.run(main())
+    """
+
+    def __init__(self, config: TelescopeConfig | str | None = None) -> None:
+        """
+        Initialize telescope interface.
+
+        Unlike NexStarTelescope, ``config.auto_connect`` is ignored because a
+        constructor cannot await; call ``connect()`` or use ``async with``.
+
+        Args:
+            config: TelescopeConfig object or port string.
+                   If string, uses default configuration with specified port.
+                   If None, uses default '/dev/ttyUSB0'
+        """
+        if config is None:
+            self.config = TelescopeConfig()
+        elif isinstance(config, str):
+            self.config = TelescopeConfig(port=config)
+        else:
+            self.config = config
+
+        if self.config.verbose:
+            logging.basicConfig(level=logging.DEBUG)
+
+        self.protocol = AsyncNexStarProtocol(
+            port=self.config.port,
+            baudrate=self.config.baudrate,
+            timeout=self.config.timeout,
+            connection_type=self.config.connection_type,
+            host=self.config.host,
+            tcp_port=self.config.tcp_port,
+        )
+
+    async def _ensure_connected(self) -> None:
+        """
+        Ensure telescope is connected, attempting to reconnect if not open.
+
+        Raises:
+            TelescopeConnectionError: If reconnection fails
+        """
+        if not self.protocol.is_open():
+            logger.info("Connection not open, attempting to reconnect...")
+            await self.connect()
+
+    @deal.raises(TelescopeConnectionError)
+    async def connect(self) -> bool:
+        """
+        Establish connection to telescope.
+
+        Returns:
+            True if connection successful
+
+        Raises:
+            TelescopeConnectionError: If connection fails
+        """
+        try:
+            await self.protocol.open()
+            if await self.protocol.echo():
+                logger.info(f"Successfully connected to telescope on {self.config.port}")
+                return True
+            logger.error("Echo test failed - telescope not responding properly")
+            await self.protocol.close()
+            raise TelescopeConnectionError("Echo test failed") from None
+        except Exception as e:
+            logger.error(f"Connection failed: {e}")
+            raise
+
+    @deal.post(lambda result: result is None, message="Disconnect must complete")
+    async def disconnect(self) -> None:
+        """Close telescope connection."""
+        await self.protocol.close()
+        logger.info("Disconnected from telescope")
+
+    @deal.pre(lambda self, char="x": len(char) == 1, message="Char must be single character")  # type: ignore[misc,arg-type]
+    async def echo_test(self, char: str = "x") -> bool:
+        """
+        Test connection with echo command.
+
+        Args:
+            char: Single character to echo (default 'x')
+
+        Returns:
+            True if echo successful
+        """
+        return await self.protocol.echo(char)
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_info(self) -> TelescopeInfo:
+        """
+        Get telescope hardware information.
+
+        Returns:
+            TelescopeInfo object with model and firmware version
+        """
+        version, model = await self.protocol.transaction(["V", "m"])
+        major, minor = (ord(version[0]), ord(version[1])) if len(version) == 2 else (0, 0)
+        return TelescopeInfo(model=ord(model) if len(model) == 1 else 0, firmware_major=major, firmware_minor=minor)
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_version(self) -> tuple[int, int]:
+        """
+        Get telescope firmware version.
+
+        Returns:
+            Tuple of (major_version, minor_version)
+        """
+        return await self.protocol.get_version()
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_model(self) -> int:
+        """
+        Get telescope model number.
+
+        Returns:
+            Model number (6 for NexStar 6SE)
+        """
+        return await self.protocol.get_model()
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_position_ra_dec(self) -> EquatorialCoordinates:
+        """
+        Get current Right Ascension and Declination.
+
+        Returns:
+            EquatorialCoordinates object with RA in hours and Dec in degrees
+        """
+        return _equatorial(await self.protocol.send_command("E"))
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_position_alt_az(self) -> HorizontalCoordinates:
+        """
+        Get current Altitude and Azimuth.
+
+        Returns:
+            HorizontalCoordinates object with azimuth and altitude in degrees
+        """
+        return _horizontal(await self.protocol.send_command("Z"))
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_state(self) -> TelescopeState:
+        """
+        Get position, slew status and tracking mode in one pipelined exchange.
+
+        Returns:
+            TelescopeState snapshot
+        """
+        ra_dec, alt_az, goto, mode = await self.protocol.transaction(["E", "Z", "L", "t"])
+        return TelescopeState(
+            equatorial=_equatorial(ra_dec),
+            horizontal=_horizontal(alt_az),
+            is_slewing=goto == "1",
+            tracking_mode=TrackingMode(ord(mode) if len(mode) == 1 else 0),
+        )
+
+    @deal.pre(lambda self, ra_hours, dec_degrees: 0 <= ra_hours < 24, message="RA must be 0-24 hours")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, ra_hours, dec_degrees: -90 <= dec_degrees <= 90, message="Dec must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    @deal.raises(NotConnectedError, InvalidCoordinateError, TelescopeConnectionError)
+    async def goto_ra_dec(self, ra_hours: float, dec_degrees: float) -> bool:
+        """
+        Slew telescope to specific RA/Dec coordinates.
+
+        Args:
+            ra_hours: Right Ascension in hours (0-24)
+            dec_degrees: Declination in degrees (-90 to +90)
+
+        Returns:
+            True if command successful
+        """
+        await self._ensure_connected()
+        ra_deg = CoordinateConverter.ra_hours_to_degrees(ra_hours)
+        dec_deg = CoordinateConverter.dec_to_unsigned(dec_degrees)
+
+        logger.info(f"Slewing to RA {ra_hours:.4f}h, Dec {dec_degrees:.4f}°")
+        return await self.protocol.goto_ra_dec_precise(ra_deg, dec_deg)
+
+    @deal.pre(lambda self, azimuth, altitude: 0 <= azimuth < 360, message="Azimuth must be 0-360 degrees")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, azimuth, altitude: -90 <= altitude <= 90, message="Altitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    @deal.raises(NotConnectedError, InvalidCoordinateError, TelescopeConnectionError)
+    async def goto_alt_az(self, azimuth: float, altitude: float) -> bool:
+        """
+        Slew telescope to specific Alt/Az coordinates.
+
+        Args:
+            azimuth: Azimuth in degrees (0-360, where 0=North, 90=East)
+            altitude: Altitude in degrees (-90 to +90, where 0=horizon, 90=zenith)
+
+        Returns:
+            True if command successful
+        """
+        await self._ensure_connected()
+        alt_deg = CoordinateConverter.altitude_to_unsigned(altitude)
+
+        logger.info(f"Slewing to Az {azimuth:.2f}°, Alt {altitude:.2f}°")
+        return await self.protocol.goto_alt_az_precise(azimuth, alt_deg)
+
+    @deal.pre(lambda self, ra_hours, dec_degrees: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, ra_hours, dec_degrees: 0 <= ra_hours < 24, message="RA must be 0-24 hours")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, ra_hours, dec_degrees: -90 <= dec_degrees <= 90, message="Dec must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    async def sync_ra_dec(self, ra_hours: float, dec_degrees: float) -> bool:
+        """
+        Sync telescope position to specified RA/Dec coordinates.
+
+        Args:
+            ra_hours: Right Ascension in hours (0-24)
+            dec_degrees: Declination in degrees (-90 to +90)
+
+        Returns:
+            True if command successful
+        """
+        ra_deg = CoordinateConverter.ra_hours_to_degrees(ra_hours)
+        dec_deg = CoordinateConverter.dec_to_unsigned(dec_degrees)
+
+        logger.info(f"Syncing to RA {ra_hours:.4f}h, Dec {dec_degrees:.4f}°")
+        return await self.protocol.sync_ra_dec_precise(ra_deg, dec_deg)
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def is_slewing(self) -> bool:
+        """Check if telescope is currently slewing (moving to target)."""
+        return await self.protocol.is_goto_in_progress()
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def cancel_goto(self) -> bool:
+        """Cancel current goto/slew operation."""
+        logger.info("Canceling goto operation")
+        return await self.protocol.cancel_goto()
+
+    @deal.pre(lambda self, direction, rate=4: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, rate=4: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
+    @deal.raises(ValueError)
+    async def move_fixed(self, direction: Direction | str, rate: int = 4) -> bool:
+        """
+        Move telescope in a fixed direction at specified rate.
+
+        Args:
+            direction: Direction enum value (UP, DOWN, LEFT, RIGHT)
+            rate: Speed rate 0-9 (0=stop, 9=fastest at 5°/sec)
+
+        Returns:
+            True if command successful
+
+        Raises:
+            ValueError: If direction is invalid or diagonal
+        """
+        direction = _parse_direction(direction)
+        if direction not in _AXIS_MOTION:
+            raise ValueError(
+                f"Invalid direction for move_fixed: {direction}. Use UP, DOWN, LEFT, or RIGHT (not diagonal)"
+            ) from None
+
+        axis, cmd_dir = _AXIS_MOTION[direction]
+        logger.debug(f"Moving {direction.value} at rate {rate}")
+        return await self.protocol.variable_rate_motion(axis, cmd_dir, rate)
+
+    @deal.pre(lambda self, axis="both": self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, axis="both": axis in ["az", "alt", "both"], message="Axis must be az/alt/both")  # type: ignore[misc,arg-type]
+    async def stop_motion(self, axis: str = "both") -> bool:
+        """
+        Stop telescope motion on specified axis.
+
+        Args:
+            axis: 'az' (azimuth only), 'alt' (altitude only), or 'both' (default)
+
+        Returns:
+            True if command successful on all requested axes
+        """
+        success = True
+        if axis in ["az", "both"]:
+            success = success and await self.protocol.variable_rate_motion(1, 17, 0)
+        if axis in ["alt", "both"]:
+            success = success and await self.protocol.variable_rate_motion(2, 17, 0)
+
+        logger.debug(f"Stopped motion on {axis} axis")
+        return success
+
+    @deal.pre(lambda self, direction, rate=4: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, rate=4: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
+    @deal.raises(ValueError)
+    async def move_step(self, direction: Direction | str, rate: int = 4) -> bool:
+        """
+        Move telescope one step in the specified direction.
+
+        This mimics a single button press on the NexStar hand controller
+        (motion for 0.2 seconds at the given rate).
+
+        Args:
+            direction: Direction enum value or string, including diagonals
+            rate: Speed rate 0-9 (0=stop, 9=fastest at 5°/sec)
+
+        Returns:
+            True if command successful
+        """
+        return await self._move_for(_parse_direction(direction), rate, STEP_DURATION)
+
+    @deal.pre(lambda self, direction, duration, rate=4: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, duration, rate=4: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, duration, rate=4: duration > 0, message="Duration must be positive")  # type: ignore[misc,arg-type]
+    @deal.raises(ValueError)
+    async def move_for_time(self, direction: Direction | str, duration: float, rate: int = 4) -> bool:
+        """
+        Move telescope in specified direction for a set duration.
+
+        The wait is an ``asyncio.sleep``, so other tasks keep running
+        while the mount moves.
+
+        Args:
+            direction: Direction enum value or string, including diagonals
+            duration: Duration in seconds (must be positive)
+            rate: Speed rate 0-9 (0=stop, 9=fastest at 5°/sec)
+
+        Returns:
+            True if command successful
+        """
+        return await self._move_for(_parse_direction(direction), rate, duration)
+
+    async def _move_for(self, direction: Direction, rate: int, duration: float) -> bool:
+        """Move along one or both axes for a duration, then stop them."""
+        if rate == 0:
+            return await self.stop_motion("both")
+
+        if direction in _DIAGONALS:
+            alt_direction, az_direction = _DIAGONALS[direction]
+            alt_success = await self.move_fixed(alt_direction, rate)
+            az_success = await self.move_fixed(az_direction, rate)
+            if not (alt_success and az_success):
+                return False
+            await asyncio.sleep(duration)
+            return await self.stop_motion("both")
+
+        if not await self.move_fixed(direction, rate):
+            return False
+        await asyncio.sleep(duration)
+
+        axis = "alt" if direction in [Direction.UP, Direction.DOWN] else "az"
+        return await self.stop_motion(axis)
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_tracking_mode(self) -> TrackingMode:
+        """Get current tracking mode."""
+        return TrackingMode(await self.protocol.get_tracking_mode())
+
+    @deal.pre(lambda self, mode: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def set_tracking_mode(self, mode: TrackingMode) -> bool:
+        """
+        Set tracking mode.
+
+        Args:
+            mode: TrackingMode enum value
+
+        Returns:
+            True if command successful
+        """
+        logger.info(f"Setting tracking mode to {mode.name}")
+        return await self.protocol.set_tracking_mode(mode.value)
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_location(self) -> GeographicLocation:
+        """Get observer location (latitude, longitude)."""
+        result = await self.protocol.get_location()
+        if result is None:
+            logger.warning("Failed to get location")
+            return GeographicLocation(latitude=0.0, longitude=0.0)
+
+        latitude, longitude = result
+        return GeographicLocation(
+            latitude=CoordinateConverter.location_to_signed(latitude),
+            longitude=CoordinateConverter.location_to_signed(longitude),
+        )
+
+    @deal.pre(lambda self, latitude, longitude: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, latitude, longitude: -90 <= latitude <= 90, message="Latitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    @deal.pre(
+        lambda self, latitude, longitude: -180 <= longitude <= 180, message="Longitude must be -180 to +180 degrees"
+    )  # type: ignore[misc,arg-type]
+    async def set_location(self, latitude: float, longitude: float) -> bool:
+        """
+        Set observer location.
+
+        Args:
+            latitude: Latitude in degrees (-90 to +90, positive=North)
+            longitude: Longitude in degrees (-180 to +180, positive=East)
+
+        Returns:
+            True if command successful
+        """
+        lat_deg = CoordinateConverter.location_to_unsigned(latitude)
+        lon_deg = CoordinateConverter.location_to_unsigned(longitude)
+
+        logger.info(f"Setting location to {latitude:.4f}°, {longitude:.4f}°")
+        return await self.protocol.set_location(lat_deg, lon_deg)
+
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    async def get_time(self) -> TelescopeTime:
+        """Get date and time from telescope."""
+        result = await self.protocol.get_time()
+        if result is None:
+            logger.warning("Failed to get time")
+            return TelescopeTime(0, 0, 0, 0, 0, 0)
+
+        hour, minute, second, month, day, year_offset, timezone, daylight = result
+        return TelescopeTime(
+            hour=hour,
+            minute=minute,
+            second=second,
+            month=month,
+            day=day,
+            year=year_offset + 2000,
+            timezone=timezone,
+            daylight_savings=daylight,
+        )
+
+    @deal.pre(
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: self.protocol.is_open(),
+        message="Telescope must be connected",
+    )  # type: ignore[misc,arg-type]
+    async def set_time(
+        self,
+        hour: int,
+        minute: int,
+        second: int,
+        month: int,
+        day: int,
+        year: int,
+        timezone: int = 0,
+        daylight_savings: int = 0,
+    ) -> bool:
+        """
+        Set date and time on telescope.
+
+        Args:
+            hour: Hour (0-23)
+            minute: Minute (0-59)
+            second: Second (0-59)
+            month: Month (1-12)
+            day: Day (1-31)
+            year: Year (e.g., 2024)
+            timezone: Timezone offset from GMT in hours
+            daylight_savings: 0 or 1 for daylight savings
+
+        Returns:
+            True if command successful
+        """
+        logger.info(f"Setting time to {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}")
+        return await self.protocol.set_time(hour, minute, second, month, day, year - 2000, timezone, daylight_savings)
+
+    async def __aenter__(self) -> AsyncNexStarTelescope:
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None) -> Literal[False]:
+        """Async context manager exit."""
+        await self.disconnect()
+        return False
@@ -0,0 +1,196 @@
+"""
+Connection Pool for Long-Lived Telescope Sessions
+
+This module provides the ConnectionPool class, which keeps one open
+NexStarTelescope per device and hands it out to callers such as the
+PositionTracker, the MovementController and the TUI. Features include:
+- One long-lived connection per port (no reconnect cost per command)
+- Serialised access to each device across threads
+- Automatic reconnect after a connection failure
+- Adoption of connections opened elsewhere (e.g. the CLI connect command)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+
+import serial
+
+from celestron_nexstar.api.core.exceptions import (
+    NotConnectedError,
+    TelescopeConnectionError,
+    TelescopeTimeoutError,
+)
+from celestron_nexstar.api.core.types import TelescopeConfig
+from celestron_nexstar.api.telescope.telescope import NexStarTelescope
+
+
+__all__ = ["ConnectionPool", "get_connection_pool", "port_key"]
+
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean the underlying connection can no longer be trusted
+_CONNECTION_ERRORS = (
+    NotConnectedError,
+    TelescopeConnectionError,
+    TelescopeTimeoutError,
+    serial.SerialException,
+    OSError,
+)
+
+
+@dataclass
+class _PooledConnection:
+    """A pooled telescope and the lock serialising access to it."""
+
+    telescope: NexStarTelescope | None = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+
+def port_key(config: TelescopeConfig) -> str:
+    """Get the pool key for a telescope configuration.
+
+    Serial connections are keyed by device path, TCP/IP connections by ``host:port``.
+
+    Args:
+        config: Telescope configuration
+
+    Returns:
+        Device key used by the connection pool
+    """
+    if config.connection_type == "tcp":
+        return f"{config.host}:{config.tcp_port}"
+    return config.port
+
+
+def _default_factory(port: str) -> NexStarTelescope:
+    """Create an unconnected telescope for a pool key (``host:port`` means TCP/IP)."""
+    host, sep, tcp_port = port.rpartition(":")
+    if sep and host and tcp_port.isdigit():
+        return NexStarTelescope(TelescopeConfig(connection_type="tcp", host=host, tcp_port=int(tcp_port)))
+    return NexStarTelescope(port)
+
+
+class ConnectionPool:
+    """Thread-safe pool of long-lived telescope connections, one per device."""
+
+    def __init__(self, factory: Callable[[str], NexStarTelescope] | None = None) -> None:
+        """Initialize the connection pool.
+
+        Args:
+            factory: Function creating an unconnected telescope for a port
+                     (defaults to a serial telescope, or TCP/IP for ``host:port`` keys)
+        """
+        self.factory: Callable[[str], NexStarTelescope] = factory or _default_factory
+        self._entries: dict[str, _PooledConnection] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, port: str) -> _PooledConnection:
+        """Get or create the pool entry for a port."""
+        with self._lock:
+            entry = self._entries.get(port)
+            if entry is None:
+                entry = _PooledConnection()
+                self._entries[port] = entry
+            return entry
+
+    @contextlib.contextmanager
+    def session(self, port: str) -> Iterator[NexStarTelescope]:
+        """Borrow the connected telescope for a port.
+
+        The connection is opened on first use and kept open afterwards.
+        Other threads asking for the same port wait until the session ends.
+        If a connection error escapes the session, the connection is closed
+        and reopened on the next session.
+
+        Args:
+            port: Telescope port (device key)
+
+        Yields:
+            Connected NexStarTelescope
+
+        Raises:
+            TelescopeConnectionError: If the connection cannot be opened
+        """
+        entry = self._entry(port)
+        with entry.lock:
+            if entry.telescope is None or not entry.telescope.protocol.is_open():
+                self._drop(port, entry)
+                telescope = self.factory(port)
+                telescope.connect()
+                entry.telescope = telescope
+                logger.info(f"Opened pooled connection to {port}")
+
+            try:
+                yield entry.telescope
+            except _CONNECTION_ERRORS:
+                logger.warning(f"Connection error on {port}, will reconnect on next use")
+                self._drop(port, entry)
+                raise
+
+    def adopt(self, port: str, telescope: NexStarTelescope) -> None:
+        """Register an already connected telescope for a port.
+
+        Any connection previously pooled for the port is closed.
+
+        Args:
+            port: Telescope port (device key)
+            telescope: Connected telescope to share
+        """
+        entry = self._entry(port)
+        with entry.lock:
+            if entry.telescope is not telescope:
+                self._drop(port, entry)
+            entry.telescope = telescope
+
+    def release(self, port: str) -> None:
+        """Close and forget the connection for a port.
+
+        Args:
+            port: Telescope port (device key)
+        """
+        with self._lock:
+            entry = self._entries.pop(port, None)
+        if entry is not None:
+            with entry.lock:
+                self._drop(port, entry)
+
+    def close_all(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            ports = list(self._entries)
+        for port in ports:
+            self.release(port)
+
+    def ports(self) -> list[str]:
+        """Get the ports that currently hold an open connection."""
+        with self._lock:
+            entries = list(self._entries.items())
+        return [port for port, entry in entries if entry.telescope is not None]
+
+    def _drop(self, port: str, entry: _PooledConnection) -> None:
+        """Disconnect and clear a pool entry (caller holds the entry lock)."""
+        if entry.telescope is None:
+            return
+        with contextlib.suppress(Exception):
+            entry.telescope.disconnect()
+        entry.telescope = None
+        logger.debug(f"Closed pooled connection to {port}")
+
+
+_default_pool: ConnectionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> ConnectionPool:
+    """Get the process-wide connection pool shared by the tracker, movement controller and TUI."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ConnectionPool()
+        return _default_pool
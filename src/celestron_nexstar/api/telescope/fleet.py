@@ -0,0 +1,286 @@
+"""
+Multi-Mount Fleet Controller
+
+This module provides the TelescopeFleet class, which drives several
+telescopes from one asyncio event loop instead of one thread per mount.
+Features include:
+- One AsyncNexStarTelescope connection per mount, keyed by name
+- Concurrent broadcast of goto, sync, set_time and set_location
+- Per-mount results, so one failing mount does not abort the others
+- An aggregated telemetry stream of pipelined state snapshots
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Literal, TypeVar
+
+import deal
+from returns.result import Failure, Result, Success
+
+from celestron_nexstar.api.core.exceptions import NexstarError
+from celestron_nexstar.api.core.types import TelescopeConfig, TelescopeState
+from celestron_nexstar.api.telescope.async_telescope import AsyncNexStarTelescope
+
+
+__all__ = ["FleetTelemetry", "TelescopeFleet"]
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors reported per mount instead of propagating out of a broadcast
+# (PreContractError covers commands sent to a mount that is not connected)
+_MOUNT_ERRORS = (NexstarError, OSError, ValueError, deal.PreContractError)
+
+
+@dataclass
+class FleetTelemetry:
+    """
+    One telemetry sample across the fleet.
+
+    Attributes:
+        timestamp: Unix time the sample was requested
+        states: State snapshot for each mount that answered
+        errors: Error for each mount that did not
+    """
+
+    timestamp: float
+    states: dict[str, TelescopeState] = field(default_factory=dict)
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        """Format as one line per mount."""
+        lines = [f"{name}: {state}" for name, state in sorted(self.states.items())]
+        lines += [f"{name}: error: {error}" for name, error in sorted(self.errors.items())]
+        return "\n".join(lines)
+
+
+class TelescopeFleet:
+    """
+    Concurrent controller for several NexStar mounts.
+
+    Every broadcast runs the command on all mounts at once and returns a
+    ``Result`` per mount name: ``Success`` with the command's return value,
+    or ``Failure`` with the exception raised for that mount.
+
+    Example:
+        >>> fleet = TelescopeFleet({
+        ...     "east": TelescopeConfig(connection_type="tcp", host="192.168.1.20"),
+        ...     "west": TelescopeConfig(connection_type="tcp", host="192.168.1.21"),
+        ... })
+        >>> async with fleet:
+        ...     await fleet.goto_ra_dec(5.5, -5.4)
+        ...     async for sample in fleet.telemetry(interval=1.0):
+        ...         print(sample)
+    """
+
+    def __init__(
+        self,
+        mounts: Mapping[str, TelescopeConfig | str | AsyncNexStarTelescope]
+        | Iterable[TelescopeConfig | str | AsyncNexStarTelescope],
+    ) -> None:
+        """
+        Initialize the fleet.
+
+        Args:
+            mounts: Mapping of mount name to config, port string or telescope.
+                    A plain iterable is named by position ("mount0", "mount1", ...).
+        """
+        items = mounts.items() if isinstance(mounts, Mapping) else ((f"mount{i}", m) for i, m in enumerate(mounts))
+        self.telescopes: dict[str, AsyncNexStarTelescope] = {
+            name: mount if isinstance(mount, AsyncNexStarTelescope) else AsyncNexStarTelescope(mount)
+            for name, mount in items
+        }
+
+    @property
+    def names(self) -> list[str]:
+        """Get the mount names in fleet order."""
+        return list(self.telescopes)
+
+    def __len__(self) -> int:
+        """Get the number of mounts."""
+        return len(self.telescopes)
+
+    async def _broadcast(
+        self, command: Callable[[AsyncNexStarTelescope], Awaitable[T]]
+    ) -> dict[str, Result[T, Exception]]:
+        """Run a command on every mount concurrently and collect per-mount results."""
+
+        async def run(name: str, telescope: AsyncNexStarTelescope) -> Result[T, Exception]:
+            try:
+                return Success(await command(telescope))
+            except _MOUNT_ERRORS as e:
+                logger.warning(f"Fleet command failed on {name}: {e}")
+                return Failure(e)
+
+        results = await asyncio.gather(*(run(name, telescope) for name, telescope in self.telescopes.items()))
+        return dict(zip(self.telescopes, results, strict=True))
+
+    async def connect(self) -> dict[str, Result[bool, Exception]]:
+        """
+        Connect to every mount concurrently.
+
+        Returns:
+            Result per mount name
+        """
+        return await self._broadcast(lambda telescope: telescope.connect())
+
+    async def disconnect(self) -> None:
+        """Close every mount connection."""
+        await asyncio.gather(*(telescope.disconnect() for telescope in self.telescopes.values()))
+
+    @deal.pre(lambda self, ra_hours, dec_degrees: 0 <= ra_hours < 24, message="RA must be 0-24 hours")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, ra_hours, dec_degrees: -90 <= dec_degrees <= 90, message="Dec must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    async def goto_ra_dec(self, ra_hours: float, dec_degrees: float) -> dict[str, Result[bool, Exception]]:
+        """
+        Slew every mount to RA/Dec coordinates.
+
+        Args:
+            ra_hours: Right Ascension in hours (0-24)
+            dec_degrees: Declination in degrees (-90 to +90)
+
+        Returns:
+            Result per mount name
+        """
+        logger.info(f"Fleet slewing to RA {ra_hours:.4f}h, Dec {dec_degrees:.4f}°")
+        return await self._broadcast(lambda telescope: telescope.goto_ra_dec(ra_hours, dec_degrees))
+
+    @deal.pre(lambda self, azimuth, altitude: 0 <= azimuth < 360, message="Azimuth must be 0-360 degrees")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, azimuth, altitude: -90 <= altitude <= 90, message="Altitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    async def goto_alt_az(self, azimuth: float, altitude: float) -> dict[str, Result[bool, Exception]]:
+        """
+        Slew every mount to Alt/Az coordinates.
+
+        Args:
+            azimuth: Azimuth in degrees (0-360)
+            altitude: Altitude in degrees (-90 to +90)
+
+        Returns:
+            Result per mount name
+        """
+        logger.info(f"Fleet slewing to Az {azimuth:.2f}°, Alt {altitude:.2f}°")
+        return await self._broadcast(lambda telescope: telescope.goto_alt_az(azimuth, altitude))
+
+    @deal.pre(lambda self, ra_hours, dec_degrees: 0 <= ra_hours < 24, message="RA must be 0-24 hours")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, ra_hours, dec_degrees: -90 <= dec_degrees <= 90, message="Dec must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    async def sync_ra_dec(self, ra_hours: float, dec_degrees: float) -> dict[str, Result[bool, Exception]]:
+        """
+        Sync every mount to RA/Dec coordinates.
+
+        Args:
+            ra_hours: Right Ascension in hours (0-24)
+            dec_degrees: Declination in degrees (-90 to +90)
+
+        Returns:
+            Result per mount name
+        """
+        logger.info(f"Fleet syncing to RA {ra_hours:.4f}h, Dec {dec_degrees:.4f}°")
+        return await self._broadcast(lambda telescope: telescope.sync_ra_dec(ra_hours, dec_degrees))
+
+    async def cancel_goto(self) -> dict[str, Result[bool, Exception]]:
+        """
+        Cancel the current slew on every mount.
+
+        Returns:
+            Result per mount name
+        """
+        return await self._broadcast(lambda telescope: telescope.cancel_goto())
+
+    async def set_time(
+        self, when: datetime | None = None, timezone: int = 0, daylight_savings: int = 0
+    ) -> dict[str, Result[bool, Exception]]:
+        """
+        Set the same date and time on every mount.
+
+        Args:
+            when: Local date and time to set (default: now)
+            timezone: Timezone offset from GMT in hours
+            daylight_savings: 0 or 1 for daylight savings
+
+        Returns:
+            Result per mount name
+        """
+        when = when or datetime.now()
+        return await self._broadcast(
+            lambda telescope: telescope.set_time(
+                when.hour, when.minute, when.second, when.month, when.day, when.year, timezone, daylight_savings
+            )
+        )
+
+    @deal.pre(lambda self, latitude, longitude: -90 <= latitude <= 90, message="Latitude must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
+    @deal.pre(
+        lambda self, latitude, longitude: -180 <= longitude <= 180, message="Longitude must be -180 to +180 degrees"
+    )  # type: ignore[misc,arg-type]
+    async def set_location(self, latitude: float, longitude: float) -> dict[str, Result[bool, Exception]]:
+        """
+        Set the same observer location on every mount.
+
+        Args:
+            latitude: Latitude in degrees (-90 to +90, positive=North)
+            longitude: Longitude in degrees (-180 to +180, positive=East)
+
+        Returns:
+            Result per mount name
+        """
+        return await self._broadcast(lambda telescope: telescope.set_location(latitude, longitude))
+
+    async def poll(self) -> FleetTelemetry:
+        """
+        Take one state snapshot of every mount concurrently.
+
+        Each mount answers with a single pipelined exchange (see
+        ``AsyncNexStarTelescope.get_state``).
+
+        Returns:
+            FleetTelemetry sample
+        """
+        sample = FleetTelemetry(timestamp=time.time())
+        results = await self._broadcast(lambda telescope: telescope.get_state())
+        for name, result in results.items():
+            match result:
+                case Success(state):
+                    sample.states[name] = state
+                case Failure(error):
+                    sample.errors[name] = error
+        return sample
+
+    @deal.pre(lambda self, interval=1.0, count=None: interval > 0, message="Interval must be positive")  # type: ignore[misc,arg-type]
+    async def telemetry(self, interval: float = 1.0, count: int | None = None) -> AsyncIterator[FleetTelemetry]:
+        """
+        Stream fleet telemetry at a fixed cadence.
+
+        Samples are scheduled on a fixed grid, so a slow poll shortens the
+        following wait instead of drifting the cadence.
+
+        Args:
+            interval: Seconds between samples (must be positive)
+            count: Number of samples to produce (default: unlimited)
+
+        Yields:
+            FleetTelemetry samples
+        """
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time()
+        produced = 0
+        while count is None or produced < count:
+            yield await self.poll()
+            produced += 1
+            next_poll += interval
+            await asyncio.sleep(max(0.0, next_poll - loop.time()))
+
+    async def __aenter__(self) -> TelescopeFleet:
+        """Async context manager entry (connects every mount)."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None) -> Literal[False]:
+        """Async context manager exit."""
+        await self.disconnect()
+        return False
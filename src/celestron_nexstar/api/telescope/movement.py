@@ -6,6 +6,7 @@ movement control with features including:
 - Directional control (up/down/left/right)
 - Variable slew rate adjustment (0-9)
 - Movement state tracking
+- Shared long-lived connection (no reconnect per key press)
 """
 
 from __future__ import annotations
@@ -15,19 +16,26 @@ from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    pass
+    from celestron_nexstar.api.telescope.connection_pool import ConnectionPool
 
 
 class MovementController:
     """Controller for interactive telescope movement."""
 
-    def __init__(self, get_port_func: Callable[[], str | None]) -> None:
+    def __init__(self, get_port_func: Callable[[], str | None], pool: ConnectionPool | None = None) -> None:
         """Initialize the movement controller.
 
         Args:
             get_port_func: Function to get the telescope port (returns str | None)
+            pool: Connection pool to borrow the telescope from (defaults to the shared pool)
         """
+        if pool is None:
+            from celestron_nexstar.api.telescope.connection_pool import get_connection_pool
+
+            pool = get_connection_pool()
+
         self.get_port = get_port_func
+        self.pool = pool
         self.slew_rate = 5  # Default rate 0-9
         self.active_direction: str | None = None  # Current movement direction
         self.moving = False
@@ -46,9 +54,7 @@ class MovementController:
             return
 
         try:
-            from celestron_nexstar.api.telescope.telescope import NexStarTelescope
-
-            with NexStarTelescope(str(port)) as telescope:
+            with self.pool.session(str(port)) as telescope:
                 telescope.move_fixed(direction, self.slew_rate)
                 self.moving = True
                 self.active_direction = direction
@@ -65,9 +71,7 @@ class MovementController:
             return
 
         try:
-            from celestron_nexstar.api.telescope.telescope import NexStarTelescope
-
-            with NexStarTelescope(str(port)) as telescope:
+            with self.pool.session(str(port)) as telescope:
                 telescope.stop_motion("both")
                 self.moving = False
                 self.active_direction = None
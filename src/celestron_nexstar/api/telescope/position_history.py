@@ -0,0 +1,476 @@
+"""
+Columnar Position History
+
+This module provides the PositionHistory ring buffer used by PositionTracker
+to record telescope positions. Features include:
+- Preallocated NumPy columns (timestamp, RA, Dec, Alt, Az, speed, flags)
+  instead of one dict per sample, so 10^6 samples fit in about 45 MB
+- O(1) appends with no per-sample allocation
+- Lock-free snapshots for readers (seqlock-style validation against the writer)
+- Streaming CSV/JSON export and a columnar NPZ export, written chunk by chunk
+
+Times are stored as Unix time. Datetimes passed in are read as UTC when
+they are naive, as elsewhere in the API, and datetimes handed back are
+timezone-aware UTC.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import threading
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import deal
+import numpy as np
+import numpy.typing as npt
+
+
+__all__ = [
+    "DEFAULT_HISTORY_CAPACITY",
+    "FLAG_SLEWING",
+    "FLAG_UNEXPECTED_MOVEMENT",
+    "MAX_HISTORY_CAPACITY",
+    "HistorySnapshot",
+    "PositionHistory",
+]
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_CAPACITY = 1000
+MAX_HISTORY_CAPACITY = 10_000_000
+
+# Bits in the flags column
+FLAG_UNEXPECTED_MOVEMENT = 0x01
+FLAG_SLEWING = 0x02
+
+# Rows per chunk when streaming an export
+EXPORT_CHUNK_ROWS = 65536
+
+_COLUMNS: tuple[tuple[str, type[np.generic]], ...] = (
+    ("timestamp", np.float64),
+    ("ra_hours", np.float64),
+    ("dec_degrees", np.float64),
+    ("alt_degrees", np.float64),
+    ("az_degrees", np.float64),
+    ("speed", np.float32),
+    ("flags", np.uint8),
+)
+
+
+def _to_epoch(timestamp: datetime | float) -> float:
+    """Convert a datetime (naive means UTC) or Unix time to Unix time."""
+    if isinstance(timestamp, datetime):
+        return (timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=UTC)).timestamp()
+    return float(timestamp)
+
+
+@dataclass(frozen=True)
+class HistorySnapshot:
+    """
+    Consistent copy of a range of position history.
+
+    Every column is a read-only NumPy array of the same length, oldest first.
+
+    Attributes:
+        timestamp: Unix time of each sample (float64 seconds)
+        ra_hours: Right Ascension in hours
+        dec_degrees: Declination in degrees
+        alt_degrees: Altitude in degrees
+        az_degrees: Azimuth in degrees
+        speed: Total angular speed in degrees/sec (float32)
+        flags: Bit flags (FLAG_UNEXPECTED_MOVEMENT, FLAG_SLEWING)
+    """
+
+    timestamp: npt.NDArray[np.float64]
+    ra_hours: npt.NDArray[np.float64]
+    dec_degrees: npt.NDArray[np.float64]
+    alt_degrees: npt.NDArray[np.float64]
+    az_degrees: npt.NDArray[np.float64]
+    speed: npt.NDArray[np.float32]
+    flags: npt.NDArray[np.uint8]
+
+    def __len__(self) -> int:
+        """Get the number of samples."""
+        return len(self.timestamp)
+
+    def __str__(self) -> str:
+        """Format as a one-line summary."""
+        if not len(self):
+            return "0 samples"
+        first = datetime.fromtimestamp(float(self.timestamp[0]), UTC)
+        last = datetime.fromtimestamp(float(self.timestamp[-1]), UTC)
+        return f"{len(self)} samples from {first.isoformat()} to {last.isoformat()}"
+
+    def iso_timestamps(self) -> npt.NDArray[np.str_]:
+        """Format every timestamp as an ISO 8601 UTC string (vectorized)."""
+        micros = np.round(self.timestamp * 1e6).astype("datetime64[us]")
+        return np.datetime_as_string(micros, unit="us", timezone="UTC")
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """
+        Convert to the per-sample dict format returned by PositionTracker.get_history.
+
+        Timestamps become timezone-aware UTC datetimes. Samples flagged as
+        unexpected movement also carry "alert" and "speed" keys.
+        """
+        entries = []
+        for ts, ra, dec, alt, az, speed, flags in zip(
+            self.timestamp.tolist(),
+            self.ra_hours.tolist(),
+            self.dec_degrees.tolist(),
+            self.alt_degrees.tolist(),
+            self.az_degrees.tolist(),
+            self.speed.tolist(),
+            self.flags.tolist(),
+            strict=True,
+        ):
+            entry: dict[str, Any] = {
+                "timestamp": datetime.fromtimestamp(ts, UTC),
+                "ra_hours": ra,
+                "dec_degrees": dec,
+                "alt_degrees": alt,
+                "az_degrees": az,
+            }
+            if flags & FLAG_UNEXPECTED_MOVEMENT:
+                entry["alert"] = "UNEXPECTED_MOVEMENT"
+                entry["speed"] = speed
+            entries.append(entry)
+        return entries
+
+
+class _Ring:
+    """Preallocated column storage plus the writer's sequence counters."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        # np.zeros is lazily committed by the OS, so a large capacity costs
+        # nothing until it is written
+        self.columns = tuple(np.zeros(capacity, dtype=dtype) for _, dtype in _COLUMNS)
+        # Sequence number of the next row to publish. ``reserved`` is bumped
+        # before a row is written and ``count`` after, so a reader knows which
+        # slots the writer may be touching.
+        self.count = 0
+        self.reserved = 0
+
+
+class PositionHistory:
+    """
+    Fixed-capacity ring buffer of telescope positions in NumPy columns.
+
+    Appends are serialized by an internal lock; reads never take it. A reader
+    copies the rows it wants and then checks the writer's sequence counters,
+    discarding any row that was overwritten while it was being copied, so
+    snapshots are always consistent and the tracking thread is never blocked
+    by an export.
+
+    Example:
+        >>> history = PositionHistory(capacity=1_000_000)
+        >>> history.record(time.time(), 5.59, -5.39, 35.2, 180.4)
+        >>> snapshot = history.snapshot(last=100)
+        >>> snapshot.alt_degrees.mean()
+    """
+
+    @deal.pre(
+        lambda self, capacity=DEFAULT_HISTORY_CAPACITY: 1 <= capacity <= MAX_HISTORY_CAPACITY,
+        message=f"Capacity must be 1-{MAX_HISTORY_CAPACITY} samples",
+    )  # type: ignore[misc,arg-type]
+    def __init__(self, capacity: int = DEFAULT_HISTORY_CAPACITY) -> None:
+        """
+        Initialize the history.
+
+        Args:
+            capacity: Maximum number of samples kept (oldest are overwritten)
+        """
+        self._write_lock = threading.Lock()
+        self._ring = _Ring(capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Get the maximum number of samples kept."""
+        return self._ring.capacity
+
+    @property
+    def total_recorded(self) -> int:
+        """Get the number of samples recorded since the last clear, including overwritten ones."""
+        return self._ring.count
+
+    def __len__(self) -> int:
+        """Get the number of samples currently held."""
+        ring = self._ring
+        return min(ring.count, ring.capacity)
+
+    def __bool__(self) -> bool:
+        """Check whether any samples are held."""
+        return self._ring.count > 0
+
+    def record(
+        self,
+        timestamp: datetime | float,
+        ra_hours: float,
+        dec_degrees: float,
+        alt_degrees: float,
+        az_degrees: float,
+        speed: float = 0.0,
+        flags: int = 0,
+    ) -> None:
+        """
+        Append one sample, overwriting the oldest when full.
+
+        Args:
+            timestamp: Sample time as a datetime (naive means UTC) or Unix time
+            ra_hours: Right Ascension in hours
+            dec_degrees: Declination in degrees
+            alt_degrees: Altitude in degrees
+            az_degrees: Azimuth in degrees
+            speed: Total angular speed in degrees/sec
+            flags: Bit flags (FLAG_UNEXPECTED_MOVEMENT, FLAG_SLEWING)
+        """
+        values = (_to_epoch(timestamp), ra_hours, dec_degrees, alt_degrees, az_degrees, speed, flags)
+        with self._write_lock:
+            ring = self._ring
+            seq = ring.count
+            ring.reserved = seq + 1
+            slot = seq % ring.capacity
+            for column, value in zip(ring.columns, values, strict=True):
+                column[slot] = value
+            ring.count = seq + 1
+
+    def append(self, entry: Mapping[str, Any]) -> None:
+        """
+        Append a sample given as a history dict (the format of ``get_history``).
+
+        Args:
+            entry: Dict with timestamp, ra_hours, dec_degrees, alt_degrees and
+                   az_degrees, and optionally "alert" and "speed"
+        """
+        self.record(
+            entry["timestamp"],
+            entry["ra_hours"],
+            entry["dec_degrees"],
+            entry["alt_degrees"],
+            entry["az_degrees"],
+            speed=entry.get("speed", 0.0),
+            flags=FLAG_UNEXPECTED_MOVEMENT if entry.get("alert") else 0,
+        )
+
+    def clear(self) -> None:
+        """Drop all samples (snapshots already taken are unaffected)."""
+        with self._write_lock:
+            self._ring = _Ring(self._ring.capacity)
+
+    @deal.pre(
+        lambda self, capacity: 1 <= capacity <= MAX_HISTORY_CAPACITY,
+        message=f"Capacity must be 1-{MAX_HISTORY_CAPACITY} samples",
+    )  # type: ignore[misc,arg-type]
+    def resize(self, capacity: int) -> None:
+        """
+        Change the capacity, keeping the most recent samples that fit.
+
+        Args:
+            capacity: New maximum number of samples
+        """
+        with self._write_lock:
+            old = self._ring
+            keep = min(old.count, old.capacity, capacity)
+            ring = _Ring(capacity)
+            # The write lock excludes the only writer, so this copy cannot tear
+            for target, source in zip(ring.columns, self._copy(old, old.count - keep, old.count), strict=True):
+                target[:keep] = source
+            ring.count = ring.reserved = keep
+            self._ring = ring
+
+    @staticmethod
+    def _copy(ring: _Ring, start: int, stop: int) -> list[npt.NDArray[Any]]:
+        """Copy rows with sequence numbers [start, stop) out of a ring, oldest first."""
+        begin = start % ring.capacity
+        end = begin + (stop - start)
+        if end <= ring.capacity:
+            return [column[begin:end].copy() for column in ring.columns]
+        wrapped = end - ring.capacity
+        return [np.concatenate((column[begin:], column[:wrapped])) for column in ring.columns]
+
+    def _read(self, ring: _Ring, start: int, stop: int) -> tuple[int, list[npt.NDArray[Any]]]:
+        """
+        Copy a sequence range without locking.
+
+        Returns the first sequence number that is still valid together with
+        the copied columns, trimmed to the rows the writer did not touch.
+        """
+        start = max(start, stop - ring.capacity)
+        if stop <= start:
+            return stop, [np.empty(0, dtype=dtype) for _, dtype in _COLUMNS]
+        columns = self._copy(ring, start, stop)
+        # Any slot the writer reserved since the range was chosen may be torn
+        first_valid = max(start, ring.reserved - ring.capacity)
+        if first_valid > start:
+            columns = [column[first_valid - start :] for column in columns]
+        return max(first_valid, start), columns
+
+    def _bisect_since(self, ring: _Ring, start: int, stop: int, since: float) -> int:
+        """Find the first sequence number in [start, stop) with timestamp >= since."""
+        timestamps = ring.columns[0]
+        lo, hi = start, stop
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if timestamps[mid % ring.capacity] < since:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @staticmethod
+    def _snapshot(columns: list[npt.NDArray[Any]]) -> HistorySnapshot:
+        for column in columns:
+            column.flags.writeable = False
+        return HistorySnapshot(*columns)
+
+    def snapshot(
+        self, last: int | None = None, since: datetime | float | None = None, first: int | None = None
+    ) -> HistorySnapshot:
+        """
+        Take a consistent copy of the history without blocking the writer.
+
+        Samples are assumed to be recorded in time order, so ``since`` is a
+        binary search rather than a scan. Only the selected rows are copied.
+
+        Args:
+            last: Keep only the newest N samples
+            since: Keep only samples at or after this time (datetime, naive means UTC, or Unix time)
+            first: Keep only the oldest N samples
+
+        Returns:
+            HistorySnapshot of the selected samples
+        """
+        ring = self._ring
+        stop = ring.count
+        start = max(0, stop - ring.capacity)
+        if since is not None:
+            start = self._bisect_since(ring, start, stop, _to_epoch(since))
+        if last is not None:
+            start = max(start, stop - last)
+        if first is not None:
+            stop = min(stop, start + first)
+        _, columns = self._read(ring, start, stop)
+        return self._snapshot(columns)
+
+    @deal.pre(lambda self, chunk_size=EXPORT_CHUNK_ROWS: chunk_size > 0, message="Chunk size must be positive")  # type: ignore[misc,arg-type]
+    def iter_chunks(self, chunk_size: int = EXPORT_CHUNK_ROWS) -> Iterator[HistorySnapshot]:
+        """
+        Stream the current history as consecutive snapshots, oldest first.
+
+        The range is fixed when iteration starts; samples recorded afterwards
+        are not included, and samples overwritten before their chunk is read
+        are skipped rather than returned torn.
+
+        Args:
+            chunk_size: Maximum samples per chunk
+
+        Yields:
+            HistorySnapshot chunks
+        """
+        ring = self._ring
+        stop = ring.count
+        position = max(0, stop - ring.capacity)
+        while position < stop:
+            first_valid, columns = self._read(ring, position, min(position + chunk_size, stop))
+            position = first_valid + len(columns[0])
+            if len(columns[0]):
+                yield self._snapshot(columns)
+
+    def export_csv(self, path: str | Path, chunk_size: int = EXPORT_CHUNK_ROWS) -> int:
+        """
+        Stream the history to a CSV file.
+
+        Columns are timestamp (ISO 8601 UTC), ra_hours, dec_degrees,
+        alt_degrees, az_degrees and flags.
+
+        Args:
+            path: Output file path
+            chunk_size: Samples formatted per write
+
+        Returns:
+            Number of samples written
+        """
+        written = 0
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["timestamp", "ra_hours", "dec_degrees", "alt_degrees", "az_degrees", "flags"])
+            for chunk in self.iter_chunks(chunk_size):
+                writer.writerows(
+                    zip(
+                        chunk.iso_timestamps().tolist(),
+                        chunk.ra_hours.tolist(),
+                        chunk.dec_degrees.tolist(),
+                        chunk.alt_degrees.tolist(),
+                        chunk.az_degrees.tolist(),
+                        chunk.flags.tolist(),
+                        strict=True,
+                    )
+                )
+                written += len(chunk)
+        return written
+
+    def export_json(self, path: str | Path, chunk_size: int = EXPORT_CHUNK_ROWS) -> int:
+        """
+        Stream the history to a JSON file.
+
+        The document is ``{"export_time": ..., "positions": [...], "count": N}``
+        and is written incrementally, so memory use does not grow with the
+        history size.
+
+        Args:
+            path: Output file path
+            chunk_size: Samples formatted per write
+
+        Returns:
+            Number of samples written
+        """
+        written = 0
+        with open(path, "w") as f:
+            f.write(f'{{"export_time": {json.dumps(datetime.now(UTC).isoformat())},\n "positions": [')
+            for chunk in self.iter_chunks(chunk_size):
+                rows = []
+                for ts, ra, dec, alt, az, speed, flags in zip(
+                    chunk.iso_timestamps().tolist(),
+                    chunk.ra_hours.tolist(),
+                    chunk.dec_degrees.tolist(),
+                    chunk.alt_degrees.tolist(),
+                    chunk.az_degrees.tolist(),
+                    chunk.speed.tolist(),
+                    chunk.flags.tolist(),
+                    strict=True,
+                ):
+                    row = {"timestamp": ts, "ra_hours": ra, "dec_degrees": dec, "alt_degrees": alt, "az_degrees": az}
+                    if flags & FLAG_UNEXPECTED_MOVEMENT:
+                        row["alert"] = "UNEXPECTED_MOVEMENT"
+                        row["speed"] = speed
+                    rows.append(json.dumps(row))
+                f.write(("," if written else "") + "\n  " + ",\n  ".join(rows))
+                written += len(chunk)
+            f.write(f'\n ],\n "count": {written}}}\n')
+        return written
+
+    def export_npz(self, path: str | Path, compressed: bool = True) -> int:
+        """
+        Write the history as a columnar NumPy archive (one array per column).
+
+        Args:
+            path: Output file path
+            compressed: Use zip compression
+
+        Returns:
+            Number of samples written
+        """
+        snapshot = self.snapshot()
+        columns = {name: getattr(snapshot, name) for name, _ in _COLUMNS}
+        save = np.savez_compressed if compressed else np.savez
+        with open(path, "wb") as f:
+            save(f, **columns)
+        return len(snapshot)
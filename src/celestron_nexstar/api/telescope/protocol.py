@@ -23,6 +23,7 @@ import contextlib
 import logging
 import socket
 import time
+from collections import deque
 
 import deal
 import serial
@@ -43,7 +44,9 @@ class NexStarProtocol:
 
     This class handles:
     - Serial port and TCP/IP socket management
-    - Command transmission and response reception
+    - Command transmission and buffered response reception
+    - Pipelined multi-command transactions
+    - Per-command round-trip latency measurement
     - Coordinate encoding/decoding (degrees <-> hex)
     - Protocol-level error handling
 
@@ -56,6 +59,10 @@ class NexStarProtocol:
     DEFAULT_TIMEOUT = 2.0
     DEFAULT_TCP_PORT = 4030
     DEFAULT_TCP_HOST = "192.168.4.1"
+    RECV_BUFFER_SIZE = 256
+    LATENCY_HISTORY = 100
+    # Fastest precise slew: 16-bit rate in quarter arcseconds per second
+    MAX_VARIABLE_RATE = 0xFFFF / 4
 
     def __init__(
         self,
@@ -85,6 +92,12 @@ class NexStarProtocol:
         self.tcp_port = tcp_port
         self.serial_conn: serial.Serial | None = None
         self.tcp_socket: socket.socket | None = None
+        # Receive buffer shared by both transports; bytes past a terminator are kept here
+        self._rx_buffer = bytearray()
+        self._recv_view = memoryview(bytearray(self.RECV_BUFFER_SIZE))
+        # Round-trip latency of recent commands (seconds)
+        self.last_round_trip: float | None = None
+        self.round_trip_times: deque[float] = deque(maxlen=self.LATENCY_HISTORY)
 
     def open(self) -> bool:
         """
@@ -140,6 +153,7 @@ class NexStarProtocol:
 
     def close(self) -> None:
         """Close connection (serial or TCP/IP)."""
+        self._rx_buffer.clear()
         if self.connection_type == "tcp":
             if self.tcp_socket:
                 try:
@@ -178,6 +192,36 @@ class NexStarProtocol:
             TelescopeConnectionError: If reconnection fails
             TelescopeTimeoutError: If no response within timeout
         """
+        self._ensure_open()
+        return self._exchange([command])[0]
+
+    def transaction(self, commands: list[str]) -> list[str]:
+        """
+        Send several commands in one write and receive their responses in order.
+
+        The commands are pipelined: all of them are written at once and the
+        '#'-terminated responses are then demultiplexed from the receive
+        buffer in the same order. This costs a single write/read cycle
+        instead of one round-trip per command.
+
+        Args:
+            commands: Command strings to send (without terminators)
+
+        Returns:
+            Response strings (without terminators), one per command
+
+        Raises:
+            NotConnectedError: If not connected and reconnection fails
+            TelescopeConnectionError: If reconnection fails
+            TelescopeTimeoutError: If not all responses arrive within timeout
+        """
+        if not commands:
+            return []
+        self._ensure_open()
+        return self._exchange(commands)
+
+    def _ensure_open(self) -> None:
+        """Reopen the connection if it is not open."""
         if not self.is_open():
             logger.info("Connection not open, attempting to reconnect...")
             try:
@@ -189,92 +233,149 @@ class NexStarProtocol:
                 logger.error(f"Reconnection failed: {e}")
                 raise NotConnectedError("Connection not open and reconnection failed") from e
 
+    def _exchange(self, commands: list[str]) -> list[str]:
+        """Write commands and read one response per command over the open transport."""
+        # Binary arguments (rates, time fields) use the full byte range
+        payload = "".join(command + self.TERMINATOR for command in commands).encode("latin-1")
+        logger.debug(f"Sending command(s): {', '.join(repr(command) for command in commands)}")
+        self._rx_buffer.clear()
+
         if self.connection_type == "tcp":
-            return self._send_command_tcp(command)
+            # Type guard to ensure tcp_socket is not None
+            assert self.tcp_socket is not None, "TCP/IP connection should be open at this point"
+            started = time.perf_counter()
+            try:
+                self.tcp_socket.sendall(payload)
+            except OSError as e:
+                logger.error(f"Error sending command over TCP/IP: {e}")
+                raise TelescopeConnectionError(f"Failed to send command: {e}") from e
         else:
-            return self._send_command_serial(command)
+            # Type guard to ensure serial_conn is not None
+            assert self.serial_conn is not None, "Serial connection should be open at this point"
+            # Clear buffers to ensure clean communication
+            self.serial_conn.reset_input_buffer()
+            self.serial_conn.reset_output_buffer()
+            started = time.perf_counter()
+            self.serial_conn.write(payload)
+
+        # One deadline for the whole transaction, however many commands it holds
+        deadline = time.monotonic() + self.timeout
+        try:
+            responses = [self._read_response(command, deadline) for command in commands]
+        except TelescopeTimeoutError:
+            # A late reply would be read as the next command's response, so
+            # drop the connection; the next command reopens it clean
+            self.close()
+            raise
+        self._record_round_trip(time.perf_counter() - started)
+        return responses
 
-    def _send_command_serial(self, command: str) -> str:
-        """Send command over serial connection."""
-        # Type guard to ensure serial_conn is not None
-        assert self.serial_conn is not None, "Serial connection should be open at this point"
+    # ========== Buffered Response Reading ==========
 
-        # Clear buffers to ensure clean communication
-        self.serial_conn.reset_input_buffer()
-        self.serial_conn.reset_output_buffer()
+    def _read_response(self, command: str, deadline: float) -> str:
+        """
+        Read one '#'-terminated response from the receive buffer.
+
+        Bytes are pulled from the transport in bulk and accumulated in
+        ``_rx_buffer``; anything received after the terminator is kept for
+        the next call. Reads block on the transport until data arrives or
+        the deadline passes, so waiting for a reply does not spin the CPU.
 
-        # Send command with terminator
-        full_command = command + self.TERMINATOR
-        logger.debug(f"Sending command: {command!r}")
-        self.serial_conn.write(full_command.encode("ascii"))
+        Args:
+            command: Command the response belongs to (for error messages)
+            deadline: ``time.monotonic()`` value after which to give up
 
-        # Read response until terminator
-        response = b""
-        start_time = time.time()
+        Returns:
+            Response string (without terminator)
 
+        Raises:
+            TelescopeTimeoutError: If no complete response arrives before the deadline
+            TelescopeConnectionError: If the transport fails or is closed
+        """
+        terminator = self.TERMINATOR.encode("ascii")
         while True:
-            if time.time() - start_time > self.timeout:
+            index = self._rx_buffer.find(terminator)
+            if index >= 0:
+                response = bytes(self._rx_buffer[:index])
+                del self._rx_buffer[: index + 1]
+                response_str = response.decode("latin-1")
+                logger.debug(f"Received response: {response_str!r}")
+                return response_str
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._fill_buffer(remaining):
                 logger.error(f"Timeout waiting for response to command: {command!r}")
                 raise TelescopeTimeoutError(f"Timeout waiting for response to: {command}") from None
 
-            if self.serial_conn.in_waiting > 0:
-                byte = self.serial_conn.read(1)
-                response += byte
-                if byte == self.TERMINATOR.encode("ascii"):
-                    break
-
-        # Decode and remove terminator
-        response_str = response.decode("ascii").rstrip(self.TERMINATOR)
-        logger.debug(f"Received response: {response_str!r}")
-        return response_str
-
-    def _send_command_tcp(self, command: str) -> str:
-        """Send command over TCP/IP connection."""
-        # Type guard to ensure tcp_socket is not None
-        assert self.tcp_socket is not None, "TCP/IP connection should be open at this point"
-
-        # Send command with terminator
-        full_command = command + self.TERMINATOR
-        logger.debug(f"Sending command: {command!r}")
-        try:
-            self.tcp_socket.sendall(full_command.encode("ascii"))
-        except OSError as e:
-            logger.error(f"Error sending command over TCP/IP: {e}")
-            raise TelescopeConnectionError(f"Failed to send command: {e}") from e
-
-        # Read response until terminator
-        response = b""
-        start_time = time.time()
+    def _fill_buffer(self, remaining: float) -> bool:
+        """
+        Block until more bytes arrive from the transport and append them to ``_rx_buffer``.
 
-        while True:
-            if time.time() - start_time > self.timeout:
-                logger.error(f"Timeout waiting for response to command: {command!r}")
-                raise TelescopeTimeoutError(f"Timeout waiting for response to: {command}") from None
+        Args:
+            remaining: Seconds left before the response deadline
 
+        Returns:
+            True if any bytes were received, False if the wait timed out
+        """
+        if self.connection_type == "tcp":
+            assert self.tcp_socket is not None, "TCP/IP connection should be open at this point"
             try:
-                # Set socket to non-blocking for timeout handling
-                self.tcp_socket.settimeout(0.1)
-                byte = self.tcp_socket.recv(1)
-                if not byte:
-                    # Connection closed
-                    raise TelescopeConnectionError("Connection closed by remote host") from None
-                response += byte
-                if byte == self.TERMINATOR.encode("ascii"):
-                    break
+                self.tcp_socket.settimeout(remaining)
+                received = self.tcp_socket.recv_into(self._recv_view)
             except TimeoutError:
-                # Continue waiting if timeout hasn't been exceeded
-                continue
+                return False
             except OSError as e:
                 logger.error(f"Error receiving response over TCP/IP: {e}")
                 raise TelescopeConnectionError(f"Failed to receive response: {e}") from e
             finally:
                 # Restore original timeout
                 self.tcp_socket.settimeout(self.timeout)
+            if not received:
+                # Connection closed
+                raise TelescopeConnectionError("Connection closed by remote host") from None
+            self._rx_buffer += self._recv_view[:received]
+            return True
+
+        assert self.serial_conn is not None, "Serial connection should be open at this point"
+        # Read everything already waiting, or block (up to the deadline) for the next byte
+        try:
+            self.serial_conn.timeout = remaining
+            chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+        finally:
+            # Restore original timeout
+            self.serial_conn.timeout = self.timeout
+        if not chunk:
+            return False
+        self._rx_buffer += chunk
+        return True
+
+    def _record_round_trip(self, seconds: float) -> None:
+        """Record the round-trip latency of a completed command or transaction."""
+        self.last_round_trip = seconds
+        self.round_trip_times.append(seconds)
+
+    def get_latency_stats(self) -> dict[str, float]:
+        """
+        Get round-trip latency statistics for recent commands.
 
-        # Decode and remove terminator
-        response_str = response.decode("ascii").rstrip(self.TERMINATOR)
-        logger.debug(f"Received response: {response_str!r}")
-        return response_str
+        Latency is measured from writing the command (or transaction) to
+        receiving the terminator of its last response, over the last
+        ``LATENCY_HISTORY`` exchanges.
+
+        Returns:
+            Dictionary with count, last, mean, min and max (seconds);
+            empty if no command has completed yet
+        """
+        samples = list(self.round_trip_times)
+        if not samples:
+            return {}
+        return {
+            "count": float(len(samples)),
+            "last": samples[-1],
+            "mean": sum(samples) / len(samples),
+            "min": min(samples),
+            "max": max(samples),
+        }
 
     # ========== Coordinate Encoding/Decoding ==========
 
@@ -333,6 +434,25 @@ class NexStarProtocol:
         hex2 = NexStarProtocol.degrees_to_hex(value2)
         return f"{hex1},{hex2}"
 
+    @staticmethod
+    def encode_variable_rate(axis: int, arcsec_per_sec: float) -> str:
+        """
+        Encode a precise variable-rate slew command.
+
+        The rate is sent as a 16-bit value in quarter arcseconds per second,
+        with the sign carried by the direction byte (6=positive, 7=negative).
+
+        Args:
+            axis: 1=azimuth, 2=altitude
+            arcsec_per_sec: Signed rate in arcseconds per second
+
+        Returns:
+            Command string (without terminator)
+        """
+        value = min(0xFFFF, round(abs(arcsec_per_sec) * 4))
+        direction = 6 if arcsec_per_sec >= 0 else 7
+        return f"P{chr(3)}{chr(15 + axis)}{chr(direction)}{chr(value >> 8)}{chr(value & 0xFF)}{chr(0)}{chr(0)}"
+
     @staticmethod
     def decode_coordinate_pair(response: str) -> Result[tuple[float, float], str]:
         """
@@ -403,7 +523,7 @@ class NexStarProtocol:
 
     # ========== Specific Protocol Commands ==========
 
-    @deal.pre(lambda self, char: len(char) == 1)  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, char="x": len(char) == 1)  # type: ignore[misc,arg-type]
     def echo(self, char: str = "x") -> bool:
         """
         Test connection with echo command.
@@ -578,6 +698,27 @@ class NexStarProtocol:
         command = f"P{chr(axis)}{chr(direction)}{chr(rate)}{chr(0)}{chr(0)}{chr(0)}"
         return self.send_empty_command(command)
 
+    @deal.pre(
+        lambda self, axis, arcsec_per_sec: axis in [1, 2] and abs(arcsec_per_sec) <= NexStarProtocol.MAX_VARIABLE_RATE
+    )  # type: ignore[misc,arg-type]
+    def variable_rate_slew(self, axis: int, arcsec_per_sec: float) -> bool:
+        """
+        Slew one axis at a precise rate.
+        Command: P<3><dest><dir><rate_high><rate_low><0><0>#
+
+        Unlike ``variable_rate_motion``, which selects one of the ten
+        hand-controller speeds, this sets any rate in steps of 0.25 arcsec/sec,
+        which is what closed-loop guiding needs.
+
+        Args:
+            axis: 1=azimuth, 2=altitude
+            arcsec_per_sec: Signed rate in arcseconds per second (0 stops the axis)
+
+        Returns:
+            True if successful
+        """
+        return self.send_empty_command(self.encode_variable_rate(axis, arcsec_per_sec))
+
     def get_tracking_mode(self) -> int:
         """
         Get tracking mode.
@@ -625,8 +766,9 @@ class NexStarProtocol:
         return None
 
     @deal.pre(
-        lambda self, latitude_degrees, longitude_degrees: 0.0 <= latitude_degrees <= 360.0
-        and 0.0 <= longitude_degrees <= 360.0
+        lambda self, latitude_degrees, longitude_degrees: (
+            0.0 <= latitude_degrees <= 360.0 and 0.0 <= longitude_degrees <= 360.0
+        )
     )  # type: ignore[misc,arg-type]
     def set_location(self, latitude_degrees: float, longitude_degrees: float) -> bool:
         """
@@ -662,13 +804,15 @@ class NexStarProtocol:
         return None
 
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year_offset, timezone, dst: 0 <= hour <= 23
-        and 0 <= minute <= 59
-        and 0 <= second <= 59
-        and 1 <= month <= 12
-        and 1 <= day <= 31
-        and year_offset >= 0
-        and dst in [0, 1]
+        lambda self, hour, minute, second, month, day, year_offset, timezone, dst: (
+            0 <= hour <= 23
+            and 0 <= minute <= 59
+            and 0 <= second <= 59
+            and 1 <= month <= 12
+            and 1 <= day <= 31
+            and year_offset >= 0
+            and dst in [0, 1]
+        )
     )  # type: ignore[misc,arg-type]
     def set_time(
         self, hour: int, minute: int, second: int, month: int, day: int, year_offset: int, timezone: int, dst: int
@@ -691,7 +835,5 @@ class NexStarProtocol:
         Returns:
             True if successful
         """
-        command = (
-            f"H{chr(hour)}{chr(minute)}{chr(second)}{chr(month)}{chr(day)}{chr(year_offset)}{chr(timezone)}{chr(dst)}"
-        )
+        command = f"H{chr(hour)}{chr(minute)}{chr(second)}{chr(month)}{chr(day)}{chr(year_offset)}{chr(timezone % 256)}{chr(dst)}"
         return self.send_empty_command(command)
@@ -0,0 +1,613 @@
+"""
+Simulated NexStar Mount
+
+This module provides a software NexStar mount for testing and benchmarking
+the protocol stack without hardware. Features include:
+- The command set used by NexStarProtocol (K, V, m, E, Z, R, B, S, L, M, P, t, T, w, W, h, H)
+- Slew kinematics: gotos, fixed-rate and precise variable-rate motion move the
+  axes at finite speed, and sidereal tracking keeps RA/Dec fixed while Alt/Az drift
+- TCP/IP endpoint (like the SkyPortal WiFi Adapter) and pty serial endpoint
+- Link modelling: per-byte baud rate delay and per-exchange turnaround latency
+- Fault injection: dropped, corrupted and delayed responses, and disconnects
+
+Example:
+    >>> from celestron_nexstar import NexStarTelescope
+    >>> from celestron_nexstar.api.telescope.simulator import MountSimulator
+    >>> with MountSimulator(baudrate=9600, latency=0.01) as simulator:
+    ...     with NexStarTelescope(simulator.start_tcp()) as telescope:
+    ...         telescope.goto_alt_az(120.0, 45.0)
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+import os
+import random
+import select
+import socket
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any, Literal
+
+from celestron_nexstar.api.core.types import TelescopeConfig
+from celestron_nexstar.api.telescope.protocol import NexStarProtocol
+
+
+__all__ = ["FaultInjector", "MountSimulator", "SimulatedMount"]
+
+
+logger = logging.getLogger(__name__)
+
+# Sidereal rate in degrees per second
+SIDEREAL_RATE = 360.0 / 86164.0905
+
+# Fixed slew speeds (degrees per second) for variable rate motion rates 0-9
+SLEW_RATES = (
+    0.0,
+    2 * SIDEREAL_RATE,
+    4 * SIDEREAL_RATE,
+    8 * SIDEREAL_RATE,
+    16 * SIDEREAL_RATE,
+    32 * SIDEREAL_RATE,
+    0.5,
+    1.0,
+    3.0,
+    5.0,
+)
+
+# Default goto speed per axis (degrees per second)
+GOTO_RATE = 5.0
+
+# Positions closer than this to the goto target count as arrived (degrees)
+ARRIVAL_TOLERANCE = 1e-6
+
+# Poll interval for server threads checking whether to stop (seconds)
+_POLL_INTERVAL = 0.1
+
+# Commands with binary arguments have a fixed length (terminator excluded), because
+# an argument byte may itself be '#'. Precise rate commands (P<3>...) are one byte longer.
+_BINARY_COMMAND_LENGTHS = {b"K": 2, b"T": 2, b"H": 9, b"P": 7}
+
+_J2000 = datetime(2000, 1, 1, 12, tzinfo=UTC)
+
+
+def _split_command(pending: bytes) -> tuple[bytes, bytes] | None:
+    """Split the first complete command off a receive buffer, or return None if it is incomplete."""
+    length = _BINARY_COMMAND_LENGTHS.get(pending[:1])
+    if length is None:
+        if b"#" not in pending:
+            return None
+        command, rest = pending.split(b"#", 1)
+        return command, rest
+    if pending[:2] == b"P\x03":
+        length += 1
+    if len(pending) <= length:
+        return None
+    return pending[:length], pending[length + 1 :]
+
+
+def _wrap180(degrees: float) -> float:
+    """Wrap an angle difference to -180..180 degrees."""
+    return (degrees + 180.0) % 360.0 - 180.0
+
+
+def _signed(degrees: float) -> float:
+    """Convert an unsigned protocol angle (0-360) to signed (-180..180)."""
+    return degrees - 360.0 if degrees > 180.0 else degrees
+
+
+def _step_towards(current: float, target: float, step: float) -> float:
+    """Move from current towards target by at most step."""
+    delta = target - current
+    if abs(delta) <= step:
+        return target
+    return current + math.copysign(step, delta)
+
+
+def _local_sidereal_degrees(utc: datetime, longitude: float) -> float:
+    """Local mean sidereal time in degrees (IAU 1982 GMST, ample for simulation)."""
+    days = (utc - _J2000).total_seconds() / 86400.0
+    return (280.46061837 + 360.98564736629 * days + longitude) % 360.0
+
+
+def _equatorial_to_horizontal(ra: float, dec: float, latitude: float, lst: float) -> tuple[float, float]:
+    """Convert RA/Dec (degrees) to azimuth/altitude (degrees, azimuth from North through East)."""
+    ha, dec_r, lat = math.radians(lst - ra), math.radians(dec), math.radians(latitude)
+    sin_alt = math.sin(dec_r) * math.sin(lat) + math.cos(dec_r) * math.cos(lat) * math.cos(ha)
+    alt = math.asin(max(-1.0, min(1.0, sin_alt)))
+    az = math.atan2(
+        -math.sin(ha) * math.cos(dec_r),
+        math.sin(dec_r) * math.cos(lat) - math.cos(dec_r) * math.sin(lat) * math.cos(ha),
+    )
+    return math.degrees(az) % 360.0, math.degrees(alt)
+
+
+def _horizontal_to_equatorial(az: float, alt: float, latitude: float, lst: float) -> tuple[float, float]:
+    """Convert azimuth/altitude (degrees) to RA/Dec (degrees)."""
+    az_r, alt_r, lat = math.radians(az), math.radians(alt), math.radians(latitude)
+    sin_dec = math.sin(alt_r) * math.sin(lat) + math.cos(alt_r) * math.cos(lat) * math.cos(az_r)
+    dec = math.asin(max(-1.0, min(1.0, sin_dec)))
+    ha = math.atan2(
+        -math.sin(az_r) * math.cos(alt_r),
+        math.sin(alt_r) * math.cos(lat) - math.cos(alt_r) * math.sin(lat) * math.cos(az_r),
+    )
+    return (lst - math.degrees(ha)) % 360.0, math.degrees(dec)
+
+
+class SimulatedMount:
+    """
+    State machine of an Alt-Az NexStar mount.
+
+    The mount's axes are azimuth and altitude. RA/Dec are derived from the
+    axes, the observer location and the mount clock. Positions are advanced
+    lazily from the injected clock whenever a command is handled, so the
+    model costs nothing between commands and can be driven deterministically
+    in tests.
+    """
+
+    def __init__(
+        self,
+        latitude: float = 40.0,
+        longitude: float = -74.0,
+        goto_rate: float = GOTO_RATE,
+        model: int = 11,
+        version: tuple[int, int] = (4, 21),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the simulated mount.
+
+        Args:
+            latitude: Observer latitude in degrees (positive=North)
+            longitude: Observer longitude in degrees (positive=East)
+            goto_rate: Goto speed per axis in degrees per second
+            model: Model number reported by the m command
+            version: Firmware (major, minor) reported by the V command
+            clock: Monotonic clock in seconds driving the kinematics
+        """
+        self.latitude = latitude
+        self.longitude = longitude
+        self.goto_rate = goto_rate
+        self.model = model
+        self.version = version
+        self.clock = clock
+
+        self.azimuth = 0.0
+        self.altitude = 0.0
+        self.tracking_mode = 0
+        self.timezone = 0
+        self.daylight_savings = 0
+
+        self._lock = threading.RLock()
+        self._updated = clock()
+        self._utc_epoch = datetime.now(UTC)
+        self._clock_epoch = self._updated
+        # Goto target on the axes, and the RA/Dec being chased by an equatorial goto
+        self._target: tuple[float, float] | None = None
+        self._goto_equatorial: tuple[float, float] | None = None
+        # Manual motion speed per axis (degrees per second)
+        self._az_rate = 0.0
+        self._alt_rate = 0.0
+        # RA/Dec held fixed while tracking and idle
+        self._tracked: tuple[float, float] | None = None
+
+        self._handlers: dict[str, Callable[[str], str]] = {
+            "K": lambda args: args,
+            "V": lambda args: chr(self.version[0]) + chr(self.version[1]),
+            "m": lambda args: chr(self.model),
+            "E": self._get_ra_dec,
+            "Z": self._get_alt_az,
+            "R": self._goto_ra_dec,
+            "B": self._goto_alt_az,
+            "S": self._sync_ra_dec,
+            "L": lambda args: "1" if self._target is not None else "0",
+            "M": self._cancel_goto,
+            "P": self._variable_rate_motion,
+            "t": lambda args: chr(self.tracking_mode),
+            "T": self._set_tracking_mode,
+            "w": self._get_location,
+            "W": self._set_location,
+            "h": self._get_time,
+            "H": self._set_time,
+        }
+
+    # ========== Clock and Kinematics ==========
+
+    def utc_now(self) -> datetime:
+        """Get the mount's current UTC time."""
+        return self._utc_epoch + timedelta(seconds=self.clock() - self._clock_epoch)
+
+    def _lst(self) -> float:
+        return _local_sidereal_degrees(self.utc_now(), self.longitude)
+
+    def _horizontal_of(self, ra: float, dec: float) -> tuple[float, float]:
+        return _equatorial_to_horizontal(ra, dec, self.latitude, self._lst())
+
+    def _equatorial_of(self, az: float, alt: float) -> tuple[float, float]:
+        return _horizontal_to_equatorial(az, alt, self.latitude, self._lst())
+
+    def is_slewing(self) -> bool:
+        """Check if a goto is in progress."""
+        with self._lock:
+            self.advance()
+            return self._target is not None
+
+    def advance(self) -> None:
+        """Advance the axes to the current clock time."""
+        with self._lock:
+            now = self.clock()
+            dt = max(0.0, now - self._updated)
+            self._updated = now
+
+            if self._target is not None:
+                if self._goto_equatorial is not None:
+                    # Chase the target as the sky turns
+                    self._target = self._horizontal_of(*self._goto_equatorial)
+                target_az, target_alt = self._target
+                step = self.goto_rate * dt
+                self.azimuth = (self.azimuth + _step_towards(0.0, _wrap180(target_az - self.azimuth), step)) % 360.0
+                self.altitude = _step_towards(self.altitude, target_alt, step)
+                if (
+                    abs(_wrap180(target_az - self.azimuth)) <= ARRIVAL_TOLERANCE
+                    and abs(target_alt - self.altitude) <= ARRIVAL_TOLERANCE
+                ):
+                    self._tracked = self._goto_equatorial
+                    self._target = None
+                    self._goto_equatorial = None
+            elif self._az_rate or self._alt_rate:
+                self.azimuth = (self.azimuth + self._az_rate * dt) % 360.0
+                self.altitude = max(-90.0, min(90.0, self.altitude + self._alt_rate * dt))
+                self._tracked = None
+
+            if self.tracking_mode and self._target is None and not (self._az_rate or self._alt_rate):
+                if self._tracked is None:
+                    self._tracked = self._equatorial_of(self.azimuth, self.altitude)
+                else:
+                    self.azimuth, self.altitude = self._horizontal_of(*self._tracked)
+
+    # ========== Command Handling ==========
+
+    def handle(self, command: str) -> str:
+        """
+        Execute one command.
+
+        Args:
+            command: Command string (without terminator)
+
+        Returns:
+            Response string (without terminator); empty for unknown commands
+        """
+        if not command:
+            return ""
+        handler = self._handlers.get(command[0])
+        if handler is None:
+            logger.debug(f"Simulator ignoring unknown command {command!r}")
+            return ""
+        with self._lock:
+            self.advance()
+            try:
+                return handler(command[1:])
+            except (ValueError, IndexError):
+                logger.debug(f"Simulator ignoring malformed command {command!r}")
+                return ""
+
+    @staticmethod
+    def _parse_pair(args: str) -> tuple[float, float]:
+        first, second = args.split(",")
+        return NexStarProtocol.hex_to_degrees(first), NexStarProtocol.hex_to_degrees(second)
+
+    def _get_ra_dec(self, args: str) -> str:
+        ra, dec = self._tracked or self._equatorial_of(self.azimuth, self.altitude)
+        return NexStarProtocol.encode_coordinate_pair(ra % 360.0, dec % 360.0)
+
+    def _get_alt_az(self, args: str) -> str:
+        return NexStarProtocol.encode_coordinate_pair(self.azimuth % 360.0, self.altitude % 360.0)
+
+    def _goto_ra_dec(self, args: str) -> str:
+        ra, dec = self._parse_pair(args)
+        self._goto_equatorial = (ra, _signed(dec))
+        self._target = self._horizontal_of(*self._goto_equatorial)
+        self._az_rate = self._alt_rate = 0.0
+        return ""
+
+    def _goto_alt_az(self, args: str) -> str:
+        az, alt = self._parse_pair(args)
+        self._goto_equatorial = None
+        self._target = (az, max(-90.0, min(90.0, _signed(alt))))
+        self._az_rate = self._alt_rate = 0.0
+        return ""
+
+    def _sync_ra_dec(self, args: str) -> str:
+        ra, dec = self._parse_pair(args)
+        self.azimuth, self.altitude = self._horizontal_of(ra, _signed(dec))
+        self._tracked = (ra, _signed(dec)) if self.tracking_mode else None
+        return ""
+
+    def _cancel_goto(self, args: str) -> str:
+        self._target = None
+        self._goto_equatorial = None
+        self._tracked = None
+        return ""
+
+    def _variable_rate_motion(self, args: str) -> str:
+        if ord(args[0]) == 3:
+            # Precise rate: <3><dest 16/17><dir 6/7><rate_high><rate_low>, quarter arcsec/sec
+            axis, direction = ord(args[1]) - 15, ord(args[2])
+            speed = (ord(args[3]) << 8 | ord(args[4])) / 4 / 3600 * (1.0 if direction == 6 else -1.0)
+        else:
+            axis, direction, rate = ord(args[0]), ord(args[1]), ord(args[2])
+            speed = SLEW_RATES[rate] * (1.0 if direction == 17 else -1.0)
+        # Manual motion aborts a goto, as on the hand controller
+        self._target = None
+        self._goto_equatorial = None
+        if axis == 1:
+            self._az_rate = speed
+        else:
+            self._alt_rate = speed
+        return ""
+
+    def _set_tracking_mode(self, args: str) -> str:
+        self.tracking_mode = ord(args[0])
+        self._tracked = None
+        return ""
+
+    def _get_location(self, args: str) -> str:
+        return NexStarProtocol.degrees_to_hex(self.latitude % 360.0) + NexStarProtocol.degrees_to_hex(
+            self.longitude % 360.0
+        )
+
+    def _set_location(self, args: str) -> str:
+        latitude, longitude = self._parse_pair(args)
+        self.latitude, self.longitude = _signed(latitude), _signed(longitude)
+        self._tracked = None
+        return ""
+
+    def _get_time(self, args: str) -> str:
+        local = self.utc_now() + timedelta(hours=self.timezone + self.daylight_savings)
+        values = (local.hour, local.minute, local.second, local.month, local.day, local.year - 2000)
+        return "".join(chr(v) for v in values) + chr(self.timezone % 256) + chr(self.daylight_savings)
+
+    def _set_time(self, args: str) -> str:
+        hour, minute, second, month, day, year_offset, timezone, dst = (ord(c) for c in args[:8])
+        self.timezone = timezone - 256 if timezone > 127 else timezone
+        self.daylight_savings = dst
+        local = datetime(2000 + year_offset, month, day, hour, minute, second, tzinfo=UTC)
+        self._utc_epoch = local - timedelta(hours=self.timezone + dst)
+        self._clock_epoch = self.clock()
+        self._tracked = None
+        return ""
+
+
+@dataclass
+class FaultInjector:
+    """
+    Faults applied to simulator responses.
+
+    Attributes:
+        drop_rate: Probability that a response is never sent
+        corrupt_rate: Probability that a response body is garbled (terminator kept)
+        jitter: Maximum extra random delay per response (seconds)
+        disconnect_after: Close the link after this many commands (None = never)
+        seed: Random seed for reproducible fault sequences
+    """
+
+    drop_rate: float = 0.0
+    corrupt_rate: float = 0.0
+    jitter: float = 0.0
+    disconnect_after: int | None = None
+    seed: int | None = None
+    _random: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Create the random source."""
+        self._random = random.Random(self.seed)
+
+    def apply(self, response: bytes) -> tuple[bytes | None, float]:
+        """
+        Decide the fate of one response.
+
+        Args:
+            response: Response body (without terminator)
+
+        Returns:
+            Tuple of (response to send or None to drop it, extra delay in seconds)
+        """
+        delay = self._random.uniform(0.0, self.jitter) if self.jitter else 0.0
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            return None, delay
+        if self.corrupt_rate and self._random.random() < self.corrupt_rate:
+            response = bytes(self._random.randrange(33, 127) for _ in range(max(1, len(response))))
+        return response, delay
+
+
+class MountSimulator:
+    """
+    Serves a SimulatedMount over TCP/IP and pty serial endpoints.
+
+    Each endpoint is served from a background thread, so synchronous clients
+    such as NexStarTelescope can run in the calling thread.
+    """
+
+    def __init__(
+        self,
+        mount: SimulatedMount | None = None,
+        baudrate: int | None = None,
+        latency: float = 0.0,
+        faults: FaultInjector | None = None,
+    ) -> None:
+        """
+        Initialize the simulator.
+
+        Args:
+            mount: Mount model to serve (default: new SimulatedMount)
+            baudrate: Modelled serial link speed; each byte costs 10 bit times (None = unlimited)
+            latency: Turnaround latency added once per received burst (seconds)
+            faults: Fault injection settings (default: none)
+        """
+        self.mount = mount or SimulatedMount()
+        self.baudrate = baudrate
+        self.latency = latency
+        self.faults = faults or FaultInjector()
+        self.commands_served = 0
+        self._count_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._closers: list[Callable[[], None]] = []
+
+    @property
+    def byte_time(self) -> float:
+        """Time to transfer one byte over the modelled link (seconds)."""
+        return 10.0 / self.baudrate if self.baudrate else 0.0
+
+    def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> TelescopeConfig:
+        """
+        Start a TCP/IP endpoint.
+
+        Args:
+            host: Address to listen on
+            port: Port to listen on (0 = pick a free port)
+
+        Returns:
+            TelescopeConfig connecting to the endpoint
+        """
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server.bind((host, port))
+        server.listen()
+        server.settimeout(_POLL_INTERVAL)
+        self._closers.append(server.close)
+        bound_host, bound_port = server.getsockname()[:2]
+        self._spawn(self._accept_loop, server)
+        logger.info(f"Simulated mount listening on {bound_host}:{bound_port}")
+        return TelescopeConfig(connection_type="tcp", host=bound_host, tcp_port=bound_port)
+
+    def start_pty(self) -> TelescopeConfig:
+        """
+        Start a pty serial endpoint (POSIX only).
+
+        Returns:
+            TelescopeConfig opening the pty's device path
+        """
+        import tty
+
+        master_fd, slave_fd = os.openpty()
+        tty.setraw(slave_fd)
+        # Keep the slave open so the master does not see EOF between client sessions
+        self._closers.extend([lambda: os.close(master_fd), lambda: os.close(slave_fd)])
+        path = os.ttyname(slave_fd)
+
+        def recv() -> bytes | None:
+            ready, _, _ = select.select([master_fd], [], [], _POLL_INTERVAL)
+            return os.read(master_fd, 256) if ready else None
+
+        self._spawn(self._serve, recv, lambda data: os.write(master_fd, data), None)
+        logger.info(f"Simulated mount serving on {path}")
+        return TelescopeConfig(port=path)
+
+    def stop(self) -> None:
+        """Stop all endpoints and wait for their threads."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=2.0)
+        for close in self._closers:
+            with contextlib.suppress(OSError):
+                close()
+        self._threads.clear()
+        self._closers.clear()
+        self._stop.clear()
+
+    def _spawn(self, target: Callable[..., None], *args: Any) -> None:
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _accept_loop(self, server: socket.socket) -> None:
+        while not self._stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except TimeoutError:
+                continue
+            except OSError:
+                return
+            conn.settimeout(_POLL_INTERVAL)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def recv(conn: socket.socket = conn) -> bytes | None:
+                try:
+                    return conn.recv(256)
+                except TimeoutError:
+                    return None
+
+            self._spawn(self._serve, recv, conn.sendall, conn.close)
+
+    def _serve(
+        self,
+        recv: Callable[[], bytes | None],
+        send: Callable[[bytes], Any],
+        close: Callable[[], None] | None,
+    ) -> None:
+        """Answer commands on one link until it closes or the simulator stops."""
+        pending = b""
+        try:
+            while not self._stop.is_set():
+                try:
+                    data = recv()
+                except OSError:
+                    return
+                if data is None:
+                    continue
+                if not data:
+                    return
+
+                # Link turnaround once per burst, plus the bytes on the wire
+                self._wait(self.latency + len(data) * self.byte_time)
+                pending += data
+                while (split := _split_command(pending)) is not None:
+                    command, pending = split
+                    if not self._respond(command, send):
+                        return
+        finally:
+            if close is not None:
+                close()
+
+    def _respond(self, command: bytes, send: Callable[[bytes], Any]) -> bool:
+        """Answer one command; returns False when the link should be closed."""
+        with self._count_lock:
+            self.commands_served += 1
+            served = self.commands_served
+        limit = self.faults.disconnect_after
+        if limit is not None and served > limit:
+            logger.debug("Simulator injecting disconnect")
+            return False
+
+        response = self.mount.handle(command.decode("latin-1")).encode("latin-1")
+        body, delay = self.faults.apply(response)
+        if body is None:
+            logger.debug(f"Simulator dropping response to {command!r}")
+            return True
+
+        reply = body + b"#"
+        self._wait(delay + len(reply) * self.byte_time)
+        try:
+            send(reply)
+        except OSError:
+            return False
+        return True
+
+    def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def __enter__(self) -> MountSimulator:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_val: Exception | None, exc_tb: Any | None) -> Literal[False]:
+        """Context manager exit."""
+        self.stop()
+        return False
@@ -32,6 +32,7 @@ from celestron_nexstar.api.core.types import (
     HorizontalCoordinates,
     TelescopeConfig,
     TelescopeInfo,
+    TelescopeState,
     TelescopeTime,
     TrackingMode,
 )
@@ -127,7 +128,6 @@ class NexStarTelescope:
             logger.info("Connection not open, attempting to reconnect...")
             self.connect()
 
-    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: result is True, message="Connection must succeed")
     @deal.raises(TelescopeConnectionError)
     def connect(self) -> bool:
@@ -176,7 +176,7 @@ class NexStarTelescope:
         self.serial_conn = None
         logger.info("Disconnected from telescope")
 
-    @deal.pre(lambda self, char: len(char) == 1, message="Char must be single character")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, char="x": len(char) == 1, message="Char must be single character")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
     def echo_test(self, char: str = "x") -> bool:
         """
@@ -301,6 +301,56 @@ class NexStarTelescope:
             HorizontalCoordinates(azimuth=0.0, altitude=0.0)
         )
 
+    @deal.pre(lambda self: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.post(lambda result: result is not None, message="State must be returned")
+    def get_state(self) -> TelescopeState:
+        """
+        Get position, slew status and tracking mode in one exchange.
+
+        The four queries (E, Z, L, t) are pipelined in a single protocol
+        transaction, so a full snapshot costs one write/read cycle instead
+        of four round-trips.
+
+        Returns:
+            TelescopeState snapshot
+
+        Raises:
+            NotConnectedError: If not connected to telescope
+
+        Example:
+            >>> state = telescope.get_state()
+            >>> print(state.equatorial, state.is_slewing)
+        """
+        ra_dec, alt_az, goto, mode = self.protocol.transaction(["E", "Z", "L", "t"])
+
+        equatorial = (
+            self.protocol.decode_coordinate_pair(ra_dec)
+            .map(
+                lambda coords: EquatorialCoordinates(
+                    ra_hours=CoordinateConverter.ra_degrees_to_hours(coords[0]),
+                    dec_degrees=CoordinateConverter.dec_to_signed(coords[1]),
+                )
+            )
+            .value_or(EquatorialCoordinates(ra_hours=0.0, dec_degrees=0.0))
+        )
+        horizontal = (
+            self.protocol.decode_coordinate_pair(alt_az)
+            .map(
+                lambda coords: HorizontalCoordinates(
+                    azimuth=coords[0], altitude=CoordinateConverter.altitude_to_signed(coords[1])
+                )
+            )
+            .value_or(HorizontalCoordinates(azimuth=0.0, altitude=0.0))
+        )
+        mode_val = ord(mode) if len(mode) == 1 else 0
+
+        return TelescopeState(
+            equatorial=equatorial,
+            horizontal=horizontal,
+            is_slewing=goto == "1",
+            tracking_mode=TrackingMode(mode_val),
+        )
+
     @deal.pre(lambda self, ra_hours, dec_degrees: 0 <= ra_hours < 24, message="RA must be 0-24 hours")  # type: ignore[misc,arg-type]
     @deal.pre(lambda self, ra_hours, dec_degrees: -90 <= dec_degrees <= 90, message="Dec must be -90 to +90 degrees")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: result is True, message="Goto must succeed")
@@ -434,12 +484,12 @@ class NexStarTelescope:
         logger.info("Canceling goto operation")
         return self.protocol.cancel_goto()
 
-    @deal.pre(lambda self, direction, rate: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, rate=4: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, direction, rate: isinstance(direction, (Direction, str)),
+        lambda self, direction, rate=4: isinstance(direction, (Direction, str)),
         message="Direction must be Direction enum or str",
     )  # type: ignore[misc,arg-type]
-    @deal.pre(lambda self, direction, rate: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, rate=4: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
     @deal.raises(ValueError)
     def move_fixed(self, direction: Direction | str, rate: int = 4) -> bool:
@@ -503,8 +553,8 @@ class NexStarTelescope:
         logger.debug(f"Moving {direction.value} at rate {rate}")
         return self.protocol.variable_rate_motion(axis, cmd_dir, rate)
 
-    @deal.pre(lambda self, axis: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
-    @deal.pre(lambda self, axis: axis in ["az", "alt", "both"], message="Axis must be az/alt/both")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, axis="both": self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, axis="both": axis in ["az", "alt", "both"], message="Axis must be az/alt/both")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
     def stop_motion(self, axis: str = "both") -> bool:
         """
@@ -533,12 +583,12 @@ class NexStarTelescope:
         logger.debug(f"Stopped motion on {axis} axis")
         return success
 
-    @deal.pre(lambda self, direction, rate: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, rate=4: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, direction, rate: isinstance(direction, (Direction, str)),
+        lambda self, direction, rate=4: isinstance(direction, (Direction, str)),
         message="Direction must be Direction enum or str",
     )  # type: ignore[misc,arg-type]
-    @deal.pre(lambda self, direction, rate: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, rate=4: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
     @deal.raises(ValueError)
     def move_step(self, direction: Direction | str, rate: int = 4) -> bool:
@@ -625,13 +675,13 @@ class NexStarTelescope:
         axis = "alt" if direction in [Direction.UP, Direction.DOWN] else "az"
         return self.stop_motion(axis)
 
-    @deal.pre(lambda self, direction, rate, duration: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, duration, rate=4: self.protocol.is_open(), message="Telescope must be connected")  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, direction, rate, duration: isinstance(direction, (Direction, str)),
+        lambda self, direction, duration, rate=4: isinstance(direction, (Direction, str)),
         message="Direction must be Direction enum or str",
     )  # type: ignore[misc,arg-type]
-    @deal.pre(lambda self, direction, rate, duration: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
-    @deal.pre(lambda self, direction, rate, duration: duration > 0, message="Duration must be positive")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, duration, rate=4: 0 <= rate <= 9, message="Rate must be 0-9")  # type: ignore[misc,arg-type]
+    @deal.pre(lambda self, direction, duration, rate=4: duration > 0, message="Duration must be positive")  # type: ignore[misc,arg-type]
     @deal.post(lambda result: isinstance(result, bool), message="Must return boolean")
     @deal.raises(ValueError)
     def move_for_time(self, direction: Direction | str, duration: float, rate: int = 4) -> bool:
@@ -837,27 +887,27 @@ class NexStarTelescope:
         )
 
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year, timezone, daylight_savings: self.protocol.is_open(),
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: self.protocol.is_open(),
         message="Telescope must be connected",
     )  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year, timezone, daylight_savings: 0 <= hour <= 23,
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: 0 <= hour <= 23,
         message="Hour must be 0-23",
     )  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year, timezone, daylight_savings: 0 <= minute <= 59,
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: 0 <= minute <= 59,
         message="Minute must be 0-59",
     )  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year, timezone, daylight_savings: 0 <= second <= 59,
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: 0 <= second <= 59,
         message="Second must be 0-59",
     )  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year, timezone, daylight_savings: 1 <= month <= 12,
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: 1 <= month <= 12,
         message="Month must be 1-12",
     )  # type: ignore[misc,arg-type]
     @deal.pre(
-        lambda self, hour, minute, second, month, day, year, timezone, daylight_savings: 1 <= day <= 31,
+        lambda self, hour, minute, second, month, day, year, timezone=0, daylight_savings=0: 1 <= day <= 31,
         message="Day must be 1-31",
     )  # type: ignore[misc,arg-type]
     @deal.post(lambda result: result is True, message="Time must be set")
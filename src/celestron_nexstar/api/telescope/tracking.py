@@ -7,32 +7,56 @@ in a background thread with features including:
 - Position history logging
 - Slew speed tracking
 - Collision detection alerts
-- Position export (CSV/JSON)
+- Position export (CSV/JSON/NPZ), streamed from a columnar ring buffer
 - ASCII star chart visualization
+- Shared long-lived connection with fixed-cadence polling
 """
 
 from __future__ import annotations
 
-import csv
-import json
 import threading
 import time
-from collections import deque
 from collections.abc import Callable
-from datetime import datetime
-from typing import Any
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import deal
+
+from celestron_nexstar.api.telescope.position_history import (
+    DEFAULT_HISTORY_CAPACITY,
+    FLAG_SLEWING,
+    FLAG_UNEXPECTED_MOVEMENT,
+    PositionHistory,
+)
+
+
+if TYPE_CHECKING:
+    from celestron_nexstar.api.telescope.connection_pool import ConnectionPool
 
 
 class PositionTracker:
     """Background thread for tracking telescope position."""
 
-    def __init__(self, get_port_func: Callable[[], str | None]) -> None:
+    def __init__(
+        self,
+        get_port_func: Callable[[], str | None],
+        pool: ConnectionPool | None = None,
+        history_capacity: int = DEFAULT_HISTORY_CAPACITY,
+    ) -> None:
         """Initialize the position tracker.
 
         Args:
             get_port_func: Function to get the telescope port (returns str | None)
+            pool: Connection pool to borrow the telescope from (defaults to the shared pool)
+            history_capacity: Number of positions kept in history (up to 10 million)
         """
+        if pool is None:
+            from celestron_nexstar.api.telescope.connection_pool import get_connection_pool
+
+            pool = get_connection_pool()
+
         self.get_port = get_port_func
+        self.pool = pool
         self.enabled = False
         self.running = False
         self.thread: threading.Thread | None = None
@@ -41,8 +65,8 @@ class PositionTracker:
         self.last_position: dict[str, Any] = {}
         self.last_update: datetime | None = None
         self.error_count = 0
-        # Position history using circular buffer
-        self.history: deque[dict[str, Any]] = deque(maxlen=1000)
+        # Position history in a columnar ring buffer (readers never block the loop)
+        self.history = PositionHistory(history_capacity)
         self.history_enabled = True
         # Slew speed tracking
         self.last_velocity: dict[str, float] = {}  # degrees/sec for alt, az; hours/sec for RA
@@ -103,25 +127,28 @@ class PositionTracker:
             since: Return only entries since this timestamp
 
         Returns:
-            List of position history entries
+            List of position history entries (timestamps are timezone-aware UTC)
         """
-        with self.lock:
-            history_list = list(self.history)
+        return self.history.snapshot(last=last or None, since=since).to_dicts()
 
-        # Filter by timestamp if requested
-        if since:
-            history_list = [entry for entry in history_list if entry["timestamp"] >= since]
+    def clear_history(self) -> None:
+        """Clear all position history."""
+        self.history.clear()
 
-        # Limit to last N if requested
-        if last:
-            history_list = history_list[-last:]
+    def set_history_capacity(self, capacity: int) -> bool:
+        """Set how many positions the history keeps.
 
-        return history_list
+        Args:
+            capacity: Number of positions (1 to 10 million); the newest are kept
 
-    def clear_history(self) -> None:
-        """Clear all position history."""
-        with self.lock:
-            self.history.clear()
+        Returns:
+            True if the capacity was set, False if invalid
+        """
+        try:
+            self.history.resize(capacity)
+        except deal.PreContractError:
+            return False
+        return True
 
     def get_history_stats(self) -> dict[str, Any]:
         """Get statistics about the position history.
@@ -129,19 +156,18 @@ class PositionTracker:
         Returns:
             Dictionary with stats: count, duration, drift, etc.
         """
-        with self.lock:
-            history_list = list(self.history)
-
-        if len(history_list) < 2:
+        count = len(self.history)
+        if count < 2:
             return {
-                "count": len(history_list),
+                "count": count,
                 "duration_seconds": 0,
                 "total_ra_drift_arcsec": 0,
                 "total_dec_drift_arcsec": 0,
             }
 
-        first = history_list[0]
-        last = history_list[-1]
+        # Only the two end samples are copied, however long the history is
+        first = self.history.snapshot(first=1).to_dicts()[0]
+        last = self.history.snapshot(last=1).to_dicts()[0]
         duration = (last["timestamp"] - first["timestamp"]).total_seconds()
 
         # Calculate drift in arcseconds
@@ -149,7 +175,7 @@ class PositionTracker:
         dec_drift = abs(last["dec_degrees"] - first["dec_degrees"]) * 3600  # degrees to arcsec
 
         return {
-            "count": len(history_list),
+            "count": count,
             "duration_seconds": duration,
             "first_timestamp": first["timestamp"],
             "last_timestamp": last["timestamp"],
@@ -285,83 +311,60 @@ class PositionTracker:
     def export_history(self, filename: str, format: str = "csv") -> tuple[bool, str]:
         """Export position history to a file.
 
+        The export is streamed from the ring buffer in chunks, so it neither
+        copies the whole history nor blocks the tracking loop.
+
         Args:
             filename: Output file path
-            format: Export format ('csv' or 'json')
+            format: Export format ('csv', 'json' or 'npz')
 
         Returns:
             Tuple of (success, message)
         """
-        with self.lock:
-            history_list = list(self.history)
-
-        if not history_list:
+        exporters = {
+            "csv": self.history.export_csv,
+            "json": self.history.export_json,
+            "npz": self.history.export_npz,
+        }
+        if not self.history:
             return False, "No history to export"
 
-        try:
-            if format.lower() == "csv":
-                with open(filename, "w", newline="") as f:
-                    writer = csv.writer(f)
-                    writer.writerow(["timestamp", "ra_hours", "dec_degrees", "alt_degrees", "az_degrees"])
-                    for entry in history_list:
-                        writer.writerow(
-                            [
-                                entry["timestamp"].isoformat(),
-                                entry["ra_hours"],
-                                entry["dec_degrees"],
-                                entry["alt_degrees"],
-                                entry["az_degrees"],
-                            ]
-                        )
-                return True, f"Exported {len(history_list)} entries to {filename}"
-
-            elif format.lower() == "json":
-                # Convert datetime objects to ISO format for JSON
-                json_data = []
-                for entry in history_list:
-                    json_entry = entry.copy()
-                    json_entry["timestamp"] = entry["timestamp"].isoformat()
-                    json_data.append(json_entry)
-
-                with open(filename, "w") as f:
-                    json.dump(
-                        {"export_time": datetime.now().isoformat(), "count": len(json_data), "positions": json_data},
-                        f,
-                        indent=2,
-                    )
-                return True, f"Exported {len(history_list)} entries to {filename}"
-
-            else:
-                return False, f"Unknown format: {format}. Use 'csv' or 'json'"
+        exporter = exporters.get(format.lower())
+        if exporter is None:
+            return False, f"Unknown format: {format}. Use 'csv', 'json' or 'npz'"
 
+        try:
+            count = exporter(filename)
         except Exception as e:
             return False, f"Export failed: {e}"
+        return True, f"Exported {count} entries to {filename}"
 
     def _track_loop(self) -> None:
         """Background tracking loop."""
+        next_poll = time.monotonic()
         while self.enabled:
             try:
-                # Import here to avoid circular dependencies
-                from celestron_nexstar.api.telescope.telescope import NexStarTelescope
-
+                # Poll on a fixed cadence so the interval is not stretched by command latency
+                next_poll += self.update_interval
                 # Check if we have a connection
                 port = self.get_port()
                 if not port:
                     time.sleep(self.update_interval)
+                    next_poll = time.monotonic()
                     continue
 
                 # Get current position
                 try:
-                    with NexStarTelescope(str(port)) as telescope:
-                        eq_coords = telescope.get_position_ra_dec()
-                        hor_coords = telescope.get_position_alt_az()
-                        ra_hours = eq_coords.ra_hours
-                        dec_degrees = eq_coords.dec_degrees
-                        alt_degrees = hor_coords.altitude
-                        az_degrees = hor_coords.azimuth
+                    with self.pool.session(str(port)) as telescope:
+                        # One pipelined exchange instead of separate RA/Dec and Alt/Az round-trips
+                        snapshot = telescope.get_state()
+                        ra_hours = snapshot.equatorial.ra_hours
+                        dec_degrees = snapshot.equatorial.dec_degrees
+                        alt_degrees = snapshot.horizontal.altitude
+                        az_degrees = snapshot.horizontal.azimuth
 
                         with self.lock:
-                            now = datetime.now()
+                            now = datetime.now(UTC)
                             prev_position = self.last_position.copy()
                             prev_time = self.last_update
 
@@ -377,15 +380,19 @@ class PositionTracker:
                             self.error_count = 0
 
                             # Calculate velocity if we have a previous position
+                            flags = 0
+                            total_speed = 0.0
                             if prev_position and prev_time:
                                 time_delta = (now - prev_time).total_seconds()
                                 self.last_velocity = self._calculate_velocity(prev_position, curr_position, time_delta)
 
                                 # Detect if slewing (velocity > 0.1 deg/sec)
-                                self.is_slewing = self.last_velocity.get("total", 0) > 0.1
+                                total_speed = self.last_velocity.get("total", 0)
+                                self.is_slewing = total_speed > 0.1
+                                if self.is_slewing:
+                                    flags |= FLAG_SLEWING
 
                                 # Check for unexpected movement (collision detection)
-                                total_speed = self.last_velocity.get("total", 0)
                                 if not self.expected_slew and total_speed > self.alert_threshold:
                                     # Alert only once every 5 seconds to prevent spam
                                     should_alert = True
@@ -395,30 +402,13 @@ class PositionTracker:
 
                                     if should_alert:
                                         self.last_alert = now
-                                        # Log alert in history with special marker
-                                        if self.history_enabled:
-                                            self.history.append(
-                                                {
-                                                    "timestamp": now,
-                                                    "ra_hours": ra_hours,
-                                                    "dec_degrees": dec_degrees,
-                                                    "alt_degrees": alt_degrees,
-                                                    "az_degrees": az_degrees,
-                                                    "alert": "UNEXPECTED_MOVEMENT",
-                                                    "speed": total_speed,
-                                                }
-                                            )
+                                        # Mark the sample so history shows the alert
+                                        flags |= FLAG_UNEXPECTED_MOVEMENT
 
                             # Add to history if enabled
                             if self.history_enabled:
-                                self.history.append(
-                                    {
-                                        "timestamp": now,
-                                        "ra_hours": ra_hours,
-                                        "dec_degrees": dec_degrees,
-                                        "alt_degrees": alt_degrees,
-                                        "az_degrees": az_degrees,
-                                    }
+                                self.history.record(
+                                    now, ra_hours, dec_degrees, alt_degrees, az_degrees, speed=total_speed, flags=flags
                                 )
 
                 except Exception:
@@ -429,7 +419,12 @@ class PositionTracker:
                             self.enabled = False
                             self.running = False
 
-                time.sleep(self.update_interval)
+                delay = next_poll - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # Fell behind (slow command); resume cadence from now
+                    next_poll = time.monotonic()
 
             except Exception:
                 # Fatal error in tracking loop
@@ -463,7 +458,7 @@ class PositionTracker:
 
             age = ""
             if self.last_update:
-                seconds_ago = (datetime.now() - self.last_update).total_seconds()
+                seconds_ago = (datetime.now(UTC) - self.last_update).total_seconds()
                 age = " [live]" if seconds_ago < 5 else f" [{int(seconds_ago)}s ago]"
 
             # Add slew speed indicator if moving
@@ -5,6 +5,7 @@ Display current space weather conditions from NOAA SWPC including
 NOAA scales, solar activity, geomagnetic conditions, and alerts.
 """
 
+import asyncio
 from collections import defaultdict
 from datetime import datetime
 
@@ -16,12 +17,14 @@ from rich.table import Table
 from rich.text import Text
 from typer.core import TyperGroup
 
+from celestron_nexstar.api.events.async_space_weather import fetch_space_weather_conditions
 from celestron_nexstar.api.events.space_weather import (
     NOAAScale,
     OvationAuroraForecast,
     get_ovation_aurora_forecast,
-    get_space_weather_conditions,
+    get_ovation_aurora_grid,
 )
+from celestron_nexstar.api.location.observer import get_observer_location
 
 
 class SortedCommandsGroup(TyperGroup):
@@ -66,7 +69,8 @@ def status() -> None:
     console.print("[dim]Data from NOAA Space Weather Prediction Center[/dim]\n")
 
     try:
-        conditions = get_space_weather_conditions()
+        # Run async function - this is a sync entry point, so asyncio.run() is safe
+        conditions = asyncio.run(fetch_space_weather_conditions())
 
         # NOAA Scales Table
         scales_table = Table(title="NOAA Space Weather Scales", show_header=True, header_style="bold")
@@ -201,6 +205,16 @@ def ovation() -> None:
             console.print("[yellow]⚠[/yellow] Ovation aurora forecast data not available.\n")
             return
 
+        # Probability at the observer's site, interpolated from the gridded forecast
+        grid = get_ovation_aurora_grid()
+        if grid is not None:
+            location = get_observer_location()
+            site_percent = grid.probability_at(location.latitude, location.longitude) * 100
+            console.print(
+                f"[bold]At {location.name or 'your location'}:[/bold] {site_percent:.1f}% "
+                f"[dim]({location.latitude:.2f}°, {location.longitude:.2f}°)[/dim]\n"
+            )
+
         # Group forecasts by timestamp
         forecasts_by_time: defaultdict[datetime, list[OvationAuroraForecast]] = defaultdict(list)
         for forecast in forecasts:
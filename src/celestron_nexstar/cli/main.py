@@ -564,13 +564,19 @@ def shell() -> None:
     from prompt_toolkit.key_binding.key_processor import KeyPressEvent
     from prompt_toolkit.styles import Style
 
+    from celestron_nexstar.api.telescope.connection_pool import get_connection_pool, port_key
     from celestron_nexstar.api.telescope.movement import MovementController
     from celestron_nexstar.api.telescope.tracking import PositionTracker
     from celestron_nexstar.cli.tutorial import TutorialSystem
+    from celestron_nexstar.cli.utils.state import get_telescope, telescope_session
 
     # Helper function to get port with correct type
     def get_port() -> str | None:
-        """Get port from state, ensuring correct type."""
+        """Get the pool key of the connected telescope, or the port from state."""
+        telescope = get_telescope()
+        if telescope is not None:
+            # Same key the connection was adopted under (host:port for TCP/IP)
+            return port_key(telescope.config)
         port = state.get("port")
         return port if isinstance(port, str) else None
 
@@ -931,7 +937,7 @@ def shell() -> None:
                             table.add_column("Az", justify="right")
 
                             for entry in history:
-                                timestamp = entry["timestamp"].strftime("%H:%M:%S")
+                                timestamp = entry["timestamp"].astimezone().strftime("%H:%M:%S")
                                 ra = entry["ra_hours"]
                                 dec = entry["dec_degrees"]
                                 alt = entry["alt_degrees"]
@@ -976,9 +982,11 @@ def shell() -> None:
                             duration_min = stats["duration_seconds"] / 60
                             console.print(f"  Duration: [cyan]{duration_min:.1f}[/cyan] minutes")
                             console.print(
-                                f"  First recorded: [dim]{stats['first_timestamp'].strftime('%H:%M:%S')}[/dim]"
+                                f"  First recorded: [dim]{stats['first_timestamp'].astimezone().strftime('%H:%M:%S')}[/dim]"
+                            )
+                            console.print(
+                                f"  Last recorded: [dim]{stats['last_timestamp'].astimezone().strftime('%H:%M:%S')}[/dim]"
                             )
-                            console.print(f"  Last recorded: [dim]{stats['last_timestamp'].strftime('%H:%M:%S')}[/dim]")
                             console.print(
                                 f"  Total RA drift: [yellow]{stats['total_ra_drift_arcsec']:.1f}[/yellow] arcsec"
                             )
@@ -1002,7 +1010,7 @@ def shell() -> None:
 
                 elif subcmd == "export":
                     if len(parts) < 3:
-                        console.print("[yellow]Usage: tracking export <filename> [--format csv|json][/yellow]")
+                        console.print("[yellow]Usage: tracking export <filename> [--format csv|json|npz][/yellow]")
                         console.print("[dim]Default format is CSV[/dim]")
                     else:
                         filename = parts[2]
@@ -1098,8 +1106,10 @@ def shell() -> None:
                 # Construct argv as if called from command line
                 sys.argv = ["nexstar", *args]
 
-                # Call the app without exiting on error
-                app(standalone_mode=False)
+                # Call the app without exiting on error, holding the connection so the
+                # background tracker cannot interleave its commands with this one
+                with telescope_session():
+                    app(standalone_mode=False)
                 command_success = True
 
             except SystemExit as e:
@@ -1147,8 +1157,9 @@ def shell() -> None:
             console.print("\n[bold]Goodbye![/bold]\n")
             break
 
-    # Clean up: stop tracking thread
+    # Clean up: stop tracking thread and close pooled telescope connections
     tracker.stop()
+    get_connection_pool().close_all()
 
 
 if __name__ == "__main__":
@@ -192,7 +192,7 @@ def _goto_selected_object() -> None:
         obj, vis_info = selected
 
         # Check telescope connection
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import get_telescope, telescope_session
 
         telescope = get_telescope()
         session: PromptSession[str] = PromptSession()
@@ -214,7 +214,8 @@ def _goto_selected_object() -> None:
         console.print(f"\n[bold]Slewing to {display_name}[/bold]")
         console.print(f"[dim]RA: {obj.ra_hours:.4f}h, Dec: {obj.dec_degrees:+.4f}°[/dim]\n")
 
-        success = telescope.goto_ra_dec(obj.ra_hours, obj.dec_degrees)
+        with telescope_session():
+            success = telescope.goto_ra_dec(obj.ra_hours, obj.dec_degrees)
         if success:
             console.print("[green]✓[/green] Slew initiated")
             console.print("[dim]Press Enter to return...[/dim]")
@@ -262,17 +263,13 @@ def _connect_telescope_interactive() -> None:
             console.print("[yellow]No port specified[/yellow]")
             return
 
-        # Connect
-        from celestron_nexstar import NexStarTelescope, TelescopeConfig
-
-        console.print(f"\n[dim]Connecting to {port}...[/dim]")
-        config = TelescopeConfig(port=port)
-        telescope = NexStarTelescope(config)
-        telescope.connect()
-
+        # Connect through the pool, so the connection is shared with the tracker and movement controller
+        from celestron_nexstar.api.telescope.connection_pool import get_connection_pool
         from celestron_nexstar.cli.utils.state import set_telescope
 
-        set_telescope(telescope)
+        console.print(f"\n[dim]Connecting to {port}...[/dim]")
+        with get_connection_pool().session(port) as telescope:
+            set_telescope(telescope)
 
         console.print("[green]✓[/green] Connected")
         console.print("[dim]Press Enter to return...[/dim]")
@@ -287,7 +284,7 @@ def _connect_telescope_interactive() -> None:
 def _park_telescope_interactive() -> None:
     """Interactive telescope parking."""
     try:
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import get_telescope, telescope_session
 
         telescope = get_telescope()
         session: PromptSession[str] = PromptSession()
@@ -307,7 +304,8 @@ def _park_telescope_interactive() -> None:
         console.print("\n[dim]Parking telescope...[/dim]")
         # Note: Actual park command depends on telescope model
         # For now, just move to a safe position
-        success = telescope.goto_alt_az(180.0, 0.0)  # South, horizon
+        with telescope_session():
+            success = telescope.goto_alt_az(180.0, 0.0)  # South, horizon
         if success:
             console.print("[green]✓[/green] Telescope parked")
         else:
@@ -325,7 +323,7 @@ def _park_telescope_interactive() -> None:
 def _change_tracking_mode_interactive() -> None:
     """Interactive tracking mode selection."""
     try:
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import get_telescope, telescope_session
 
         telescope = get_telescope()
         session: PromptSession[str] = PromptSession()
@@ -360,7 +358,8 @@ def _change_tracking_mode_interactive() -> None:
             return
 
         mode = mode_map[choice]
-        telescope.set_tracking_mode(mode)
+        with telescope_session():
+            telescope.set_tracking_mode(mode)
         console.print(f"[green]✓[/green] Tracking mode set to {mode.value}")
         console.print("[dim]Press Enter to return...[/dim]")
         session.prompt("")
@@ -394,20 +393,20 @@ def _show_settings_dialog() -> None:
         console.print("")
 
         # Telescope connection status
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import telescope_session
 
-        telescope = get_telescope()
         console.print("[bold]Telescope:[/bold]")
-        if telescope and telescope.protocol and telescope.protocol.is_open():
-            console.print("  [green]✓[/green] Connected")
-            try:
-                info = telescope.get_info()
-                console.print(f"  Model: {info.model}")
-                console.print(f"  Firmware: {info.firmware_major}.{info.firmware_minor}")
-            except Exception:
-                pass
-        else:
-            console.print("  [yellow]✗[/yellow] Not connected")
+        with telescope_session() as telescope:
+            if telescope is not None:
+                console.print("  [green]✓[/green] Connected")
+                try:
+                    info = telescope.get_info()
+                    console.print(f"  Model: {info.model}")
+                    console.print(f"  Firmware: {info.firmware_major}.{info.firmware_minor}")
+                except Exception:
+                    pass
+            else:
+                console.print("  [yellow]✗[/yellow] Not connected")
         console.print("")
 
         session: PromptSession[str] = PromptSession()
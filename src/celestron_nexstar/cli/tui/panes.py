@@ -205,62 +205,62 @@ def get_dataset_info() -> FormattedText:
         lines.append(("", "\n"))
 
         try:
-            from celestron_nexstar.cli.utils.state import get_telescope
+            from celestron_nexstar.cli.utils.state import telescope_session
 
-            telescope = get_telescope()
-            if telescope and telescope.protocol and telescope.protocol.is_open():
-                # Connection status
-                lines.append(("green", "  Connected\n"))
-                lines.append(("", "\n"))
-
-                # Get position
-                try:
-                    ra_dec = telescope.get_position_ra_dec()
-                    alt_az = telescope.get_position_alt_az()
-
-                    # Format RA
-                    ra_h = int(ra_dec.ra_hours)
-                    ra_m = int((ra_dec.ra_hours - ra_h) * 60)
-                    ra_s = int(((ra_dec.ra_hours - ra_h) * 60 - ra_m) * 60)
-
-                    # Format Dec
-                    dec_d = int(ra_dec.dec_degrees)
-                    dec_m = int((abs(ra_dec.dec_degrees) - abs(dec_d)) * 60)
-                    dec_s = int(((abs(ra_dec.dec_degrees) - abs(dec_d)) * 60 - dec_m) * 60)
-                    dec_dir = "N" if ra_dec.dec_degrees >= 0 else "S"
-
-                    lines.append(("", "Position (RA/Dec):\n"))
-                    lines.append(("cyan", f"  RA:  {ra_h:02d}h {ra_m:02d}m {ra_s:02d}s\n"))
-                    lines.append(("cyan", f"  Dec: {abs(dec_d):02d}° {dec_m:02d}' {dec_s:02d}\" {dec_dir}\n"))
-                    lines.append(("", "\n"))
-
-                    lines.append(("", "Position (Alt/Az):\n"))
-                    lines.append(("cyan", f"  Alt: {alt_az.altitude:5.1f}°\n"))
-                    lines.append(("cyan", f"  Az:  {alt_az.azimuth:5.1f}°\n"))
+            with telescope_session() as telescope:
+                if telescope is not None:
+                    # Connection status
+                    lines.append(("green", "  Connected\n"))
                     lines.append(("", "\n"))
 
-                except Exception:
-                    lines.append(("yellow", "  Position: Unavailable\n"))
-                    lines.append(("", "\n"))
+                    # Get position
+                    try:
+                        ra_dec = telescope.get_position_ra_dec()
+                        alt_az = telescope.get_position_alt_az()
+
+                        # Format RA
+                        ra_h = int(ra_dec.ra_hours)
+                        ra_m = int((ra_dec.ra_hours - ra_h) * 60)
+                        ra_s = int(((ra_dec.ra_hours - ra_h) * 60 - ra_m) * 60)
+
+                        # Format Dec
+                        dec_d = int(ra_dec.dec_degrees)
+                        dec_m = int((abs(ra_dec.dec_degrees) - abs(dec_d)) * 60)
+                        dec_s = int(((abs(ra_dec.dec_degrees) - abs(dec_d)) * 60 - dec_m) * 60)
+                        dec_dir = "N" if ra_dec.dec_degrees >= 0 else "S"
+
+                        lines.append(("", "Position (RA/Dec):\n"))
+                        lines.append(("cyan", f"  RA:  {ra_h:02d}h {ra_m:02d}m {ra_s:02d}s\n"))
+                        lines.append(("cyan", f"  Dec: {abs(dec_d):02d}° {dec_m:02d}' {dec_s:02d}\" {dec_dir}\n"))
+                        lines.append(("", "\n"))
+
+                        lines.append(("", "Position (Alt/Az):\n"))
+                        lines.append(("cyan", f"  Alt: {alt_az.altitude:5.1f}°\n"))
+                        lines.append(("cyan", f"  Az:  {alt_az.azimuth:5.1f}°\n"))
+                        lines.append(("", "\n"))
+
+                    except Exception:
+                        lines.append(("yellow", "  Position: Unavailable\n"))
+                        lines.append(("", "\n"))
+
+                    # Get tracking mode
+                    try:
+                        tracking_mode_num = telescope.protocol.get_tracking_mode()
+                        tracking_modes = {
+                            0: "Off",
+                            1: "Alt-Az",
+                            2: "EQ North",
+                            3: "EQ South",
+                        }
+                        tracking_name = tracking_modes.get(tracking_mode_num, f"Unknown ({tracking_mode_num})")
+                        lines.append(("", "Tracking: "))
+                        lines.append(("cyan", f"{tracking_name}\n"))
+                    except Exception:
+                        lines.append(("yellow", "  Tracking: Unknown\n"))
 
-                # Get tracking mode
-                try:
-                    tracking_mode_num = telescope.protocol.get_tracking_mode()
-                    tracking_modes = {
-                        0: "Off",
-                        1: "Alt-Az",
-                        2: "EQ North",
-                        3: "EQ South",
-                    }
-                    tracking_name = tracking_modes.get(tracking_mode_num, f"Unknown ({tracking_mode_num})")
-                    lines.append(("", "Tracking: "))
-                    lines.append(("cyan", f"{tracking_name}\n"))
-                except Exception:
-                    lines.append(("yellow", "  Tracking: Unknown\n"))
-
-            else:
-                lines.append(("dim", "  Not connected\n"))
-                lines.append(("dim", "  Press 'c' to connect\n"))
+                else:
+                    lines.append(("dim", "  Not connected\n"))
+                    lines.append(("dim", "  Press 'c' to connect\n"))
 
         except Exception as e:
             lines.append(("yellow", f"Status: Error ({str(e)[:30]})\n"))
@@ -329,24 +329,42 @@ def get_conditions_info() -> FormattedText:
     # Location
     try:
         from celestron_nexstar.api.location.observer import get_observer_location
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import telescope_session
 
         # Check if telescope has location
-        telescope = get_telescope()
-        if telescope and telescope.protocol and telescope.protocol.is_open():
-            try:
-                telescope_location = telescope.get_location()
-                if telescope_location and telescope_location.latitude != 0.0 and telescope_location.longitude != 0.0:
-                    # Use telescope location
-                    lat = telescope_location.latitude
-                    lon = telescope_location.longitude
-                    lat_dir = "N" if lat >= 0 else "S"
-                    lon_dir = "E" if lon >= 0 else "W"
-                    lines.append(("", "Location:\n"))
-                    lines.append(("cyan", f"  {abs(lat):.4f}°{lat_dir}, {abs(lon):.4f}°{lon_dir}\n"))
-                    lines.append(("dim", "  (from telescope GPS)\n"))
-            except Exception:
-                # Fall back to observer location
+        with telescope_session() as telescope:
+            if telescope is not None:
+                try:
+                    telescope_location = telescope.get_location()
+                    if (
+                        telescope_location
+                        and telescope_location.latitude != 0.0
+                        and telescope_location.longitude != 0.0
+                    ):
+                        # Use telescope location
+                        lat = telescope_location.latitude
+                        lon = telescope_location.longitude
+                        lat_dir = "N" if lat >= 0 else "S"
+                        lon_dir = "E" if lon >= 0 else "W"
+                        lines.append(("", "Location:\n"))
+                        lines.append(("cyan", f"  {abs(lat):.4f}°{lat_dir}, {abs(lon):.4f}°{lon_dir}\n"))
+                        lines.append(("dim", "  (from telescope GPS)\n"))
+                except Exception:
+                    # Fall back to observer location
+                    location = get_observer_location()
+                    if location:
+                        lat = location.latitude
+                        lon = location.longitude
+                        lat_dir = "N" if lat >= 0 else "S"
+                        lon_dir = "E" if lon >= 0 else "W"
+                        lines.append(("", "Location:\n"))
+                        if location.name:
+                            lines.append(("cyan", f"  {location.name}\n"))
+                        lines.append(("", f"  {abs(lat):.4f}°{lat_dir}, {abs(lon):.4f}°{lon_dir}\n"))
+                    else:
+                        lines.append(("yellow", "Location: Not set\n"))
+            else:
+                # No telescope, use observer location
                 location = get_observer_location()
                 if location:
                     lat = location.latitude
@@ -359,20 +377,6 @@ def get_conditions_info() -> FormattedText:
                     lines.append(("", f"  {abs(lat):.4f}°{lat_dir}, {abs(lon):.4f}°{lon_dir}\n"))
                 else:
                     lines.append(("yellow", "Location: Not set\n"))
-        else:
-            # No telescope, use observer location
-            location = get_observer_location()
-            if location:
-                lat = location.latitude
-                lon = location.longitude
-                lat_dir = "N" if lat >= 0 else "S"
-                lon_dir = "E" if lon >= 0 else "W"
-                lines.append(("", "Location:\n"))
-                if location.name:
-                    lines.append(("cyan", f"  {location.name}\n"))
-                lines.append(("", f"  {abs(lat):.4f}°{lat_dir}, {abs(lon):.4f}°{lon_dir}\n"))
-            else:
-                lines.append(("yellow", "Location: Not set\n"))
     except Exception as e:
         lines.append(("yellow", f"Location: Error ({e})\n"))
 
@@ -405,18 +409,22 @@ def get_conditions_info() -> FormattedText:
     moon_observer_lon = None
     try:
         from celestron_nexstar.api.location.observer import get_observer_location
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import telescope_session
 
         # Try telescope GPS first
-        telescope = get_telescope()
-        if telescope and telescope.protocol and telescope.protocol.is_open():
-            try:
-                telescope_location = telescope.get_location()
-                if telescope_location and telescope_location.latitude != 0.0 and telescope_location.longitude != 0.0:
-                    moon_observer_lat = telescope_location.latitude
-                    moon_observer_lon = telescope_location.longitude
-            except Exception:
-                pass
+        with telescope_session() as telescope:
+            if telescope is not None:
+                try:
+                    telescope_location = telescope.get_location()
+                    if (
+                        telescope_location
+                        and telescope_location.latitude != 0.0
+                        and telescope_location.longitude != 0.0
+                    ):
+                        moon_observer_lat = telescope_location.latitude
+                        moon_observer_lon = telescope_location.longitude
+                except Exception:
+                    pass
 
         # Fall back to observer location
         if moon_observer_lat is None or moon_observer_lon is None:
@@ -504,27 +512,27 @@ def get_conditions_info() -> FormattedText:
         # Get location for weather
         weather_location = None
         try:
-            from celestron_nexstar.cli.utils.state import get_telescope
-
-            telescope = get_telescope()
-            if telescope and telescope.protocol and telescope.protocol.is_open():
-                try:
-                    telescope_location = telescope.get_location()
-                    if (
-                        telescope_location
-                        and telescope_location.latitude != 0.0
-                        and telescope_location.longitude != 0.0
-                    ):
-                        # Create ObserverLocation from telescope location
-                        from celestron_nexstar.api.location.observer import ObserverLocation
-
-                        weather_location = ObserverLocation(
-                            latitude=telescope_location.latitude,
-                            longitude=telescope_location.longitude,
-                            elevation=0.0,  # GeographicLocation doesn't have elevation
-                        )
-                except Exception:
-                    pass
+            from celestron_nexstar.cli.utils.state import telescope_session
+
+            with telescope_session() as telescope:
+                if telescope is not None:
+                    try:
+                        telescope_location = telescope.get_location()
+                        if (
+                            telescope_location
+                            and telescope_location.latitude != 0.0
+                            and telescope_location.longitude != 0.0
+                        ):
+                            # Create ObserverLocation from telescope location
+                            from celestron_nexstar.api.location.observer import ObserverLocation
+
+                            weather_location = ObserverLocation(
+                                latitude=telescope_location.latitude,
+                                longitude=telescope_location.longitude,
+                                elevation=0.0,  # GeographicLocation doesn't have elevation
+                            )
+                    except Exception:
+                        pass
 
             if weather_location is None:
                 weather_location = get_observer_location()
@@ -658,20 +666,20 @@ def get_conditions_info() -> FormattedText:
         # Get location for light pollution (same logic as weather)
         lp_location = None
         try:
-            from celestron_nexstar.cli.utils.state import get_telescope
-
-            telescope = get_telescope()
-            if telescope and telescope.protocol and telescope.protocol.is_open():
-                try:
-                    telescope_location = telescope.get_location()
-                    if (
-                        telescope_location
-                        and telescope_location.latitude != 0.0
-                        and telescope_location.longitude != 0.0
-                    ):
-                        lp_location = (telescope_location.latitude, telescope_location.longitude)
-                except Exception:
-                    pass
+            from celestron_nexstar.cli.utils.state import telescope_session
+
+            with telescope_session() as telescope:
+                if telescope is not None:
+                    try:
+                        telescope_location = telescope.get_location()
+                        if (
+                            telescope_location
+                            and telescope_location.latitude != 0.0
+                            and telescope_location.longitude != 0.0
+                        ):
+                            lp_location = (telescope_location.latitude, telescope_location.longitude)
+                    except Exception:
+                        pass
 
             if lp_location is None:
                 location = get_observer_location()
@@ -768,21 +776,21 @@ def get_visible_objects_info() -> FormattedText:
         observer_lon = None
 
         try:
-            from celestron_nexstar.cli.utils.state import get_telescope
-
-            telescope = get_telescope()
-            if telescope and telescope.protocol and telescope.protocol.is_open():
-                try:
-                    telescope_location = telescope.get_location()
-                    if (
-                        telescope_location
-                        and telescope_location.latitude != 0.0
-                        and telescope_location.longitude != 0.0
-                    ):
-                        observer_lat = telescope_location.latitude
-                        observer_lon = telescope_location.longitude
-                except Exception:
-                    pass
+            from celestron_nexstar.cli.utils.state import telescope_session
+
+            with telescope_session() as telescope:
+                if telescope is not None:
+                    try:
+                        telescope_location = telescope.get_location()
+                        if (
+                            telescope_location
+                            and telescope_location.latitude != 0.0
+                            and telescope_location.longitude != 0.0
+                        ):
+                            observer_lat = telescope_location.latitude
+                            observer_lon = telescope_location.longitude
+                    except Exception:
+                        pass
         except Exception:
             pass
 
@@ -995,20 +1003,20 @@ def get_status_info() -> FormattedText:
 
     # Telescope position if connected
     try:
-        from celestron_nexstar.cli.utils.state import get_telescope
+        from celestron_nexstar.cli.utils.state import telescope_session
 
-        telescope = get_telescope()
-        if telescope and telescope.protocol and telescope.protocol.is_open():
-            try:
-                ra_dec = telescope.get_position_ra_dec()
-                alt_az = telescope.get_position_alt_az()
-                lines.append(("cyan", f"RA:{ra_dec.ra_hours:6.2f}h "))
-                lines.append(("cyan", f"Dec:{ra_dec.dec_degrees:6.2f}° "))
-                lines.append(("cyan", f"Alt:{alt_az.altitude:5.1f}° "))
-                lines.append(("cyan", f"Az:{alt_az.azimuth:5.1f}° "))
-                lines.append(("", " | "))
-            except Exception:
-                pass
+        with telescope_session() as telescope:
+            if telescope is not None:
+                try:
+                    ra_dec = telescope.get_position_ra_dec()
+                    alt_az = telescope.get_position_alt_az()
+                    lines.append(("cyan", f"RA:{ra_dec.ra_hours:6.2f}h "))
+                    lines.append(("cyan", f"Dec:{ra_dec.dec_degrees:6.2f}° "))
+                    lines.append(("cyan", f"Alt:{alt_az.altitude:5.1f}° "))
+                    lines.append(("cyan", f"Az:{alt_az.azimuth:5.1f}° "))
+                    lines.append(("", " | "))
+                except Exception:
+                    pass
     except Exception:
         pass
 
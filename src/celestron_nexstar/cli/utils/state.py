@@ -5,6 +5,7 @@ Manages telescope connection state across CLI commands.
 """
 
 import contextlib
+from collections.abc import Iterator
 from typing import Any
 
 import typer
@@ -12,6 +13,7 @@ from rich.console import Console
 from rich.prompt import Prompt
 
 from celestron_nexstar import NexStarTelescope, TelescopeConfig
+from celestron_nexstar.api.telescope.connection_pool import get_connection_pool, port_key
 from celestron_nexstar.cli.utils.output import print_error, print_info
 
 
@@ -26,15 +28,37 @@ def get_telescope() -> NexStarTelescope | None:
 
 
 def set_telescope(telescope: NexStarTelescope) -> None:
-    """Set the telescope instance."""
+    """Set the telescope instance and share its connection through the connection pool."""
     global _telescope
     _telescope = telescope
+    get_connection_pool().adopt(port_key(telescope.config), telescope)
+
+
+@contextlib.contextmanager
+def telescope_session() -> Iterator[NexStarTelescope | None]:
+    """
+    Borrow the connected telescope through the connection pool.
+
+    The pool lock for the telescope's port is held for the whole session, so
+    commands sent inside it cannot interleave with the position tracker or
+    the movement controller.
+
+    Yields:
+        Connected telescope, or None if no telescope is connected
+    """
+    telescope = _telescope
+    if telescope is None or not telescope.protocol or not telescope.protocol.is_open():
+        yield None
+        return
+    with get_connection_pool().session(port_key(telescope.config)) as pooled:
+        yield pooled
 
 
 def clear_telescope() -> None:
     """Clear the telescope instance."""
     global _telescope
     if _telescope is not None:
+        get_connection_pool().release(port_key(_telescope.config))
         with contextlib.suppress(Exception):
             _telescope.disconnect()
     _telescope = None
@@ -63,6 +87,8 @@ def ensure_connected() -> NexStarTelescope:
             print_info("Telescope connection lost. Attempting to reconnect...")
             try:
                 _telescope.connect()
+                # The pool drops connections that fail, so share the reconnected one again
+                set_telescope(_telescope)
                 print_info("Reconnected successfully")
                 return _telescope
             except Exception as e:
@@ -111,6 +137,7 @@ def ensure_connected() -> NexStarTelescope:
         with console.status(f"[bold blue]Connecting to telescope on {connection_desc}...", spinner="dots"):
             _telescope = NexStarTelescope(config)
             _telescope.connect()
+        set_telescope(_telescope)
         print_info(f"Connected to telescope on {connection_desc}")
         return _telescope
     except Exception as e:
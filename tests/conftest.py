@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture
+def benchmark_stats(benchmark):
+    """
+    Timing statistics of the test's benchmark, once it has run.
+
+    Returns a callable so the benchmarked code runs (and its results are
+    checked) first. With --benchmark-disable there are no timings, so the
+    call skips the test's timing checks.
+    """
+
+    def stats():
+        if benchmark.disabled or benchmark.stats is None:
+            pytest.skip("benchmark timings are disabled")
+        return benchmark.stats.stats
+
+    return stats
@@ -0,0 +1,183 @@
+"""
+Unit tests for async_space_weather.py
+
+Tests the concurrent SWPC aggregator against a local aiohttp server standing
+in for NOAA: parallel fetching, per-feed TTLs, stale-while-revalidate and
+fallback paths.
+"""
+
+import asyncio
+import time
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from celestron_nexstar.api.events.async_space_weather import (
+    SWPC_FEEDS,
+    AsyncSpaceWeatherClient,
+    fetch_space_weather_conditions,
+)
+
+
+PAYLOADS = {
+    "/products/solar-wind/plasma-7-day.json": [
+        ["time_tag", "density", "speed", "temperature"],
+        ["2024-10-14 12:00:00.000", "5.2", "650.0", "100000"],
+    ],
+    "/products/solar-wind/mag-7-day.json": [
+        ["time_tag", "bt", "bz", "phi", "theta"],
+        ["2024-10-14 12:00:00.000", "8.1", "-6.5", "0", "0"],
+    ],
+    "/json/goes/goes-xrs-report.json": [{"time_tag": "2024-10-14T12:00:00Z", "flux": "1.5e-4", "class": "X1.5"}],
+    "/json/goes/goes-proton-flux.json": [{"time_tag": "2024-10-14T12:00:00Z", "flux_10mev": "150"}],
+    "/products/noaa-planetary-k-index-forecast.json": [
+        ["time_tag", "kp", "observed", "noaa_scale"],
+        ["2024-10-14 09:00:00", "6.33", "observed", "G2"],
+    ],
+    "/json/radio_flux/daily_flux.json": [{"time_tag": "2024-10-14T00:00:00Z", "flux": "180.5"}],
+}
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAsyncSpaceWeatherClient(unittest.IsolatedAsyncioTestCase):
+    """Test suite for AsyncSpaceWeatherClient"""
+
+    async def asyncSetUp(self):
+        """Start a local SWPC stand-in that counts requests per path"""
+        self.payloads = dict(PAYLOADS)
+        self.hits: dict[str, int] = {}
+        self.delay = 0.0
+
+        async def handler(request):
+            self.hits[request.path] = self.hits.get(request.path, 0) + 1
+            await asyncio.sleep(self.delay)
+            if request.path not in self.payloads:
+                raise web.HTTPNotFound()
+            return web.json_response(self.payloads[request.path])
+
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+        self.clock = FakeClock()
+
+    def client(self, **kwargs):
+        """Create a client with a private cache pointed at the stand-in"""
+        return AsyncSpaceWeatherClient(
+            base_url=str(self.server.make_url("")), shared_cache=False, clock=self.clock, **kwargs
+        )
+
+    async def test_conditions_match_feeds(self):
+        """Test every feed is parsed into conditions and NOAA scales"""
+        async with self.client() as client:
+            conditions = await client.get_conditions()
+        self.assertEqual(conditions.solar_wind_speed, 650.0)
+        self.assertEqual(conditions.solar_wind_bz, -6.5)
+        self.assertEqual(conditions.xray_class, "X1.5")
+        self.assertEqual(conditions.kp_index, 6.33)
+        self.assertEqual(conditions.radio_flux_107, 180.5)
+        self.assertEqual(conditions.g_scale.level, 2)
+        self.assertEqual(conditions.r_scale.level, 3)
+        self.assertEqual(conditions.s_scale.level, 2)
+        self.assertIn("High solar wind speed detected", conditions.alerts)
+
+    async def test_feeds_are_fetched_concurrently(self):
+        """Test latency is set by the slowest feed, not the sum"""
+        self.delay = 0.2
+        async with self.client() as client:
+            started = time.perf_counter()
+            await client.get_conditions()
+            elapsed = time.perf_counter() - started
+        self.assertLess(elapsed, 0.2 * len(SWPC_FEEDS) / 2)
+        self.assertEqual(sum(self.hits.values()), len(SWPC_FEEDS))
+
+    async def test_fresh_payloads_are_cached(self):
+        """Test feeds within their TTL are not fetched again"""
+        async with self.client() as client:
+            await client.get_conditions()
+            self.clock.now += 120.0
+            await client.get_conditions()
+        self.assertEqual(self.hits["/products/noaa-planetary-k-index-forecast.json"], 1)
+        self.assertEqual(self.hits["/products/solar-wind/plasma-7-day.json"], 2)
+
+    async def test_stale_while_revalidate(self):
+        """Test an expired payload is served at once and refreshed in the background"""
+        async with self.client() as client:
+            await client.get_feed("kp")
+            self.payloads["/products/noaa-planetary-k-index-forecast.json"] = [
+                ["time_tag", "kp", "observed", "noaa_scale"],
+                ["2024-10-14 12:00:00", "7.0", "observed", "G3"],
+            ]
+            self.clock.now += 1000.0
+            self.delay = 0.2
+            started = time.perf_counter()
+            stale = await client.get_feed("kp")
+            self.assertLess(time.perf_counter() - started, 0.1)
+            self.assertEqual(stale[1][1], "6.33")
+        self.assertEqual(self.hits["/products/noaa-planetary-k-index-forecast.json"], 2)
+
+    async def test_refresh_updates_cache(self):
+        """Test closing waits for the background refresh to store the new payload"""
+        client = self.client()
+        await client.get_feed("kp")
+        self.payloads["/products/noaa-planetary-k-index-forecast.json"] = [["time_tag"], ["new", "7.0", "observed"]]
+        self.clock.now += 1000.0
+        await client.get_feed("kp")
+        await client.close()
+        self.assertEqual(await client.get_feed("kp"), [["time_tag"], ["new", "7.0", "observed"]])
+        await client.close()
+
+    async def test_too_stale_payload_waits_for_fetch(self):
+        """Test payloads past max_stale_seconds are refetched before returning"""
+        async with self.client(max_stale_seconds=500.0) as client:
+            await client.get_feed("kp")
+            self.payloads["/products/noaa-planetary-k-index-forecast.json"] = [["time_tag"], ["new"]]
+            self.clock.now += 1000.0
+            self.assertEqual(await client.get_feed("kp"), [["time_tag"], ["new"]])
+
+    async def test_failed_fetch_serves_last_payload(self):
+        """Test an unreachable feed falls back to its last payload, or None"""
+        async with self.client(max_stale_seconds=0.0) as client:
+            await client.get_feed("kp")
+            del self.payloads["/products/noaa-planetary-k-index-forecast.json"]
+            self.clock.now += 1000.0
+            self.assertEqual(await client.get_feed("kp"), PAYLOADS["/products/noaa-planetary-k-index-forecast.json"])
+            self.payloads.clear()
+            self.assertIsNone(await client.get_feed("plasma"))
+
+    async def test_fallback_path(self):
+        """Test the proton feed falls back to its alternative endpoint"""
+        self.payloads["/products/goes/goes-proton-flux.json"] = self.payloads.pop("/json/goes/goes-proton-flux.json")
+        async with self.client() as client:
+            conditions = await client.get_conditions()
+        self.assertEqual(conditions.s_scale.level, 2)
+        self.assertEqual(self.hits["/json/goes/goes-proton-flux.json"], 1)
+
+    async def test_concurrent_requests_share_one_fetch(self):
+        """Test simultaneous requests for a feed make one HTTP request"""
+        self.delay = 0.05
+        async with self.client() as client:
+            results = await asyncio.gather(*(client.get_feed("xrays") for _ in range(5)))
+        self.assertEqual(len({str(result) for result in results}), 1)
+        self.assertEqual(self.hits["/json/goes/goes-xrs-report.json"], 1)
+
+    async def test_fetch_space_weather_conditions(self):
+        """Test the module-level helper uses the given client"""
+        async with self.client() as client:
+            conditions = await fetch_space_weather_conditions(client)
+        self.assertEqual(conditions.kp_index, 6.33)
+
+
+if __name__ == "__main__":
+    unittest.main()
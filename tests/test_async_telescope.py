@@ -0,0 +1,369 @@
+"""
+Unit tests for async_protocol.py and async_telescope.py
+
+Tests AsyncNexStarProtocol and AsyncNexStarTelescope against fake mounts
+served on the event loop over loopback TCP and a pseudo-terminal.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from typing import ClassVar
+
+from celestron_nexstar.api.core.enums import Direction
+from celestron_nexstar.api.core.exceptions import NotConnectedError, TelescopeTimeoutError
+from celestron_nexstar.api.core.types import TelescopeConfig, TrackingMode
+from celestron_nexstar.api.telescope.async_protocol import AsyncNexStarProtocol
+from celestron_nexstar.api.telescope.async_telescope import AsyncNexStarTelescope
+
+
+class _AsyncFakeMount:
+    """Fake mount answering NexStar commands on an asyncio TCP server"""
+
+    RESPONSES: ClassVar[dict[bytes, bytes]] = {
+        b"Kx": b"x#",
+        b"V": b"4\x15#",
+        b"m": b"\x0b#",
+        b"E": b"34AB0500,12CE0500#",
+        b"Z": b"40000000,10000000#",
+        b"L": b"0#",
+        b"t": b"\x01#",
+        b"w": b"1C71C71CCB425ED0#",
+        b"h": b"\x0c\x1e\x00\x0a\x0e\x18\x00\x00#",
+    }
+
+    def __init__(self, reply_delay=0.0):
+        self.reply_delay = reply_delay
+        self.commands = []
+        self.server = None
+
+    async def start(self):
+        """Start listening on an ephemeral loopback port and return it"""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop the server"""
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                command = (await reader.readuntil(b"#"))[:-1]
+                self.commands.append(command)
+                if self.reply_delay:
+                    await asyncio.sleep(self.reply_delay)
+                writer.write(self.RESPONSES.get(command, b"#"))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _tcp_config(port, timeout=2.0):
+    return TelescopeConfig(connection_type="tcp", host="127.0.0.1", tcp_port=port, timeout=timeout)
+
+
+class TestAsyncNexStarProtocol(unittest.TestCase):
+    """Test suite for AsyncNexStarProtocol over loopback TCP"""
+
+    def setUp(self):
+        """Skip connection settle delays"""
+        self.settle = AsyncNexStarProtocol.TCP_SETTLE_TIME, AsyncNexStarProtocol.SERIAL_SETTLE_TIME
+        AsyncNexStarProtocol.TCP_SETTLE_TIME = 0.0
+        AsyncNexStarProtocol.SERIAL_SETTLE_TIME = 0.0
+
+    def tearDown(self):
+        """Restore connection settle delays"""
+        AsyncNexStarProtocol.TCP_SETTLE_TIME, AsyncNexStarProtocol.SERIAL_SETTLE_TIME = self.settle
+
+    def test_send_command_and_transaction(self):
+        """Test single commands and pipelined transactions"""
+
+        async def run():
+            mount = _AsyncFakeMount()
+            port = await mount.start()
+            protocol = AsyncNexStarProtocol(connection_type="tcp", host="127.0.0.1", tcp_port=port)
+            self.assertFalse(protocol.is_open())
+            await protocol.open()
+            self.assertTrue(protocol.is_open())
+
+            self.assertEqual(await protocol.send_command("V"), "4\x15")
+            self.assertEqual(await protocol.transaction(["E", "L", "t"]), ["34AB0500,12CE0500", "0", "\x01"])
+            self.assertEqual(await protocol.transaction([]), [])
+            self.assertEqual(mount.commands, [b"V", b"E", b"L", b"t"])
+            self.assertEqual(protocol.get_latency_stats()["count"], 2)
+
+            await protocol.close()
+            self.assertFalse(protocol.is_open())
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_timeout(self):
+        """Test a missing response raises TelescopeTimeoutError"""
+
+        async def run():
+            mount = _AsyncFakeMount(reply_delay=0.5)
+            port = await mount.start()
+            protocol = AsyncNexStarProtocol(connection_type="tcp", host="127.0.0.1", tcp_port=port, timeout=0.05)
+            await protocol.open()
+            with self.assertRaises(TelescopeTimeoutError):
+                await protocol.send_command("L")
+            await protocol.close()
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_late_reply_after_timeout(self):
+        """Test a reply arriving after a timeout is not taken as the next command's response"""
+
+        async def run():
+            mount = _AsyncFakeMount(reply_delay=0.2)
+            port = await mount.start()
+            protocol = AsyncNexStarProtocol(connection_type="tcp", host="127.0.0.1", tcp_port=port, timeout=0.1)
+            await protocol.open()
+            with self.assertRaises(TelescopeTimeoutError):
+                await protocol.send_command("L")
+
+            # Let the late "0#" reply to L arrive, then ask something else
+            await asyncio.sleep(0.2)
+            mount.reply_delay = 0.0
+            self.assertEqual(await protocol.send_command("V"), "4\x15")
+            await protocol.close()
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_transaction_shares_one_deadline(self):
+        """Test the timeout covers the whole transaction rather than each response"""
+
+        async def run():
+            mount = _AsyncFakeMount(reply_delay=0.06)
+            port = await mount.start()
+            protocol = AsyncNexStarProtocol(connection_type="tcp", host="127.0.0.1", tcp_port=port, timeout=0.15)
+            await protocol.open()
+            started = time.monotonic()
+            with self.assertRaises(TelescopeTimeoutError):
+                await protocol.transaction(["E", "L", "t", "V"])
+            self.assertLess(time.monotonic() - started, 0.2)
+            await protocol.close()
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_reconnect_failure(self):
+        """Test commands on an unreachable host raise NotConnectedError"""
+
+        async def run():
+            mount = _AsyncFakeMount()
+            port = await mount.start()
+            await mount.stop()
+            protocol = AsyncNexStarProtocol(connection_type="tcp", host="127.0.0.1", tcp_port=port, timeout=0.5)
+            with self.assertRaises(NotConnectedError):
+                await protocol.send_command("L")
+            self.assertFalse(await protocol.echo())
+
+        asyncio.run(run())
+
+    def test_concurrent_commands_are_serialised(self):
+        """Test tasks sharing one connection each get their own response"""
+
+        async def run():
+            mount = _AsyncFakeMount()
+            port = await mount.start()
+            protocol = AsyncNexStarProtocol(connection_type="tcp", host="127.0.0.1", tcp_port=port)
+            await protocol.open()
+            responses = await asyncio.gather(*(protocol.send_command(c) for c in ["V", "L", "t", "Kx"] * 5))
+            self.assertEqual(responses, ["4\x15", "0", "\x01", "x"] * 5)
+            await protocol.close()
+            await mount.stop()
+
+        asyncio.run(run())
+
+    @unittest.skipUnless(sys.platform.startswith("linux") or sys.platform == "darwin", "requires a pty")
+    def test_serial_pty_round_trip(self):
+        """Test the non-blocking serial path against a fake mount on a pseudo-terminal"""
+        master_fd, slave_fd = os.openpty()
+        self.addCleanup(os.close, master_fd)
+        commands = []
+
+        def serve():
+            pending = b""
+            while True:
+                try:
+                    data = os.read(master_fd, 64)
+                except OSError:
+                    return
+                if not data:
+                    return
+                pending += data
+                while b"#" in pending:
+                    command, pending = pending.split(b"#", 1)
+                    commands.append(command)
+                    time.sleep(0.2)
+                    os.write(master_fd, _AsyncFakeMount.RESPONSES.get(command, b"#"))
+
+        async def run():
+            protocol = AsyncNexStarProtocol(port=os.ttyname(slave_fd), timeout=2.0)
+            await protocol.open()
+            os.close(slave_fd)
+            threading.Thread(target=serve, daemon=True).start()
+
+            # The loop stays free to run other tasks while the reply is pending
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticking = asyncio.create_task(ticker())
+            cpu_start = time.process_time()
+            self.assertEqual(await protocol.send_command("Kx"), "x")
+            cpu_used = time.process_time() - cpu_start
+            ticking.cancel()
+
+            self.assertEqual(commands, [b"Kx"])
+            self.assertGreaterEqual(protocol.last_round_trip, 0.2)
+            self.assertGreater(ticks, 5)
+            self.assertLess(cpu_used, 0.1)
+            await protocol.close()
+
+        asyncio.run(run())
+
+
+class TestAsyncNexStarTelescope(unittest.TestCase):
+    """Test suite for AsyncNexStarTelescope against fake TCP mounts"""
+
+    def setUp(self):
+        """Skip connection settle delays"""
+        self.settle = AsyncNexStarProtocol.TCP_SETTLE_TIME
+        AsyncNexStarProtocol.TCP_SETTLE_TIME = 0.0
+
+    def tearDown(self):
+        """Restore connection settle delays"""
+        AsyncNexStarProtocol.TCP_SETTLE_TIME = self.settle
+
+    def test_queries(self):
+        """Test the read-only methods decode mount responses"""
+
+        async def run():
+            mount = _AsyncFakeMount()
+            port = await mount.start()
+            async with AsyncNexStarTelescope(_tcp_config(port)) as telescope:
+                info = await telescope.get_info()
+                self.assertEqual((info.model, info.firmware_major, info.firmware_minor), (11, 52, 21))
+                self.assertEqual(await telescope.get_version(), (52, 21))
+                self.assertEqual(await telescope.get_model(), 11)
+
+                position = await telescope.get_position_ra_dec()
+                self.assertAlmostEqual(position.ra_hours, 4.9376, places=3)
+                horizontal = await telescope.get_position_alt_az()
+                self.assertAlmostEqual(horizontal.azimuth, 90.0, places=3)
+                self.assertAlmostEqual(horizontal.altitude, 22.5, places=3)
+
+                state = await telescope.get_state()
+                self.assertFalse(state.is_slewing)
+                self.assertEqual(state.tracking_mode, TrackingMode.ALT_AZ)
+                self.assertEqual(state.equatorial, position)
+                self.assertFalse(await telescope.is_slewing())
+                self.assertEqual(await telescope.get_tracking_mode(), TrackingMode.ALT_AZ)
+
+                location = await telescope.get_location()
+                self.assertAlmostEqual(location.latitude, 40.0, places=3)
+                self.assertAlmostEqual(location.longitude, -74.1667, places=3)
+                self.assertEqual((await telescope.get_time()).year, 2024)
+            self.assertFalse(telescope.protocol.is_open())
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_commands(self):
+        """Test movement and setter methods send the expected commands"""
+
+        async def run():
+            mount = _AsyncFakeMount()
+            port = await mount.start()
+            async with AsyncNexStarTelescope(_tcp_config(port)) as telescope:
+                self.assertTrue(await telescope.goto_alt_az(90.0, 45.0))
+                self.assertTrue(await telescope.goto_ra_dec(12.0, 45.0))
+                self.assertTrue(await telescope.sync_ra_dec(12.0, 45.0))
+                self.assertTrue(await telescope.cancel_goto())
+                self.assertTrue(await telescope.set_tracking_mode(TrackingMode.EQ_NORTH))
+                self.assertTrue(await telescope.set_location(40.0, -74.0))
+                self.assertTrue(await telescope.set_time(12, 30, 0, 10, 14, 2024))
+
+                mount.commands.clear()
+                self.assertTrue(await telescope.move_for_time("up-left", duration=0.01, rate=5))
+                self.assertEqual(
+                    mount.commands,
+                    [
+                        b"P\x02\x11\x05\x00\x00\x00",
+                        b"P\x01\x11\x05\x00\x00\x00",
+                        b"P\x01\x11\x00\x00\x00\x00",
+                        b"P\x02\x11\x00\x00\x00\x00",
+                    ],
+                )
+                with self.assertRaises(ValueError):
+                    await telescope.move_fixed(Direction.UP_LEFT)
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_move_does_not_block_loop(self):
+        """Test timed moves sleep asynchronously"""
+
+        async def run():
+            mount = _AsyncFakeMount()
+            port = await mount.start()
+            async with AsyncNexStarTelescope(_tcp_config(port)) as telescope:
+                start = time.perf_counter()
+                results = await asyncio.gather(
+                    telescope.move_for_time(Direction.UP, duration=0.2),
+                    telescope.move_for_time(Direction.LEFT, duration=0.2),
+                )
+                elapsed = time.perf_counter() - start
+            self.assertEqual(results, [True, True])
+            self.assertLess(elapsed, 0.35)
+            await mount.stop()
+
+        asyncio.run(run())
+
+    def test_many_mounts_concurrently(self):
+        """Test one event loop drives several slow mounts in parallel"""
+
+        async def run():
+            mounts = [_AsyncFakeMount(reply_delay=0.1) for _ in range(5)]
+            ports = [await mount.start() for mount in mounts]
+            telescopes = [AsyncNexStarTelescope(_tcp_config(port)) for port in ports]
+            await asyncio.gather(*(telescope.connect() for telescope in telescopes))
+
+            start = time.perf_counter()
+            states = await asyncio.gather(*(telescope.get_position_alt_az() for telescope in telescopes))
+            elapsed = time.perf_counter() - start
+
+            self.assertEqual(len(states), 5)
+            # Five sequential round-trips would take at least 0.5 s
+            self.assertLess(elapsed, 0.3)
+            await asyncio.gather(*(telescope.disconnect() for telescope in telescopes))
+            for mount in mounts:
+                await mount.stop()
+
+        asyncio.run(run())
+
+    def test_string_config(self):
+        """Test a port string creates a serial configuration"""
+        telescope = AsyncNexStarTelescope("/dev/ttyUSB1")
+        self.assertEqual(telescope.config.port, "/dev/ttyUSB1")
+        self.assertEqual(telescope.protocol.connection_type, "serial")
+
+
+if __name__ == "__main__":
+    unittest.main()
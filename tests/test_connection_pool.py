@@ -0,0 +1,222 @@
+"""
+Unit tests for connection_pool.py
+
+Tests ConnectionPool for shared, long-lived telescope connections.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from celestron_nexstar.api.core.exceptions import TelescopeConnectionError, TelescopeTimeoutError
+from celestron_nexstar.api.core.types import TelescopeConfig
+from celestron_nexstar.api.telescope.connection_pool import (
+    ConnectionPool,
+    _default_factory,
+    get_connection_pool,
+    port_key,
+)
+from celestron_nexstar.cli.utils import state as cli_state
+
+
+class TestConnectionPool(unittest.TestCase):
+    """Test suite for ConnectionPool class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.telescopes = []
+
+        def factory(port):
+            telescope = MagicMock()
+            telescope.port = port
+            telescope.protocol.is_open.return_value = True
+            self.telescopes.append(telescope)
+            return telescope
+
+        self.pool = ConnectionPool(factory=factory)
+
+    def test_session_opens_once_and_reuses(self):
+        """Test the connection is opened on first use and then reused"""
+        with self.pool.session("/dev/ttyUSB0") as first:
+            pass
+        with self.pool.session("/dev/ttyUSB0") as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.telescopes), 1)
+        first.connect.assert_called_once()
+        first.disconnect.assert_not_called()
+
+    def test_one_connection_per_port(self):
+        """Test each port gets its own connection"""
+        with self.pool.session("/dev/ttyUSB0") as first, self.pool.session("/dev/ttyUSB1") as second:
+            self.assertIsNot(first, second)
+
+        self.assertEqual(sorted(self.pool.ports()), ["/dev/ttyUSB0", "/dev/ttyUSB1"])
+
+    def test_reconnects_after_connection_error(self):
+        """Test a connection error drops the connection and the next session reconnects"""
+        with self.assertRaises(TelescopeTimeoutError), self.pool.session("/dev/ttyUSB0"):
+            raise TelescopeTimeoutError("no response")
+
+        self.telescopes[0].disconnect.assert_called_once()
+        self.assertEqual(self.pool.ports(), [])
+
+        with self.pool.session("/dev/ttyUSB0") as telescope:
+            self.assertIs(telescope, self.telescopes[1])
+
+    def test_reconnects_when_port_closed(self):
+        """Test a connection closed underneath the pool is reopened"""
+        with self.pool.session("/dev/ttyUSB0") as telescope:
+            telescope.protocol.is_open.return_value = False
+
+        with self.pool.session("/dev/ttyUSB0") as telescope:
+            self.assertIs(telescope, self.telescopes[1])
+
+    def test_other_errors_keep_connection(self):
+        """Test non-connection errors do not drop the connection"""
+        with self.assertRaises(ValueError), self.pool.session("/dev/ttyUSB0"):
+            raise ValueError("bad direction")
+
+        self.assertEqual(self.pool.ports(), ["/dev/ttyUSB0"])
+        self.telescopes[0].disconnect.assert_not_called()
+
+    def test_connect_failure_propagates(self):
+        """Test a failed connect raises and leaves nothing pooled"""
+        pool = ConnectionPool(
+            factory=MagicMock(return_value=MagicMock(**{"connect.side_effect": TelescopeConnectionError("x")}))
+        )
+
+        with self.assertRaises(TelescopeConnectionError), pool.session("/dev/ttyUSB0"):
+            pass
+
+        self.assertEqual(pool.ports(), [])
+
+    def test_sessions_are_serialised(self):
+        """Test concurrent sessions on one port never overlap"""
+        active = []
+        overlaps = []
+
+        def worker():
+            for _ in range(20):
+                with self.pool.session("/dev/ttyUSB0"):
+                    active.append(1)
+                    if len(active) > 1:
+                        overlaps.append(1)
+                    time.sleep(0.0005)
+                    active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(overlaps, [])
+        self.assertEqual(len(self.telescopes), 1)
+
+    def test_adopt_existing_connection(self):
+        """Test adopting a telescope connected elsewhere"""
+        telescope = MagicMock()
+        self.pool.adopt("/dev/ttyUSB0", telescope)
+
+        with self.pool.session("/dev/ttyUSB0") as borrowed:
+            self.assertIs(borrowed, telescope)
+        self.assertEqual(self.telescopes, [])
+
+    def test_release_and_close_all(self):
+        """Test releasing connections closes them"""
+        with self.pool.session("/dev/ttyUSB0"), self.pool.session("/dev/ttyUSB1"):
+            pass
+
+        self.pool.release("/dev/ttyUSB0")
+        self.telescopes[0].disconnect.assert_called_once()
+        self.assertEqual(self.pool.ports(), ["/dev/ttyUSB1"])
+
+        self.pool.close_all()
+        self.telescopes[1].disconnect.assert_called_once()
+        self.assertEqual(self.pool.ports(), [])
+
+    def test_get_connection_pool_singleton(self):
+        """Test the process-wide pool is a singleton"""
+        self.assertIs(get_connection_pool(), get_connection_pool())
+
+
+class TestTelescopeSession(unittest.TestCase):
+    """Test suite for sharing the CLI telescope through the pool"""
+
+    def setUp(self):
+        """Use a private pool and a connected TCP/IP telescope"""
+        self.pool = ConnectionPool(factory=MagicMock())
+        patcher = patch.object(cli_state, "get_connection_pool", return_value=self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(cli_state.clear_telescope)
+
+        self.telescope = MagicMock()
+        self.telescope.config = TelescopeConfig(connection_type="tcp", host="10.0.0.5", tcp_port=4030)
+        self.telescope.protocol.is_open.return_value = True
+
+    def test_no_telescope(self):
+        """Test the session yields None when nothing is connected"""
+        with cli_state.telescope_session() as telescope:
+            self.assertIsNone(telescope)
+
+    def test_shares_adopted_connection(self):
+        """Test the session yields the adopted telescope under its host:port key"""
+        cli_state.set_telescope(self.telescope)
+
+        with cli_state.telescope_session() as telescope:
+            self.assertIs(telescope, self.telescope)
+        with self.pool.session("10.0.0.5:4030") as pooled:
+            self.assertIs(pooled, self.telescope)
+        self.pool.factory.assert_not_called()
+
+    def test_session_excludes_pool_users(self):
+        """Test pool sessions on the same port wait for the CLI session to end"""
+        cli_state.set_telescope(self.telescope)
+        events = []
+
+        def tracker():
+            with self.pool.session("10.0.0.5:4030"):
+                events.append("tracker")
+
+        with cli_state.telescope_session():
+            thread = threading.Thread(target=tracker)
+            thread.start()
+            time.sleep(0.05)
+            events.append("cli")
+        thread.join()
+
+        self.assertEqual(events, ["cli", "tracker"])
+
+
+class TestPortKey(unittest.TestCase):
+    """Test suite for pool keys and the default factory"""
+
+    def test_port_key_serial(self):
+        """Test serial configs are keyed by device path"""
+        self.assertEqual(port_key(TelescopeConfig(port="/dev/ttyUSB1")), "/dev/ttyUSB1")
+
+    def test_port_key_tcp(self):
+        """Test TCP/IP configs are keyed by host:port"""
+        config = TelescopeConfig(connection_type="tcp", host="10.0.0.5", tcp_port=4030)
+        self.assertEqual(port_key(config), "10.0.0.5:4030")
+
+    def test_default_factory_tcp(self):
+        """Test host:port keys create TCP/IP telescopes"""
+        telescope = _default_factory("10.0.0.5:4030")
+        self.assertEqual(telescope.config.connection_type, "tcp")
+        self.assertEqual(telescope.config.host, "10.0.0.5")
+        self.assertEqual(telescope.config.tcp_port, 4030)
+
+    def test_default_factory_serial(self):
+        """Test device paths create serial telescopes"""
+        telescope = _default_factory("COM3")
+        self.assertEqual(telescope.config.connection_type, "serial")
+        self.assertEqual(telescope.config.port, "COM3")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,236 @@
+"""
+Unit tests for database.py and name_index.py
+
+Tests CatalogDatabase full-text search and name autocompletion against a
+temporary SQLite database.
+"""
+
+import asyncio
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import deal
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+from celestron_nexstar.api.database.database import CatalogDatabase
+from celestron_nexstar.api.database.models import CelestialObjectModel
+from celestron_nexstar.api.database.name_index import NameIndex
+
+
+OBJECTS = [
+    {"name": "M31", "common_name": "Andromeda Galaxy", "description": "Spiral galaxy in Andromeda"},
+    {"name": "M32", "common_name": None, "description": "Satellite of the Andromeda Galaxy"},
+    {"name": "M42", "common_name": "Orion Nebula", "description": "Emission nebula"},
+    {"name": "M57", "common_name": "Ring Nebula", "description": "Planetary nebula in Lyra"},
+    {"name": "NGC 7000", "common_name": "North America Nebula", "description": "Emission nebula in Cygnus"},
+]
+
+TRIGRAM_MIGRATION = (
+    Path(__file__).resolve().parents[1] / "alembic" / "versions" / "20250202000000_add_objects_trigram_index.py"
+)
+
+
+def _run_trigram_migration(sync_conn, direction="upgrade"):
+    """Run the trigram index migration against a connection"""
+    spec = importlib.util.spec_from_file_location("trigram_migration", TRIGRAM_MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    with Operations.context(MigrationContext.configure(sync_conn)):
+        getattr(migration, direction)()
+
+
+class _DatabaseTestCase(unittest.TestCase):
+    """Base class creating a temporary database holding OBJECTS"""
+
+    # Whether the trigram index migration runs before OBJECTS are inserted
+    migrate_trigram = True
+
+    def setUp(self):
+        """Create a database holding a handful of objects"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db = CatalogDatabase(Path(self.tmp.name) / "catalogs.db")
+        self.addCleanup(lambda: asyncio.run(self.db.close()))
+        asyncio.run(self._populate())
+
+    async def _populate(self):
+        async with self.db._engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: CelestialObjectModel.__table__.create(sync_conn))
+            if self.migrate_trigram:
+                await conn.run_sync(_run_trigram_migration)
+        await self.db.insert_objects_batch(
+            [
+                {**obj, "catalog": "messier", "ra_hours": 1.0, "dec_degrees": 10.0, "object_type": "nebula"}
+                for obj in OBJECTS
+            ]
+        )
+
+
+class TestCatalogDatabaseSearch(_DatabaseTestCase):
+    """Test suite for CatalogDatabase.search"""
+
+    def _names(self, query, **kwargs):
+        return [obj.name for obj in asyncio.run(self.db.search(query, **kwargs))]
+
+    def test_ranked_prefers_name_matches(self):
+        """Test common-name hits rank above description-only hits"""
+        self.assertEqual(self._names("andromeda"), ["M31", "M32"])
+
+    def test_prefix_mode(self):
+        """Test every word may be a prefix in prefix mode"""
+        self.assertEqual(self._names("andro gal"), [])
+        self.assertEqual(self._names("andro gal", mode="prefix"), ["M31", "M32"])
+
+    def test_fuzzy_mode_tolerates_typos(self):
+        """Test fuzzy mode finds misspelled names through the trigram index"""
+        self.assertEqual(self._names("orian nebla", mode="fuzzy")[0], "M42")
+        self.assertEqual(self._names("ring nebla", mode="fuzzy")[0], "M57")
+
+    def test_fuzzy_index_follows_inserts(self):
+        """Test objects inserted after the trigram index exists are found"""
+        self.assertEqual(self._names("veil", mode="fuzzy"), [])
+        asyncio.run(self.db.insert_object("NGC 6960", "ngc", 20.8, 30.7, "nebula", common_name="Veil Nebula"))
+        self.assertEqual(self._names("veil", mode="fuzzy"), ["NGC 6960"])
+
+    def test_pagination(self):
+        """Test offset and limit page through the ranked results"""
+        everything = self._names("nebula")
+        self.assertEqual(len(everything), 3)
+        pages = self._names("nebula", limit=2) + self._names("nebula", limit=2, offset=2)
+        self.assertEqual(pages, everything)
+
+    def test_query_syntax_is_literal(self):
+        """Test FTS5 operators and punctuation in queries are not parsed"""
+        self.assertEqual(self._names('"ring" (nebula*'), ["M57"])
+        self.assertEqual(self._names("NGC-7000"), ["NGC 7000"])
+        self.assertEqual(self._names("***"), [])
+
+    def test_fts_readiness_is_memoised(self):
+        """Test the index check runs once per engine and resets on close"""
+        self._names("ring")
+        self.assertEqual(self.db._fts_state, {"objects_fts": True})
+        asyncio.run(self.db.close())
+        self.assertEqual(self.db._fts_state, {})
+
+    def test_invalid_arguments(self):
+        """Test search argument contracts"""
+        with self.assertRaises(deal.PreContractError):
+            asyncio.run(self.db.search("ring", mode="regex"))
+        with self.assertRaises(deal.PreContractError):
+            asyncio.run(self.db.search("ring", offset=-1))
+
+
+class TestTrigramMigration(_DatabaseTestCase):
+    """Test suite for the trigram index migration and its readiness probe"""
+
+    migrate_trigram = False
+
+    def _migrate(self, direction):
+        async def run():
+            async with self.db._engine.begin() as conn:
+                await conn.run_sync(_run_trigram_migration, direction)
+
+        asyncio.run(run())
+
+    def _names(self, query):
+        return [obj.name for obj in asyncio.run(self.db.search(query, mode="fuzzy"))]
+
+    def test_upgrade_backfills_existing_objects(self):
+        """Test fuzzy search falls back to prefix until the migration indexes the existing objects"""
+        self.assertFalse(asyncio.run(self.db.has_trigram_table()))
+        self.assertEqual(self._names("orian nebla"), [])
+
+        self._migrate("upgrade")
+        self.assertTrue(asyncio.run(self.db.has_trigram_table()))
+        self.assertEqual(self._names("orian nebla")[0], "M42")
+        # Idempotent over an index created by an older release
+        self._migrate("upgrade")
+        self.assertEqual(self._names("orian nebla")[0], "M42")
+
+    def test_downgrade_drops_index_and_triggers(self):
+        """Test downgrade removes the table and its triggers"""
+        self._migrate("upgrade")
+        self._migrate("downgrade")
+
+        async def leftovers():
+            async with self.db._engine.connect() as conn:
+                result = await conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE name LIKE 'objects_trigram%'")
+                return result.fetchall()
+
+        self.assertEqual(asyncio.run(leftovers()), [])
+        asyncio.run(self.db.insert_object("NGC 6960", "ngc", 20.8, 30.7, "nebula", common_name="Veil Nebula"))
+
+
+class TestNameIndex(unittest.TestCase):
+    """Test suite for NameIndex"""
+
+    def test_complete(self):
+        """Test case-insensitive prefix completion in alphabetical order"""
+        index = NameIndex(["M31", "Mizar", "m101", "Andromeda Galaxy", None, " ", "M31"])
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.complete("m"), ["m101", "M31", "Mizar"])
+        self.assertEqual(index.complete("M3"), ["M31"])
+        self.assertEqual(index.complete("m", limit=2), ["m101", "M31"])
+        self.assertEqual(index.complete("x"), [])
+        self.assertEqual(index.complete(""), ["Andromeda Galaxy", "m101", "M31", "Mizar"])
+
+    def test_cache_round_trip(self):
+        """Test a saved index loads only with a matching fingerprint"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "names.json"
+            self.assertIsNone(NameIndex.load(path, [1]))
+            NameIndex(["Vega", "Véga"], fingerprint=[1, "2024"]).save(path)
+            self.assertEqual(NameIndex.load(path, [1, "2024"]).complete("v"), ["Vega", "Véga"])
+            self.assertIsNone(NameIndex.load(path, [2, "2024"]))
+            path.write_text("not json")
+            self.assertIsNone(NameIndex.load(path, [1, "2024"]))
+
+
+class TestCatalogDatabaseCompletion(_DatabaseTestCase):
+    """Test suite for CatalogDatabase name completion"""
+
+    def _complete(self, prefix, limit=50):
+        return asyncio.run(self.db.get_names_for_completion(prefix, limit))
+
+    def test_completes_names_and_common_names(self):
+        """Test both name fields are completed"""
+        self.assertEqual(self._complete("m"), ["M31", "M32", "M42", "M57"])
+        self.assertEqual(self._complete("n"), ["NGC 7000", "North America Nebula"])
+        self.assertEqual(self._complete("or"), ["Orion Nebula"])
+
+    def test_index_is_cached_to_file(self):
+        """Test the index is persisted and reused by a new database instance"""
+        self._complete("m")
+        self.assertTrue(self.db.name_index_path.exists())
+
+        other = CatalogDatabase(self.db.db_path)
+        self.addCleanup(lambda: asyncio.run(other.close()))
+        with patch.object(NameIndex, "__init__", side_effect=AssertionError("rebuilt")):
+            self.assertEqual(asyncio.run(other.get_names_for_completion("ring")), ["Ring Nebula"])
+
+    def test_insert_invalidates_index(self):
+        """Test inserted objects show up in completion"""
+        self.assertEqual(self._complete("veil"), [])
+        asyncio.run(self.db.insert_object("NGC 6960", "ngc", 20.8, 30.7, "nebula", common_name="Veil Nebula"))
+        self.assertFalse(self.db.name_index_path.exists())
+        self.assertEqual(self._complete("veil"), ["Veil Nebula"])
+
+    def test_stale_cache_is_rebuilt(self):
+        """Test a cache written before another process changed the data is ignored"""
+        self._complete("m")
+        other = CatalogDatabase(self.db.db_path)
+        self.addCleanup(lambda: asyncio.run(other.close()))
+        # Simulate an import that bypassed this instance (and its invalidation)
+        self.db.name_index_path.rename(self.db.name_index_path.with_suffix(".bak"))
+        asyncio.run(self.db.insert_object("M45", "messier", 3.8, 24.1, "cluster", common_name="Pleiades"))
+        self.db.name_index_path.with_suffix(".bak").rename(self.db.name_index_path)
+
+        self.assertEqual(asyncio.run(other.get_names_for_completion("p")), ["Pleiades"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Unit tests for ephemeris.py
+
+Tests the batched multi-time planetary position API and its per-minute
+result cache.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import deal
+import numpy as np
+
+from celestron_nexstar.api.ephemeris import ephemeris
+from celestron_nexstar.api.ephemeris.ephemeris import clear_planetary_position_cache, get_planetary_positions
+
+
+START = datetime(2024, 1, 15, 0, 0, tzinfo=UTC)
+
+
+def _fake_compute(planet_key, minutes, observer_lat, observer_lon):
+    """Rows whose values encode the minute, so lookups can be checked"""
+    minutes = np.asarray(minutes, dtype=np.float64)
+    return np.vstack(
+        [
+            minutes % 24,
+            np.full_like(minutes, 10.0),
+            minutes % 90,
+            minutes % 360,
+            np.ones_like(minutes),
+            np.zeros_like(minutes),
+        ]
+    )
+
+
+class TestGetPlanetaryPositions(unittest.TestCase):
+    """Test suite for get_planetary_positions"""
+
+    def setUp(self):
+        """Patch the Skyfield computation and start with an empty cache"""
+        clear_planetary_position_cache()
+        self.addCleanup(clear_planetary_position_cache)
+        patcher = patch.object(ephemeris, "_compute_positions", side_effect=_fake_compute)
+        self.compute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_one_call_per_body(self):
+        """Test each body is computed once for all times"""
+        times = [START + timedelta(minutes=10 * i) for i in range(12)]
+        positions = get_planetary_positions(["Mars", "jupiter", "MARS"], times, 40.0, -100.0)
+        self.assertEqual(set(positions), {"mars", "jupiter"})
+        self.assertEqual(self.compute.call_count, 2)
+        mars = positions["mars"]
+        self.assertEqual(len(mars), 12)
+        self.assertEqual(mars.times[1] - mars.times[0], 600.0)
+        np.testing.assert_array_equal(mars.ra_hours, (mars.times / 60.0) % 24)
+
+    def test_times_are_rounded_to_the_minute(self):
+        """Test times within a minute share a result"""
+        positions = get_planetary_positions(
+            ["venus"], [START + timedelta(seconds=10), START - timedelta(seconds=20)], 40.0, -100.0
+        )
+        self.assertTrue(np.all(positions["venus"].times == START.timestamp()))
+        (minutes,) = self.compute.call_args.args[1:2]
+        self.assertEqual(len(minutes), 1)
+
+    def test_cache_only_computes_new_minutes(self):
+        """Test overlapping requests reuse cached minutes"""
+        get_planetary_positions(["saturn"], [START + timedelta(minutes=i) for i in range(5)], 40.0, -100.0)
+        positions = get_planetary_positions(
+            ["saturn"], [START + timedelta(minutes=i) for i in range(3, 8)], 40.0, -100.0
+        )
+        np.testing.assert_array_equal(
+            self.compute.call_args.args[1], np.array([5, 6, 7]) + int(START.timestamp() // 60)
+        )
+        self.assertEqual(len(positions["saturn"]), 5)
+        # A different location is a different cache entry
+        get_planetary_positions(["saturn"], START, 41.0, -100.0)
+        self.assertEqual(self.compute.call_count, 3)
+
+    def test_single_datetime_and_naive_times(self):
+        """Test a lone datetime is accepted and naive times are UTC"""
+        positions = get_planetary_positions(["neptune"], START.replace(tzinfo=None), 40.0, -100.0)
+        self.assertEqual(positions["neptune"].times[0], START.timestamp())
+
+    def test_unknown_body(self):
+        """Test the name contract"""
+        with self.assertRaises(deal.PreContractError):
+            get_planetary_positions(["vulcan"], START, 40.0, -100.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
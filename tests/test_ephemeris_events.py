@@ -0,0 +1,142 @@
+"""
+Unit tests for ephemeris_events.py and the solar_system caches
+
+Tests crossing detection with Skyfield's search on synthetic altitude
+curves (no ephemeris files needed), the twilight band lookups, and the
+event-table and moon/sun information caches.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+from skyfield.api import load
+
+from celestron_nexstar.api.astronomy import ephemeris_events, solar_system
+from celestron_nexstar.api.astronomy.ephemeris_events import (
+    SUN_THRESHOLDS,
+    AltitudeCrossings,
+    EphemerisEvents,
+    find_altitude_crossings,
+    get_ephemeris_events,
+)
+
+
+START = datetime(2024, 3, 20, 0, 0, tzinfo=UTC)
+ts = load.timescale(builtin=True)
+
+
+def _sun_like(t):
+    """Altitude peaking at +40° at 12:00 UTC and bottoming at -40° at midnight"""
+    hours = (np.asarray(t.tt) - ts.from_datetime(START).tt) * 24.0
+    return -40.0 * np.cos(2.0 * np.pi * hours / 24.0)
+
+
+class TestFindAltitudeCrossings(unittest.TestCase):
+    """Test suite for find_altitude_crossings"""
+
+    def setUp(self):
+        """Search two days of the synthetic curve"""
+        self.crossings = find_altitude_crossings(ts, _sun_like, START, START + timedelta(days=2), SUN_THRESHOLDS)
+
+    def test_crossing_times(self):
+        """Test each threshold is crossed once per day each way, at the right time"""
+        for threshold in SUN_THRESHOLDS:
+            self.assertEqual(len(self.crossings.rising[threshold]), 2)
+            self.assertEqual(len(self.crossings.setting[threshold]), 2)
+            # -40 cos(2 pi h / 24) = threshold
+            hours = np.degrees(np.arccos(-threshold / 40.0)) / 15.0
+            expected = START + timedelta(hours=float(hours))
+            self.assertLess(abs(self.crossings.rising[threshold][0] - expected), timedelta(seconds=2))
+            expected = START + timedelta(hours=24.0 - float(hours))
+            self.assertLess(abs(self.crossings.setting[threshold][0] - expected), timedelta(seconds=2))
+
+    def test_next_and_previous(self):
+        """Test looking up the crossings around a time"""
+        noon = START + timedelta(hours=12)
+        sunset = self.crossings.next(0.0, noon, rising=False)
+        self.assertEqual(sunset, self.crossings.setting[0.0][0])
+        self.assertEqual(self.crossings.previous(0.0, noon, rising=True), self.crossings.rising[0.0][0])
+        self.assertIsNone(self.crossings.previous(0.0, START, rising=True))
+        self.assertIsNone(self.crossings.next(0.0, START + timedelta(days=2), rising=True))
+
+
+class TestSunBand(unittest.TestCase):
+    """Test suite for EphemerisEvents.sun_band"""
+
+    def setUp(self):
+        """Build a table from the synthetic curve"""
+        crossings = find_altitude_crossings(ts, _sun_like, START, START + timedelta(days=3), SUN_THRESHOLDS)
+        self.events = EphemerisEvents(0.0, 0.0, START, START + timedelta(days=3), crossings, None)
+        self.crossings = crossings
+
+    def test_band_from_noon(self):
+        """Test the evening and next morning passages through the golden hour band"""
+        noon = START + timedelta(hours=12)
+        evening_start, evening_end, morning_start, morning_end = self.events.sun_band(0.0, 6.0, noon)
+        self.assertEqual(evening_start, self.crossings.setting[6.0][0])
+        self.assertEqual(evening_end, self.crossings.setting[0.0][0])
+        self.assertEqual(morning_start, self.crossings.rising[0.0][1])
+        self.assertEqual(morning_end, self.crossings.rising[6.0][1])
+        self.assertLess(evening_start, evening_end)
+        self.assertLess(morning_start, morning_end)
+
+    def test_band_already_entered(self):
+        """Test a passage already under way has no start"""
+        inside = self.crossings.setting[-12.0][0] + timedelta(minutes=1)
+        evening_start, evening_end, _, _ = self.events.sun_band(-18.0, -12.0, inside)
+        self.assertIsNone(evening_start)
+        self.assertEqual(evening_end, self.crossings.setting[-18.0][0])
+
+
+class TestEventCache(unittest.TestCase):
+    """Test suite for get_ephemeris_events caching"""
+
+    def setUp(self):
+        """Start with empty caches"""
+        solar_system.clear_solar_system_cache()
+        self.addCleanup(solar_system.clear_solar_system_cache)
+
+    def test_tables_are_shared_per_day_and_rounded_location(self):
+        """Test nearby calls reuse one table and another day computes a new one"""
+        empty = AltitudeCrossings({}, {})
+        with patch.object(
+            ephemeris_events,
+            "_compute_events",
+            side_effect=lambda lat, lon, start, bodies: EphemerisEvents(lat, lon, start, start, empty, None),
+        ) as compute:
+            first = get_ephemeris_events(40.001, -74.002, START + timedelta(hours=3), ())
+            self.assertIs(get_ephemeris_events(40.003, -74.0, START + timedelta(hours=20), ()), first)
+            self.assertEqual(compute.call_count, 1)
+            self.assertEqual(first.start, START)
+            get_ephemeris_events(40.0, -74.0, START + timedelta(days=1), ())
+            self.assertEqual(compute.call_count, 2)
+
+
+class TestInfoMemoization(unittest.TestCase):
+    """Test suite for get_sun_info/get_moon_info memoization"""
+
+    def setUp(self):
+        """Start with empty caches"""
+        solar_system.clear_solar_system_cache()
+        self.addCleanup(solar_system.clear_solar_system_cache)
+
+    def test_same_minute_is_shared(self):
+        """Test calls within a minute share a result and later ones recompute"""
+        with patch.object(solar_system, "_compute_sun_info", return_value=MagicMock()) as compute:
+            first = solar_system.get_sun_info(40.0, -74.0, START + timedelta(seconds=5))
+            self.assertIs(solar_system.get_sun_info(40.0, -74.0, START + timedelta(seconds=50)), first)
+            solar_system.get_sun_info(40.0, -74.0, START + timedelta(minutes=1))
+            self.assertEqual(compute.call_count, 2)
+
+    def test_failures_are_not_cached(self):
+        """Test a None result is retried on the next call"""
+        with patch.object(solar_system, "_compute_moon_info", return_value=None) as compute:
+            self.assertIsNone(solar_system.get_moon_info(40.0, -74.0, START))
+            self.assertIsNone(solar_system.get_moon_info(40.0, -74.0, START))
+            self.assertEqual(compute.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for registry.py
+
+Tests that the shared timescale, kernels and body handles load once, that
+failed loads are retried, and that load timings are recorded.
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from celestron_nexstar.api.ephemeris.registry import EphemerisRegistry, get_ephemeris_registry, get_timescale
+
+
+class FakeKernel(dict):
+    """Kernel stand-in that counts body lookups"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lookups = 0
+
+    def __getitem__(self, name):
+        self.lookups += 1
+        return super().__getitem__(name)
+
+
+class TestEphemerisRegistry(unittest.TestCase):
+    """Test suite for EphemerisRegistry"""
+
+    def setUp(self):
+        """Patch the Skyfield loader with a counting fake"""
+        self.kernel = FakeKernel(earth="EARTH", moon="MOON")
+        self.loader = MagicMock(return_value=self.kernel)
+        self.loader.timescale.return_value = "TIMESCALE"
+        patcher = patch("celestron_nexstar.api.ephemeris.registry.get_skyfield_loader", return_value=self.loader)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = EphemerisRegistry()
+
+    def test_timescale_loads_once(self):
+        """Test the timescale is built on first use and then shared"""
+        self.assertEqual(self.registry.timescale(), "TIMESCALE")
+        self.assertEqual(self.registry.timescale(), "TIMESCALE")
+        self.loader.timescale.assert_called_once()
+
+    def test_kernels_and_bodies_load_once(self):
+        """Test each kernel is opened and each body resolved only once"""
+        self.assertIs(self.registry.kernel("de421.bsp"), self.kernel)
+        self.assertEqual(self.registry.bodies("de421.bsp", "earth", "moon"), ("EARTH", "MOON"))
+        self.assertEqual(self.registry.body("de421.bsp", "earth"), "EARTH")
+        self.loader.assert_called_once_with("de421.bsp")
+        self.assertEqual(self.kernel.lookups, 2)
+
+    def test_failures_are_not_cached(self):
+        """Test a missing kernel or body is retried on the next request"""
+        self.loader.side_effect = [FileNotFoundError("de421.bsp"), self.kernel]
+        with self.assertRaises(FileNotFoundError):
+            self.registry.kernel("de421.bsp")
+        self.assertIs(self.registry.kernel("de421.bsp"), self.kernel)
+        with self.assertRaises(KeyError):
+            self.registry.body("de421.bsp", "sun")
+        self.kernel["sun"] = "SUN"
+        self.assertEqual(self.registry.body("de421.bsp", "sun"), "SUN")
+
+    def test_warm_up_records_timings(self):
+        """Test warm-up loads everything, skips missing files and reports timings"""
+
+        def load(name):
+            if name != "de421.bsp":
+                raise FileNotFoundError(name)
+            return self.kernel
+
+        self.loader.side_effect = load
+        timings = self.registry.warm_up(["de421.bsp", "jup365.bsp"])
+        self.assertEqual(set(timings), {"timescale", "de421.bsp"})
+        self.assertTrue(all(seconds >= 0.0 for seconds in timings.values()))
+
+    def test_discard_and_clear(self):
+        """Test forgotten kernels are reopened"""
+        self.registry.body("de421.bsp", "earth")
+        self.registry.discard("de421.bsp")
+        self.registry.body("de421.bsp", "earth")
+        self.assertEqual(self.loader.call_count, 2)
+        self.registry.timescale()
+        self.registry.clear()
+        self.assertEqual(self.registry.timings, {})
+        self.registry.timescale()
+        self.assertEqual(self.loader.timescale.call_count, 2)
+
+
+class TestModuleFunctions(unittest.TestCase):
+    """Test suite for the process-wide registry"""
+
+    def test_shared_registry(self):
+        """Test every caller gets the same registry and timescale"""
+        self.assertIs(get_ephemeris_registry(), get_ephemeris_registry())
+        self.assertIs(get_timescale(), get_timescale())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Unit tests for fleet.py
+
+Tests TelescopeFleet against several fake mounts on loopback TCP servers.
+"""
+
+import asyncio
+import time
+import unittest
+from datetime import datetime
+
+from returns.result import Failure, Success
+
+from celestron_nexstar.api.core.exceptions import TelescopeConnectionError
+from celestron_nexstar.api.core.types import TelescopeConfig
+from celestron_nexstar.api.telescope.async_protocol import AsyncNexStarProtocol
+from celestron_nexstar.api.telescope.fleet import FleetTelemetry, TelescopeFleet
+
+
+class _FakeMountServer:
+    """Fake mount on a loopback TCP server with a fixed reply delay"""
+
+    RESPONSES = {  # noqa: RUF012
+        b"Kx": b"x#",
+        b"E": b"34AB0500,12CE0500#",
+        b"Z": b"40000000,10000000#",
+        b"L": b"0#",
+        b"t": b"\x01#",
+    }
+
+    def __init__(self, reply_delay=0.0):
+        self.reply_delay = reply_delay
+        self.commands = []
+        self.server = None
+
+    async def start(self):
+        """Start listening and return a TCP config pointing at the server"""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return TelescopeConfig(connection_type="tcp", host="127.0.0.1", tcp_port=port, timeout=1.0)
+
+    async def stop(self):
+        """Stop the server"""
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                data = await reader.readuntil(b"#")
+                if self.reply_delay:
+                    await asyncio.sleep(self.reply_delay)
+                # Answer everything already pipelined in one burst
+                commands = [data[:-1]]
+                while b"#" in reader._buffer:
+                    commands.append((await reader.readuntil(b"#"))[:-1])
+                self.commands.extend(commands)
+                writer.write(b"".join(self.RESPONSES.get(command, b"#") for command in commands))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestTelescopeFleet(unittest.TestCase):
+    """Test suite for TelescopeFleet"""
+
+    def setUp(self):
+        """Skip connection settle delays"""
+        self.settle = AsyncNexStarProtocol.TCP_SETTLE_TIME
+        AsyncNexStarProtocol.TCP_SETTLE_TIME = 0.0
+
+    def tearDown(self):
+        """Restore connection settle delays"""
+        AsyncNexStarProtocol.TCP_SETTLE_TIME = self.settle
+
+    async def _fleet(self, count, reply_delay=0.0):
+        mounts = [_FakeMountServer(reply_delay) for _ in range(count)]
+        configs = [await mount.start() for mount in mounts]
+        return mounts, TelescopeFleet({f"m{i}": config for i, config in enumerate(configs)})
+
+    async def _stop(self, mounts):
+        for mount in mounts:
+            await mount.stop()
+
+    def test_names(self):
+        """Test mounts are named by key or by position"""
+        fleet = TelescopeFleet(["/dev/ttyUSB0", "/dev/ttyUSB1"])
+        self.assertEqual(fleet.names, ["mount0", "mount1"])
+        self.assertEqual(len(fleet), 2)
+
+    def test_broadcast_commands(self):
+        """Test broadcast commands reach every mount"""
+
+        async def run():
+            mounts, fleet = await self._fleet(3)
+            async with fleet:
+                results = await fleet.goto_ra_dec(12.0, 45.0)
+                self.assertEqual(results, {name: Success(True) for name in fleet.names})
+                await fleet.goto_alt_az(90.0, 45.0)
+                await fleet.sync_ra_dec(12.0, 45.0)
+                await fleet.set_location(40.0, -74.0)
+                await fleet.set_time(datetime(2024, 10, 14, 12, 30, 0))
+                await fleet.cancel_goto()
+            for mount in mounts:
+                self.assertEqual(
+                    [command[:1] for command in mount.commands], [b"K", b"R", b"B", b"S", b"W", b"H", b"M"]
+                )
+                self.assertEqual(mount.commands[5], b"H\x0c\x1e\x00\x0a\x0e\x18\x00\x00")
+            await self._stop(mounts)
+
+        asyncio.run(run())
+
+    def test_failed_mount_does_not_abort_others(self):
+        """Test an unreachable mount is reported without affecting the rest"""
+
+        async def run():
+            mounts, fleet = await self._fleet(2)
+            await mounts[1].stop()
+            results = await fleet.connect()
+            self.assertEqual(results["m0"], Success(True))
+            self.assertIsInstance(results["m1"], Failure)
+            self.assertIsInstance(results["m1"].failure(), TelescopeConnectionError)
+
+            sample = await fleet.poll()
+            self.assertEqual(list(sample.states), ["m0"])
+            self.assertEqual(list(sample.errors), ["m1"])
+            await fleet.disconnect()
+            await mounts[0].stop()
+
+        asyncio.run(run())
+
+    def test_telemetry_stream(self):
+        """Test the telemetry stream yields one aggregated sample per interval"""
+
+        async def run():
+            mounts, fleet = await self._fleet(3)
+            async with fleet:
+                samples = [sample async for sample in fleet.telemetry(interval=0.05, count=3)]
+            self.assertEqual(len(samples), 3)
+            for sample in samples:
+                self.assertIsInstance(sample, FleetTelemetry)
+                self.assertEqual(sorted(sample.states), ["m0", "m1", "m2"])
+                self.assertAlmostEqual(sample.states["m0"].horizontal.azimuth, 90.0, places=3)
+            self.assertGreaterEqual(samples[-1].timestamp - samples[0].timestamp, 0.09)
+            # Each snapshot is a single pipelined E/Z/L/t exchange per mount
+            self.assertEqual(mounts[0].commands[1:5], [b"E", b"Z", b"L", b"t"])
+            self.assertIn("m0:", str(samples[0]))
+            await self._stop(mounts)
+
+        asyncio.run(run())
+
+    def test_throughput_scales_with_mount_count(self):
+        """Measure polling throughput as the fleet grows"""
+        reply_delay = 0.02
+        rounds = 5
+
+        async def measure(count):
+            mounts, fleet = await self._fleet(count, reply_delay)
+            async with fleet:
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    sample = await fleet.poll()
+                    self.assertEqual(len(sample.states), count)
+                elapsed = time.perf_counter() - start
+            await self._stop(mounts)
+            return count * rounds / elapsed
+
+        throughput = {count: asyncio.run(measure(count)) for count in (1, 2, 4, 8)}
+
+        # Mounts are polled concurrently, so snapshots/sec grows with the fleet
+        self.assertGreater(throughput[8], throughput[1] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,12 +6,21 @@ Tests geohash encoding, decoding, and spatial search utilities.
 
 import unittest
 
+import numpy as np
+
 from celestron_nexstar.api.location.geohash_utils import (
     decode,
+    decode_array,
     encode,
+    encode_array,
+    encode_int_array,
+    geohash_to_int,
+    get_int_ranges_for_search,
     get_neighbors_for_search,
     get_precision_for_radius,
+    int_range,
     neighbors,
+    neighbors_array,
 )
 
 
@@ -230,6 +239,15 @@ class TestNeighbors(unittest.TestCase):
         self.assertLessEqual(len(neighbor_list), 8)
         self.assertNotIn(geohash, neighbor_list)
 
+    def test_neighbors_surround_center(self):
+        """Test all 8 neighbors away from the edges, including south and west"""
+        geohash = "u09tvqr"
+        lat, lon, lat_err, lon_err = decode(geohash)
+        neighbor_list = neighbors(geohash)
+        self.assertEqual(len(neighbor_list), 8)
+        self.assertIn(encode(lat - 2 * lat_err, lon, 7), neighbor_list)
+        self.assertIn(encode(lat, lon - 2 * lon_err, 7), neighbor_list)
+
 
 class TestGetPrecisionForRadius(unittest.TestCase):
     """Test suite for get_precision_for_radius function"""
@@ -368,5 +386,99 @@ class TestGeohashRoundtrip(unittest.TestCase):
             self.assertLessEqual(abs(decoded_lon - lon), lon_err)
 
 
+# Random points, plus the poles, the antimeridian and exact cell boundaries
+_LATS = np.concatenate([np.random.default_rng(7).uniform(-90, 90, 500), [90.0, -90.0, 0.0, 45.0, -45.0]])
+_LONS = np.concatenate([np.random.default_rng(8).uniform(-180, 180, 500), [180.0, -180.0, 0.0, 90.0, -90.0]])
+
+
+class TestArrayFunctions(unittest.TestCase):
+    """Test the vectorised geohash functions against their scalar versions"""
+
+    def test_encode_array_matches_encode(self):
+        """Test every precision gives the same geohashes as encode()"""
+        for precision in range(1, 13):
+            result = encode_array(_LATS, _LONS, precision)
+            self.assertEqual(result.dtype, np.dtype(f"S{precision}"))
+            expected = [encode(lat, lon, precision) for lat, lon in zip(_LATS, _LONS, strict=True)]
+            self.assertEqual(result.astype(str).tolist(), expected)
+
+    def test_encode_array_shape_and_precision(self):
+        """Test inputs are broadcast and bad precisions rejected"""
+        self.assertEqual(encode_array([[10.0], [20.0]], [1.0, 2.0, 3.0], 5).shape, (2, 3))
+        with self.assertRaises(ValueError):
+            encode_array(_LATS, _LONS, 13)
+
+    def test_decode_array_matches_decode(self):
+        """Test decoding str and bytes arrays gives the same values as decode()"""
+        for precision in (1, 6, 9, 12):
+            geohashes = encode_array(_LATS, _LONS, precision)
+            lats, lons, lat_errs, lon_errs = decode_array(geohashes)
+            self.assertEqual(decode_array(geohashes.astype(str))[0].tolist(), lats.tolist())
+            expected = np.array([decode(geohash) for geohash in geohashes.astype(str)])
+            np.testing.assert_array_equal(np.stack([lats, lons, lat_errs, lon_errs], axis=-1), expected)
+
+    def test_decode_array_invalid(self):
+        """Test invalid characters and mixed lengths are rejected"""
+        with self.assertRaises(ValueError):
+            decode_array(["u09a"])
+        with self.assertRaises(ValueError):
+            decode_array(["u09t", "u09"])
+
+    def test_neighbors_array_matches_neighbors(self):
+        """Test each row holds the distinct neighbors() of its geohash"""
+        geohashes = encode_array(_LATS, _LONS, 5)
+        result = neighbors_array(geohashes)
+        self.assertEqual(result.shape, (len(geohashes), 8))
+        for geohash, row in zip(geohashes.astype(str), result.astype(str), strict=True):
+            expected = neighbors(geohash)
+            self.assertEqual([n for n in dict.fromkeys(row.tolist()) if n != geohash], expected)
+
+
+class TestIntegerGeohash(unittest.TestCase):
+    """Test integer geohashes and their range searches"""
+
+    def test_encode_int_array(self):
+        """Test integer geohashes hold the bits of the geohash characters"""
+        codes = encode_int_array(_LATS, _LONS)
+        self.assertEqual(codes.dtype, np.int64)
+        expected = [geohash_to_int(encode(lat, lon, 12)) for lat, lon in zip(_LATS, _LONS, strict=True)]
+        self.assertEqual(codes.tolist(), expected)
+        self.assertEqual(geohash_to_int("u0"), 26 * 32)
+
+    def test_int_range(self):
+        """Test a prefix range holds exactly the geohashes starting with it"""
+        low, high = int_range("u09")
+        codes = encode_int_array(_LATS, _LONS)
+        inside = (codes >= low) & (codes <= high)
+        prefixes = encode_array(_LATS, _LONS, 3)
+        self.assertEqual(inside.tolist(), (prefixes == b"u09").tolist())
+        self.assertEqual(int_range("u0", precision=3), (26624, 26655))
+        with self.assertRaises(ValueError):
+            int_range("u09t", precision=3)
+
+    def test_search_ranges_cover_radius(self):
+        """Test every point within the radius falls in one of a few merged ranges"""
+        for center_lat, center_lon, radius_km in [(40.7, -74.0, 50.0), (-33.9, 179.9, 200.0), (0.0, 0.0, 1.0)]:
+            ranges = get_int_ranges_for_search(center_lat, center_lon, radius_km)
+            self.assertLessEqual(len(ranges), 9)
+            self.assertEqual(ranges, sorted(ranges))
+
+            # Points on circles inside the radius
+            angles = np.linspace(0, 2 * np.pi, 360)
+            fractions = np.array([0.0, 0.5, 0.99])[:, None]
+            lats = center_lat + fractions * radius_km / 111.2 * np.sin(angles)
+            lons = center_lon + fractions * radius_km / (111.2 * np.cos(np.radians(lats))) * np.cos(angles)
+            lons = (lons + 180.0) % 360.0 - 180.0
+            codes = encode_int_array(lats, lons).ravel()
+            covered = np.zeros(codes.shape, dtype=bool)
+            for low, high in ranges:
+                covered |= (codes >= low) & (codes <= high)
+            self.assertTrue(covered.all())
+
+    def test_search_ranges_over_pole(self):
+        """Test a circle over a pole searches every geohash"""
+        self.assertEqual(get_int_ranges_for_search(89.9, 0.0, 100.0), [(0, (1 << 60) - 1)])
+
+
 if __name__ == "__main__":
     unittest.main()
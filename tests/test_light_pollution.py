@@ -5,10 +5,11 @@ Tests light pollution data fetching, Bortle scale conversion, and caching.
 """
 
 import asyncio
-import json
+import sqlite3
 import tempfile
+import threading
 import unittest
-from datetime import UTC, datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -17,14 +18,11 @@ from celestron_nexstar.api.location.light_pollution import (
     BortleClass,
     LightPollutionData,
     _create_light_pollution_data,
-    _ensure_cache_dir,
     _fetch_sqm,
     _get_bortle_characteristics,
+    _get_cache,
     _get_cache_key,
-    _is_cache_stale,
-    _is_cache_too_old,
-    _load_cache,
-    _save_cache,
+    _LightPollutionCache,
     get_light_pollution_data,
     get_light_pollution_data_batch,
     sqm_to_bortle,
@@ -188,17 +186,13 @@ class TestCacheFunctions(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.temp_dir = tempfile.mkdtemp()
-        self.original_cache_dir = None
+        self.cache = _LightPollutionCache(Path(self.temp_dir) / "cache" / "light_pollution.db", memory_size=2)
+        self.addCleanup(self.cache.close)
 
     def tearDown(self):
         """Clean up test fixtures"""
         import shutil
 
-        if self.original_cache_dir is not None:
-            # Restore original cache dir
-            from celestron_nexstar.api.location.light_pollution import CACHE_DIR
-
-            CACHE_DIR = self.original_cache_dir
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_get_cache_key(self):
@@ -206,68 +200,72 @@ class TestCacheFunctions(unittest.TestCase):
         key = _get_cache_key(40.123456, -100.987654)
         self.assertEqual(key, "40.12,-100.99")
 
-    def test_ensure_cache_dir(self):
-        """Test cache directory creation"""
-        with patch("celestron_nexstar.api.location.light_pollution.CACHE_DIR", Path(self.temp_dir) / "cache"):
-            _ensure_cache_dir()
-            self.assertTrue((Path(self.temp_dir) / "cache").exists())
-
-    def test_save_and_load_cache(self):
-        """Test saving and loading cache"""
-        cache_file = Path(self.temp_dir) / "test_cache.json"
+    def test_put_and_get(self):
+        """Test stored entries are read back, also by a fresh cache on the same file"""
+        self.cache.put("40.0,-100.0", 21.5, "database")
+        self.assertEqual(self.cache.get("40.0,-100.0"), (21.5, "database"))
+        self.assertIsNone(self.cache.get("41.0,-100.0"))
+
+        reopened = _LightPollutionCache(self.cache.path)
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.get("40.0,-100.0"), (21.5, "database"))
+
+    def test_entries_expire(self):
+        """Test each entry expires after its own TTL"""
+        self.cache.put("40.0,-100.0", 21.5, "database", ttl=timedelta(seconds=-1))
+        self.cache.put("41.0,-100.0", 20.5, "database")
+        self.assertIsNone(self.cache.get("40.0,-100.0"))
+        self.assertEqual(self.cache.get("41.0,-100.0"), (20.5, "database"))
+
+    def test_memory_is_bounded(self):
+        """Test the in-memory LRU keeps only the most recent entries"""
+        for i in range(5):
+            self.cache.put(f"{i}.0,0.0", 20.0 + i / 10, None)
+        self.assertEqual(list(self.cache._memory), ["3.0,0.0", "4.0,0.0"])
+        self.assertEqual(self.cache.get("0.0,0.0"), (20.0, None))
+
+    def test_overwrite_and_clear(self):
+        """Test entries are replaced in place and cleared"""
+        self.cache.put("40.0,-100.0", 21.5, "database")
+        self.cache.put("40.0,-100.0", 21.8, "database")
+        self.assertEqual(self.cache.get("40.0,-100.0"), (21.8, "database"))
+        with sqlite3.connect(self.cache.path) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM light_pollution_cache").fetchone()[0], 1)
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("40.0,-100.0"))
+
+    def test_concurrent_writers(self):
+        """Test writes from many threads all land"""
+
+        def write(start):
+            for i in range(start, start + 50):
+                self.cache.put(f"{i}.0,0.0", 20.0, "database")
+
+        threads = [threading.Thread(target=write, args=(start,)) for start in range(0, 400, 50)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with sqlite3.connect(self.cache.path) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM light_pollution_cache").fetchone()[0], 400)
+
+    def test_get_cache_follows_cache_file(self):
+        """Test the shared cache is per cache file"""
+        cache_file = Path(self.temp_dir) / "shared.db"
         with patch("celestron_nexstar.api.location.light_pollution.CACHE_FILE", cache_file):
-            test_data = {"data": {"40.0,-100.0": {"sqm": 21.5}}, "timestamp": datetime.now(UTC).isoformat()}
-            _save_cache(test_data)
-
-            loaded = _load_cache()
-            self.assertIsNotNone(loaded)
-            self.assertEqual(loaded["data"]["40.0,-100.0"]["sqm"], 21.5)
-
-    def test_load_cache_not_exists(self):
-        """Test loading cache when file doesn't exist"""
-        with patch("celestron_nexstar.api.location.light_pollution.CACHE_FILE", Path(self.temp_dir) / "nonexistent.json"):
-            result = _load_cache()
-            self.assertIsNone(result)
-
-    def test_load_cache_invalid_json(self):
-        """Test loading cache with invalid JSON"""
-        cache_file = Path(self.temp_dir) / "invalid_cache.json"
-        cache_file.write_text("invalid json{")
-        with patch("celestron_nexstar.api.location.light_pollution.CACHE_FILE", cache_file):
-            result = _load_cache()
-            self.assertIsNone(result)
-
-    def test_is_cache_stale_fresh(self):
-        """Test cache staleness check with fresh cache"""
-        cache_data = {"timestamp": datetime.now(UTC).isoformat()}
-        self.assertFalse(_is_cache_stale(cache_data))
-
-    def test_is_cache_stale_old(self):
-        """Test cache staleness check with old cache"""
-        old_time = (datetime.now(UTC) - timedelta(hours=25)).isoformat()
-        cache_data = {"timestamp": old_time}
-        self.assertTrue(_is_cache_stale(cache_data))
-
-    def test_is_cache_stale_no_timestamp(self):
-        """Test cache staleness check without timestamp"""
-        cache_data = {}
-        self.assertTrue(_is_cache_stale(cache_data))
-
-    def test_is_cache_too_old_fresh(self):
-        """Test cache age check with fresh cache"""
-        cache_data = {"timestamp": datetime.now(UTC).isoformat()}
-        self.assertFalse(_is_cache_too_old(cache_data))
-
-    def test_is_cache_too_old_very_old(self):
-        """Test cache age check with very old cache"""
-        old_time = (datetime.now(UTC) - timedelta(days=8)).isoformat()
-        cache_data = {"timestamp": old_time}
-        self.assertTrue(_is_cache_too_old(cache_data))
-
-    def test_is_cache_too_old_no_timestamp(self):
-        """Test cache age check without timestamp"""
-        cache_data = {}
-        self.assertTrue(_is_cache_too_old(cache_data))
+            self.assertIs(_get_cache(), _get_cache())
+            self.assertEqual(_get_cache().path, cache_file)
+            _get_cache().close()
+
+    def test_legacy_json_cache_is_removed(self):
+        """Test the JSON cache file the store replaced is deleted on first open"""
+        legacy = self.cache.path.with_suffix(".json")
+        legacy.parent.mkdir(parents=True, exist_ok=True)
+        legacy.write_text('{"timestamp": "2024-01-01T00:00:00", "locations": {}}', encoding="utf-8")
+        self.assertIsNone(self.cache.get("40.0,-100.0"))
+        self.assertFalse(legacy.exists())
 
 
 class TestFetchSqm(unittest.TestCase):
@@ -313,14 +311,16 @@ class TestGetLightPollutionData(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_session = AsyncMock()
+        self.cache = _LightPollutionCache(Path(tempfile.mkdtemp()) / "light_pollution.db")
+        self.addCleanup(self.cache.close)
+        patcher = patch("celestron_nexstar.api.location.light_pollution._get_cache", return_value=self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     @patch("celestron_nexstar.api.location.light_pollution._fetch_sqm")
     @patch("celestron_nexstar.api.location.light_pollution._create_light_pollution_data")
-    @patch("celestron_nexstar.api.location.light_pollution._load_cache")
-    @patch("celestron_nexstar.api.location.light_pollution._save_cache")
-    def test_get_light_pollution_data_success(self, mock_save, mock_load, mock_create, mock_fetch):
+    def test_get_light_pollution_data_success(self, mock_create, mock_fetch):
         """Test successful light pollution data retrieval"""
-        mock_load.return_value = None  # No cache
         mock_fetch.return_value = 21.5
 
         mock_data = LightPollutionData(
@@ -339,23 +339,12 @@ class TestGetLightPollutionData(unittest.TestCase):
 
         self.assertIsInstance(result, LightPollutionData)
         mock_fetch.assert_called_once_with(40.0, -100.0)
+        self.assertEqual(self.cache.get("40.0,-100.0"), (21.5, "database"))
 
     @patch("celestron_nexstar.api.location.light_pollution._fetch_sqm")
-    @patch("celestron_nexstar.api.location.light_pollution._load_cache")
-    def test_get_light_pollution_data_from_cache(self, mock_load, mock_fetch):
+    def test_get_light_pollution_data_from_cache(self, mock_fetch):
         """Test using cached light pollution data"""
-        now = datetime.now(UTC)
-        cache_data = {
-            "data": {
-                "40.0,-100.0": {
-                    "sqm": 21.5,
-                    "source": "database",
-                    "timestamp": now.isoformat(),
-                }
-            },
-            "timestamp": now.isoformat(),
-        }
-        mock_load.return_value = cache_data
+        self.cache.put("40.0,-100.0", 21.5, "database")
 
         mock_data = LightPollutionData(
             bortle_class=BortleClass.CLASS_3,
@@ -376,12 +365,11 @@ class TestGetLightPollutionData(unittest.TestCase):
 
             self.assertTrue(result.cached)
             mock_fetch.assert_not_called()
+            mock_create.assert_called_once_with(self.mock_session, 21.5, "database", cached=True)
 
     @patch("celestron_nexstar.api.location.light_pollution._fetch_sqm")
-    @patch("celestron_nexstar.api.location.light_pollution._load_cache")
-    def test_get_light_pollution_data_not_found(self, mock_load, mock_fetch):
+    def test_get_light_pollution_data_not_found(self, mock_fetch):
         """Test error when no light pollution data found"""
-        mock_load.return_value = None
         mock_fetch.return_value = None
 
         with self.assertRaises(DatabaseError) as context:
@@ -390,12 +378,10 @@ class TestGetLightPollutionData(unittest.TestCase):
         self.assertIn("No light pollution data found", str(context.exception))
 
     @patch("celestron_nexstar.api.location.light_pollution._fetch_sqm")
-    @patch("celestron_nexstar.api.location.light_pollution._load_cache")
     @patch("celestron_nexstar.api.location.light_pollution._create_light_pollution_data")
-    @patch("celestron_nexstar.api.location.light_pollution._save_cache")
-    def test_get_light_pollution_data_force_refresh(self, mock_save, mock_create, mock_load, mock_fetch):
+    def test_get_light_pollution_data_force_refresh(self, mock_create, mock_fetch):
         """Test forcing refresh of light pollution data"""
-        mock_load.return_value = {"data": {"40.0,-100.0": {"sqm": 21.5}}}
+        self.cache.put("40.0,-100.0", 21.5, "database")
         mock_fetch.return_value = 21.8
 
         mock_data = LightPollutionData(
@@ -414,6 +400,30 @@ class TestGetLightPollutionData(unittest.TestCase):
 
         mock_fetch.assert_called_once()
         self.assertFalse(result.cached)
+        self.assertEqual(self.cache.get("40.0,-100.0"), (21.8, "database"))
+
+    @patch("celestron_nexstar.api.location.light_pollution._fetch_sqm")
+    @patch("celestron_nexstar.api.location.light_pollution._create_light_pollution_data")
+    def test_cache_access_runs_off_the_event_loop(self, mock_create, mock_fetch):
+        """Test the cache file is read and written from worker threads"""
+        mock_fetch.return_value = 21.5
+        threads = []
+
+        def recorded(func):
+            def wrapper(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        with (
+            patch.object(self.cache, "get", recorded(self.cache.get)),
+            patch.object(self.cache, "put", recorded(self.cache.put)),
+        ):
+            asyncio.run(get_light_pollution_data(self.mock_session, 40.0, -100.0))
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(threading.get_ident(), threads)
 
 
 class TestGetLightPollutionDataBatch(unittest.TestCase):
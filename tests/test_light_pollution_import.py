@@ -0,0 +1,183 @@
+"""
+Unit tests for World Atlas PNG ingestion in light_pollution_db.py
+
+Tests strip-wise PNG decoding, vectorised RGB to SQM conversion, and the
+streaming upsert of grid points into the light_pollution_grid table.
+"""
+
+import asyncio
+import tempfile
+import unittest
+import zlib
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+from sqlalchemy import create_engine, text
+
+from celestron_nexstar.api.database.database import CatalogDatabase
+from celestron_nexstar.api.database.light_pollution_db import (
+    _iter_png_strips,
+    _process_png_to_database,
+    _read_png_chunks,
+    _rgb_to_sqm,
+    _rgb_to_sqm_array,
+)
+from celestron_nexstar.api.database.models import Base, LightPollutionGridModel
+from celestron_nexstar.api.location.geohash_utils import encode
+
+
+def _image(height=36, width=72):
+    """RGB image with a different colour in every pixel"""
+    rng = np.random.default_rng(42)
+    return rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+
+
+class TestIterPngStrips(unittest.TestCase):
+    """Test suite for _iter_png_strips"""
+
+    def setUp(self):
+        """Create a temporary directory for images"""
+        self.tmp = Path(tempfile.mkdtemp())
+
+    def _assert_strips_match(self, path, expected, strip_rows):
+        strips = list(_iter_png_strips(path, strip_rows))
+        self.assertEqual([first for first, _ in strips], list(range(0, expected.shape[0], strip_rows)))
+        self.assertTrue(all(len(rgb) <= strip_rows for _, rgb in strips))
+        np.testing.assert_array_equal(np.concatenate([rgb for _, rgb in strips]), expected)
+
+    def test_rgb_strips(self):
+        """Test strips of a filtered RGB image reassemble into the image"""
+        pixels = _image()
+        path = self.tmp / "rgb.png"
+        Image.fromarray(pixels).save(path, optimize=True)
+        self._assert_strips_match(path, pixels, strip_rows=5)
+
+    def test_palette_and_alpha_strips(self):
+        """Test palette and RGBA images are converted to RGB"""
+        img = Image.fromarray(_image()).quantize(colors=16)
+        img.save(self.tmp / "palette.png")
+        self._assert_strips_match(self.tmp / "palette.png", np.asarray(img.convert("RGB")), strip_rows=8)
+
+        rgba = Image.fromarray(_image()).convert("RGBA")
+        rgba.save(self.tmp / "rgba.png")
+        self._assert_strips_match(self.tmp / "rgba.png", np.asarray(rgba.convert("RGB")), strip_rows=36)
+
+    def test_interlaced_fallback(self):
+        """Test interlaced images are decoded whole and split"""
+        pixels = _image()
+        path = self.tmp / "interlaced.png"
+        Image.fromarray(pixels).save(path, interlace=1)
+        self._assert_strips_match(path, pixels, strip_rows=10)
+
+    def test_inflates_at_most_a_strip_per_call(self):
+        """Test a highly compressed image never expands by more than a strip at a time"""
+        pixels = np.full((200, 100, 3), 128, dtype=np.uint8)
+        path = self.tmp / "flat.png"
+        Image.fromarray(pixels).save(path)
+        sizes = []
+        decompressobj = zlib.decompressobj
+
+        class RecordingInflater:
+            def __init__(self):
+                self._inflater = decompressobj()
+
+            def __getattr__(self, name):
+                return getattr(self._inflater, name)
+
+            def decompress(self, data, max_length=0):
+                out = self._inflater.decompress(data, max_length)
+                sizes.append(len(out))
+                return out
+
+        with patch("celestron_nexstar.api.database.light_pollution_db.zlib.decompressobj", RecordingInflater):
+            self._assert_strips_match(path, pixels, strip_rows=4)
+        self.assertLessEqual(max(sizes), 4 * (1 + 100 * 3))
+
+    def test_large_chunks_are_read_in_pieces(self):
+        """Test IDAT data longer than the read size is yielded in pieces"""
+        path = self.tmp / "rgb.png"
+        Image.fromarray(_image()).save(path)
+        with open(path, "rb") as f:
+            f.read(8)
+            whole = list(_read_png_chunks(f))
+        with open(path, "rb") as f:
+            f.read(8)
+            pieces = list(_read_png_chunks(f, max_size=7))
+        self.assertTrue(all(len(data) <= 7 for kind, data in pieces if kind == b"IDAT"))
+        self.assertEqual([chunk for chunk in pieces if chunk[0] != b"IDAT"], [c for c in whole if c[0] != b"IDAT"])
+        self.assertEqual(
+            b"".join(data for kind, data in pieces if kind == b"IDAT"),
+            b"".join(data for kind, data in whole if kind == b"IDAT"),
+        )
+        self.assertEqual(pieces[-1], (b"IEND", b""))
+
+    def test_not_a_png(self):
+        """Test other files are rejected"""
+        path = self.tmp / "image.png"
+        path.write_bytes(b"GIF89a")
+        with self.assertRaises(ValueError):
+            list(_iter_png_strips(path))
+
+
+class TestRgbToSqmArray(unittest.TestCase):
+    """Test suite for _rgb_to_sqm_array"""
+
+    def test_matches_scalar_conversion(self):
+        """Test every pixel converts as _rgb_to_sqm() does"""
+        pixels = _image(8, 8)
+        expected = [[_rgb_to_sqm(*map(int, pixel)) for pixel in row] for row in pixels]
+        np.testing.assert_allclose(_rgb_to_sqm_array(pixels), expected)
+
+
+class TestProcessPngToDatabase(unittest.TestCase):
+    """Test suite for _process_png_to_database"""
+
+    def setUp(self):
+        """Create a world image and a database with an empty grid table"""
+        self.tmp = Path(tempfile.mkdtemp())
+        self.png_path = self.tmp / "world.png"
+        Image.fromarray(_image()).save(self.png_path)
+        self.db = CatalogDatabase(self.tmp / "catalogs.db")
+        self.engine = create_engine(f"sqlite:///{self.db.db_path}")
+        Base.metadata.create_all(self.engine, tables=[LightPollutionGridModel.__table__])
+        self.addCleanup(self.engine.dispose)
+
+    def _import(self, **kwargs):
+        # Unknown regions span the whole globe: 5° per pixel of the 72x36 image
+        return asyncio.run(
+            _process_png_to_database(self.png_path, "test", self.db, grid_resolution=5.0, strip_rows=7, **kwargs)
+        )
+
+    def _rows(self):
+        with self.engine.connect() as conn:
+            return conn.execute(
+                text("SELECT latitude, longitude, geohash, sqm_value FROM light_pollution_grid ORDER BY id")
+            ).all()
+
+    def test_import_and_reimport(self):
+        """Test every pixel is stored once with its geohash, and re-imports update in place"""
+        self.assertEqual(self._import(), 36 * 72)
+        rows = self._rows()
+        self.assertEqual(len(rows), 36 * 72)
+
+        lat, lon, geohash, sqm = rows[72 + 3]
+        self.assertEqual((lat, lon), (85.0, -165.0))
+        self.assertEqual(geohash, encode(lat, lon, precision=9))
+        self.assertAlmostEqual(sqm, _rgb_to_sqm(*map(int, _image()[1, 3])))
+
+        self.assertEqual(self._import(), 36 * 72)
+        self.assertEqual(len(self._rows()), 36 * 72)
+
+    def test_sampling_step(self):
+        """Test coarser grids sample every n-th pixel across strip boundaries"""
+        count = asyncio.run(
+            _process_png_to_database(self.png_path, "test", self.db, grid_resolution=15.0, strip_rows=5)
+        )
+        self.assertEqual(count, 12 * 24)
+        self.assertEqual({lat for lat, *_ in self._rows()}, {90.0 - 15.0 * i for i in range(12)})
+
+
+if __name__ == "__main__":
+    unittest.main()
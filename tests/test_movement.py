@@ -5,8 +5,10 @@ Tests MovementController for interactive telescope control.
 """
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
+from celestron_nexstar.api.core.exceptions import TelescopeConnectionError
+from celestron_nexstar.api.telescope.connection_pool import ConnectionPool, get_connection_pool
 from celestron_nexstar.api.telescope.movement import MovementController
 
 
@@ -16,7 +18,9 @@ class TestMovementController(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures"""
         self.mock_get_port = MagicMock(return_value="/dev/ttyUSB0")
-        self.controller = MovementController(self.mock_get_port)
+        self.mock_telescope = MagicMock()
+        self.mock_factory = MagicMock(return_value=self.mock_telescope)
+        self.controller = MovementController(self.mock_get_port, pool=ConnectionPool(factory=self.mock_factory))
 
     def test_initialization(self):
         """Test controller initialization"""
@@ -58,22 +62,15 @@ class TestMovementController(unittest.TestCase):
         self.controller.active_direction = "up"
         self.assertEqual(self.controller.get_direction(), "up")
 
-    @patch("celestron_nexstar.api.telescope.telescope.NexStarTelescope")
-    def test_start_move_success(self, mock_telescope_class):
+    def test_start_move_success(self):
         """Test starting movement successfully"""
-        mock_telescope = MagicMock()
-        mock_telescope.__enter__ = MagicMock(return_value=mock_telescope)
-        mock_telescope.__exit__ = MagicMock(return_value=None)
-        mock_telescope_class.return_value = mock_telescope
-
         self.controller.start_move("up")
 
-        mock_telescope.move_fixed.assert_called_once_with("up", 5)
+        self.mock_telescope.move_fixed.assert_called_once_with("up", 5)
         self.assertTrue(self.controller.moving)
         self.assertEqual(self.controller.active_direction, "up")
 
-    @patch("celestron_nexstar.api.telescope.telescope.NexStarTelescope")
-    def test_start_move_same_direction(self, mock_telescope_class):
+    def test_start_move_same_direction(self):
         """Test starting move when already moving in same direction"""
         self.controller.moving = True
         self.controller.active_direction = "up"
@@ -81,7 +78,8 @@ class TestMovementController(unittest.TestCase):
         self.controller.start_move("up")
 
         # Should not call telescope again
-        mock_telescope_class.assert_not_called()
+        self.mock_factory.assert_not_called()
+        self.mock_telescope.move_fixed.assert_not_called()
 
     def test_start_move_no_port(self):
         """Test starting move when no port available"""
@@ -91,33 +89,23 @@ class TestMovementController(unittest.TestCase):
 
         self.assertFalse(self.controller.moving)
 
-    @patch("celestron_nexstar.api.telescope.telescope.NexStarTelescope")
-    def test_start_move_exception(self, mock_telescope_class):
+    def test_start_move_exception(self):
         """Test starting move when exception occurs"""
-        mock_telescope = MagicMock()
-        mock_telescope.__enter__ = MagicMock(side_effect=Exception("Connection error"))
-        mock_telescope.__exit__ = MagicMock(return_value=None)
-        mock_telescope_class.return_value = mock_telescope
+        self.mock_telescope.connect.side_effect = TelescopeConnectionError("Connection error")
 
         # Should not raise exception
         self.controller.start_move("up")
 
         self.assertFalse(self.controller.moving)
 
-    @patch("celestron_nexstar.api.telescope.telescope.NexStarTelescope")
-    def test_stop_move_success(self, mock_telescope_class):
+    def test_stop_move_success(self):
         """Test stopping movement successfully"""
         self.controller.moving = True
         self.controller.active_direction = "up"
 
-        mock_telescope = MagicMock()
-        mock_telescope.__enter__ = MagicMock(return_value=mock_telescope)
-        mock_telescope.__exit__ = MagicMock(return_value=None)
-        mock_telescope_class.return_value = mock_telescope
-
         self.controller.stop_move()
 
-        mock_telescope.stop_motion.assert_called_once_with("both")
+        self.mock_telescope.stop_motion.assert_called_once_with("both")
         self.assertFalse(self.controller.moving)
         self.assertIsNone(self.controller.active_direction)
 
@@ -137,14 +125,10 @@ class TestMovementController(unittest.TestCase):
         # Should still be marked as moving since we couldn't stop
         self.assertTrue(self.controller.moving)
 
-    @patch("celestron_nexstar.api.telescope.telescope.NexStarTelescope")
-    def test_stop_move_exception(self, mock_telescope_class):
+    def test_stop_move_exception(self):
         """Test stopping move when exception occurs"""
         self.controller.moving = True
-        mock_telescope = MagicMock()
-        mock_telescope.__enter__ = MagicMock(side_effect=Exception("Connection error"))
-        mock_telescope.__exit__ = MagicMock(return_value=None)
-        mock_telescope_class.return_value = mock_telescope
+        self.mock_telescope.connect.side_effect = TelescopeConnectionError("Connection error")
 
         # Should not raise exception
         self.controller.stop_move()
@@ -152,19 +136,28 @@ class TestMovementController(unittest.TestCase):
         # Should still be marked as moving since we couldn't stop
         self.assertTrue(self.controller.moving)
 
-    @patch("celestron_nexstar.api.telescope.telescope.NexStarTelescope")
-    def test_different_directions(self, mock_telescope_class):
+    def test_different_directions(self):
         """Test moving in different directions"""
-        mock_telescope = MagicMock()
-        mock_telescope.__enter__ = MagicMock(return_value=mock_telescope)
-        mock_telescope.__exit__ = MagicMock(return_value=None)
-        mock_telescope_class.return_value = mock_telescope
-
         for direction in ["up", "down", "left", "right"]:
             self.controller.start_move(direction)
-            mock_telescope.move_fixed.assert_called_with(direction, 5)
+            self.mock_telescope.move_fixed.assert_called_with(direction, 5)
             self.assertEqual(self.controller.active_direction, direction)
 
+    def test_moves_reuse_pooled_connection(self):
+        """Test key presses reuse one connection instead of reconnecting"""
+        for direction in ["up", "left", "down"]:
+            self.controller.start_move(direction)
+            self.controller.stop_move()
+
+        self.mock_factory.assert_called_once_with("/dev/ttyUSB0")
+        self.mock_telescope.connect.assert_called_once()
+        self.mock_telescope.disconnect.assert_not_called()
+
+    def test_default_pool_is_shared(self):
+        """Test controllers use the process-wide pool by default"""
+        controller = MovementController(self.mock_get_port)
+        self.assertIs(controller.pool, get_connection_pool())
+
 
 if __name__ == "__main__":
     unittest.main()
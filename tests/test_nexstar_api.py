@@ -17,6 +17,7 @@ from celestron_nexstar.api.core.types import (
     HorizontalCoordinates,
     TelescopeConfig,
     TelescopeInfo,
+    TelescopeState,
     TelescopeTime,
     TrackingMode,
 )
@@ -85,7 +86,8 @@ class TestNexStarTelescope(unittest.TestCase):
             patch.object(self.telescope.protocol, "is_open", return_value=True),
             patch.object(self.telescope.protocol, "open", return_value=True),
             patch.object(self.telescope.protocol, "echo", return_value=False),
-            patch.object(self.telescope.protocol, "close"),self.assertRaises(TelescopeConnectionError)
+            patch.object(self.telescope.protocol, "close"),
+            self.assertRaises(TelescopeConnectionError),
         ):
             self.telescope.connect()
 
@@ -195,6 +197,37 @@ class TestNexStarTelescope(unittest.TestCase):
         self.assertAlmostEqual(position.ra_hours, 6.0, places=2)
         self.assertEqual(position.dec_degrees, -30.0)
 
+    def test_get_state(self):
+        """Test getting a full state snapshot in one transaction"""
+        responses = ["80000000,20000000", "40000000,10000000", "1", "\x02"]
+        with (
+            patch.object(self.telescope.protocol, "is_open", return_value=True),
+            patch.object(self.telescope.protocol, "transaction", return_value=responses) as mock_transaction,
+        ):
+            state = self.telescope.get_state()
+
+        mock_transaction.assert_called_once_with(["E", "Z", "L", "t"])
+        self.assertIsInstance(state, TelescopeState)
+        self.assertAlmostEqual(state.equatorial.ra_hours, 12.0, places=4)
+        self.assertAlmostEqual(state.equatorial.dec_degrees, 45.0, places=4)
+        self.assertAlmostEqual(state.horizontal.azimuth, 90.0, places=4)
+        self.assertAlmostEqual(state.horizontal.altitude, 22.5, places=4)
+        self.assertTrue(state.is_slewing)
+        self.assertEqual(state.tracking_mode, TrackingMode.EQ_NORTH)
+
+    def test_get_state_invalid_responses(self):
+        """Test get_state falls back to defaults on malformed responses"""
+        with (
+            patch.object(self.telescope.protocol, "is_open", return_value=True),
+            patch.object(self.telescope.protocol, "transaction", return_value=["bad", "", "0", ""]),
+        ):
+            state = self.telescope.get_state()
+
+        self.assertEqual(state.equatorial, EquatorialCoordinates(ra_hours=0.0, dec_degrees=0.0))
+        self.assertEqual(state.horizontal, HorizontalCoordinates(azimuth=0.0, altitude=0.0))
+        self.assertFalse(state.is_slewing)
+        self.assertEqual(state.tracking_mode, TrackingMode.OFF)
+
     def test_get_position_alt_az(self):
         """Test getting Alt/Az position"""
         with (
@@ -749,6 +782,7 @@ class TestNexStarTelescopeAdditional(unittest.TestCase):
         """Test move_for_time with invalid duration"""
         # The deal.pre decorator will raise PreContractError, not ValueError
         from deal import PreContractError
+
         with patch.object(self.telescope.protocol, "is_open", return_value=True):
             with self.assertRaises((ValueError, PreContractError)):
                 self.telescope.move_for_time(Direction.UP, duration=0, rate=5)
@@ -757,6 +791,7 @@ class TestNexStarTelescopeAdditional(unittest.TestCase):
         """Test move_for_time with negative duration"""
         # The deal.pre decorator will raise PreContractError, not ValueError
         from deal import PreContractError
+
         with patch.object(self.telescope.protocol, "is_open", return_value=True):
             with self.assertRaises((ValueError, PreContractError)):
                 self.telescope.move_for_time(Direction.UP, duration=-1.0, rate=5)
@@ -796,7 +831,6 @@ class TestNexStarTelescopeAdditional(unittest.TestCase):
             result = self.telescope.move_step(Direction.UP, rate=0)
             self.assertTrue(result)
 
-
     def test_stop_motion_failure(self):
         """Test stop_motion when one axis fails"""
         with (
@@ -5,9 +5,16 @@ Provides comprehensive test coverage for the protocol module.
 
 import builtins
 import contextlib
+import os
+import socket
+import sys
+import threading
+import time
 import unittest
+from typing import ClassVar
 from unittest.mock import MagicMock, patch
 
+import deal
 import serial
 from celestron_nexstar.api.telescope.protocol import NexStarProtocol
 from returns.result import Failure
@@ -19,6 +26,20 @@ from celestron_nexstar.api.core.exceptions import (
 )
 
 
+def _recv_chunks(chunks):
+    """Build a ``socket.recv_into`` side effect that delivers the given chunks (or raises exceptions) in order"""
+    pending = iter(chunks)
+
+    def recv_into(buffer):
+        chunk = next(pending)
+        if isinstance(chunk, Exception):
+            raise chunk
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 class TestNexStarProtocol(unittest.TestCase):
     """Test suite for NexStarProtocol class"""
 
@@ -127,20 +148,39 @@ class TestNexStarProtocol(unittest.TestCase):
         mock_conn.reset_output_buffer.assert_called()
         mock_conn.write.assert_called_once_with(b"V#")
 
-    @patch("celestron_nexstar.api.telescope.protocol.time.time")
-    def test_send_command_timeout(self, mock_time):
+    def test_send_command_timeout(self):
         """Test command timeout"""
         mock_conn = MagicMock()
         mock_conn.is_open = True
         mock_conn.in_waiting = 0
+        # Serial read returns no data once the port timeout elapses
+        mock_conn.read.return_value = b""
         self.protocol.serial_conn = mock_conn
 
-        # Mock time to simulate timeout
-        mock_time.side_effect = [0, 0.5, 1.0, 1.5, 2.0, 2.5]
+        with self.assertRaises(TelescopeTimeoutError):
+            self.protocol.send_command("V")
+
+    def test_send_command_serial_read_bounded_by_deadline(self):
+        """Test serial reads wait at most the time left before the deadline"""
+        read_timeouts = []
+
+        def _read(size):
+            read_timeouts.append(mock_conn.timeout)
+            return b""
+
+        mock_conn = MagicMock()
+        mock_conn.is_open = True
+        mock_conn.in_waiting = 0
+        mock_conn.read.side_effect = _read
+        self.protocol.serial_conn = mock_conn
 
         with self.assertRaises(TelescopeTimeoutError):
             self.protocol.send_command("V")
 
+        self.assertTrue(read_timeouts)
+        self.assertTrue(all(0 < timeout <= self.protocol.timeout for timeout in read_timeouts))
+        self.assertEqual(mock_conn.timeout, self.protocol.timeout)
+
     # ========== Coordinate Encoding/Decoding Tests ==========
 
     def test_degrees_to_hex_zero(self):
@@ -401,6 +441,24 @@ class TestNexStarProtocol(unittest.TestCase):
         expected_cmd = f"P{chr(1)}{chr(17)}{chr(5)}{chr(0)}{chr(0)}{chr(0)}"
         mock_send_empty.assert_called_once_with(expected_cmd)
 
+    @patch.object(NexStarProtocol, "send_empty_command")
+    def test_variable_rate_slew(self, mock_send_empty):
+        """Test precise variable rate slew command"""
+        mock_send_empty.return_value = True
+
+        self.assertTrue(self.protocol.variable_rate_slew(2, -3600.0))
+
+        # 3600"/s = 14400 quarter arcsec/s = 0x3840, negative direction on the altitude axis
+        expected_cmd = f"P{chr(3)}{chr(17)}{chr(7)}{chr(0x38)}{chr(0x40)}{chr(0)}{chr(0)}"
+        mock_send_empty.assert_called_once_with(expected_cmd)
+
+    def test_variable_rate_slew_limits(self):
+        """Test precise variable rate slew rejects invalid axes and rates"""
+        with self.assertRaises(deal.PreContractError):
+            self.protocol.variable_rate_slew(3, 10.0)
+        with self.assertRaises(deal.PreContractError):
+            self.protocol.variable_rate_slew(1, NexStarProtocol.MAX_VARIABLE_RATE + 1)
+
     @patch.object(NexStarProtocol, "get_single_byte")
     def test_get_tracking_mode(self, mock_get_single):
         """Test get tracking mode"""
@@ -570,7 +628,7 @@ class TestNexStarProtocol(unittest.TestCase):
         """Test successful command send over TCP/IP"""
         protocol = NexStarProtocol(host="192.168.1.100", tcp_port=4030, connection_type="tcp")
         mock_socket = MagicMock()
-        mock_socket.recv.side_effect = [b"4", b"\x15", b"#"]
+        mock_socket.recv_into.side_effect = _recv_chunks([b"4", b"\x15", b"#"])
         protocol.tcp_socket = mock_socket
 
         mock_time.return_value = 0
@@ -587,7 +645,7 @@ class TestNexStarProtocol(unittest.TestCase):
         mock_socket = MagicMock()
         # Simulate timeout by raising TimeoutError (which is caught and loop continues)
         # until the overall timeout is exceeded
-        mock_socket.recv.side_effect = TimeoutError("Socket timeout")
+        mock_socket.recv_into.side_effect = TimeoutError("Socket timeout")
         protocol.tcp_socket = mock_socket
 
         # Simulate time progression: start at 0, then quickly exceed timeout
@@ -604,7 +662,7 @@ class TestNexStarProtocol(unittest.TestCase):
         """Test TCP/IP command when connection is closed"""
         protocol = NexStarProtocol(host="192.168.1.100", tcp_port=4030, connection_type="tcp")
         mock_socket = MagicMock()
-        mock_socket.recv.return_value = b""  # Connection closed
+        mock_socket.recv_into.return_value = 0  # Connection closed
         protocol.tcp_socket = mock_socket
 
         mock_time.return_value = 0
@@ -634,7 +692,7 @@ class TestNexStarProtocol(unittest.TestCase):
         """Test TCP/IP command receive error"""
         protocol = NexStarProtocol(host="192.168.1.100", tcp_port=4030, connection_type="tcp")
         mock_socket = MagicMock()
-        mock_socket.recv.side_effect = OSError("Recv error")
+        mock_socket.recv_into.side_effect = OSError("Recv error")
         protocol.tcp_socket = mock_socket
 
         mock_time.return_value = 0
@@ -680,5 +738,202 @@ class TestNexStarProtocol(unittest.TestCase):
         self.assertIsInstance(result, Failure)
 
 
+class _FakeMount:
+    """Minimal fake mount answering NexStar commands on a byte stream"""
+
+    RESPONSES: ClassVar[dict[bytes, bytes]] = {
+        b"Kx": b"x#",
+        b"V": b"4\x15#",
+        b"E": b"34AB0500,12CE0500#",
+        b"Z": b"40000000,10000000#",
+        b"L": b"0#",
+        b"t": b"\x01#",
+    }
+
+    def __init__(self, reply_delay=0.0, link_latency=0.0, baudrate=None):
+        self.reply_delay = reply_delay
+        self.link_latency = link_latency
+        self.byte_time = 10.0 / baudrate if baudrate else 0.0
+        self.commands = []
+
+    def serve(self, recv, send):
+        """Answer commands until the stream closes"""
+        pending = b""
+        while True:
+            try:
+                data = recv()
+            except OSError:
+                return
+            if not data:
+                return
+            # Link turnaround once per burst, plus 10 bits per byte on the wire
+            time.sleep(self.link_latency + len(data) * self.byte_time)
+            pending += data
+            while b"#" in pending:
+                command, pending = pending.split(b"#", 1)
+                self.commands.append(command)
+                if self.reply_delay:
+                    time.sleep(self.reply_delay)
+                response = self.RESPONSES.get(command, b"#")
+                time.sleep(len(response) * self.byte_time)
+                send(response)
+
+
+class TestBufferedReaderLoopback(unittest.TestCase):
+    """Exercise the buffered reader against a fake mount over real transports"""
+
+    def _tcp_protocol(self, mount, timeout=2.0):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server.bind(("127.0.0.1", 0))
+        server.listen(1)
+        self.addCleanup(server.close)
+
+        def serve(conn):
+            # Replies to a connection the client dropped are lost
+            with conn, contextlib.suppress(OSError):
+                mount.serve(lambda: conn.recv(64), conn.sendall)
+
+        def run():
+            # Serve reconnections too
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except OSError:
+                    return
+                serve(conn)
+
+        threading.Thread(target=run, daemon=True).start()
+
+        protocol = NexStarProtocol(
+            connection_type="tcp", host="127.0.0.1", tcp_port=server.getsockname()[1], timeout=timeout
+        )
+        with patch("celestron_nexstar.api.telescope.protocol.time.sleep"):
+            protocol.open()
+        self.addCleanup(protocol.close)
+        return protocol
+
+    def test_tcp_round_trip(self):
+        """Test commands and responses over a loopback TCP fake mount"""
+        mount = _FakeMount()
+        protocol = self._tcp_protocol(mount)
+
+        self.assertEqual(protocol.send_command("V"), "4\x15")
+        self.assertEqual(protocol.send_command("E"), "34AB0500,12CE0500")
+        self.assertEqual(mount.commands, [b"V", b"E"])
+
+    def test_tcp_latency_stats(self):
+        """Test per-command round-trip latency is recorded"""
+        protocol = self._tcp_protocol(_FakeMount(reply_delay=0.05))
+        self.assertEqual(protocol.get_latency_stats(), {})
+
+        for _ in range(3):
+            protocol.send_command("L")
+
+        stats = protocol.get_latency_stats()
+        self.assertEqual(stats["count"], 3)
+        self.assertGreaterEqual(stats["min"], 0.05)
+        self.assertLess(stats["max"], 1.0)
+        self.assertEqual(protocol.last_round_trip, stats["last"])
+
+    def test_tcp_wait_does_not_spin(self):
+        """Test waiting for a slow reply blocks instead of burning CPU"""
+        protocol = self._tcp_protocol(_FakeMount(reply_delay=0.3))
+
+        cpu_start = time.process_time()
+        self.assertEqual(protocol.send_command("L"), "0")
+        cpu_used = time.process_time() - cpu_start
+
+        self.assertGreaterEqual(protocol.last_round_trip, 0.3)
+        self.assertLess(cpu_used, 0.1)
+
+    def test_tcp_transaction(self):
+        """Test pipelined commands are written together and responses demultiplexed in order"""
+        mount = _FakeMount()
+        protocol = self._tcp_protocol(mount)
+
+        responses = protocol.transaction(["E", "Z", "L", "t"])
+
+        self.assertEqual(responses, ["34AB0500,12CE0500", "40000000,10000000", "0", "\x01"])
+        self.assertEqual(mount.commands, [b"E", b"Z", b"L", b"t"])
+        self.assertEqual(protocol.get_latency_stats()["count"], 1)
+        self.assertEqual(protocol.transaction([]), [])
+
+    def test_transaction_benchmark_9600_baud(self):
+        """Benchmark a state snapshot: one pipelined transaction vs four round-trips at 9600 baud"""
+        commands = ["E", "Z", "L", "t"]
+        protocol = self._tcp_protocol(_FakeMount(link_latency=0.016, baudrate=9600))
+
+        start = time.perf_counter()
+        sequential = [protocol.send_command(command) for command in commands]
+        sequential_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pipelined = protocol.transaction(commands)
+        pipelined_time = time.perf_counter() - start
+
+        self.assertEqual(pipelined, sequential)
+        self.assertLess(pipelined_time, sequential_time * 0.8)
+
+    def test_transaction_timeout_on_missing_response(self):
+        """Test a transaction times out if a later response never arrives"""
+        protocol = NexStarProtocol(connection_type="tcp", timeout=0.05)
+        mock_socket = MagicMock()
+        mock_socket.recv_into.side_effect = _recv_chunks([b"0#", TimeoutError()])
+        protocol.tcp_socket = mock_socket
+
+        with self.assertRaises(TelescopeTimeoutError):
+            protocol.transaction(["L", "t"])
+        mock_socket.sendall.assert_called_once_with(b"L#t#")
+
+    def test_tcp_transaction_shares_one_deadline(self):
+        """Test a transaction is bounded by one timeout, not one per command"""
+        protocol = self._tcp_protocol(_FakeMount(reply_delay=0.06), timeout=0.15)
+
+        start = time.monotonic()
+        with self.assertRaises(TelescopeTimeoutError):
+            protocol.transaction(["E", "Z", "L", "t"])
+        self.assertLess(time.monotonic() - start, 0.3)
+
+    def test_tcp_late_reply_after_timeout(self):
+        """Test a reply arriving after a timeout is not read as the next command's response"""
+        mount = _FakeMount(reply_delay=0.2)
+        protocol = self._tcp_protocol(mount, timeout=0.1)
+
+        with self.assertRaises(TelescopeTimeoutError):
+            protocol.send_command("L")
+        self.assertFalse(protocol.is_open())
+
+        mount.reply_delay = 0.0
+        time.sleep(0.2)
+        self.assertEqual(protocol.send_command("V"), "4\x15")
+
+    @unittest.skipUnless(sys.platform.startswith("linux") or sys.platform == "darwin", "requires a pty")
+    def test_serial_pty_round_trip(self):
+        """Test the serial path against a fake mount on a pseudo-terminal"""
+        master_fd, slave_fd = os.openpty()
+        self.addCleanup(os.close, master_fd)
+        mount = _FakeMount(reply_delay=0.2)
+
+        protocol = NexStarProtocol(port=os.ttyname(slave_fd), timeout=2.0)
+        with patch("celestron_nexstar.api.telescope.protocol.time.sleep"):
+            protocol.open()
+        os.close(slave_fd)
+        self.addCleanup(protocol.close)
+
+        threading.Thread(
+            target=mount.serve,
+            args=(lambda: os.read(master_fd, 64), lambda data: os.write(master_fd, data)),
+            daemon=True,
+        ).start()
+
+        cpu_start = time.process_time()
+        self.assertEqual(protocol.send_command("Kx"), "x")
+        cpu_used = time.process_time() - cpu_start
+
+        self.assertEqual(mount.commands, [b"Kx"])
+        self.assertGreaterEqual(protocol.last_round_trip, 0.2)
+        self.assertLess(cpu_used, 0.1)
+
+
 if __name__ == "__main__":
     unittest.main()
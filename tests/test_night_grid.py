@@ -0,0 +1,184 @@
+"""
+Unit tests for night_grid.py
+
+Tests the object-by-time altitude/azimuth grid and the rise, set, transit
+and visibility figures derived from it.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+
+import deal
+import numpy as np
+
+from celestron_nexstar.api.catalogs.catalogs import CelestialObject
+from celestron_nexstar.api.core.enums import CelestialObjectType
+from celestron_nexstar.api.core.utils import calculate_lst, ra_dec_to_alt_az
+from celestron_nexstar.api.observation import night_grid
+from celestron_nexstar.api.observation.night_grid import NightGrid, get_night_grid
+
+
+START = datetime(2024, 1, 15, 0, 0, tzinfo=UTC)
+LATITUDE, LONGITUDE = 40.0, -100.0
+
+
+def _object(name, ra_hours, dec_degrees, catalog="test"):
+    return CelestialObject(
+        name=name,
+        common_name=None,
+        catalog=catalog,
+        ra_hours=ra_hours,
+        dec_degrees=dec_degrees,
+        object_type=CelestialObjectType.STAR,
+        magnitude=2.0,
+    )
+
+
+OBJECTS = [
+    _object("M31", 0.712, 41.27),
+    _object("Polaris", 2.53, 89.26),
+    _object("Southern", 12.0, -80.0),
+    _object("Equator", 6.0, 0.0),
+]
+
+
+def _datetime(unix_seconds):
+    return datetime.fromtimestamp(float(unix_seconds), UTC)
+
+
+class TestNightGrid(unittest.TestCase):
+    """Test suite for NightGrid"""
+
+    def setUp(self):
+        """Build a one-day grid of OBJECTS"""
+        self.grid = NightGrid.for_objects(OBJECTS, LATITUDE, LONGITUDE, START, hours=24.0, step_minutes=10.0)
+
+    def test_shape_matches_scalar_transform(self):
+        """Test the grid holds one row per step and agrees with the scalar transform"""
+        self.assertEqual(self.grid.altitude.shape, (145, 4))
+        self.assertEqual(self.grid.altitude.dtype, np.float32)
+        self.assertEqual(self.grid.step_seconds, 600.0)
+        row = 37
+        azimuth, altitude = ra_dec_to_alt_az(0.712, 41.27, LATITUDE, LONGITUDE, _datetime(self.grid.times[row]))
+        self.assertAlmostEqual(float(self.grid.altitude[row, 0]), altitude, places=3)
+        self.assertAlmostEqual(float(self.grid.azimuth[row, 0]), azimuth, places=3)
+
+    def test_rise_and_set_cross_the_horizon(self):
+        """Test interpolated rise and set times are within a minute of the true crossing"""
+        column = self.grid.index("Equator")
+        for unix in (self.grid.rise_times()[column], self.grid.set_times()[column]):
+            _, altitude = ra_dec_to_alt_az(6.0, 0.0, LATITUDE, LONGITUDE, _datetime(unix))
+            # The object moves about 0.2° per minute near the horizon
+            self.assertLess(abs(altitude), 0.2)
+
+    def test_rise_and_set_missing_without_crossing(self):
+        """Test objects that never cross the horizon have no rise or set"""
+        for name in ("Polaris", "Southern"):
+            column = self.grid.index(name)
+            self.assertTrue(np.isnan(self.grid.rise_times()[column]))
+            self.assertTrue(np.isnan(self.grid.set_times()[column]))
+
+    def test_transit_and_max_altitude(self):
+        """Test the culmination is at zero hour angle and at 90 - |lat - dec| degrees"""
+        column = self.grid.index("M31")
+        transit = _datetime(self.grid.transit_times()[column])
+        # The J2000 coordinates have precessed by about a minute of RA and
+        # a few arcminutes of Dec since 2000
+        hour_angle = (calculate_lst(LONGITUDE, transit) - 0.712 + 12.0) % 24.0 - 12.0
+        self.assertLess(abs(hour_angle) * 60.0, 3.0)
+        self.assertAlmostEqual(self.grid.max_altitudes()[column], 90.0 - abs(LATITUDE - 41.27), delta=0.3)
+
+    def test_hours_above(self):
+        """Test time above the horizon is 12 hours on the equator, 24 and 0 at the extremes"""
+        hours = dict(zip(self.grid.names, self.grid.hours_above(), strict=True))
+        # Precession moves the equator object slightly, so allow a few minutes
+        self.assertAlmostEqual(hours["Equator"], 12.0, delta=0.1)
+        self.assertAlmostEqual(hours["Polaris"], 24.0)
+        self.assertEqual(hours["Southern"], 0.0)
+        self.assertLess(self.grid.hours_above(30.0)[self.grid.index("Equator")], 12.0)
+
+    def test_timelines(self):
+        """Test per-object timelines flag circumpolar and never-visible objects"""
+        polaris = self.grid.timeline("Polaris")
+        self.assertTrue(polaris.is_circumpolar)
+        self.assertTrue(polaris.is_always_visible)
+        southern = self.grid.timeline("Southern")
+        self.assertTrue(southern.is_never_visible)
+        self.assertIsNone(southern.transit_time)
+        equator = self.grid.timeline("Equator")
+        self.assertIsNotNone(equator.rise_time)
+        self.assertIsNotNone(equator.set_time)
+        self.assertEqual([timeline.object_name for timeline in self.grid.timelines()], list(self.grid.names))
+        with self.assertRaises(KeyError):
+            self.grid.timeline("M1")
+
+    def test_at(self):
+        """Test looking up every object at a time returns the nearest row"""
+        altitude, _ = self.grid.at(START + timedelta(minutes=61))
+        np.testing.assert_array_equal(altitude, self.grid.altitude[6])
+
+    def test_invalid_arguments(self):
+        """Test contracts on the window and altitude"""
+        with self.assertRaises(deal.PreContractError):
+            NightGrid.from_coordinates(["A"], [1.0], [2.0], LATITUDE, LONGITUDE, START, hours=0)
+        with self.assertRaises(deal.PreContractError):
+            self.grid.rise_times(min_altitude=95.0)
+
+
+class TestDynamicObjects(unittest.TestCase):
+    """Test suite for solar system objects in a NightGrid"""
+
+    def test_positions_are_interpolated(self):
+        """Test moving objects follow the position function, including across RA 0h"""
+        calls = []
+
+        def position(name, latitude, longitude, dt):
+            calls.append(dt)
+            hours = (dt - START).total_seconds() / 3600.0
+            return (23.9 + 0.01 * hours) % 24.0, 5.0
+
+        grid = NightGrid.for_objects(
+            [_object("Moon", 0.0, 0.0, catalog="moons")], LATITUDE, LONGITUDE, START, hours=24.0, position_func=position
+        )
+        self.assertEqual(len(calls), 25)
+        row = 100
+        when = _datetime(grid.times[row])
+        ra, dec = position("Moon", LATITUDE, LONGITUDE, when)
+        _, altitude = ra_dec_to_alt_az(ra, dec, LATITUDE, LONGITUDE, when)
+        self.assertAlmostEqual(float(grid.altitude[row, 0]), altitude, places=3)
+
+    def test_failing_objects_are_skipped(self):
+        """Test objects whose position cannot be calculated are left out"""
+
+        def position(name, latitude, longitude, dt):
+            raise ValueError("no ephemeris")
+
+        grid = NightGrid.for_objects(
+            [_object("Jupiter", 0.0, 0.0), OBJECTS[0]], LATITUDE, LONGITUDE, START, position_func=position
+        )
+        self.assertEqual(grid.names, ("M31",))
+
+
+class TestGetNightGrid(unittest.TestCase):
+    """Test suite for get_night_grid"""
+
+    def setUp(self):
+        """Start with an empty cache"""
+        night_grid._cache.clear()
+        self.addCleanup(night_grid._cache.clear)
+
+    def test_grids_are_reused(self):
+        """Test identical requests share a grid and different ones do not"""
+        grid = get_night_grid(OBJECTS, LATITUDE, LONGITUDE, START)
+        self.assertIs(get_night_grid(OBJECTS, LATITUDE, LONGITUDE, START.replace(tzinfo=None)), grid)
+        self.assertIsNot(get_night_grid(OBJECTS[:2], LATITUDE, LONGITUDE, START), grid)
+
+    def test_cache_is_bounded(self):
+        """Test only the most recent grids are kept"""
+        for day in range(night_grid._CACHE_SIZE + 2):
+            get_night_grid(OBJECTS[:1], LATITUDE, LONGITUDE, START + timedelta(days=day), hours=1.0)
+        self.assertEqual(len(night_grid._cache), night_grid._CACHE_SIZE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -251,6 +251,41 @@ class TestObservationPlannerInternalMethods(unittest.TestCase):
         rec = self.planner._score_object(self.obj, self.conditions, not_visible, moon_ra=12.0, moon_dec=45.0)
         self.assertIsNone(rec)
 
+    def test_score_object_visible_hours(self):
+        """Test that the visible duration comes from the calculated hours"""
+        rec = self.planner._score_object(self.obj, self.conditions, self.vis_info, visible_hours=3.5)
+        self.assertEqual(rec.visible_duration_hours, 3.5)
+
+    def test_calculate_visible_hours(self):
+        """Test hours above an altitude until sunrise"""
+        conditions = ObservingConditions(
+            **{**self.conditions.__dict__, "sunrise_time": self.conditions.timestamp + timedelta(hours=10)}
+        )
+        circumpolar = CelestialObject(
+            name="Polaris",
+            common_name=None,
+            ra_hours=2.53,
+            dec_degrees=89.26,
+            magnitude=2.0,
+            object_type=CelestialObjectType.STAR,
+            catalog="test",
+        )
+        southern = CelestialObject(
+            name="Southern",
+            common_name=None,
+            ra_hours=12.0,
+            dec_degrees=-80.0,
+            magnitude=2.0,
+            object_type=CelestialObjectType.STAR,
+            catalog="test",
+        )
+
+        hours = self.planner._calculate_visible_hours([circumpolar, southern], conditions, min_altitude_deg=20.0)
+
+        self.assertAlmostEqual(hours["Polaris"], 10.0, places=3)
+        self.assertEqual(hours["Southern"], 0.0)
+        self.assertEqual(self.planner._calculate_visible_hours([], conditions, min_altitude_deg=20.0), {})
+
     def test_determine_priority_excellent_seeing(self):
         """Test priority determination with excellent seeing"""
         excellent_conditions = ObservingConditions(
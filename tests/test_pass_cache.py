@@ -0,0 +1,110 @@
+"""
+Unit tests for pass_cache.py
+
+Tests that passes are stored by TLE epoch and observer geohash, that longer
+windows only compute their tail, and that newer TLEs invalidate old passes.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from celestron_nexstar.api.database.models import Base, SatellitePassModel, SatellitePassWindowModel
+from celestron_nexstar.api.events import pass_cache
+from celestron_nexstar.api.events.pass_cache import get_cached_passes, invalidate_stale_passes, tle_cache_key
+from celestron_nexstar.api.events.pass_engine import predict_passes
+
+
+ISS_TLE = (
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24288.51782528  .00018012  00000+0  31853-3 0  9995",
+    "2 25544  51.6393 126.4467 0009145  65.3329  45.1618 15.50131588477116",
+)
+START = datetime(2024, 10, 14, tzinfo=UTC)
+LATITUDE, LONGITUDE = 40.7, -74.0
+
+
+class TestGetCachedPasses(unittest.TestCase):
+    """Test suite for get_cached_passes"""
+
+    def setUp(self):
+        """Use an in-memory database and count pass engine searches"""
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine, tables=[SatellitePassWindowModel.__table__, SatellitePassModel.__table__])
+        self.session = sessionmaker(bind=engine)()
+        self.addCleanup(self.session.close)
+        patcher = patch.object(pass_cache, "predict_passes", wraps=predict_passes)
+        self.predict = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, days, min_altitude_deg=10.0, tles=(ISS_TLE,)):
+        """Get ISS passes for a window starting at START"""
+        return get_cached_passes(
+            list(tles),
+            LATITUDE,
+            LONGITUDE,
+            START,
+            START + timedelta(days=days),
+            min_altitude_deg=min_altitude_deg,
+            db_session=self.session,
+        )
+
+    def test_matches_direct_computation(self):
+        """Test cached passes equal a direct engine search"""
+        cached = self.get(1)
+        direct = predict_passes([ISS_TLE], LATITUDE, LONGITUDE, START, START + timedelta(days=1), workers=1)
+        self.assertEqual([p.rise_time for p in cached], [p.rise_time for p in direct.passes])
+        self.assertEqual(cached[0].name, "ISS (ZARYA)")
+        self.assertEqual(cached[0].rise_time.tzinfo, UTC)
+
+    def test_repeat_is_served_from_cache(self):
+        """Test a covered window and other altitude thresholds need no search"""
+        first = self.get(1)
+        self.assertEqual(self.get(1), first)
+        high = self.get(1, min_altitude_deg=30.0)
+        self.assertEqual(self.predict.call_count, 1)
+        self.assertEqual(high, [p for p in first if p.max_altitude_deg >= 30.0])
+
+    def test_longer_window_computes_only_the_tail(self):
+        """Test extending the window searches from the covered end"""
+        self.get(1)
+        extended = self.get(2)
+        self.assertEqual(self.predict.call_count, 2)
+        tail_start = self.predict.call_args.args[3]
+        self.assertGreater(tail_start, START + timedelta(hours=23))
+
+        direct = predict_passes([ISS_TLE], LATITUDE, LONGITUDE, START, START + timedelta(days=2), workers=1)
+        self.assertEqual([p.rise_time for p in extended], [p.rise_time for p in direct.passes])
+        self.assertEqual(self.session.query(SatellitePassWindowModel).count(), 1)
+
+    def test_new_epoch_replaces_old_passes(self):
+        """Test a newer TLE is a cache miss and removes the older passes"""
+        self.get(1)
+        newer = (ISS_TLE[0], ISS_TLE[1].replace("24288.51782528", "24288.91782528"), ISS_TLE[2])
+        self.get(1, tles=[newer])
+        self.assertEqual(self.predict.call_count, 2)
+        epochs = {row.tle_epoch for row in self.session.query(SatellitePassModel)}
+        self.assertEqual(len(epochs), 1)
+
+    def test_invalidate_stale_passes(self):
+        """Test storing a newer epoch deletes passes from older TLEs"""
+        self.get(1)
+        norad_id, epoch = tle_cache_key(ISS_TLE[1], ISS_TLE[2])
+        self.assertEqual(invalidate_stale_passes(self.session, {norad_id: epoch}), 0)
+        deleted = invalidate_stale_passes(self.session, {norad_id: epoch + timedelta(hours=6)})
+        self.assertGreater(deleted, 0)
+        self.assertEqual(self.session.query(SatellitePassWindowModel).count(), 0)
+
+    def test_tle_cache_key(self):
+        """Test NORAD id and epoch are read from the TLE"""
+        norad_id, epoch = tle_cache_key(ISS_TLE[1], ISS_TLE[2])
+        self.assertEqual(norad_id, 25544)
+        self.assertEqual(epoch.date(), datetime(2024, 10, 14).date())
+        self.assertEqual(epoch.tzinfo, UTC)
+
+
+if __name__ == "__main__":
+    unittest.main()
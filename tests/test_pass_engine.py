@@ -0,0 +1,130 @@
+"""
+Unit tests for pass_engine.py
+
+Tests the vectorized satellite pass engine against Skyfield's find_events,
+the process-pool fan-out, and the bulk sunlit/dark-sky flags.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+from skyfield.api import EarthSatellite, wgs84
+
+from celestron_nexstar.api.ephemeris.registry import get_timescale
+from celestron_nexstar.api.events import pass_engine
+from celestron_nexstar.api.events.pass_engine import PredictedPass, predict_passes, tle_from_satellite
+
+
+ISS_TLE = (
+    "ISS (ZARYA)",
+    "1 25544U 98067A   24288.51782528  .00018012  00000+0  31853-3 0  9995",
+    "2 25544  51.6393 126.4467 0009145  65.3329  45.1618 15.50131588477116",
+)
+START = datetime(2024, 10, 14, tzinfo=UTC)
+END = START + timedelta(days=1)
+LATITUDE, LONGITUDE = 40.7, -74.0
+
+
+class TestPredictPasses(unittest.TestCase):
+    """Test suite for predict_passes"""
+
+    def test_matches_skyfield_find_events(self):
+        """Test rise, culmination and set agree with Skyfield to within a second"""
+        ts = get_timescale()
+        satellite = EarthSatellite(ISS_TLE[1], ISS_TLE[2], ISS_TLE[0], ts)
+        observer = wgs84.latlon(LATITUDE, LONGITUDE)
+        times, events = satellite.find_events(observer, ts.from_datetime(START), ts.from_datetime(END), 10.0)
+        culminations = [t.utc_datetime() for t, event in zip(times, events, strict=True) if event == 1]
+
+        result = predict_passes([ISS_TLE], LATITUDE, LONGITUDE, START, END, min_altitude_deg=10.0, workers=1)
+        self.assertEqual(len(result.passes), len(culminations))
+        for predicted, expected in zip(result.passes, culminations, strict=True):
+            self.assertLess(abs((predicted.culmination_time - expected).total_seconds()), 1.0)
+            altitude = (satellite - observer).at(ts.from_datetime(expected)).altaz()[0].degrees
+            self.assertAlmostEqual(predicted.max_altitude_deg, altitude, places=2)
+
+        first = result.passes[0]
+        self.assertEqual(first.name, "ISS (ZARYA)")
+        self.assertLess(abs((first.rise_time - datetime(2024, 10, 14, 13, 37, 25, tzinfo=UTC)).total_seconds()), 1.0)
+        self.assertLess(abs((first.set_time - datetime(2024, 10, 14, 13, 47, 34, tzinfo=UTC)).total_seconds()), 1.0)
+
+    def test_minimum_altitude_and_statistics(self):
+        """Test low passes are screened out and counted"""
+        result = predict_passes([ISS_TLE], LATITUDE, LONGITUDE, START, END, min_altitude_deg=30.0, workers=1)
+        self.assertTrue(all(p.max_altitude_deg >= 30.0 for p in result.passes))
+        self.assertGreaterEqual(result.candidates, len(result.passes))
+        self.assertEqual(result.satellites, 1)
+        self.assertGreater(result.satellites_per_second, 0.0)
+
+    def test_process_pool_matches_serial(self):
+        """Test chunks fanned out to workers give the serial result, sorted by rise time"""
+        tles = [(f"SAT {i}", ISS_TLE[1], ISS_TLE[2]) for i in range(4)]
+        serial = predict_passes(tles, LATITUDE, LONGITUDE, START, END, workers=1, chunk_size=1)
+        pooled = predict_passes(tles, LATITUDE, LONGITUDE, START, END, workers=2, chunk_size=1)
+        self.assertEqual(serial.passes, pooled.passes)
+        self.assertEqual(len(serial.passes), 4 * len(predict_passes([ISS_TLE], LATITUDE, LONGITUDE, START, END).passes))
+        rises = [p.rise_time for p in pooled.passes]
+        self.assertEqual(rises, sorted(rises))
+
+    def test_pool_failure_falls_back_to_serial(self):
+        """Test an unavailable process pool does not fail the search"""
+        tles = [ISS_TLE, ISS_TLE]
+        with patch.object(pass_engine, "ProcessPoolExecutor", side_effect=OSError("no processes")):
+            result = predict_passes(tles, LATITUDE, LONGITUDE, START, END, workers=2, chunk_size=1)
+        self.assertEqual(len(result.passes), 2 * len(predict_passes([ISS_TLE], LATITUDE, LONGITUDE, START, END).passes))
+
+    def test_default_workers(self):
+        """Test small searches stay in process and large ones get one balanced chunk per worker"""
+        tles = [(f"SAT {i}", ISS_TLE[1], ISS_TLE[2]) for i in range(130)]
+        with (
+            patch.object(pass_engine, "_available_cpus", return_value=2),
+            patch.object(pass_engine, "ProcessPoolExecutor") as executor,
+        ):
+            executor.return_value.__enter__.return_value.map.side_effect = map
+            predict_passes(tles[:100], LATITUDE, LONGITUDE, START, END)
+            executor.assert_not_called()
+
+            result = predict_passes(tles, LATITUDE, LONGITUDE, START, END)
+            executor.assert_called_once_with(max_workers=2)
+        _task, chunks = executor.return_value.__enter__.return_value.map.call_args.args
+        self.assertEqual([len(chunk) for chunk in chunks], [65, 65])
+        self.assertEqual(result.satellites, 130)
+
+    def test_tle_from_satellite_round_trip(self):
+        """Test Skyfield satellites convert back to TLE text"""
+        satellite = EarthSatellite(ISS_TLE[1], ISS_TLE[2], ISS_TLE[0], get_timescale())
+        name, line1, line2 = tle_from_satellite(satellite)
+        self.assertEqual(name, ISS_TLE[0])
+        self.assertEqual(line1[:32], ISS_TLE[1][:32])
+        self.assertEqual(line2[:63], ISS_TLE[2][:63])
+
+
+class TestSunlight(unittest.TestCase):
+    """Test suite for the bulk sunlit and dark-sky flags"""
+
+    def test_sun_direction_at_solstice(self):
+        """Test the Sun's declination at the June solstice"""
+        solstice = datetime(2024, 6, 20, 20, 51, tzinfo=UTC).timestamp()
+        sun = pass_engine._sun_direction(np.array([solstice]))
+        self.assertAlmostEqual(np.linalg.norm(sun[0]), 1.0)
+        self.assertAlmostEqual(np.degrees(np.arcsin(sun[0, 2])), 23.44, places=1)
+
+    def test_earth_shadow(self):
+        """Test positions behind the Earth are in shadow"""
+        sun = np.array([[1.0, 0.0, 0.0]] * 3)
+        positions = np.array([[7000.0, 0.0, 0.0], [-7000.0, 0.0, 0.0], [-7000.0, 7000.0, 0.0]])
+        np.testing.assert_array_equal(pass_engine._is_sunlit(positions, sun), [True, False, True])
+
+    def test_visibility_needs_dark_sky(self):
+        """Test a sunlit satellite is only visible once the Sun is down"""
+        now = datetime(2024, 10, 14, tzinfo=UTC)
+        predicted = PredictedPass("ISS", now, now, now, 45.0, is_sunlit=True, sun_altitude_deg=-12.0)
+        self.assertTrue(predicted.is_visible)
+        self.assertFalse(PredictedPass("ISS", now, now, now, 45.0, True, 10.0).is_visible)
+        self.assertFalse(PredictedPass("ISS", now, now, now, 45.0, False, -12.0).is_visible)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Benchmarks for the satellite pass engine
+
+Measures satellites/sec for a one-day pass search over a synthetic
+Starlink-like shell, serially and across a process pool, and checks the
+pool is faster than a serial search on hosts with more than one CPU.
+
+Run only the benchmarks with:
+    pytest tests/test_pass_engine_benchmarks.py --benchmark-only
+"""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+
+pytest.importorskip("pytest_benchmark")
+
+from sgp4.api import WGS72, Satrec
+from sgp4.exporter import export_tle
+
+from celestron_nexstar.api.events import pass_engine
+from celestron_nexstar.api.events.pass_engine import predict_passes
+
+
+START = datetime(2024, 10, 14, tzinfo=UTC)
+END = START + timedelta(days=1)
+SATELLITES = 512
+
+
+@pytest.fixture(scope="module")
+def constellation():
+    """TLEs for a 53° shell at 550 km, spread over 32 planes"""
+    epoch = (START - datetime(1949, 12, 31, tzinfo=UTC)).total_seconds() / 86400.0
+    mean_motion = 15.06 * 2.0 * np.pi / 1440.0  # rad/min
+    tles = []
+    for i in range(SATELLITES):
+        satrec = Satrec()
+        satrec.sgp4init(
+            WGS72,
+            "i",
+            i + 1,
+            epoch,
+            2.0e-5,
+            0.0,
+            0.0,
+            0.0001,
+            0.0,
+            np.radians(53.0),
+            np.radians((i * 137.5) % 360.0),
+            mean_motion,
+            np.radians((i % 32) * 11.25),
+        )
+        line1, line2 = export_tle(satrec)
+        tles.append((f"SHELL-{i}", line1, line2))
+    return tles
+
+
+@pytest.mark.parametrize("workers", [1, None], ids=["serial", "default"])
+def test_predict_passes_throughput(benchmark, benchmark_stats, constellation, workers):
+    """Benchmark a one-day search over the whole shell, serially and with the default workers"""
+    result = benchmark.pedantic(
+        predict_passes,
+        args=(constellation, 40.7, -74.0, START, END),
+        kwargs={"workers": workers},
+        rounds=3,
+    )
+
+    assert result.passes
+    benchmark.extra_info["satellites_per_sec"] = SATELLITES / benchmark_stats().mean
+    benchmark.extra_info["candidates"] = result.candidates
+
+
+@pytest.mark.skipif(pass_engine._available_cpus() < 2, reason="needs at least two CPUs")
+def test_process_pool_speedup(benchmark, benchmark_stats, constellation):
+    """Benchmark the default process pool against a serial search: it has to be faster"""
+    serial = min(predict_passes(constellation, 40.7, -74.0, START, END, workers=1).elapsed_seconds for _ in range(3))
+    benchmark.pedantic(predict_passes, args=(constellation, 40.7, -74.0, START, END), rounds=3)
+
+    speedup = serial / benchmark_stats().mean
+    benchmark.extra_info["speedup"] = speedup
+    assert speedup > 1.3
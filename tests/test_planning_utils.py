@@ -7,7 +7,7 @@ checklists, difficulty ratings, moon phase impact, and more.
 
 import unittest
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from celestron_nexstar.api.catalogs.catalogs import CelestialObject
 from celestron_nexstar.api.core.enums import CelestialObjectType, MoonPhase
@@ -431,7 +431,7 @@ class TestGenerateQuickReference(unittest.TestCase):
         """Test quick reference generation"""
         objects = [
             CelestialObject(
-            name="M31",
+                name="M31",
                 common_name=None,
                 catalog="messier",
                 ra_hours=0.7,
@@ -440,7 +440,7 @@ class TestGenerateQuickReference(unittest.TestCase):
                 magnitude=3.4,
             ),
             CelestialObject(
-            name="Jupiter",
+                name="Jupiter",
                 common_name=None,
                 catalog="planet",
                 ra_hours=10.0,
@@ -538,23 +538,17 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
     """Test suite for get_object_visibility_timeline function"""
 
     @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.planning_utils.calculate_lst")
     @patch("celestron_nexstar.api.observation.planning_utils.ra_dec_to_alt_az")
     @patch("celestron_nexstar.api.observation.planning_utils.is_dynamic_object")
-    def test_get_timeline_fixed_object(self, mock_dynamic, mock_ra_dec, mock_lst, mock_alt_az, mock_location):
+    def test_get_timeline_fixed_object(self, mock_dynamic, mock_ra_dec, mock_lst, mock_location):
         """Test timeline for fixed object"""
         from celestron_nexstar.api.location.observer import ObserverLocation
 
         mock_dynamic.return_value = False
         mock_location.return_value = ObserverLocation(latitude=40.0, longitude=-100.0)
         mock_lst.return_value = 12.0
-        mock_ra_dec.return_value = (45.0, 0.0)  # altitude, azimuth
-        mock_alt_az.side_effect = [
-            (30.0, 180.0),  # Initial check
-            (45.0, 0.0),  # Transit
-            (30.0, 180.0),  # Later check
-        ]
+        mock_ra_dec.return_value = (0.0, 45.0)  # azimuth, altitude
 
         obj = CelestialObject(
             name="M31",
@@ -571,11 +565,10 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
 
     @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
     @patch("celestron_nexstar.api.observation.planning_utils.get_planetary_position")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.planning_utils.calculate_lst")
     @patch("celestron_nexstar.api.observation.planning_utils.ra_dec_to_alt_az")
     @patch("celestron_nexstar.api.observation.planning_utils.is_dynamic_object")
-    def test_get_timeline_dynamic_object(self, mock_dynamic, mock_ra_dec, mock_lst, mock_alt_az, mock_planet_pos, mock_location):
+    def test_get_timeline_dynamic_object(self, mock_dynamic, mock_ra_dec, mock_lst, mock_planet_pos, mock_location):
         """Test timeline for dynamic object (planet)"""
         from celestron_nexstar.api.location.observer import ObserverLocation
 
@@ -583,12 +576,7 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
         mock_location.return_value = ObserverLocation(latitude=40.0, longitude=-100.0)
         mock_planet_pos.return_value = (10.0, 20.0)  # RA, Dec
         mock_lst.return_value = 12.0
-        mock_ra_dec.return_value = (45.0, 0.0)  # altitude, azimuth
-        mock_alt_az.side_effect = [
-            (30.0, 180.0),  # Initial check
-            (45.0, 0.0),  # Transit
-            (30.0, 180.0),  # Later check
-        ]
+        mock_ra_dec.return_value = (0.0, 45.0)  # azimuth, altitude
 
         obj = CelestialObject(
             name="Jupiter",
@@ -604,11 +592,10 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
         self.assertEqual(timeline.object_name, "Jupiter")
 
     @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.planning_utils.calculate_lst")
     @patch("celestron_nexstar.api.observation.planning_utils.ra_dec_to_alt_az")
     @patch("celestron_nexstar.api.observation.planning_utils.is_dynamic_object")
-    def test_get_timeline_circumpolar(self, mock_dynamic, mock_ra_dec, mock_lst, mock_alt_az, mock_location):
+    def test_get_timeline_circumpolar(self, mock_dynamic, mock_ra_dec, mock_lst, mock_location):
         """Test timeline for circumpolar object"""
         from celestron_nexstar.api.location.observer import ObserverLocation
 
@@ -616,13 +603,8 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
         # High latitude observer, object near pole
         mock_location.return_value = ObserverLocation(latitude=80.0, longitude=-100.0)
         mock_lst.return_value = 12.0
-        mock_ra_dec.return_value = (85.0, 0.0)  # altitude, azimuth
+        mock_ra_dec.return_value = (0.0, 85.0)  # azimuth, altitude
         # Always above horizon
-        mock_alt_az.side_effect = [
-            (85.0, 180.0),  # Initial check
-            (85.0, 0.0),  # Transit
-            (85.0, 180.0),  # Later check
-        ]
 
         obj = CelestialObject(
             name="Polaris",
@@ -639,11 +621,10 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
         self.assertTrue(timeline.is_always_visible)
 
     @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.planning_utils.calculate_lst")
     @patch("celestron_nexstar.api.observation.planning_utils.ra_dec_to_alt_az")
     @patch("celestron_nexstar.api.observation.planning_utils.is_dynamic_object")
-    def test_get_timeline_never_visible(self, mock_dynamic, mock_ra_dec, mock_lst, mock_alt_az, mock_location):
+    def test_get_timeline_never_visible(self, mock_dynamic, mock_ra_dec, mock_lst, mock_location):
         """Test timeline for object never visible"""
         from celestron_nexstar.api.location.observer import ObserverLocation
 
@@ -651,15 +632,8 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
         mock_location.return_value = ObserverLocation(latitude=40.0, longitude=-100.0)
         mock_lst.return_value = 12.0
         # Transit altitude is below horizon
-        mock_ra_dec.return_value = (-10.0, 0.0)  # Below horizon at transit
+        mock_ra_dec.return_value = (0.0, -10.0)  # Below horizon at transit
         # All altitude checks return negative (below horizon)
-        mock_alt_az.side_effect = [
-            (-5.0, 180.0),  # Initial check - below horizon
-            (-10.0, 0.0),  # Transit - below horizon (max altitude is negative)
-            (-5.0, 180.0),  # Later check - below horizon
-            (-5.0, 180.0),  # Additional checks for rise/set
-            (-5.0, 180.0),
-        ]
 
         obj = CelestialObject(
             name="Southern Object",
@@ -679,99 +653,48 @@ class TestGetObjectVisibilityTimeline(unittest.TestCase):
 class TestGetTransitTimes(unittest.TestCase):
     """Test suite for get_transit_times function"""
 
-    @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_visibility_timeline")
-    def test_get_transit_times(self, mock_timeline, mock_location):
-        """Test getting transit times for multiple objects"""
-        from celestron_nexstar.api.location.observer import ObserverLocation
-
-        mock_location.return_value = ObserverLocation(latitude=40.0, longitude=-100.0)
+    DATE = datetime(2024, 1, 15, 3, 0, 0, tzinfo=UTC)
 
-        transit_time = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
-        mock_timeline.return_value = ObjectVisibilityTimeline(
-            object_name="M31",
-            rise_time=None,
-            transit_time=transit_time,
-            set_time=None,
-            max_altitude=45.0,
-            is_circumpolar=False,
-            is_always_visible=False,
-            is_never_visible=False,
+    def _object(self, name, ra_hours, dec_degrees):
+        return CelestialObject(
+            name=name,
+            common_name=None,
+            catalog="test",
+            ra_hours=ra_hours,
+            dec_degrees=dec_degrees,
+            object_type=CelestialObjectType.GALAXY,
+            magnitude=3.4,
         )
 
-        objects = [
-            CelestialObject(
-            name="M31",
-                common_name=None,
-                catalog="messier",
-                ra_hours=0.7,
-                dec_degrees=41.3,
-                object_type=CelestialObjectType.GALAXY,
-                magnitude=3.4,
-            )
-        ]
+    def test_get_transit_times(self):
+        """Test transit times match the moment the hour angle is zero"""
+        from celestron_nexstar.api.core.utils import calculate_lst
 
-        result = get_transit_times(objects)
+        result = get_transit_times([self._object("M31", 0.7, 41.3)], 40.0, -100.0, self.DATE)
         self.assertIn("M31", result)
-        self.assertEqual(result["M31"], transit_time)
+        # The next transit after the date, never one that already happened
+        self.assertGreaterEqual(result["M31"], self.DATE)
+        self.assertLess(result["M31"], self.DATE + timedelta(hours=24))
+        # The J2000 RA has precessed by about a minute of time since 2000
+        hour_angle = (calculate_lst(-100.0, result["M31"]) - 0.7 + 12.0) % 24.0 - 12.0
+        self.assertLess(abs(hour_angle) * 60.0, 3.0)
+
+    def test_get_transit_times_no_transit(self):
+        """Test objects that never rise have no transit"""
+        result = get_transit_times([self._object("Southern", 12.0, -80.0)], 40.0, -100.0, self.DATE)
+        self.assertNotIn("Southern", result)
 
     @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_visibility_timeline")
-    def test_get_transit_times_no_transit(self, mock_timeline, mock_location):
-        """Test getting transit times when object has no transit"""
-        from celestron_nexstar.api.location.observer import ObserverLocation
-
-        mock_location.return_value = ObserverLocation(latitude=40.0, longitude=-100.0)
-        mock_timeline.return_value = ObjectVisibilityTimeline(
-            object_name="M31",
-            rise_time=None,
-            transit_time=None,  # No transit
-            set_time=None,
-            max_altitude=-10.0,
-            is_circumpolar=False,
-            is_always_visible=False,
-            is_never_visible=True,
-        )
-
-        objects = [
-            CelestialObject(
-            name="M31",
-                common_name=None,
-                catalog="messier",
-                ra_hours=0.7,
-                dec_degrees=41.3,
-                object_type=CelestialObjectType.GALAXY,
-                magnitude=3.4,
-            )
-        ]
-
-        result = get_transit_times(objects)
-        self.assertNotIn("M31", result)
-
-    @patch("celestron_nexstar.api.observation.planning_utils.get_observer_location")
-    @patch("celestron_nexstar.api.observation.planning_utils.get_object_visibility_timeline")
-    def test_get_transit_times_exception(self, mock_timeline, mock_location):
-        """Test getting transit times when exception occurs"""
+    @patch("celestron_nexstar.api.observation.planning_utils.get_planetary_position")
+    def test_get_transit_times_exception(self, mock_position, mock_location):
+        """Test objects whose position cannot be calculated are skipped"""
         from celestron_nexstar.api.location.observer import ObserverLocation
 
         mock_location.return_value = ObserverLocation(latitude=40.0, longitude=-100.0)
-        mock_timeline.side_effect = Exception("Calculation error")
-
-        objects = [
-            CelestialObject(
-            name="M31",
-                common_name=None,
-                catalog="messier",
-                ra_hours=0.7,
-                dec_degrees=41.3,
-                object_type=CelestialObjectType.GALAXY,
-                magnitude=3.4,
-            )
-        ]
+        mock_position.side_effect = Exception("Calculation error")
 
-        result = get_transit_times(objects)
-        # Should return empty dict when exception occurs
-        self.assertEqual(result, {})
+        result = get_transit_times([self._object("Jupiter", 10.0, 20.0), self._object("M31", 0.7, 41.3)])
+        self.assertEqual(list(result), ["M31"])
 
 
 if __name__ == "__main__":
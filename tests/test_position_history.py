@@ -0,0 +1,208 @@
+"""
+Unit tests for position_history.py
+
+Tests the PositionHistory ring buffer, its lock-free snapshots and the
+streaming exports.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import deal
+import numpy as np
+
+from celestron_nexstar.api.telescope.position_history import (
+    FLAG_UNEXPECTED_MOVEMENT,
+    HistorySnapshot,
+    PositionHistory,
+)
+
+
+def _fill(history, count, start=0):
+    """Record samples whose every column encodes the sequence number"""
+    for seq in range(start, start + count):
+        history.record(1_700_000_000.0 + seq, seq, seq, seq, seq, flags=seq % 2)
+
+
+class TestPositionHistory(unittest.TestCase):
+    """Test suite for PositionHistory"""
+
+    def setUp(self):
+        """Create a small history and a temporary directory"""
+        self.history = PositionHistory(capacity=8)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_capacity_validation(self):
+        """Test capacity must be in range"""
+        with self.assertRaises(deal.PreContractError):
+            PositionHistory(capacity=0)
+        with self.assertRaises(deal.PreContractError):
+            self.history.resize(20_000_000)
+
+    def test_large_capacity_is_cheap(self):
+        """Test a million-sample history can be created and used"""
+        history = PositionHistory(capacity=1_000_000)
+        _fill(history, 3)
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history.capacity, 1_000_000)
+
+    def test_wraparound_keeps_newest(self):
+        """Test the oldest samples are overwritten once full"""
+        _fill(self.history, 20)
+        snapshot = self.history.snapshot()
+        self.assertEqual(len(self.history), 8)
+        self.assertEqual(self.history.total_recorded, 20)
+        self.assertEqual(snapshot.ra_hours.tolist(), list(range(12, 20)))
+        self.assertEqual(snapshot.flags.tolist(), [seq % 2 for seq in range(12, 20)])
+
+    def test_snapshot_filters(self):
+        """Test last, first and since selections on a wrapped buffer"""
+        _fill(self.history, 13)
+        self.assertEqual(self.history.snapshot(last=3).ra_hours.tolist(), [10, 11, 12])
+        self.assertEqual(self.history.snapshot(first=2).ra_hours.tolist(), [5, 6])
+        since = datetime.fromtimestamp(1_700_000_009.0, UTC)
+        self.assertEqual(self.history.snapshot(since=since).ra_hours.tolist(), [9, 10, 11, 12])
+        self.assertEqual(self.history.snapshot(since=since, last=2).ra_hours.tolist(), [11, 12])
+
+    def test_snapshot_is_read_only_copy(self):
+        """Test snapshots do not change when the buffer is overwritten"""
+        _fill(self.history, 4)
+        snapshot = self.history.snapshot()
+        _fill(self.history, 8, start=100)
+        self.assertEqual(snapshot.ra_hours.tolist(), [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            snapshot.ra_hours[0] = 1.0
+
+    def test_append_history_dict(self):
+        """Test dict entries round-trip through to_dicts"""
+        when = datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
+        self.history.append(
+            {
+                "timestamp": when,
+                "ra_hours": 5.5,
+                "dec_degrees": -5.4,
+                "alt_degrees": 30.0,
+                "az_degrees": 180.0,
+                "alert": "UNEXPECTED_MOVEMENT",
+                "speed": 7.5,
+            }
+        )
+        (entry,) = self.history.snapshot().to_dicts()
+        self.assertEqual(entry["timestamp"], when)
+        self.assertEqual(entry["ra_hours"], 5.5)
+        self.assertEqual(entry["alert"], "UNEXPECTED_MOVEMENT")
+        self.assertEqual(entry["speed"], 7.5)
+
+    def test_naive_datetimes_are_utc(self):
+        """Test naive datetimes are read as UTC and history hands back UTC datetimes"""
+        when = datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
+        with patch.dict(os.environ, {"TZ": "America/New_York"}):
+            time.tzset()
+            self.addCleanup(time.tzset)
+            self.history.record(when.replace(tzinfo=None), 5.5, -5.4, 30.0, 180.0)
+            self.history.record(when + timedelta(minutes=1), 5.6, -5.4, 30.0, 180.0)
+            since = self.history.snapshot(since=datetime(2024, 6, 1, 12, 0, 30))
+
+        self.assertEqual(self.history.snapshot().timestamp[0], when.timestamp())
+        self.assertEqual(since.ra_hours.tolist(), [5.6])
+        (entry, _) = self.history.snapshot().to_dicts()
+        self.assertEqual(entry["timestamp"], when)
+        self.assertIs(entry["timestamp"].tzinfo, UTC)
+
+    def test_clear_and_resize(self):
+        """Test clear empties the buffer and resize keeps the newest samples"""
+        _fill(self.history, 6)
+        self.history.resize(4)
+        self.assertEqual(self.history.snapshot().ra_hours.tolist(), [2, 3, 4, 5])
+        self.history.resize(16)
+        _fill(self.history, 2, start=6)
+        self.assertEqual(self.history.snapshot().ra_hours.tolist(), [2, 3, 4, 5, 6, 7])
+        self.history.clear()
+        self.assertEqual(len(self.history), 0)
+        self.assertFalse(self.history)
+        self.assertEqual(len(self.history.snapshot()), 0)
+
+    def test_iter_chunks(self):
+        """Test chunked iteration covers every held sample once"""
+        _fill(self.history, 11)
+        chunks = list(self.history.iter_chunks(chunk_size=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 2])
+        self.assertEqual(np.concatenate([chunk.ra_hours for chunk in chunks]).tolist(), list(range(3, 11)))
+        self.assertIsInstance(chunks[0], HistorySnapshot)
+
+    def test_snapshots_consistent_under_concurrent_writes(self):
+        """Test lock-free readers never see a torn row while the writer wraps the buffer"""
+        history = PositionHistory(capacity=64)
+        stop = threading.Event()
+
+        def writer():
+            seq = 0
+            while not stop.is_set():
+                history.record(float(seq), seq, seq, seq, seq)
+                seq += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(2000):
+                snapshot = history.snapshot()
+                for column in (snapshot.ra_hours, snapshot.dec_degrees, snapshot.alt_degrees, snapshot.az_degrees):
+                    np.testing.assert_array_equal(column, snapshot.timestamp)
+                if len(snapshot) > 1:
+                    self.assertTrue(np.all(np.diff(snapshot.timestamp) == 1.0))
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_export_csv(self):
+        """Test streaming CSV export"""
+        _fill(self.history, 10)
+        path = os.path.join(self.tmp.name, "history.csv")
+        self.assertEqual(self.history.export_csv(path, chunk_size=3), 8)
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["timestamp", "ra_hours", "dec_degrees", "alt_degrees", "az_degrees", "flags"])
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(rows[1][0], "2023-11-14T22:13:22.000000Z")
+        self.assertEqual(float(rows[-1][1]), 9.0)
+
+    def test_export_json(self):
+        """Test streaming JSON export"""
+        _fill(self.history, 5)
+        self.history.record(1_700_000_100.0, 1.0, 2.0, 3.0, 4.0, speed=9.0, flags=FLAG_UNEXPECTED_MOVEMENT)
+        path = os.path.join(self.tmp.name, "history.json")
+        self.assertEqual(self.history.export_json(path, chunk_size=2), 6)
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data["count"], 6)
+        self.assertEqual([row["ra_hours"] for row in data["positions"]], [0, 1, 2, 3, 4, 1.0])
+        self.assertEqual(data["positions"][-1]["alert"], "UNEXPECTED_MOVEMENT")
+        self.assertIn("export_time", data)
+
+    def test_export_json_empty(self):
+        """Test an empty history still exports valid JSON"""
+        path = os.path.join(self.tmp.name, "empty.json")
+        self.assertEqual(self.history.export_json(path), 0)
+        with open(path) as f:
+            self.assertEqual(json.load(f)["positions"], [])
+
+    def test_export_npz(self):
+        """Test columnar NPZ export"""
+        _fill(self.history, 5)
+        path = os.path.join(self.tmp.name, "history.npz")
+        self.assertEqual(self.history.export_npz(path), 5)
+        with np.load(path) as data:
+            self.assertEqual(data["az_degrees"].tolist(), [0, 1, 2, 3, 4])
+            self.assertEqual(data["flags"].dtype, np.uint8)
+
+
+if __name__ == "__main__":
+    unittest.main()
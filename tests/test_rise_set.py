@@ -0,0 +1,201 @@
+"""
+Unit tests for rise_set.py
+
+Tests the closed-form solver for fixed objects, the root finder used for
+moving objects, and the timelines built from their results.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import deal
+import numpy as np
+
+from celestron_nexstar.api.catalogs.catalogs import CelestialObject
+from celestron_nexstar.api.core.enums import CelestialObjectType
+from celestron_nexstar.api.core.transforms import ra_dec_to_alt_az_array
+from celestron_nexstar.api.observation.rise_set import (
+    SIDEREAL_DAY_SECONDS,
+    RiseSetTransit,
+    find_rise_set_transit,
+    position_track,
+)
+
+
+START = datetime(2024, 1, 15, 0, 0, tzinfo=UTC)
+LATITUDE, LONGITUDE = 40.0, -100.0
+
+
+def _object(name, ra_hours, dec_degrees):
+    return CelestialObject(
+        name=name,
+        common_name=None,
+        catalog="test",
+        ra_hours=ra_hours,
+        dec_degrees=dec_degrees,
+        object_type=CelestialObjectType.STAR,
+        magnitude=2.0,
+    )
+
+
+def _altitude(ra, dec, unix, refraction=False):
+    return ra_dec_to_alt_az_array(ra, dec, LATITUDE, LONGITUDE, unix, refraction=refraction)[1]
+
+
+class TestFixedObjects(unittest.TestCase):
+    """Test suite for the closed-form solver"""
+
+    def setUp(self):
+        """Solve a random catalog"""
+        rng = np.random.default_rng(0)
+        self.ra = rng.uniform(0.0, 24.0, 2000)
+        self.dec = np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, 2000)))
+        names = [f"Object {i}" for i in range(2000)]
+        self.solved = RiseSetTransit.from_coordinates(names, self.ra, self.dec, LATITUDE, LONGITUDE, START)
+
+    def test_rise_and_set_are_on_the_horizon(self):
+        """Test every rise and set is within a second of the true crossing"""
+        crosses = ~np.isnan(self.solved.rise_times)
+        for times, sign in ((self.solved.rise_times, 1.0), (self.solved.set_times, -1.0)):
+            before = _altitude(self.ra[crosses], self.dec[crosses], times[crosses] - 1.0)
+            after = _altitude(self.ra[crosses], self.dec[crosses], times[crosses] + 1.0)
+            self.assertTrue(np.all(sign * before <= 0.0))
+            self.assertTrue(np.all(sign * after >= 0.0))
+
+    def test_events_are_the_next_ones(self):
+        """Test events fall within one sidereal day after the start"""
+        start = START.timestamp()
+        for times in (self.solved.rise_times, self.solved.transit_times, self.solved.set_times):
+            valid = times[~np.isnan(times)]
+            self.assertTrue(np.all(valid >= start))
+            self.assertTrue(np.all(valid < start + SIDEREAL_DAY_SECONDS))
+
+    def test_transit_is_the_highest_point(self):
+        """Test the altitude peaks at the transit time at the reported altitude"""
+        transit = self.solved.transit_times
+        at = _altitude(self.ra, self.dec, transit)
+        self.assertTrue(np.all(at >= _altitude(self.ra, self.dec, transit - 60.0)))
+        self.assertTrue(np.all(at >= _altitude(self.ra, self.dec, transit + 60.0)))
+        np.testing.assert_allclose(self.solved.max_altitudes, at, atol=0.01)
+
+    def test_circumpolar_and_never_visible(self):
+        """Test the declination limits for circumpolar and never-rising objects"""
+        self.assertTrue(np.all(self.solved.is_circumpolar[self.dec > 50.2]))
+        self.assertTrue(np.all(self.solved.is_never_visible[self.dec < -50.2]))
+        self.assertFalse(np.any(self.solved.is_circumpolar[np.abs(self.dec) < 49.8]))
+        self.assertTrue(np.all(np.isnan(self.solved.rise_times[self.solved.is_circumpolar])))
+
+    def test_threshold_and_refraction(self):
+        """Test a higher threshold shortens the arc and refraction lengthens it"""
+        # Below the horizon at the start, so all three rises belong to the same arc
+        ra, dec = np.array([18.0]), np.array([0.0])
+        horizon = RiseSetTransit.from_coordinates(["A"], ra, dec, LATITUDE, LONGITUDE, START)
+        high = RiseSetTransit.from_coordinates(["A"], ra, dec, LATITUDE, LONGITUDE, START, altitude=30.0)
+        refracted = RiseSetTransit.from_coordinates(["A"], ra, dec, LATITUDE, LONGITUDE, START, refraction=True)
+        self.assertGreater(high.rise_times[0], horizon.rise_times[0])
+        # About 34' of refraction at the horizon is a couple of minutes of time
+        self.assertAlmostEqual(horizon.rise_times[0] - refracted.rise_times[0], 180.0, delta=60.0)
+        self.assertAlmostEqual(float(_altitude(ra, dec, refracted.rise_times, refraction=True)[0]), 0.0, delta=0.01)
+
+    def test_invalid_latitude(self):
+        """Test the latitude contract"""
+        with self.assertRaises(deal.PreContractError):
+            RiseSetTransit.from_coordinates(["A"], [1.0], [2.0], 95.0, LONGITUDE, START)
+
+
+class TestRootFinder(unittest.TestCase):
+    """Test suite for find_rise_set_transit"""
+
+    def test_synthetic_curve(self):
+        """Test crossings and the peak of a known altitude curve"""
+        start = START.timestamp()
+
+        def altitude(times):
+            return 30.0 * np.sin(2.0 * np.pi * (times - start) / 86400.0)
+
+        rise, transit, set_, peak = find_rise_set_transit(altitude, start - 3600.0, start + 86400.0)
+        self.assertAlmostEqual(rise, start, delta=1.0)
+        self.assertAlmostEqual(transit, start + 21600.0, delta=1.0)
+        self.assertAlmostEqual(set_, start + 43200.0, delta=1.0)
+        self.assertAlmostEqual(peak, 30.0, places=4)
+
+    def test_no_events(self):
+        """Test a curve that never crosses or peaks gives NaN"""
+        rise, transit, set_, peak = find_rise_set_transit(lambda t: np.full_like(t, 10.0), 0.0, 86400.0)
+        self.assertTrue(np.isnan([rise, transit, set_, peak]).all())
+
+
+class TestForObjects(unittest.TestCase):
+    """Test suite for RiseSetTransit.for_objects"""
+
+    def test_moving_object_matches_fixed_solution(self):
+        """Test a 'planet' standing still is solved like a fixed object"""
+
+        def position(name, latitude, longitude, dt):
+            return 6.0, 10.0
+
+        solved = RiseSetTransit.for_objects(
+            [_object("Mars", 6.0, 10.0), _object("Star", 6.0, 10.0)], LATITUDE, LONGITUDE, START, position_func=position
+        )
+        self.assertEqual(solved.names, ("Mars", "Star"))
+        for times in (solved.rise_times, solved.transit_times, solved.set_times):
+            self.assertAlmostEqual(times[0], times[1], delta=5.0)
+        self.assertAlmostEqual(solved.max_altitudes[0], solved.max_altitudes[1], delta=0.01)
+
+    def test_default_positions_are_batched(self):
+        """Test the default track samples the whole span in one batched lookup"""
+
+        def positions(names, times, latitude, longitude):
+            minutes = np.array([round(dt.timestamp() / 60.0) for dt in times])
+            return {
+                "mars": MagicMock(
+                    times=minutes * 60.0, ra_hours=np.full(len(minutes), 23.95), dec_degrees=np.zeros(len(minutes))
+                )
+            }
+
+        start = START.timestamp() + 17.0
+        with patch("celestron_nexstar.api.observation.rise_set.get_planetary_positions", side_effect=positions) as mock:
+            track = position_track("Mars", LATITUDE, LONGITUDE, start, start + 6 * 3600.0)
+        mock.assert_called_once()
+        self.assertEqual(len(mock.call_args.args[1]), 7)
+        ra, dec = track(np.array([start, start + 3600.0]))
+        self.assertTrue(np.all((ra >= 0.0) & (ra < 24.0)))
+        np.testing.assert_array_equal(dec, [0.0, 0.0])
+
+    def test_failing_objects_are_skipped(self):
+        """Test objects whose position cannot be calculated are left out"""
+
+        def position(name, latitude, longitude, dt):
+            raise ValueError("no ephemeris")
+
+        solved = RiseSetTransit.for_objects(
+            [_object("Jupiter", 0.0, 0.0), _object("M31", 0.712, 41.27)],
+            LATITUDE,
+            LONGITUDE,
+            START,
+            position_func=position,
+        )
+        self.assertEqual(solved.names, ("M31",))
+
+    def test_timelines(self):
+        """Test timelines carry the solved events"""
+        solved = RiseSetTransit.for_objects(
+            [_object("Polaris", 2.53, 89.26), _object("Southern", 12.0, -80.0), _object("Equator", 6.0, 0.0)],
+            LATITUDE,
+            LONGITUDE,
+            START,
+        )
+        polaris, southern, equator = solved.timelines()
+        self.assertTrue(polaris.is_always_visible)
+        self.assertIsNone(polaris.rise_time)
+        self.assertTrue(southern.is_never_visible)
+        self.assertIsNone(southern.transit_time)
+        # On the celestial equator the object sets about six hours after transit
+        self.assertAlmostEqual((equator.set_time - equator.transit_time) / timedelta(hours=1), 6.0, delta=0.05)
+        with self.assertRaises(KeyError):
+            solved.timeline("M1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+"""
+Unit tests for simulator.py
+
+Tests the SimulatedMount model with a controllable clock, and the
+MountSimulator endpoints with the real protocol stack.
+"""
+
+import sys
+import time
+import unittest
+
+from celestron_nexstar.api.core.exceptions import TelescopeConnectionError, TelescopeTimeoutError
+from celestron_nexstar.api.core.types import TrackingMode
+from celestron_nexstar.api.telescope.protocol import NexStarProtocol
+from celestron_nexstar.api.telescope.simulator import (
+    SIDEREAL_RATE,
+    FaultInjector,
+    MountSimulator,
+    SimulatedMount,
+    _equatorial_to_horizontal,
+    _horizontal_to_equatorial,
+)
+from celestron_nexstar.api.telescope.telescope import NexStarTelescope
+
+
+class _Clock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _pair(first, second):
+    return NexStarProtocol.encode_coordinate_pair(first % 360.0, second % 360.0)
+
+
+def _decode(response):
+    return NexStarProtocol.decode_coordinate_pair(response).unwrap()
+
+
+class TestSimulatedMount(unittest.TestCase):
+    """Test suite for the SimulatedMount model"""
+
+    def setUp(self):
+        """Create a mount on a manual clock"""
+        self.clock = _Clock()
+        self.mount = SimulatedMount(latitude=40.0, longitude=-74.0, goto_rate=5.0, clock=self.clock)
+
+    def test_identity_commands(self):
+        """Test echo, version and model"""
+        self.assertEqual(self.mount.handle("Kx"), "x")
+        self.assertEqual(self.mount.handle("V"), "\x04\x15")
+        self.assertEqual(self.mount.handle("m"), "\x0b")
+        self.assertEqual(self.mount.handle("?"), "")
+
+    def test_transform_round_trip(self):
+        """Test the horizontal/equatorial transforms invert each other"""
+        az, alt = _equatorial_to_horizontal(100.0, 20.0, 40.0, 50.0)
+        ra, dec = _horizontal_to_equatorial(az, alt, 40.0, 50.0)
+        self.assertAlmostEqual(ra, 100.0, places=9)
+        self.assertAlmostEqual(dec, 20.0, places=9)
+
+    def test_goto_alt_az_kinematics(self):
+        """Test a goto moves both axes at the goto rate and then stops"""
+        self.assertEqual(self.mount.handle("B" + _pair(20.0, 10.0)), "")
+        self.assertEqual(self.mount.handle("L"), "1")
+
+        self.clock.now += 1.0
+        az, alt = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(az, 5.0, places=4)
+        self.assertAlmostEqual(alt, 5.0, places=4)
+        self.assertEqual(self.mount.handle("L"), "1")
+
+        self.clock.now += 3.0
+        az, alt = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(az, 20.0, places=4)
+        self.assertAlmostEqual(alt, 10.0, places=4)
+        self.assertEqual(self.mount.handle("L"), "0")
+
+    def test_goto_takes_shortest_azimuth_path(self):
+        """Test azimuth slews across north rather than the long way round"""
+        self.mount.handle("B" + _pair(350.0, 0.0))
+        self.clock.now += 1.0
+        az, _ = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(az, 355.0, places=4)
+
+    def test_cancel_goto(self):
+        """Test M stops a goto in place"""
+        self.mount.handle("B" + _pair(90.0, 0.0))
+        self.clock.now += 1.0
+        self.mount.handle("M")
+        self.clock.now += 5.0
+        az, _ = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(az, 5.0, places=4)
+        self.assertEqual(self.mount.handle("L"), "0")
+
+    def test_variable_rate_motion(self):
+        """Test fixed-rate motion moves at the slew rate until stopped"""
+        self.mount.handle("P\x02\x11\x09\x00\x00\x00")  # Altitude up at 5°/s
+        self.clock.now += 2.0
+        self.mount.handle("P\x02\x11\x00\x00\x00\x00")
+        self.clock.now += 2.0
+        _, alt = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(alt, 10.0, places=4)
+
+    def test_precise_variable_rate(self):
+        """Test precise rate commands move an axis at the requested arcsec/sec"""
+        self.mount.handle(NexStarProtocol.encode_variable_rate(1, -1800.0))
+        self.clock.now += 4.0
+        az, _ = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(az, 358.0, places=4)
+
+    def test_goto_ra_dec_then_tracks(self):
+        """Test an equatorial goto ends on target and tracking holds RA/Dec"""
+        self.mount.handle("T\x01")
+        target_ra, target_dec = 80.0, 30.0
+        self.mount.handle("R" + _pair(target_ra, target_dec))
+        for _ in range(100):
+            self.clock.now += 1.0
+            if self.mount.handle("L") == "0":
+                break
+
+        ra, dec = _decode(self.mount.handle("E"))
+        self.assertAlmostEqual(ra, target_ra, places=4)
+        self.assertAlmostEqual(dec, target_dec, places=4)
+
+        az_before, _ = _decode(self.mount.handle("Z"))
+        self.clock.now += 600.0
+        ra, dec = _decode(self.mount.handle("E"))
+        az_after, _ = _decode(self.mount.handle("Z"))
+        self.assertAlmostEqual(ra, target_ra, places=4)
+        self.assertNotAlmostEqual(az_before, az_after, places=2)
+
+    def test_sky_drifts_without_tracking(self):
+        """Test RA changes at the sidereal rate when the mount is parked"""
+        self.mount.handle("B" + _pair(180.0, 30.0))
+        self.clock.now += 100.0
+        ra_before, _ = _decode(self.mount.handle("E"))
+        self.clock.now += 600.0
+        ra_after, _ = _decode(self.mount.handle("E"))
+        self.assertAlmostEqual((ra_after - ra_before) % 360.0, 600.0 * SIDEREAL_RATE, places=3)
+
+    def test_sync(self):
+        """Test S makes the mount report the synced coordinates"""
+        self.mount.handle("S" + _pair(45.0, 20.0))
+        ra, dec = _decode(self.mount.handle("E"))
+        self.assertAlmostEqual(ra, 45.0, places=4)
+        self.assertAlmostEqual(dec, 20.0, places=4)
+
+    def test_location_and_time(self):
+        """Test location and time round-trip through W/w and H/h"""
+        self.mount.handle("W" + _pair(51.5, -0.1))
+        self.assertAlmostEqual(self.mount.latitude, 51.5, places=4)
+        self.assertAlmostEqual(self.mount.longitude, -0.1, places=4)
+        self.assertEqual(len(self.mount.handle("w")), 16)
+
+        self.mount.handle("H\x0c\x1e\x00\x0a\x0e\x18\xfb\x01")  # 12:30:00 2024-10-14, GMT-5, DST
+        self.assertEqual(self.mount.utc_now().hour, 16)
+        self.clock.now += 61.0
+        self.assertEqual(self.mount.handle("h"), "\x0c\x1f\x01\x0a\x0e\x18\xfb\x01")
+
+
+class TestFaultInjector(unittest.TestCase):
+    """Test suite for FaultInjector"""
+
+    def test_no_faults(self):
+        """Test responses pass through untouched by default"""
+        self.assertEqual(FaultInjector().apply(b"0"), (b"0", 0.0))
+
+    def test_drop_and_corrupt(self):
+        """Test certain drops and corruptions"""
+        self.assertIsNone(FaultInjector(drop_rate=1.0).apply(b"0")[0])
+        corrupted, _ = FaultInjector(corrupt_rate=1.0, seed=1).apply(b"12345678")
+        self.assertEqual(len(corrupted), 8)
+        self.assertNotIn(b"#", corrupted)
+
+    def test_jitter_is_reproducible(self):
+        """Test seeded jitter gives the same delays"""
+        first = [FaultInjector(jitter=0.1, seed=7).apply(b"0")[1] for _ in range(3)]
+        self.assertEqual(len(set(first)), 1)
+        self.assertTrue(0.0 <= first[0] <= 0.1)
+
+
+class TestMountSimulator(unittest.TestCase):
+    """Test suite for MountSimulator endpoints"""
+
+    def setUp(self):
+        """Start a simulator"""
+        self.simulator = MountSimulator()
+        self.addCleanup(self.simulator.stop)
+
+    def _telescope(self, config, timeout=1.0):
+        config.timeout = timeout
+        telescope = NexStarTelescope(config)
+        telescope.connect()
+        self.addCleanup(telescope.disconnect)
+        return telescope
+
+    def test_tcp_with_telescope(self):
+        """Test NexStarTelescope drives the simulator over TCP/IP"""
+        telescope = self._telescope(self.simulator.start_tcp())
+        self.assertEqual(telescope.get_info().model, 11)
+
+        self.assertTrue(telescope.goto_alt_az(1.0, 0.5))
+        deadline = time.monotonic() + 2.0
+        while telescope.is_slewing() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        position = telescope.get_position_alt_az()
+        self.assertAlmostEqual(position.azimuth, 1.0, places=3)
+        self.assertAlmostEqual(position.altitude, 0.5, places=3)
+
+        self.assertTrue(telescope.set_tracking_mode(TrackingMode.ALT_AZ))
+        self.assertEqual(telescope.get_state().tracking_mode, TrackingMode.ALT_AZ)
+
+    @unittest.skipUnless(sys.platform.startswith("linux") or sys.platform == "darwin", "requires a pty")
+    def test_pty_with_telescope(self):
+        """Test NexStarTelescope drives the simulator over a pty serial port"""
+        config = self.simulator.start_pty()
+        with NexStarTelescope(config) as telescope:
+            self.assertEqual(telescope.get_version(), (4, 21))
+        # A second session on the same endpoint works too
+        with NexStarTelescope(config) as telescope:
+            self.assertEqual(telescope.get_model(), 11)
+
+    def test_baud_rate_and_latency(self):
+        """Test the link model delays each exchange"""
+        self.simulator.baudrate = 9600
+        self.simulator.latency = 0.02
+        protocol = self._telescope(self.simulator.start_tcp()).protocol
+
+        protocol.send_command("E")
+        # 2 bytes in + 18 bytes out at 9600 baud, plus the turnaround latency
+        self.assertGreaterEqual(protocol.last_round_trip, 0.02 + 20 * 10 / 9600)
+
+    def test_binary_arguments_containing_terminator(self):
+        """Test binary command arguments equal to '#' are not mistaken for the terminator"""
+        telescope = self._telescope(self.simulator.start_tcp())
+        # 8.75"/s = 35 quarter arcsec/s, encoded as the byte 0x23 ('#')
+        self.assertTrue(telescope.protocol.variable_rate_slew(2, 8.75))
+        self.assertTrue(telescope.set_time(12, 35, 0, 10, 14, 2024, -5, 1))
+        self.assertEqual(self.simulator.mount.timezone, -5)
+        self.assertEqual(self.simulator.mount.utc_now().hour, 16)
+        self.assertAlmostEqual(self.simulator.mount._alt_rate * 3600.0, 8.75)
+
+    def test_dropped_response_times_out(self):
+        """Test a dropped response surfaces as a timeout"""
+        telescope = self._telescope(self.simulator.start_tcp(), timeout=0.1)
+        self.simulator.faults = FaultInjector(drop_rate=1.0)
+        with self.assertRaises(TelescopeTimeoutError):
+            telescope.protocol.send_command("L")
+
+    def test_disconnect_fault(self):
+        """Test an injected disconnect closes the link"""
+        self.simulator.faults = FaultInjector(disconnect_after=1)
+        telescope = self._telescope(self.simulator.start_tcp())
+        with self.assertRaises(TelescopeConnectionError):
+            telescope.protocol.send_command("L")
+        self.assertEqual(self.simulator.commands_served, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
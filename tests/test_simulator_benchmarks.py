@@ -0,0 +1,155 @@
+"""
+Benchmarks for the protocol stack against the simulated mount
+
+Measures commands/sec, tracker poll jitter and position history throughput
+with pytest-benchmark, so regressions in the protocol, telescope and tracker
+layers show up in CI.
+
+Run only the benchmarks with:
+    pytest tests/test_simulator_benchmarks.py --benchmark-only
+"""
+
+import asyncio
+import itertools
+import statistics
+import time
+
+import pytest
+
+
+pytest.importorskip("pytest_benchmark")
+
+from celestron_nexstar.api.telescope.async_protocol import AsyncNexStarProtocol
+from celestron_nexstar.api.telescope.connection_pool import ConnectionPool
+from celestron_nexstar.api.telescope.guiding import GuidedTracker, Trajectory
+from celestron_nexstar.api.telescope.position_history import PositionHistory
+from celestron_nexstar.api.telescope.simulator import MountSimulator
+from celestron_nexstar.api.telescope.telescope import NexStarTelescope
+from celestron_nexstar.api.telescope.tracking import PositionTracker
+
+
+@pytest.fixture
+def simulator():
+    """Simulated mount with an unlimited link"""
+    with MountSimulator() as sim:
+        yield sim
+
+
+@pytest.fixture
+def telescope(simulator):
+    """Telescope connected to the simulator over TCP/IP"""
+    with NexStarTelescope(simulator.start_tcp()) as connected:
+        yield connected
+
+
+def test_send_command_throughput(benchmark, benchmark_stats, telescope):
+    """Benchmark single position queries over loopback TCP"""
+    response = benchmark(telescope.protocol.send_command, "E")
+
+    assert "," in response
+    benchmark.extra_info["commands_per_sec"] = 1.0 / benchmark_stats().mean
+
+
+def test_state_snapshot_throughput(benchmark, benchmark_stats, telescope):
+    """Benchmark pipelined E/Z/L/t state snapshots"""
+    state = benchmark(telescope.get_state)
+
+    assert not state.is_slewing
+    benchmark.extra_info["commands_per_sec"] = 4.0 / benchmark_stats().mean
+
+
+def test_state_snapshot_at_9600_baud(benchmark, benchmark_stats, simulator):
+    """Benchmark state snapshots over a modelled 9600 baud link with 10 ms turnaround"""
+    simulator.baudrate = 9600
+    simulator.latency = 0.01
+    with NexStarTelescope(simulator.start_tcp()) as telescope:
+        benchmark.pedantic(telescope.get_state, rounds=10, iterations=1)
+
+    # 8 bytes out and 40 bytes back on the wire, but one turnaround for the whole snapshot
+    wire_time = 48 * simulator.byte_time
+    assert benchmark_stats().mean < wire_time + 2 * simulator.latency
+
+
+def test_async_protocol_throughput(benchmark, simulator):
+    """Benchmark commands/sec through the asyncio protocol"""
+    config = simulator.start_tcp()
+    commands = 200
+
+    async def run():
+        protocol = AsyncNexStarProtocol(connection_type="tcp", host=config.host, tcp_port=config.tcp_port)
+        protocol.TCP_SETTLE_TIME = 0.0
+        await protocol.open()
+        start = time.perf_counter()
+        for _ in range(commands):
+            await protocol.send_command("L")
+        elapsed = time.perf_counter() - start
+        await protocol.close()
+        return elapsed
+
+    elapsed = benchmark.pedantic(lambda: asyncio.run(run()), rounds=3, iterations=1)
+    benchmark.extra_info["commands_per_sec"] = commands / elapsed
+
+
+def test_tracker_poll_jitter(benchmark, simulator):
+    """Benchmark PositionTracker cadence: poll intervals should stay on the fixed grid"""
+    simulator.baudrate = 9600
+    config = simulator.start_tcp()
+    port = f"{config.host}:{config.tcp_port}"
+    interval = 0.05
+    pool = ConnectionPool()
+
+    def run():
+        tracker = PositionTracker(lambda: port, pool=pool)
+        tracker.update_interval = interval
+        tracker.start()
+        time.sleep(1.0)
+        tracker.stop()
+        time.sleep(2 * interval)
+        stamps = [entry["timestamp"] for entry in tracker.get_history()]
+        return [(b - a).total_seconds() for a, b in itertools.pairwise(stamps)]
+
+    gaps = benchmark.pedantic(run, rounds=1, iterations=1)
+    pool.close_all()
+
+    assert len(gaps) >= 10
+    jitter = statistics.pstdev(gaps)
+    benchmark.extra_info["mean_interval"] = statistics.fmean(gaps)
+    benchmark.extra_info["jitter"] = jitter
+    assert abs(statistics.fmean(gaps) - interval) < interval * 0.2
+    assert jitter < interval * 0.5
+
+
+def test_guiding_cycle_at_9600_baud(benchmark, benchmark_stats, simulator):
+    """Benchmark one closed-loop guiding cycle (two rates + Alt/Az) over a 9600 baud link"""
+    simulator.baudrate = 9600
+    simulator.latency = 0.01
+    now = time.time()
+    trajectory = Trajectory.from_samples([now, now + 600.0], [100.0, 200.0], [30.0, 60.0])
+    with NexStarTelescope(simulator.start_tcp()) as telescope:
+        guider = GuidedTracker(telescope, trajectory, control_rate=5.0)
+        benchmark.pedantic(guider.step, rounds=10, iterations=1)
+        guider.stop_axes()
+
+    # The whole cycle has to fit in the 200 ms control period with room to spare
+    stats = benchmark_stats()
+    assert stats.max < guider.period / 2
+    benchmark.extra_info["max_control_rate_hz"] = 1.0 / stats.mean
+
+
+def test_history_record_throughput(benchmark, benchmark_stats):
+    """Benchmark appending to a million-sample position history"""
+    history = PositionHistory(capacity=1_000_000)
+    benchmark(history.record, 1_700_000_000.0, 5.5, -5.4, 30.0, 180.0)
+    benchmark.extra_info["records_per_sec"] = 1.0 / benchmark_stats().mean
+
+
+def test_history_export_throughput(benchmark, benchmark_stats, tmp_path):
+    """Benchmark streaming a full million-sample history to CSV"""
+    history = PositionHistory(capacity=1_000_000)
+    for seq in range(1_000_000):
+        history.record(1_700_000_000.0 + seq, 5.5, -5.4, 30.0, 180.0)
+
+    written = benchmark.pedantic(history.export_csv, args=(tmp_path / "history.csv",), rounds=1, iterations=1)
+
+    assert written == 1_000_000
+    benchmark.extra_info["rows_per_sec"] = written / benchmark_stats().mean
@@ -4,17 +4,25 @@ Unit tests for space_weather.py
 Tests space weather data fetching and NOAA scale calculations.
 """
 
+import tempfile
 import unittest
 from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
+from celestron_nexstar.api.events import space_weather
 from celestron_nexstar.api.events.space_weather import (
     NOAAScale,
+    OvationAuroraGrid,
     SpaceWeatherConditions,
     get_goes_xray_data,
     get_kp_ap_data,
+    get_ovation_aurora_grid,
     get_solar_wind_data,
     get_space_weather_conditions,
+    parse_ovation_grid,
 )
 
 
@@ -151,6 +159,7 @@ class TestGetSolarWindData(unittest.TestCase):
     def test_get_solar_wind_data_error(self, mock_get_session):
         """Test solar wind data fetch with error"""
         import requests
+
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
         mock_session.get.side_effect = requests.RequestException("Network error")
@@ -206,6 +215,7 @@ class TestGetGoesXrayData(unittest.TestCase):
     def test_get_goes_xray_data_error(self, mock_get_session):
         """Test GOES X-ray data fetch with error"""
         import requests
+
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
         mock_session.get.side_effect = requests.RequestException("Network error")
@@ -244,6 +254,7 @@ class TestGetKpApData(unittest.TestCase):
     def test_get_kp_ap_data_error(self, mock_get_session):
         """Test Kp/Ap data fetch with error"""
         import requests
+
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
         mock_session.get.side_effect = requests.RequestException("Network error")
@@ -332,5 +343,78 @@ class TestGetSpaceWeatherConditions(unittest.TestCase):
         self.assertTrue(any("High solar wind" in alert for alert in result.alerts))
 
 
+def _ovation_payload():
+    """NOAA-style 1° payload whose intensity is the longitude modulo 16 above 60°N"""
+    return {
+        "Observation Time": "2024-10-14T12:00:00Z",
+        "Forecast Time": "2024-10-14T12:30:00Z",
+        "coordinates": [[lon, lat, lon % 16 if lat >= 60 else 0] for lon in range(360) for lat in range(-90, 91)],
+    }
+
+
+class TestOvationAuroraGrid(unittest.TestCase):
+    """Test suite for the dense Ovation aurora grid"""
+
+    def setUp(self):
+        """Parse the synthetic payload"""
+        self.grid = parse_ovation_grid(_ovation_payload())
+
+    def test_parse(self):
+        """Test the payload becomes a float32 latitude/longitude array"""
+        self.assertEqual(self.grid.intensity.shape, (181, 360))
+        self.assertEqual(self.grid.intensity.dtype, np.float32)
+        self.assertTrue(self.grid.wraps)
+        self.assertEqual(self.grid.forecast_time, datetime(2024, 10, 14, 12, 30, tzinfo=UTC))
+        self.assertEqual(self.grid.observation_time, datetime(2024, 10, 14, 12, 0, tzinfo=UTC))
+
+    def test_bilinear_lookup(self):
+        """Test grid points, interpolation and longitude wrap-around"""
+        self.assertAlmostEqual(self.grid.probability_at(65.0, 10.0), 10 / 15)
+        self.assertAlmostEqual(self.grid.probability_at(65.0, 10.5), 10.5 / 15)
+        self.assertAlmostEqual(self.grid.probability_at(59.5, 10.0), 5 / 15)
+        self.assertAlmostEqual(self.grid.probability_at(65.0, 359.5), 3.5 / 15)
+        self.assertAlmostEqual(self.grid.probability_at(65.0, -0.5), 3.5 / 15)
+        self.assertAlmostEqual(self.grid.probability_at(95.0, 10.0), 10 / 15)
+
+    def test_vectorized_lookup(self):
+        """Test many sites match single lookups"""
+        latitudes, longitudes = np.array([65.0, 40.0, 70.25]), np.array([10.0, -100.0, 200.75])
+        expected = [self.grid.probability_at(lat, lon) for lat, lon in zip(latitudes, longitudes, strict=True)]
+        np.testing.assert_allclose(self.grid.probabilities(latitudes, longitudes), expected)
+
+    def test_binary_round_trip(self):
+        """Test the compact cache file restores the same grid"""
+        path = Path(tempfile.mkdtemp()) / "ovation_grid.bin"
+        self.grid.save(path)
+        self.assertLess(path.stat().st_size, 300_000)
+        loaded = OvationAuroraGrid.load(path)
+        np.testing.assert_array_equal(loaded.intensity, self.grid.intensity)
+        self.assertEqual(loaded.forecast_time, self.grid.forecast_time)
+        path.write_bytes(b"junk")
+        with self.assertRaises(ValueError):
+            OvationAuroraGrid.load(path)
+
+    def test_irregular_payload(self):
+        """Test payloads without a grid are rejected"""
+        self.assertIsNone(parse_ovation_grid({"coordinates": [[0, 0, 1]]}))
+        self.assertIsNone(parse_ovation_grid({"type": "forecast"}))
+
+    @patch("celestron_nexstar.api.events.space_weather._get_cached_session")
+    def test_get_grid_uses_file_cache(self, mock_get_session):
+        """Test the grid is fetched once and then read from the binary cache"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = _ovation_payload()
+        mock_get_session.return_value.get.return_value = mock_response
+        path = Path(tempfile.mkdtemp()) / "ovation_grid.bin"
+
+        grid = get_ovation_aurora_grid(path)
+        self.assertTrue(path.exists())
+        space_weather._ovation_cache.clear()
+        cached = get_ovation_aurora_grid(path)
+        self.assertEqual(mock_get_session.return_value.get.call_count, 1)
+        np.testing.assert_array_equal(cached.intensity, grid.intensity)
+        space_weather._ovation_cache.clear()
+
+
 if __name__ == "__main__":
     unittest.main()
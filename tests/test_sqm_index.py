@@ -0,0 +1,153 @@
+"""
+Unit tests for sqm_index.py
+
+Tests rasterising light pollution grid points, vectorised bilinear and
+nearest-point lookups, the memory-mapped cache file, and SQM lookups from
+the light_pollution_grid table.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from celestron_nexstar.api.database import light_pollution_db
+from celestron_nexstar.api.database.database import CatalogDatabase
+from celestron_nexstar.api.database.light_pollution_db import (
+    clear_light_pollution_data,
+    get_sqm_from_database,
+    get_sqm_values,
+)
+from celestron_nexstar.api.database.models import Base, LightPollutionGridModel
+from celestron_nexstar.api.database.sqm_index import SQMIndex
+
+
+def _grid(lat_min=40.0, lat_max=41.0, lon_min=-75.0, lon_max=-74.0, step=0.1):
+    """Points of a 0.1° grid whose SQM rises linearly to the north-east"""
+    lats = np.round(np.arange(lat_min, lat_max + step / 2, step), 1)
+    lons = np.round(np.arange(lon_min, lon_max + step / 2, step), 1)
+    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
+    sqm = 18.0 + (lat_grid - lat_min) + (lon_grid - lon_min)
+    return lat_grid.ravel(), lon_grid.ravel(), sqm.ravel()
+
+
+class TestSQMIndex(unittest.TestCase):
+    """Test suite for SQMIndex"""
+
+    def setUp(self):
+        """Rasterise a 1° square"""
+        self.index = SQMIndex.from_points(*_grid())
+
+    def test_from_points(self):
+        """Test the grid geometry is inferred from the points"""
+        self.assertEqual(self.index.sqm.shape, (11, 11))
+        self.assertEqual(self.index.sqm.dtype, np.float32)
+        self.assertAlmostEqual(self.index.step, 0.1)
+        self.assertEqual(len(self.index), 121)
+
+    def test_bilinear_lookup(self):
+        """Test grid points and interpolation between them"""
+        self.assertAlmostEqual(self.index.sqm_at(40.0, -75.0), 18.0, places=5)
+        self.assertAlmostEqual(self.index.sqm_at(40.55, -74.45), 19.1, places=5)
+        self.assertAlmostEqual(self.index.sqm_at(40.03, -74.98), 18.05, places=5)
+
+    def test_vectorized_lookup(self):
+        """Test arrays of sites match single lookups and keep their shape"""
+        lats = np.array([[40.12, 40.5], [40.77, 40.99]])
+        lons = np.array([[-74.91, -74.5], [-74.02, -74.33]])
+        values = self.index.lookup(lats, lons)
+        self.assertEqual(values.shape, (2, 2))
+        expected = [self.index.sqm_at(lat, lon) for lat, lon in zip(lats.ravel(), lons.ravel(), strict=True)]
+        np.testing.assert_allclose(values.ravel(), expected)
+
+    def test_missing_corners_are_ignored(self):
+        """Test interpolation uses only the corners that have data"""
+        lats, lons, sqm = _grid()
+        keep = ~((lats == 40.5) & (lons == -74.5))
+        index = SQMIndex.from_points(lats[keep], lons[keep], sqm[keep])
+        self.assertTrue(np.isnan(index.sqm[5, 5]))
+        self.assertAlmostEqual(index.sqm_at(40.55, -74.55), (18.9 + 19.0 + 19.1) / 3, places=4)
+
+    def test_nearest_fallback_within_radius(self):
+        """Test sites beyond the grid get the nearest value within the radius only"""
+        near = self.index.sqm_at(41.1, -74.0)
+        self.assertAlmostEqual(near, 20.0, places=5)
+        self.assertIsNone(self.index.sqm_at(41.5, -74.0))
+        self.assertIsNone(self.index.sqm_at(41.1, -74.0, max_distance_km=5.0))
+
+    def test_longitude_normalization(self):
+        """Test longitudes outside -180..180 are wrapped"""
+        self.assertAlmostEqual(self.index.sqm_at(40.5, 285.5), self.index.sqm_at(40.5, -74.5))
+
+    def test_cache_round_trip(self):
+        """Test the cache file is memory-mapped and checked against the fingerprint"""
+        path = Path(tempfile.mkdtemp()) / "catalogs.sqm.npy"
+        self.index.fingerprint = [121, 121]
+        self.index.save(path)
+
+        loaded = SQMIndex.load(path, [121, 121])
+        self.assertIsInstance(loaded.sqm, np.memmap)
+        self.assertAlmostEqual(loaded.sqm_at(40.55, -74.45), self.index.sqm_at(40.55, -74.45))
+        self.assertIsNone(SQMIndex.load(path, [122, 122]))
+        self.assertIsNone(SQMIndex.load(path.with_name("missing.npy"), [121, 121]))
+
+
+class TestGetSqmFromDatabase(unittest.TestCase):
+    """Test suite for SQM lookups from the light_pollution_grid table"""
+
+    def setUp(self):
+        """Create a catalog database holding a light pollution grid"""
+        self.db = CatalogDatabase(Path(tempfile.mkdtemp()) / "catalogs.db")
+        engine = create_engine(f"sqlite:///{self.db.db_path}")
+        Base.metadata.create_all(engine, tables=[LightPollutionGridModel.__table__])
+        with Session(engine) as session:
+            session.add_all(
+                LightPollutionGridModel(latitude=float(lat), longitude=float(lon), geohash="", sqm_value=float(sqm))
+                for lat, lon, sqm in zip(*_grid(), strict=True)
+            )
+            session.commit()
+        engine.dispose()
+        self.addCleanup(light_pollution_db.invalidate_sqm_index, self.db)
+
+    def test_single_and_batch_lookups(self):
+        """Test single lookups and arrays of sites read the same index"""
+        self.assertAlmostEqual(get_sqm_from_database(40.55, -74.45, self.db), 19.1, places=4)
+        values = get_sqm_values([40.0, 40.55, 45.0], [-75.0, -74.45, -74.0], self.db)
+        np.testing.assert_allclose(values[:2], [18.0, 19.1], atol=1e-4)
+        self.assertTrue(np.isnan(values[2]))
+        self.assertTrue(self.db.db_path.with_suffix(".sqm.npy").exists())
+
+    def test_clear_invalidates_index(self):
+        """Test clearing the table drops the index and its cache file"""
+        self.assertIsNotNone(get_sqm_from_database(40.5, -74.5, self.db))
+        clear_light_pollution_data(self.db)
+        self.assertFalse(self.db.db_path.with_suffix(".sqm.npy").exists())
+        self.assertIsNone(get_sqm_from_database(40.5, -74.5, self.db))
+
+    def test_in_place_update_rebuilds_index(self):
+        """Test rewriting SQM values without adding rows is picked up by the next check"""
+        self.assertAlmostEqual(get_sqm_from_database(40.5, -74.5, self.db), 19.0, places=4)
+        engine = create_engine(f"sqlite:///{self.db.db_path}")
+        with engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE light_pollution_grid SET sqm_value = sqm_value + 1.0")
+        engine.dispose()
+
+        with patch.object(light_pollution_db, "_SQM_INDEX_RECHECK_SECONDS", 0.0):
+            self.assertAlmostEqual(get_sqm_from_database(40.5, -74.5, self.db), 20.0, places=4)
+        # A fresh process reads the rebuilt cache file, not the stale one
+        with light_pollution_db._sqm_indexes_lock:
+            light_pollution_db._sqm_indexes.clear()
+        self.assertAlmostEqual(get_sqm_from_database(40.5, -74.5, self.db), 20.0, places=4)
+
+    def test_missing_table(self):
+        """Test a database without the grid table has no SQM values"""
+        db = CatalogDatabase(Path(tempfile.mkdtemp()) / "empty.db")
+        self.assertIsNone(get_sqm_from_database(40.5, -74.5, db))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,13 @@ import unittest
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
+from celestron_nexstar.api.core.types import (
+    EquatorialCoordinates,
+    HorizontalCoordinates,
+    TelescopeState,
+    TrackingMode,
+)
+from celestron_nexstar.api.telescope.connection_pool import ConnectionPool
 from celestron_nexstar.api.telescope.tracking import PositionTracker
 
 
@@ -379,6 +386,47 @@ class TestPositionTracker(unittest.TestCase):
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
 
+    def test_set_history_capacity(self):
+        """Test resizing the history keeps the newest entries"""
+        for hour in range(5):
+            self.tracker.history.append(
+                {
+                    "timestamp": datetime(2024, 1, 1, hour, tzinfo=UTC),
+                    "ra_hours": float(hour),
+                    "dec_degrees": 45.0,
+                    "alt_degrees": 30.0,
+                    "az_degrees": 180.0,
+                }
+            )
+
+        self.assertTrue(self.tracker.set_history_capacity(2))
+        self.assertFalse(self.tracker.set_history_capacity(0))
+        self.assertEqual([entry["ra_hours"] for entry in self.tracker.get_history()], [3.0, 4.0])
+
+    def test_export_history_npz(self):
+        """Test exporting history as a columnar NPZ archive"""
+        import os
+        import tempfile
+
+        import numpy as np
+
+        self.tracker.history.append(
+            {
+                "timestamp": datetime.now(UTC),
+                "ra_hours": 12.0,
+                "dec_degrees": 45.0,
+                "alt_degrees": 30.0,
+                "az_degrees": 180.0,
+            }
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.npz")
+            success, message = self.tracker.export_history(path, format="npz")
+            self.assertTrue(success, message)
+            with np.load(path) as data:
+                self.assertEqual(data["ra_hours"].tolist(), [12.0])
+
     def test_get_status_text_no_data(self):
         """Test getting status text with no data"""
         text = self.tracker.get_status_text()
@@ -462,6 +510,30 @@ class TestPositionTracker(unittest.TestCase):
         self.assertFalse(self.tracker.enabled)
         # Note: running may still be True briefly while thread exits
 
+    def test_polling_reuses_pooled_connection(self):
+        """Test polling borrows one long-lived connection at a steady cadence"""
+        telescope = MagicMock()
+        telescope.get_state.return_value = TelescopeState(
+            equatorial=EquatorialCoordinates(ra_hours=12.0, dec_degrees=45.0),
+            horizontal=HorizontalCoordinates(azimuth=180.0, altitude=30.0),
+            is_slewing=False,
+            tracking_mode=TrackingMode.ALT_AZ,
+        )
+        factory = MagicMock(return_value=telescope)
+        tracker = PositionTracker(self.mock_get_port, pool=ConnectionPool(factory=factory))
+        tracker.update_interval = 0.05
+
+        tracker.start()
+        time.sleep(0.3)
+        tracker.stop()
+        time.sleep(0.1)
+
+        factory.assert_called_once_with("/dev/ttyUSB0")
+        telescope.connect.assert_called_once()
+        telescope.disconnect.assert_not_called()
+        self.assertGreaterEqual(len(tracker.get_history()), 4)
+        self.assertEqual(tracker.get_history()[-1]["az_degrees"], 180.0)
+
     def test_start_already_running(self):
         """Test starting when already running"""
         self.tracker.running = True
@@ -0,0 +1,149 @@
+"""
+Unit tests for transforms.py
+
+Tests the vectorized coordinate kernel for shape handling and checks its
+accuracy against Astropy.
+"""
+
+import unittest
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+from astropy import units as u
+from astropy.coordinates import AltAz, EarthLocation, SkyCoord
+from astropy.time import Time
+from astropy.utils import iers
+
+from celestron_nexstar.api.core.transforms import (
+    alt_az_to_ra_dec_array,
+    angular_separation_array,
+    apparent_ra_dec_array,
+    julian_date_array,
+    local_sidereal_time_array,
+    ra_dec_to_alt_az_array,
+    refraction_degrees,
+)
+
+
+WHEN = datetime(2022, 3, 10, 4, 30, tzinfo=UTC)
+SITES = [(40.7128, -74.0060), (-33.87, 151.21), (78.2, 15.6)]
+
+
+def _random_sky(count, seed=0):
+    """Uniformly distributed RA (hours) and Dec (degrees)"""
+    rng = np.random.default_rng(seed)
+    return rng.uniform(0.0, 24.0, count), np.degrees(np.arcsin(rng.uniform(-1.0, 1.0, count)))
+
+
+class TestAgainstAstropy(unittest.TestCase):
+    """Test accuracy against Astropy's ICRS <-> AltAz transform"""
+
+    def setUp(self):
+        """Use only the IERS tables bundled with Astropy"""
+        context = iers.conf.set_temp("auto_download", False)
+        context.__enter__()
+        self.addCleanup(context.__exit__, None, None, None)
+
+    def _astropy_altaz(self, ra, dec, latitude, longitude, **frame):
+        location = EarthLocation(lat=latitude * u.deg, lon=longitude * u.deg)
+        return SkyCoord(ra=ra * u.hourangle, dec=dec * u.deg).transform_to(
+            AltAz(location=location, obstime=Time(WHEN), **frame)
+        )
+
+    def test_ra_dec_to_alt_az(self):
+        """Test Alt/Az agree to a few arcseconds at several sites"""
+        ra, dec = _random_sky(300)
+        for latitude, longitude in SITES:
+            expected = self._astropy_altaz(ra, dec, latitude, longitude)
+            az, alt = ra_dec_to_alt_az_array(ra, dec, latitude, longitude, WHEN)
+            error = angular_separation_array(az / 15.0, alt, expected.az.hour, expected.alt.deg) * 3600.0
+            self.assertLess(error.max(), 3.0)
+
+    def test_alt_az_to_ra_dec(self):
+        """Test the inverse recovers ICRS coordinates"""
+        ra, dec = _random_sky(300, seed=1)
+        latitude, longitude = SITES[0]
+        expected = self._astropy_altaz(ra, dec, latitude, longitude)
+        ra_out, dec_out = alt_az_to_ra_dec_array(expected.az.deg, expected.alt.deg, latitude, longitude, WHEN)
+        self.assertLess((angular_separation_array(ra_out, dec_out, ra, dec) * 3600.0).max(), 3.0)
+
+    def test_refraction(self):
+        """Test refracted altitudes above 15° agree with Astropy's model"""
+        ra, dec = _random_sky(300, seed=2)
+        latitude, longitude = SITES[0]
+        expected = self._astropy_altaz(
+            ra, dec, latitude, longitude, pressure=1010 * u.hPa, temperature=10 * u.deg_C, obswl=0.55 * u.micron
+        )
+        _, alt = ra_dec_to_alt_az_array(ra, dec, latitude, longitude, WHEN, refraction=True)
+        high = expected.alt.deg > 15.0
+        self.assertLess(np.abs(alt - expected.alt.deg)[high].max() * 3600.0, 20.0)
+
+    def test_sidereal_time_and_julian_date(self):
+        """Test mean and apparent LST and the Julian date"""
+        time = Time(WHEN)
+        self.assertAlmostEqual(float(julian_date_array(WHEN)), time.jd, places=8)
+        for apparent, kind in ((False, "mean"), (True, "apparent")):
+            lst = local_sidereal_time_array(-74.006, WHEN, apparent=apparent)
+            expected = time.sidereal_time(kind, longitude=-74.006 * u.deg).hour
+            self.assertAlmostEqual(float(lst), expected, delta=1.0 / 3600.0)
+
+    def test_angular_separation(self):
+        """Test separations including nearly antipodal points"""
+        ra1, dec1 = _random_sky(200, seed=3)
+        ra2, dec2 = (ra1 + 12.0) % 24.0, -dec1 + 1e-4
+        expected = SkyCoord(ra=ra1 * u.hourangle, dec=dec1 * u.deg).separation(
+            SkyCoord(ra=ra2 * u.hourangle, dec=dec2 * u.deg)
+        )
+        np.testing.assert_allclose(angular_separation_array(ra1, dec1, ra2, dec2), expected.deg, atol=1e-9)
+
+
+class TestBroadcasting(unittest.TestCase):
+    """Test array shapes and time inputs"""
+
+    def test_objects_by_times_grid(self):
+        """Test (T, 1) times against (N,) objects gives a (T, N) grid matching scalar calls"""
+        ra, dec = _random_sky(5)
+        times = np.array([WHEN + timedelta(hours=hour) for hour in range(4)])
+        az, alt = ra_dec_to_alt_az_array(ra, dec, 40.0, -74.0, times[:, None])
+        self.assertEqual(az.shape, (4, 5))
+        single_az, single_alt = ra_dec_to_alt_az_array(ra[3], dec[3], 40.0, -74.0, times[2])
+        self.assertAlmostEqual(float(az[2, 3]), float(single_az), places=9)
+        self.assertAlmostEqual(float(alt[2, 3]), float(single_alt), places=9)
+
+    def test_time_formats(self):
+        """Test datetimes, naive datetimes, datetime64 and Unix seconds agree"""
+        expected = julian_date_array(WHEN)
+        self.assertEqual(julian_date_array(WHEN.replace(tzinfo=None)), expected)
+        self.assertEqual(julian_date_array(np.datetime64("2022-03-10T04:30")), expected)
+        self.assertEqual(julian_date_array(WHEN.timestamp()), expected)
+        self.assertEqual(julian_date_array([WHEN, WHEN]).shape, (2,))
+
+    def test_round_trip_with_refraction(self):
+        """Test refraction and its inverse cancel to well under an arcsecond"""
+        az = np.linspace(0.0, 350.0, 36)
+        alt = np.linspace(5.0, 85.0, 36)
+        ra, dec = alt_az_to_ra_dec_array(az, alt, 51.5, 0.0, WHEN, refraction=True)
+        az_out, alt_out = ra_dec_to_alt_az_array(ra, dec, 51.5, 0.0, WHEN, refraction=True)
+        error = angular_separation_array(az / 15.0, alt, az_out / 15.0, alt_out) * 3600.0
+        self.assertLess(error.max(), 5.0)
+
+    def test_apparent_place_matches_alt_az(self):
+        """Test the apparent place of date gives the same Alt/Az without precession"""
+        ra, dec = _random_sky(50, seed=4)
+        ra_date, dec_date = apparent_ra_dec_array(ra, dec, WHEN)
+        expected = ra_dec_to_alt_az_array(ra, dec, 40.0, -74.0, WHEN)
+        actual = ra_dec_to_alt_az_array(ra_date, dec_date, 40.0, -74.0, WHEN, precession=False)
+        # The two differ by the equation of the equinoxes in sidereal time (about a second)
+        error = angular_separation_array(actual[0] / 15.0, actual[1], expected[0] / 15.0, expected[1]) * 3600.0
+        self.assertLess(error.max(), 20.0)
+
+    def test_refraction_values(self):
+        """Test refraction is about 34' at the horizon, about 1' at 45° and zero without air"""
+        self.assertAlmostEqual(float(refraction_degrees(0.0, apparent=True)) * 60.0, 34.5, delta=0.5)
+        self.assertAlmostEqual(float(refraction_degrees(45.0)) * 60.0, 1.0, delta=0.05)
+        self.assertEqual(float(refraction_degrees(10.0, pressure_hpa=0.0)), 0.0)
+        self.assertEqual(float(refraction_degrees(90.0)), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
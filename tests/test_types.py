@@ -14,6 +14,7 @@ from celestron_nexstar.api.core.types import (
     HorizontalCoordinates,
     TelescopeConfig,
     TelescopeInfo,
+    TelescopeState,
     TelescopeTime,
     TrackingMode,
 )
@@ -164,6 +165,20 @@ class TestTelescopeInfo(unittest.TestCase):
         self.assertEqual(result, "Model 8, Firmware 4.5")
 
 
+class TestTelescopeState(unittest.TestCase):
+    """Test suite for TelescopeState dataclass"""
+
+    def test_string_representation(self):
+        """Test string representation"""
+        state = TelescopeState(
+            equatorial=EquatorialCoordinates(ra_hours=12.0, dec_degrees=-30.0),
+            horizontal=HorizontalCoordinates(azimuth=180.0, altitude=45.0),
+            is_slewing=True,
+            tracking_mode=TrackingMode.ALT_AZ,
+        )
+        self.assertEqual(str(state), "RA 12.0000h, Dec -30.0000°; Az 180.00°, Alt 45.00°; slewing, tracking ALT_AZ")
+
+
 class TestTelescopeTime(unittest.TestCase):
     """Test suite for TelescopeTime dataclass"""
 
@@ -107,7 +107,7 @@ class TestGetObjectAltitudeAzimuth(unittest.TestCase):
         """Test getting altitude/azimuth for a fixed object"""
         mock_get_location.return_value = MagicMock(latitude=40.0, longitude=-100.0)
         mock_is_dynamic.return_value = False
-        mock_ra_dec_to_alt_az.return_value = (45.0, 180.0)
+        mock_ra_dec_to_alt_az.return_value = (180.0, 45.0)  # (azimuth, altitude)
 
         alt, az = get_object_altitude_azimuth(self.test_obj)
 
@@ -126,7 +126,7 @@ class TestGetObjectAltitudeAzimuth(unittest.TestCase):
         mock_get_location.return_value = MagicMock(latitude=40.0, longitude=-100.0)
         mock_is_dynamic.return_value = True
         mock_get_position.return_value = (12.0, 20.0)  # RA, Dec
-        mock_ra_dec_to_alt_az.return_value = (30.0, 90.0)
+        mock_ra_dec_to_alt_az.return_value = (90.0, 30.0)  # (azimuth, altitude)
 
         dynamic_obj = CelestialObject(
             name="Jupiter",
@@ -149,7 +149,7 @@ class TestGetObjectAltitudeAzimuth(unittest.TestCase):
     def test_get_object_altitude_azimuth_with_explicit_location(self, mock_is_dynamic, mock_ra_dec_to_alt_az):
         """Test getting altitude/azimuth with explicit observer location"""
         mock_is_dynamic.return_value = False
-        mock_ra_dec_to_alt_az.return_value = (50.0, 270.0)
+        mock_ra_dec_to_alt_az.return_value = (270.0, 50.0)  # (azimuth, altitude)
 
         alt, az = get_object_altitude_azimuth(self.test_obj, observer_lat=35.0, observer_lon=-120.0)
 
@@ -161,7 +161,7 @@ class TestGetObjectAltitudeAzimuth(unittest.TestCase):
     def test_get_object_altitude_azimuth_with_datetime(self, mock_is_dynamic, mock_ra_dec_to_alt_az):
         """Test getting altitude/azimuth with explicit datetime"""
         mock_is_dynamic.return_value = False
-        mock_ra_dec_to_alt_az.return_value = (60.0, 0.0)
+        mock_ra_dec_to_alt_az.return_value = (0.0, 60.0)  # (azimuth, altitude)
 
         test_dt = datetime(2024, 6, 15, 20, 0, tzinfo=UTC)
         alt, az = get_object_altitude_azimuth(self.test_obj, dt=test_dt)
@@ -249,9 +249,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_visible_object(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_visible_object(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility for a visible object"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 12.0
@@ -267,9 +265,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_below_horizon(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_below_horizon(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility for object below horizon"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 12.0
@@ -284,9 +280,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_too_faint(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_too_faint(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility for object that's too faint"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 10.0  # Limiting magnitude
@@ -311,9 +305,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_low_altitude(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_low_altitude(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility for object at low altitude"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 12.0
@@ -328,9 +320,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_position_error(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_position_error(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility when position calculation fails"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 12.0
@@ -431,9 +421,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_near_detection_limit(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_near_detection_limit(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility for object near detection limit"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 12.0
@@ -459,9 +447,7 @@ class TestAssessVisibility(unittest.TestCase):
     @patch("celestron_nexstar.api.observation.visibility.get_object_altitude_azimuth")
     @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_assess_visibility_excellent_altitude(
-        self, mock_get_config, mock_calc_limiting, mock_get_alt_az
-    ):
+    def test_assess_visibility_excellent_altitude(self, mock_get_config, mock_calc_limiting, mock_get_alt_az):
         """Test assessing visibility for object at excellent altitude (>60 degrees)"""
         mock_get_config.return_value = self.test_config
         mock_calc_limiting.return_value = 12.0
@@ -528,9 +514,7 @@ class TestFilterVisibleObjects(unittest.TestCase):
 
     @patch("celestron_nexstar.api.observation.visibility.assess_visibility")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_filter_visible_objects_filters_invisible(
-        self, mock_get_config, mock_assess
-    ):
+    def test_filter_visible_objects_filters_invisible(self, mock_get_config, mock_assess):
         """Test that filter_visible_objects filters out invisible objects"""
         mock_get_config.return_value = self.test_config
 
@@ -565,9 +549,7 @@ class TestFilterVisibleObjects(unittest.TestCase):
 
     @patch("celestron_nexstar.api.observation.visibility.assess_visibility")
     @patch("celestron_nexstar.api.observation.visibility.get_current_configuration")
-    def test_filter_visible_objects_sorts_by_score(
-        self, mock_get_config, mock_assess
-    ):
+    def test_filter_visible_objects_sorts_by_score(self, mock_get_config, mock_assess):
         """Test that filter_visible_objects sorts by observability score"""
         mock_get_config.return_value = self.test_config
 
@@ -668,6 +650,47 @@ class TestFilterVisibleObjects(unittest.TestCase):
             # Should have used vectorized path and returned some results
             self.assertIsInstance(result, list)
 
+    @patch("celestron_nexstar.api.observation.visibility.get_planetary_positions")
+    @patch("celestron_nexstar.api.observation.visibility.calculate_limiting_magnitude")
+    def test_filter_visible_objects_vectorized_dynamic_objects(self, mock_calc_limiting, mock_get_positions):
+        """Test the vectorized path positions planets and moons from batched lookups"""
+        mock_calc_limiting.return_value = 12.0
+        coordinates = {"jupiter": (4.0, 20.0, 50.0), "io": (4.0, 20.0 + 10.0 / 60.0, 50.0)}
+
+        def positions(names, dt, lat, lon):
+            if names[0] not in coordinates:
+                raise FileNotFoundError(names[0])
+            ra, dec, alt = coordinates[names[0]]
+            return {names[0]: MagicMock(ra_hours=[ra], dec_degrees=[dec], altitude_degrees=[alt], azimuth_degrees=[90])}
+
+        mock_get_positions.side_effect = positions
+        objects = [
+            CelestialObject(
+                name=name,
+                common_name=None,
+                ra_hours=0.0,
+                dec_degrees=0.0,
+                magnitude=magnitude,
+                object_type=object_type,
+                catalog="planets",
+            )
+            for name, magnitude, object_type in [
+                ("Jupiter", -2.5, CelestialObjectType.PLANET),
+                ("Io", 5.0, CelestialObjectType.MOON),
+            ]
+        ] * 6
+
+        with patch("celestron_nexstar.api.observation.visibility.assess_visibility") as mock_assess:
+            result = filter_visible_objects(
+                objects, config=self.test_config, observer_lat=40.0, observer_lon=-100.0, dt=datetime.now(UTC)
+            )
+        mock_assess.assert_not_called()
+        self.assertEqual(len(result), 12)
+        io = next(visibility for obj, visibility in result if obj.name == "Io")
+        self.assertEqual(io.altitude_deg, 50.0)
+        self.assertTrue(any("Good separation from parent (" in reason for reason in io.reasons))
+        self.assertEqual({names[0] for (names, *_), _ in mock_get_positions.call_args_list}, {"io", "jupiter"})
+
 
 if __name__ == "__main__":
     unittest.main()
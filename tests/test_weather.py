@@ -5,10 +5,15 @@ Tests weather data fetching, seeing conditions calculations, and observing condi
 """
 
 import asyncio
+import tempfile
 import unittest
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
+
+from celestron_nexstar.api.database.database import CatalogDatabase
 from celestron_nexstar.api.database.models import WeatherForecastModel
 from celestron_nexstar.api.location import weather
 from celestron_nexstar.api.location.observer import ObserverLocation
@@ -919,6 +924,40 @@ class TestFetchHourlyWeatherForecast(unittest.TestCase):
                 self.assertIsInstance(forecasts, list)
 
 
+def _open_meteo_current(temperature_f: float) -> dict:
+    """One location's Open-Meteo current weather response"""
+    return {
+        "current": {
+            "temperature_2m": temperature_f,
+            "relative_humidity_2m": 50.0,
+            "cloud_cover": 10.0,
+            "wind_speed_10m": 5.0,
+            "weather_code": 0,
+        },
+        "hourly": {"dew_point_2m": [40.0]},
+    }
+
+
+def _mock_response(payload, status: int = 200) -> MagicMock:
+    """Context manager for an HTTP response with the given JSON payload"""
+    response = AsyncMock()
+    response.status = status
+    response.json = AsyncMock(return_value=payload)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return context
+
+
+def _mock_http_session(*responses) -> MagicMock:
+    """HTTP session whose successive GETs return the given responses (or raise the given errors)"""
+    session = MagicMock()
+    session.get = MagicMock(side_effect=list(responses))
+    return session
+
+
+@patch("celestron_nexstar.api.location.weather._store_current_weather", new_callable=AsyncMock)
+@patch("celestron_nexstar.api.location.weather._load_cached_current_weather", new_callable=AsyncMock)
 class TestFetchWeatherBatch(unittest.TestCase):
     """Test suite for fetch_weather_batch function"""
 
@@ -927,66 +966,152 @@ class TestFetchWeatherBatch(unittest.TestCase):
         self.test_locations = [
             ObserverLocation(latitude=40.0, longitude=-100.0, name="Location 1"),
             ObserverLocation(latitude=35.0, longitude=-110.0, name="Location 2"),
+            ObserverLocation(latitude=30.0, longitude=-90.0, name="Location 3"),
         ]
 
-    @patch("celestron_nexstar.api.location.weather.fetch_weather", new_callable=AsyncMock)
-    def test_fetch_weather_batch_success(self, mock_fetch: AsyncMock) -> None:
-        """Test successful batch weather fetch"""
-        # Mock successful responses - fetch_weather is async, so mock_fetch should be AsyncMock
-        mock_fetch.return_value = WeatherData(temperature_c=70.0, cloud_cover_percent=10.0)
-
-        # Actually, ObserverLocation is not hashable, so this test will fail
-        # Skip this test for now - the code has a bug where it tries to use ObserverLocation as dict key
-        # For now, just verify the function can be called
-        try:
-            result = asyncio.run(fetch_weather_batch(self.test_locations))
-            # If it works, check results
-            self.assertIsInstance(result, dict)
-        except TypeError as e:
-            if "unhashable" in str(e):
-                # Expected - ObserverLocation is not hashable
-                self.skipTest("ObserverLocation is not hashable, cannot be used as dict key")
-            else:
-                raise
-
-    @patch("celestron_nexstar.api.location.weather.fetch_weather", new_callable=AsyncMock)
-    def test_fetch_weather_batch_with_errors(self, mock_fetch: AsyncMock) -> None:
-        """Test batch weather fetch with some errors"""
-        # Mock one success and one error
-        # Use side_effect to return different values for each call
-        mock_fetch.side_effect = [
-            WeatherData(temperature_c=70.0, cloud_cover_percent=10.0),
-            Exception("API error"),
+    def test_fetch_weather_batch_success(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test locations are sent as coordinate lists, chunked, and stored together"""
+        mock_load.return_value = {}
+        # A multi-location chunk returns a list, a single-location chunk a bare object
+        session = _mock_http_session(
+            _mock_response([_open_meteo_current(70.0), _open_meteo_current(71.0)]),
+            _mock_response(_open_meteo_current(72.0)),
+        )
+
+        result = asyncio.run(fetch_weather_batch(self.test_locations, session=session, batch_size=2))
+
+        self.assertEqual(list(result), self.test_locations)
+        self.assertEqual([w.temperature_c for w in result.values()], [70.0, 71.0, 72.0])
+        self.assertTrue(all(w.error is None and w.condition == "Clear" for w in result.values()))
+
+        self.assertEqual(session.get.call_count, 2)
+        first_params = session.get.call_args_list[0].kwargs["params"]
+        self.assertEqual(first_params["latitude"], "40.0,35.0")
+        self.assertEqual(first_params["longitude"], "-100.0,-110.0")
+        mock_store.assert_awaited_once()
+        self.assertEqual(list(mock_store.await_args.args[0]), self.test_locations)
+
+    def test_fetch_weather_batch_uses_cache(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test only locations without fresh cached weather are requested"""
+        cached = WeatherData(temperature_c=65.0)
+        mock_load.return_value = {self.test_locations[0]: cached}
+        session = _mock_http_session(_mock_response([_open_meteo_current(71.0), _open_meteo_current(72.0)]))
+
+        result = asyncio.run(fetch_weather_batch(self.test_locations, session=session))
+
+        self.assertIs(result[self.test_locations[0]], cached)
+        self.assertEqual(session.get.call_count, 1)
+        self.assertEqual(session.get.call_args.kwargs["params"]["latitude"], "35.0,30.0")
+        self.assertEqual(list(mock_store.await_args.args[0]), self.test_locations[1:])
+
+    def test_fetch_weather_batch_all_cached(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test no request is sent when every location is cached"""
+        mock_load.return_value = {location: WeatherData(temperature_c=65.0) for location in self.test_locations}
+        session = _mock_http_session()
+
+        result = asyncio.run(fetch_weather_batch(self.test_locations, session=session))
+
+        self.assertEqual(len(result), 3)
+        session.get.assert_not_called()
+        mock_store.assert_not_awaited()
+
+    def test_fetch_weather_batch_with_errors(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test a failed request marks only its own chunk's locations as errors"""
+        mock_load.return_value = {}
+        session = _mock_http_session(
+            _mock_response([_open_meteo_current(70.0), _open_meteo_current(71.0)]),
+            aiohttp.ClientError("Network error"),
+        )
+
+        result = asyncio.run(fetch_weather_batch(self.test_locations, session=session, batch_size=2))
+
+        self.assertIsNone(result[self.test_locations[0]].error)
+        self.assertIsNone(result[self.test_locations[1]].error)
+        self.assertIsNotNone(result[self.test_locations[2]].error)
+
+    def test_fetch_weather_batch_http_error(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test HTTP errors are reported per location"""
+        mock_load.return_value = {}
+        session = _mock_http_session(_mock_response(None, status=500))
+
+        result = asyncio.run(fetch_weather_batch(self.test_locations, session=session))
+
+        self.assertTrue(all(w.error == "HTTP 500" for w in result.values()))
+
+    def test_fetch_weather_batch_unexpected_result(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test a response with the wrong number of locations is an error"""
+        mock_load.return_value = {}
+        session = _mock_http_session(_mock_response([_open_meteo_current(70.0)]))
+
+        result = asyncio.run(fetch_weather_batch(self.test_locations, session=session))
+
+        self.assertIsInstance(result, dict)
+        for weather_data in result.values():
+            self.assertIsNotNone(weather_data.error)
+
+    def test_fetch_weather_batch_empty(self, mock_load: AsyncMock, mock_store: AsyncMock) -> None:
+        """Test an empty batch does nothing"""
+        self.assertEqual(asyncio.run(fetch_weather_batch([])), {})
+        mock_load.assert_not_awaited()
+
+
+class TestFetchWeatherBatchFreshDatabase(unittest.TestCase):
+    """Test suite for fetch_weather_batch against a database without a weather_forecast table"""
+
+    def setUp(self) -> None:
+        """Create an empty database and make it the default one"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.db = CatalogDatabase(Path(self.tmp.name) / "catalogs.db")
+        self.addCleanup(lambda: asyncio.run(self.db.close()))
+        patcher = patch("celestron_nexstar.api.database.database.get_database", return_value=self.db)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.test_locations = [
+            ObserverLocation(latitude=40.0, longitude=-100.0, name="Location 1"),
+            ObserverLocation(latitude=35.0, longitude=-110.0, name="Location 2"),
         ]
 
-        # ObserverLocation is not hashable, so this test will fail
-        try:
-            result = asyncio.run(fetch_weather_batch(self.test_locations))
-            self.assertIsInstance(result, dict)
-        except TypeError as e:
-            if "unhashable" in str(e):
-                self.skipTest("ObserverLocation is not hashable, cannot be used as dict key")
-            else:
-                raise
-
-    @patch("celestron_nexstar.api.location.weather.fetch_weather", new_callable=AsyncMock)
-    def test_fetch_weather_batch_unexpected_result(self, mock_fetch: AsyncMock) -> None:
-        """Test batch weather fetch with unexpected result type"""
-        # Mock unexpected result type
-        # Set mock_fetch to return an unexpected value
-        mock_fetch.return_value = "unexpected"
-
-        # ObserverLocation is not hashable, so this test will fail
-        try:
-            result = asyncio.run(fetch_weather_batch(self.test_locations))
-            self.assertIsInstance(result, dict)
-            for weather_data in result.values():
-                self.assertIsNotNone(weather_data.error)
-        except TypeError as e:
-            if "unhashable" in str(e):
-                self.skipTest("ObserverLocation is not hashable, cannot be used as dict key")
-            else:
-                raise
+    def test_creates_table_and_stores(self) -> None:
+        """Test the missing table is created and fetched weather is stored rather than raising"""
+        from sqlalchemy import func, select
+
+        session = _mock_http_session(_mock_response([_open_meteo_current(70.0), _open_meteo_current(71.0)]))
+
+        async def _fetch_and_count() -> tuple[dict, int]:
+            result = await fetch_weather_batch(self.test_locations, session=session)
+            async with self.db._AsyncSession() as db_session:
+                count = await db_session.scalar(select(func.count()).select_from(WeatherForecastModel))
+            return result, count
+
+        result, stored = asyncio.run(_fetch_and_count())
+
+        self.assertEqual([w.temperature_c for w in result.values()], [70.0, 71.0])
+        self.assertTrue(all(w.error is None for w in result.values()))
+        self.assertEqual(stored, 2)
+
+    def test_recreates_table_after_database_is_deleted(self) -> None:
+        """Test a database rebuilt under the same path gets the table again"""
+        from sqlalchemy import func, select
+
+        session = _mock_http_session(
+            _mock_response([_open_meteo_current(70.0), _open_meteo_current(71.0)]),
+            _mock_response([_open_meteo_current(72.0), _open_meteo_current(73.0)]),
+        )
+
+        async def _fetch_twice() -> tuple[dict, int]:
+            await fetch_weather_batch(self.test_locations, session=session)
+            await self.db.close()
+            self.db.db_path.unlink()
+            result = await fetch_weather_batch(self.test_locations, session=session)
+            async with self.db._AsyncSession() as db_session:
+                count = await db_session.scalar(select(func.count()).select_from(WeatherForecastModel))
+            return result, count
+
+        result, stored = asyncio.run(_fetch_twice())
+
+        self.assertEqual([w.temperature_c for w in result.values()], [72.0, 73.0])
+        self.assertEqual(stored, 2)
 
 
 class TestFetchHourlyWeatherForecastDatabase(unittest.TestCase):